@@ -0,0 +1,330 @@
+"""
+Declarative, index-aware filtering for list and search endpoints.
+
+Each query parameter is declared once with its parser and predicate. Each supported index
+is declared as a plan listing the parameters on its leading column (leading), those on its
+later columns (driving), and the cheap predicates it tolerates on the rows it yields
+(residual). A request is accepted only if one plan has a leading parameter supplied and
+covers the rest, so new combinations need a deliberate index decision first.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable, Mapping
+from dataclasses import dataclass
+from datetime import datetime, time
+from typing import Any
+
+from django.db.models import Q, QuerySet
+from django.utils import timezone
+from django.utils.dateparse import parse_date, parse_datetime
+from rest_framework.exceptions import ValidationError
+
+from policylens.apps.claims.models import Claim
+
+_TRUE_VALUES = {"1", "true", "yes"}
+_FALSE_VALUES = {"0", "false", "no"}
+
+
+def _parse_text(raw: str) -> str:
+    """Return a stripped non-empty string."""
+    value = raw.strip()
+    if not value:
+        raise ValueError("empty value")
+    return value
+
+
+def _parse_datetime(raw: str) -> datetime:
+    """Parse an ISO datetime or date into an aware datetime."""
+    value = parse_datetime(raw)
+    if value is None:
+        day = parse_date(raw)
+        if day is None:
+            raise ValueError("not an ISO date or datetime")
+        value = datetime.combine(day, time.min)
+    if timezone.is_naive(value):
+        value = timezone.make_aware(value)
+    return value
+
+
+def _parse_flag(raw: str) -> bool | None:
+    """Parse a boolean flag. False means the filter is not applied."""
+    value = raw.strip().lower()
+    if value in _TRUE_VALUES:
+        return True
+    if value in _FALSE_VALUES:
+        return None
+    raise ValueError("not a boolean")
+
+
+def _parse_score(raw: str) -> float:
+    """Parse an ML score bound in the closed interval [0, 1]."""
+    value = float(raw)
+    if not 0.0 <= value <= 1.0:
+        raise ValueError("score out of range")
+    return value
+
+
+def _parse_percentage(raw: str) -> int:
+    """Parse a whole percentage in the closed interval [0, 100]."""
+    value = int(raw)
+    if not 0 <= value <= 100:
+        raise ValueError("percentage out of range")
+    return value
+
+
+def _parse_id(raw: str) -> int:
+    """Parse a positive primary key."""
+    value = int(raw)
+    if value < 1:
+        raise ValueError("not a positive id")
+    return value
+
+
+@dataclass(frozen=True)
+class FilterParam:
+    """A query parameter, how to parse it, and the predicate it applies."""
+
+    name: str
+    parse: Callable[[str], Any]
+    to_q: Callable[[Any], Q]
+
+
+@dataclass(frozen=True)
+class IndexPlan:
+    """An index and the filter parameters it can serve.
+
+    The index is only usable when a parameter on its leading column is supplied; parameters
+    on later columns narrow the scan but cannot start it.
+    """
+
+    index: str
+    leading: frozenset[str]
+    driving: frozenset[str] = frozenset()
+    residual: frozenset[str] = frozenset()
+
+    def covers(self, names: frozenset[str]) -> bool:
+        """Return True if a leading parameter is supplied and the index serves the rest."""
+        return bool(names & self.leading) and names <= self.leading | self.driving | self.residual
+
+
+_CREATED_RANGE = frozenset({"created_after", "created_before"})
+_CHEAP = frozenset({"status", "priority", "open"})
+
+
+class IndexedFilter:
+    """Parse declared parameters and admit only combinations an index plan covers."""
+
+    params: tuple[FilterParam, ...] = ()
+    plans: tuple[IndexPlan, ...] = ()
+    # Error returned when no filter is supplied; None means an unfiltered query is fine.
+    required_message: str | None = None
+
+    def parse(self, query_params: Mapping[str, str]) -> dict[str, Any]:
+        """Parse supplied filter parameters, ignoring unknown keys and disabled flags."""
+        values: dict[str, Any] = {}
+        errors: dict[str, str] = {}
+        for param in self.params:
+            raw = query_params.get(param.name)
+            if not raw:
+                continue
+            try:
+                value = param.parse(raw)
+            except ValueError:
+                errors[param.name] = f"Invalid value for {param.name}."
+                continue
+            if value is not None:
+                values[param.name] = value
+
+        if errors:
+            raise ValidationError(errors)
+        return values
+
+    def plan_for(self, names: frozenset[str]) -> IndexPlan | None:
+        """Return the first index plan that covers the supplied parameters."""
+        for plan in self.plans:
+            if plan.covers(names):
+                return plan
+        return None
+
+    def validate(self, query_params: Mapping[str, str]) -> dict[str, Any]:
+        """Parse filters and reject combinations with no supporting index."""
+        values = self.parse(query_params)
+        if not values:
+            if self.required_message:
+                raise ValidationError({"filters": self.required_message})
+            return values
+
+        names = frozenset(values)
+        if self.plan_for(names) is None:
+            raise ValidationError(
+                {
+                    "filters": (
+                        f"Unsupported filter combination: {', '.join(sorted(names))}. "
+                        "No index supports these filters together."
+                    )
+                }
+            )
+        return values
+
+    def filter_queryset(self, queryset: QuerySet, query_params: Mapping[str, str]) -> QuerySet:
+        """Apply supported filters or reject combinations with no supporting index."""
+        by_name = {param.name: param for param in self.params}
+        for name, value in self.validate(query_params).items():
+            queryset = queryset.filter(by_name[name].to_q(value))
+        return queryset
+
+
+class ClaimListFilter(IndexedFilter):
+    """Filter layer for ``GET /api/claims/``."""
+
+    params: tuple[FilterParam, ...] = (
+        FilterParam("status", _parse_text, lambda v: Q(status=v)),
+        FilterParam("priority", _parse_text, lambda v: Q(priority=v)),
+        FilterParam("created_after", _parse_datetime, lambda v: Q(created_at__gte=v)),
+        FilterParam("created_before", _parse_datetime, lambda v: Q(created_at__lt=v)),
+        FilterParam("policy_number", _parse_text, lambda v: Q(policy__policy_number=v)),
+        FilterParam("product_type", _parse_text, lambda v: Q(policy__product_type=v)),
+        FilterParam("created_by", _parse_text, lambda v: Q(created_by=v)),
+        FilterParam("score_min", _parse_score, lambda v: Q(ml_score__score__gte=v)),
+        FilterParam("score_max", _parse_score, lambda v: Q(ml_score__score__lte=v)),
+        FilterParam(
+            "completeness_min",
+            _parse_percentage,
+            lambda v: Q(checklist_completeness__gte=v),
+        ),
+        FilterParam(
+            "completeness_max",
+            _parse_percentage,
+            lambda v: Q(checklist_completeness__lte=v),
+        ),
+        # Must match the partial index predicate so the planner can use it.
+        FilterParam("open", _parse_flag, lambda v: ~Q(status=Claim.Status.DECIDED)),
+    )
+
+    plans: tuple[IndexPlan, ...] = (
+        IndexPlan(
+            "claim(created_at)",
+            leading=_CREATED_RANGE,
+            residual=frozenset({"status", "priority"}),
+        ),
+        IndexPlan(
+            "claim(status, priority)",
+            leading=frozenset({"status"}),
+            driving=frozenset({"priority"}),
+            residual=_CREATED_RANGE,
+        ),
+        IndexPlan(
+            "claim(created_at) WHERE status <> DECIDED",
+            leading=frozenset({"open"}),
+            driving=_CREATED_RANGE,
+            residual=frozenset({"priority"}),
+        ),
+        IndexPlan(
+            "claim(created_by, created_at)",
+            leading=frozenset({"created_by"}),
+            driving=_CREATED_RANGE,
+            residual=_CHEAP,
+        ),
+        IndexPlan(
+            "claim(policy, created_at) via policy(policy_number)",
+            leading=frozenset({"policy_number"}),
+            driving=_CREATED_RANGE,
+            residual=_CHEAP,
+        ),
+        IndexPlan(
+            "policy(product_type)",
+            leading=frozenset({"product_type"}),
+            residual=_CHEAP,
+        ),
+        IndexPlan(
+            "mlscore(score)",
+            leading=frozenset({"score_min", "score_max"}),
+            residual=_CHEAP,
+        ),
+        IndexPlan(
+            "claim(checklist_completeness, created_at)",
+            leading=frozenset({"completeness_min", "completeness_max"}),
+            residual=_CHEAP,
+        ),
+    )
+
+
+def _payload_param(name: str, parse: Callable[[str], Any]) -> FilterParam:
+    """Declare a filter on one audit payload key, matched by JSON containment (``@>``)."""
+    return FilterParam(name, parse, lambda v: Q(payload__contains={name: v}))
+
+
+# Payload keys worth searching on. They lead no plan: ``audit_search`` checks them on a
+# bounded window of the rows another plan's index yields.
+_PAYLOAD_PARAMS = (
+    _payload_param("decision", _parse_text),
+    _payload_param("decision_id", _parse_id),
+    _payload_param("document_id", _parse_id),
+    _payload_param("note_id", _parse_id),
+    _payload_param("policy_number", _parse_text),
+    _payload_param("label", _parse_text),
+    _payload_param("model_version", _parse_text),
+    # reason_codes is a list; containment matches any event that includes the code.
+    FilterParam("reason_code", _parse_text, lambda v: Q(payload__contains={"reason_codes": [v]})),
+)
+_PAYLOAD = frozenset(param.name for param in _PAYLOAD_PARAMS)
+
+
+class AuditEventFilter(IndexedFilter):
+    """Filter layer for ``GET /api/audit-events/``.
+
+    Every plan needs a selective leading filter. The time range narrows the second column
+    of each plan but leads none of them: a bare time range over the whole audit table is
+    left to the change feed. Payload keys only narrow a plan's rows, so a payload search
+    also names the actor, event type, or claim.
+    """
+
+    required_message = "Provide actor, event_type, or claim_id to search."
+    params: tuple[FilterParam, ...] = (
+        FilterParam("actor", _parse_text, lambda v: Q(actor=v)),
+        FilterParam("event_type", _parse_text, lambda v: Q(event_type=v)),
+        FilterParam("claim_id", _parse_id, lambda v: Q(claim_id=v)),
+        FilterParam("created_after", _parse_datetime, lambda v: Q(created_at__gte=v)),
+        FilterParam("created_before", _parse_datetime, lambda v: Q(created_at__lt=v)),
+        *_PAYLOAD_PARAMS,
+    )
+
+    plans: tuple[IndexPlan, ...] = (
+        IndexPlan(
+            "auditevent(claim, created_at)",
+            leading=frozenset({"claim_id"}),
+            driving=_CREATED_RANGE,
+            residual=frozenset({"actor", "event_type"}) | _PAYLOAD,
+        ),
+        IndexPlan(
+            "auditevent(actor, created_at)",
+            leading=frozenset({"actor"}),
+            driving=_CREATED_RANGE,
+            residual=frozenset({"event_type"}) | _PAYLOAD,
+        ),
+        IndexPlan(
+            "auditevent(event_type, created_at)",
+            leading=frozenset({"event_type"}),
+            driving=_CREATED_RANGE,
+            residual=_PAYLOAD,
+        ),
+    )
+
+    def split(
+        self, queryset: QuerySet, query_params: Mapping[str, str]
+    ) -> tuple[QuerySet, Q | None]:
+        """Apply the index-backed filters; return them with the payload predicate, if any.
+
+        ``audit_search.search_page`` checks the payload predicate on a bounded window of the
+        filtered rows instead of letting it steer the plan.
+        """
+        by_name = {param.name: param for param in self.params}
+        payload = None
+        for name, value in self.validate(query_params).items():
+            q = by_name[name].to_q(value)
+            if name in _PAYLOAD:
+                payload = q if payload is None else payload & q
+            else:
+                queryset = queryset.filter(q)
+        return queryset, payload
@@ -0,0 +1,49 @@
+"""
+Renderers for high-volume API responses.
+
+FastJSONRenderer encodes with orjson and produces the same bytes as DRF's JSONRenderer for
+the plain dict/list/str/int payloads built by the list fast paths. Anything orjson cannot
+encode, and indented output requested by the browsable API, falls back to DRF's encoder.
+"""
+
+from __future__ import annotations
+
+import orjson
+from rest_framework.renderers import BaseRenderer, JSONRenderer
+
+
+class FastJSONRenderer(JSONRenderer):
+    """Drop-in JSONRenderer that uses orjson for compact output."""
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        """Render ``data`` to JSON bytes, matching JSONRenderer's wire format."""
+        if data is None:
+            return b""
+
+        renderer_context = renderer_context or {}
+        if not self.compact or self.ensure_ascii:
+            return super().render(data, accepted_media_type, renderer_context)
+        if self.get_indent(accepted_media_type, renderer_context) is not None:
+            return super().render(data, accepted_media_type, renderer_context)
+
+        try:
+            ret = orjson.dumps(data)
+        except TypeError:
+            # Decimal, lazy translation strings, and other types orjson cannot encode.
+            return super().render(data, accepted_media_type, renderer_context)
+
+        # Keep JSONRenderer's escaping so output stays a strict JavaScript subset.
+        return ret.replace("\u2028".encode(), b"\\u2028").replace("\u2029".encode(), b"\\u2029")
+
+
+class PDFRenderer(BaseRenderer):
+    """Accepts ``?format=pdf`` or ``Accept: application/pdf``; views send ready-made PDFs."""
+
+    media_type = "application/pdf"
+    format = "pdf"
+    charset = None
+    render_style = "binary"
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        """Pass PDF bytes through unchanged."""
+        return data
@@ -0,0 +1,97 @@
+"""
+values()-based row builders for list endpoints.
+
+A row builder declares each output field once with the database column it reads and an
+optional converter. List views select only the requested columns with ``values_list()`` and
+build response dicts directly, skipping the per-row serializer field graph. Converters reuse
+DRF field ``to_representation`` so the wire format matches the serializer contract.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass
+from typing import Any
+
+from django.db.models import QuerySet
+from rest_framework import serializers
+from rest_framework.exceptions import ValidationError
+
+_DATETIME = serializers.DateTimeField()
+
+
+def _datetime(value: Any) -> Any:
+    """Render a datetime exactly as DRF's DateTimeField does."""
+    return _DATETIME.to_representation(value) if value is not None else None
+
+
+@dataclass(frozen=True)
+class RowField:
+    """An output field, the column it is read from, and an optional converter."""
+
+    name: str
+    column: str
+    convert: Callable[[Any], Any] | None = None
+
+
+class ValuesRowBuilder:
+    """Build response rows from ``values_list()`` tuples for a declared field list."""
+
+    def __init__(self, fields: Iterable[RowField]) -> None:
+        """Index declared fields by output name, preserving declaration order."""
+        self.fields = {field.name: field for field in fields}
+
+    def parse_fieldset(self, raw: str | None) -> list[RowField]:
+        """Return the fields selected by a ``?fields=`` value, in contract order.
+
+        An absent or empty value selects every field. Unknown names are rejected.
+        """
+        if not raw:
+            return list(self.fields.values())
+
+        requested = {name.strip() for name in raw.split(",") if name.strip()}
+        unknown = requested - self.fields.keys()
+        if unknown:
+            raise ValidationError({"fields": f"Unknown fields: {', '.join(sorted(unknown))}."})
+        return [field for name, field in self.fields.items() if name in requested]
+
+    def build(self, queryset: QuerySet, fields: list[RowField]) -> list[dict[str, Any]]:
+        """Run one narrowed query and return response dicts."""
+        names = [field.name for field in fields]
+        converters = [(i, field.convert) for i, field in enumerate(fields) if field.convert]
+        rows = queryset.values_list(*(field.column for field in fields))
+
+        out = []
+        for row in rows:
+            if converters:
+                row = list(row)
+                for i, convert in converters:
+                    row[i] = convert(row[i])
+            out.append(dict(zip(names, row, strict=True)))
+        return out
+
+
+CLAIM_LIST_ROWS = ValuesRowBuilder(
+    [
+        RowField("id", "id"),
+        RowField("policy_number", "policy__policy_number"),
+        RowField("claim_type", "claim_type"),
+        RowField("status", "status"),
+        RowField("priority", "priority"),
+        RowField("summary", "summary"),
+        RowField("created_by", "created_by"),
+        RowField("checklist_completeness", "checklist_completeness"),
+        RowField("created_at", "created_at", _datetime),
+        RowField("updated_at", "updated_at", _datetime),
+    ]
+)
+
+
+def timeline_row(event: dict[str, Any]) -> dict[str, Any]:
+    """Render a timeline event with DRF-compatible timestamps."""
+    return {**event, "occurred_at": _datetime(event["occurred_at"])}
+
+
+def audit_row(event: dict[str, Any]) -> dict[str, Any]:
+    """Render an audit event with DRF-compatible timestamps."""
+    return {**event, "created_at": _datetime(event["created_at"])}
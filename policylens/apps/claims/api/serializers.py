@@ -11,6 +11,10 @@ Week 2 adds nested contracts for:
 
 from __future__ import annotations
 
+from datetime import timedelta
+
+from django.conf import settings
+from django.utils import timezone
 from rest_framework import serializers
 
 from policylens.apps.claims import services
@@ -18,6 +22,7 @@ from policylens.apps.claims.models import (
     Claim,
     ClaimDocument,
     InternalNote,
+    MlScore,
     Policy,
     ReviewDecision,
 )
@@ -44,6 +49,7 @@ class ClaimSerializer(serializers.ModelSerializer):
             "priority",
             "summary",
             "created_by",
+            "checklist_completeness",
             "created_at",
             "updated_at",
         ]
@@ -51,6 +57,7 @@ class ClaimSerializer(serializers.ModelSerializer):
             "id",
             "status",
             "created_by",
+            "checklist_completeness",
             "created_at",
             "updated_at",
             "policy_number",
@@ -91,6 +98,7 @@ class ClaimDetailSerializer(serializers.ModelSerializer):
             "priority",
             "summary",
             "created_by",
+            "checklist_completeness",
             "created_at",
             "updated_at",
             "documents_count",
@@ -185,6 +193,31 @@ class ReviewDecisionCreateSerializer(serializers.Serializer):
         )
 
 
+class ReviewDecisionBulkCreateSerializer(serializers.Serializer):
+    """Contract for recording one decision across many claims."""
+
+    MAX_CLAIMS = 5000
+
+    claim_ids = serializers.ListField(
+        child=serializers.IntegerField(min_value=1),
+        min_length=1,
+        max_length=MAX_CLAIMS,
+        write_only=True,
+    )
+    decision = serializers.ChoiceField(choices=ReviewDecision.Decision.choices, write_only=True)
+    notes = serializers.CharField(required=False, allow_blank=True, write_only=True)
+
+    def create(self, validated_data):
+        """Create decisions via the bulk domain service."""
+        actor = str(self.context.get("actor") or "system")
+        return services.bulk_add_decisions(
+            claim_ids=validated_data["claim_ids"],
+            decision=validated_data["decision"],
+            notes=validated_data.get("notes") or "",
+            actor=actor,
+        )
+
+
 class ReviewDecisionSerializer(serializers.ModelSerializer):
     """Read contract for decisions."""
 
@@ -192,3 +225,81 @@ class ReviewDecisionSerializer(serializers.ModelSerializer):
         model = ReviewDecision
         fields = ["id", "decision", "notes", "decided_by", "decided_at"]
         read_only_fields = fields
+
+
+class MlScoreSerializer(serializers.ModelSerializer):
+    """Read contract for a claim's fraud risk score."""
+
+    claim_id = serializers.IntegerField(read_only=True)
+
+    class Meta:
+        model = MlScore
+        fields = ["claim_id", "score", "label", "reason_codes", "model_version", "scored_at"]
+        read_only_fields = fields
+
+
+class ScoreDriftQuerySerializer(serializers.Serializer):
+    """Query parameters for comparing two score windows.
+
+    The current window defaults to today and the baseline to the seven days before it.
+    ``model_version`` defaults to the active model; ``all_versions`` merges every version.
+    """
+
+    baseline_start = serializers.DateField(required=False)
+    baseline_end = serializers.DateField(required=False)
+    current_start = serializers.DateField(required=False)
+    current_end = serializers.DateField(required=False)
+    model_version = serializers.CharField(required=False, allow_blank=True)
+    all_versions = serializers.BooleanField(required=False, default=False)
+    product_type = serializers.CharField(required=False, allow_blank=True)
+
+    def validate(self, attrs):
+        """Fill default windows and reject inverted ranges or conflicting versions."""
+        if attrs.get("model_version") and attrs.get("all_versions"):
+            raise serializers.ValidationError(
+                {"all_versions": "Cannot be combined with model_version."}
+            )
+        current_end = attrs.get("current_end") or timezone.localdate()
+        current_start = attrs.get("current_start") or current_end
+        baseline_end = attrs.get("baseline_end") or current_start - timedelta(days=1)
+        baseline_start = attrs.get("baseline_start") or baseline_end - timedelta(days=6)
+        if current_start > current_end:
+            raise serializers.ValidationError({"current_start": "Must not be after current_end."})
+        if baseline_start > baseline_end:
+            raise serializers.ValidationError({"baseline_start": "Must not be after baseline_end."})
+        return {
+            **attrs,
+            "current_start": current_start,
+            "current_end": current_end,
+            "baseline_start": baseline_start,
+            "baseline_end": baseline_end,
+        }
+
+
+class AuditFeedQuerySerializer(serializers.Serializer):
+    """Query parameters for the audit change feed."""
+
+    after = serializers.IntegerField(required=False, default=0, min_value=0)
+    limit = serializers.IntegerField(required=False, default=1000, min_value=1)
+    wait = serializers.FloatField(required=False, default=0.0, min_value=0.0)
+
+    def validate(self, attrs):
+        """Clamp the page size and long-poll wait to the configured caps."""
+        return {
+            **attrs,
+            "limit": min(attrs["limit"], settings.AUDIT_FEED_MAX_LIMIT),
+            "wait": min(attrs["wait"], settings.AUDIT_FEED_MAX_WAIT_SECONDS),
+        }
+
+
+class EvidenceBundleQuerySerializer(serializers.Serializer):
+    """Date range of claims to bundle: ``created_after`` inclusive, ``created_before`` not."""
+
+    created_after = serializers.DateField()
+    created_before = serializers.DateField()
+
+    def validate(self, attrs):
+        """Reject empty or inverted ranges."""
+        if attrs["created_after"] >= attrs["created_before"]:
+            raise serializers.ValidationError({"created_before": "Must be after created_after."})
+        return attrs
@@ -0,0 +1,41 @@
+"""
+Streaming response bodies that go out chunk by chunk under WSGI and ASGI alike.
+
+Django streams a synchronous iterator as-is under WSGI, but under ASGI it drains one into a
+list with ``sync_to_async(list)`` before sending anything. ``stream_content`` therefore
+hands ASGI an async iterator that pulls one chunk at a time with ``sync_to_async``. Django's
+ASGI handler runs each request in its own ``ThreadSensitiveContext``, so every pull for one
+response runs on that request's thread and database connection, and server-side cursors
+opened by the generator stay usable between chunks.
+"""
+
+from __future__ import annotations
+
+from collections.abc import AsyncIterator, Iterator
+
+from asgiref.sync import sync_to_async
+from django.core.handlers.asgi import ASGIRequest
+from django.http import HttpRequest
+
+_DONE = object()
+
+
+async def _pull(chunks: Iterator[bytes]) -> AsyncIterator[bytes]:
+    """Yield ``chunks`` one at a time, running the generator off the event loop."""
+    step = sync_to_async(next, thread_sensitive=True)
+    try:
+        while (chunk := await step(chunks, _DONE)) is not _DONE:
+            yield chunk
+    finally:
+        close = getattr(chunks, "close", None)
+        if close is not None:
+            await sync_to_async(close, thread_sensitive=True)()
+
+
+def stream_content(
+    request: HttpRequest, chunks: Iterator[bytes]
+) -> Iterator[bytes] | AsyncIterator[bytes]:
+    """Return ``chunks`` in the form the serving handler sends one chunk at a time."""
+    if isinstance(request, ASGIRequest):
+        return _pull(chunks)
+    return chunks
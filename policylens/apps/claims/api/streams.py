@@ -0,0 +1,82 @@
+"""
+Server-sent event streams for ops screens.
+
+These are plain Django views, not DRF views, authenticated by the Django session. They run
+on the same threaded WSGI server as the rest of the API. A stream holds its worker thread
+while it is open, so each one ends after ``LIVE_STREAM_MAX_SECONDS``. The ``retry`` hint
+makes the browser's ``EventSource`` reconnect a few seconds later, which frees the thread
+and bounds how many threads idle tabs can hold. Size the server's thread pool for the
+expected number of open ops screens on top of normal API traffic.
+"""
+
+from __future__ import annotations
+
+import queue
+import time
+from collections.abc import Iterator
+
+from django.conf import settings
+from django.http import JsonResponse, StreamingHttpResponse
+from django.views.decorators.http import require_GET
+
+from policylens.apps.claims import live
+from policylens.apps.claims.api.streaming import stream_content
+
+DEFAULT_CHANNELS = (live.CLAIMS, live.QUEUE)
+
+
+def _event_stream(*, channels: frozenset[str], claim_id: int | None) -> Iterator[bytes]:
+    """Yield SSE frames for one client until it disconnects or the stream's time is up."""
+    broadcaster = live.get_broadcaster(buffer=settings.LIVE_CLIENT_BUFFER)
+    subscription = broadcaster.subscribe(channels=channels, claim_id=claim_id)
+    deadline = time.monotonic() + settings.LIVE_STREAM_MAX_SECONDS
+    try:
+        yield b"retry: 3000\n: connected\n\n"
+        while (remaining := deadline - time.monotonic()) > 0:
+            try:
+                channel, data = subscription.queue.get(
+                    timeout=min(settings.LIVE_HEARTBEAT_SECONDS, remaining)
+                )
+            except queue.Empty:
+                # Writing is also how a WSGI server notices a client that went away.
+                yield b": keepalive\n\n"
+                continue
+            yield f"event: {channel}\ndata: {data}\n\n".encode()
+    finally:
+        broadcaster.unsubscribe(subscription)
+
+
+@require_GET
+def live_events(request):
+    """Stream claim, queue, and SLA change notifications.
+
+    ``channels`` is a comma-separated subset of ``claims,queue,sla`` (default
+    ``claims,queue``); ``claim_id`` narrows the stream to one claim's notifications.
+    """
+    if not request.user.is_authenticated:
+        return JsonResponse({"detail": "Authentication credentials were not provided."}, status=401)
+
+    raw = request.GET.get("channels")
+    channels = frozenset(c.strip() for c in raw.split(",") if c.strip()) if raw else None
+    channels = channels or frozenset(DEFAULT_CHANNELS)
+    unknown = channels - live.CHANNELS.keys()
+    if unknown:
+        return JsonResponse(
+            {"channels": f"Unknown channels: {', '.join(sorted(unknown))}."}, status=400
+        )
+
+    claim_id = None
+    if request.GET.get("claim_id"):
+        try:
+            claim_id = int(request.GET["claim_id"])
+        except ValueError:
+            return JsonResponse({"claim_id": "A valid integer is required."}, status=400)
+
+    response = StreamingHttpResponse(
+        stream_content(request, _event_stream(channels=channels, claim_id=claim_id)),
+        content_type="text/event-stream",
+    )
+    response["Cache-Control"] = "no-cache"
+    # Stop reverse proxies such as Nginx from buffering the stream.
+    response["X-Accel-Buffering"] = "no"
+    return response
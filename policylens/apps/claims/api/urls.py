@@ -3,17 +3,64 @@
 
 from django.urls import path
 
+from policylens.apps.claims.api.streams import live_events
 from policylens.apps.claims.api.views import (
+    AuditEventSearchAPIView,
+    AuditFeedAPIView,
+    ClaimAuditExportAPIView,
+    ClaimDecisionBulkCreateAPIView,
     ClaimDecisionCreateAPIView,
     ClaimDocumentUploadAPIView,
+    ClaimEvidenceBundleAPIView,
+    ClaimFacetsAPIView,
     ClaimListCreateAPIView,
+    ClaimMlScoreAPIView,
     ClaimNoteCreateAPIView,
     ClaimRetrieveAPIView,
+    ClaimSimilarAPIView,
+    ClaimTimelineAPIView,
+    EvidenceBundleAPIView,
+    HolderNetworkAPIView,
+    MlMetricsAPIView,
+    ScoreDriftAPIView,
+    ShadowReportAPIView,
+    ThresholdSimulationAPIView,
 )
 
 urlpatterns = [
     path("claims/", ClaimListCreateAPIView.as_view(), name="claims-list-create"),
+    path("claims/facets/", ClaimFacetsAPIView.as_view(), name="claims-facets"),
+    path(
+        "claims/decisions/bulk/",
+        ClaimDecisionBulkCreateAPIView.as_view(),
+        name="claims-decisions-bulk",
+    ),
+    path(
+        "claims/evidence-bundle/",
+        EvidenceBundleAPIView.as_view(),
+        name="claims-evidence-bundle",
+    ),
     path("claims/<int:claim_id>/", ClaimRetrieveAPIView.as_view(), name="claims-retrieve"),
+    path(
+        "claims/<int:claim_id>/timeline/",
+        ClaimTimelineAPIView.as_view(),
+        name="claims-timeline",
+    ),
+    path(
+        "claims/<int:claim_id>/similar/",
+        ClaimSimilarAPIView.as_view(),
+        name="claims-similar",
+    ),
+    path(
+        "claims/<int:claim_id>/audit-export/",
+        ClaimAuditExportAPIView.as_view(),
+        name="claims-audit-export",
+    ),
+    path(
+        "claims/<int:claim_id>/evidence-bundle/",
+        ClaimEvidenceBundleAPIView.as_view(),
+        name="claims-evidence-bundle-detail",
+    ),
     path(
         "claims/<int:claim_id>/documents/",
         ClaimDocumentUploadAPIView.as_view(),
@@ -29,4 +76,25 @@ urlpatterns = [
         ClaimDecisionCreateAPIView.as_view(),
         name="claims-decisions-create",
     ),
+    path(
+        "claims/<int:claim_id>/ml-score/",
+        ClaimMlScoreAPIView.as_view(),
+        name="claims-ml-score",
+    ),
+    path(
+        "holders/<int:holder_id>/network/",
+        HolderNetworkAPIView.as_view(),
+        name="holders-network",
+    ),
+    path("audit-events/", AuditEventSearchAPIView.as_view(), name="audit-events-search"),
+    path("audit-events/feed/", AuditFeedAPIView.as_view(), name="audit-events-feed"),
+    path("live/", live_events, name="live-events"),
+    path("ml/metrics/", MlMetricsAPIView.as_view(), name="ml-metrics"),
+    path("ml/drift/", ScoreDriftAPIView.as_view(), name="ml-drift"),
+    path("ml/shadow-report/", ShadowReportAPIView.as_view(), name="ml-shadow-report"),
+    path(
+        "ml/threshold-simulation/",
+        ThresholdSimulationAPIView.as_view(),
+        name="ml-threshold-simulation",
+    ),
 ]
@@ -3,31 +3,75 @@
 
 from __future__ import annotations
 
+from datetime import datetime, time
+
+import orjson
+from django.conf import settings
+from django.db import transaction
 from django.db.models import Count
+from django.http import FileResponse, Http404, HttpResponse, StreamingHttpResponse
 from django.shortcuts import get_object_or_404
+from django.utils import timezone
+from rest_framework import status as http_status
+from rest_framework.exceptions import APIException, ValidationError
 from rest_framework.generics import CreateAPIView, ListCreateAPIView, RetrieveAPIView
 from rest_framework.parsers import FormParser, MultiPartParser
 from rest_framework.permissions import IsAuthenticated
-
-from policylens.apps.claims import services
+from rest_framework.renderers import BrowsableAPIRenderer
+from rest_framework.response import Response
+from rest_framework.views import APIView
+
+from policylens.apps.claims import (
+    audit_export,
+    audit_feed,
+    audit_search,
+    cursors,
+    entity_links,
+    evidence,
+    facets,
+    idempotency,
+    pdf_export,
+    services,
+    similarity,
+    timeline,
+)
+from policylens.apps.claims.api.filters import AuditEventFilter, ClaimListFilter
+from policylens.apps.claims.api.renderers import FastJSONRenderer, PDFRenderer
+from policylens.apps.claims.api.rows import CLAIM_LIST_ROWS, audit_row, timeline_row
 from policylens.apps.claims.api.serializers import (
+    AuditFeedQuerySerializer,
     ClaimDetailSerializer,
     ClaimDocumentSerializer,
     ClaimDocumentUploadSerializer,
     ClaimSerializer,
+    EvidenceBundleQuerySerializer,
     InternalNoteCreateSerializer,
     InternalNoteSerializer,
+    MlScoreSerializer,
+    ReviewDecisionBulkCreateSerializer,
     ReviewDecisionCreateSerializer,
     ReviewDecisionSerializer,
+    ScoreDriftQuerySerializer,
 )
+from policylens.apps.claims.api.streaming import stream_content
+from policylens.apps.claims.ml.batching import get_scoring_batcher, scoring_latency
+from policylens.apps.claims.ml.drift import Window, compare_windows
+from policylens.apps.claims.ml.scoring import get_model
+from policylens.apps.claims.ml.shadow import get_shadow_scorer, shadow_report
+from policylens.apps.claims.ml.simulation import distributions
 from policylens.apps.claims.models import (
+    AuditEvent,
     Claim,
     ClaimDocument,
+    HolderContactKey,
     InternalNote,
+    PolicyHolder,
     ReviewDecision,
 )
 from policylens.apps.claims.permissions import IsReviewerOrAdmin
 
+_NDJSON_OPTIONS = orjson.OPT_APPEND_NEWLINE | orjson.OPT_UTC_Z
+
 
 def _actor_from_request(request) -> str:
     """Return a stable actor id for audit events."""
@@ -37,24 +81,91 @@ def _actor_from_request(request) -> str:
     return "anonymous"
 
 
-class ClaimListCreateAPIView(ListCreateAPIView):
-    """List and create claims."""
+class IdempotentPostMixin:
+    """Honour an ``Idempotency-Key`` header on POST.
+
+    Successful responses are snapshotted per actor and key; retries replay the snapshot
+    instead of re-running the service call. Reusing a key for another endpoint or body is
+    rejected with a 422. Requests without the header are unaffected.
+    """
+
+    idempotency_header = "Idempotency-Key"
+
+    def post(self, request, *args, **kwargs):
+        """Run the write once per key and replay its response for retries."""
+        key = request.headers.get(self.idempotency_header)
+        if not key:
+            return super().post(request, *args, **kwargs)
+        if len(key) > idempotency.MAX_KEY_LENGTH:
+            raise ValidationError({"Idempotency-Key": "Key is too long."})
+
+        scope = {
+            "actor": _actor_from_request(request),
+            "key": key,
+            "method": request.method,
+            "path": request.path,
+            "request_fingerprint": idempotency.fingerprint(request.data),
+        }
+        try:
+            record = idempotency.lookup(**scope)
+            if record is None:
+                with transaction.atomic():
+                    record = idempotency.reserve(**scope)
+                    if record is not None:
+                        response = super().post(request, *args, **kwargs)
+                        idempotency.complete(
+                            record=record, status_code=response.status_code, body=response.data
+                        )
+                        return response
+                # A concurrent request with the same key committed first.
+                record = idempotency.lookup(**scope)
+        except idempotency.IdempotencyKeyMismatch as exc:
+            return Response({"detail": str(exc)}, status=http_status.HTTP_422_UNPROCESSABLE_ENTITY)
+
+        if record is None:
+            return Response(
+                {"detail": "A request with this Idempotency-Key is still in progress."},
+                status=http_status.HTTP_409_CONFLICT,
+            )
+
+        return Response(
+            record.response_body,
+            status=record.status_code,
+            headers={"Idempotent-Replayed": "true"},
+        )
+
+
+class ClaimListCreateAPIView(IdempotentPostMixin, ListCreateAPIView):
+    """List and create claims.
+
+    Listing uses a values()-based fast path with optional ``?fields=`` sparse fieldsets.
+    The output matches ClaimSerializer's read contract.
+    """
 
     serializer_class = ClaimSerializer
     permission_classes = [IsAuthenticated]
+    renderer_classes = [FastJSONRenderer, BrowsableAPIRenderer]
+    # ``?ordering=`` values; least complete first serves the review queue.
+    orderings = {
+        "-created_at": ("-created_at",),
+        "checklist_completeness": ("checklist_completeness", "created_at"),
+    }
 
     def get_queryset(self):
-        """Return queryset filtered by the canonical query parameters."""
+        """Return queryset filtered by the declarative, index-backed filter layer."""
         qs = Claim.objects.select_related("policy").all()
-        status = self.request.query_params.get("status")
-        priority = self.request.query_params.get("priority")
-
-        if status:
-            qs = qs.filter(status=status)
-        if priority:
-            qs = qs.filter(priority=priority)
+        qs = ClaimListFilter().filter_queryset(qs, self.request.query_params)
+        ordering = self.request.query_params.get("ordering") or "-created_at"
+        if ordering not in self.orderings:
+            raise ValidationError(
+                {"ordering": f"Choose one of: {', '.join(sorted(self.orderings))}."}
+            )
+        return qs.order_by(*self.orderings[ordering])
 
-        return qs.order_by("-created_at")
+    def list(self, request, *args, **kwargs):
+        """Return claim rows built straight from the narrowed values() query."""
+        fields = CLAIM_LIST_ROWS.parse_fieldset(request.query_params.get("fields"))
+        return Response(CLAIM_LIST_ROWS.build(self.get_queryset(), fields))
 
     def get_serializer_context(self):
         """Pass actor context into serializers for service-layer writes."""
@@ -63,6 +174,16 @@ class ClaimListCreateAPIView(ListCreateAPIView):
         return ctx
 
 
+class ClaimFacetsAPIView(APIView):
+    """Return dashboard facet counts from the incrementally maintained rollup."""
+
+    permission_classes = [IsAuthenticated]
+
+    def get(self, request, *args, **kwargs):
+        """Read counts by status, priority, claim type, and product type."""
+        return Response(facets.read_claim_facets())
+
+
 class ClaimRetrieveAPIView(RetrieveAPIView):
     """Retrieve claim detail."""
 
@@ -83,7 +204,78 @@ class ClaimRetrieveAPIView(RetrieveAPIView):
         )
 
 
-class ClaimDocumentUploadAPIView(CreateAPIView):
+class ClaimSimilarAPIView(APIView):
+    """List claims whose summaries nearly duplicate this claim's."""
+
+    permission_classes = [IsAuthenticated]
+    max_limit = 100
+
+    def get(self, request, claim_id: int, *args, **kwargs):
+        """Return near-duplicates ranked by estimated similarity."""
+        get_object_or_404(Claim.objects.only("pk"), pk=claim_id)
+        try:
+            limit = int(request.query_params.get("limit") or 20)
+        except ValueError as exc:
+            raise ValidationError({"limit": "A valid integer is required."}) from exc
+        limit = max(1, min(limit, self.max_limit))
+
+        matches = similarity.similar_claims(claim_id, limit=limit)
+        claims = Claim.objects.select_related("policy").in_bulk([m.claim_id for m in matches])
+        return Response(
+            {
+                "claim_id": claim_id,
+                "threshold": similarity.NEAR_DUPLICATE_THRESHOLD,
+                "results": [
+                    {
+                        "claim_id": match.claim_id,
+                        "similarity": round(match.similarity, 4),
+                        "policy_number": claims[match.claim_id].policy.policy_number,
+                        "status": claims[match.claim_id].status,
+                        "summary": claims[match.claim_id].summary,
+                        "created_at": claims[match.claim_id].created_at,
+                    }
+                    for match in matches
+                    if match.claim_id in claims
+                ],
+            }
+        )
+
+
+class ClaimTimelineAPIView(APIView):
+    """Return a claim's merged, keyset-paginated event timeline."""
+
+    permission_classes = [IsAuthenticated]
+    renderer_classes = [FastJSONRenderer, BrowsableAPIRenderer]
+
+    def get(self, request, claim_id: int, *args, **kwargs):
+        """Return one page of events after the ``after`` cursor."""
+        get_object_or_404(Claim.objects.only("pk"), pk=claim_id)
+
+        cursor = None
+        raw_cursor = request.query_params.get("after")
+        if raw_cursor:
+            try:
+                cursor = timeline.Cursor.decode(raw_cursor)
+            except cursors.InvalidCursor as exc:
+                raise ValidationError({"after": str(exc)}) from exc
+
+        try:
+            limit = int(request.query_params.get("limit") or timeline.DEFAULT_PAGE_SIZE)
+        except ValueError as exc:
+            raise ValidationError({"limit": "A valid integer is required."}) from exc
+
+        events, next_cursor = timeline.claim_timeline_page(
+            claim_id=claim_id, cursor=cursor, limit=limit
+        )
+        return Response(
+            {
+                "results": [timeline_row(event) for event in events],
+                "next": next_cursor.encode() if next_cursor else None,
+            }
+        )
+
+
+class ClaimDocumentUploadAPIView(IdempotentPostMixin, CreateAPIView):
     """Upload a document for a claim."""
 
     serializer_class = ClaimDocumentUploadSerializer
@@ -116,7 +308,7 @@ class ClaimDocumentUploadAPIView(CreateAPIView):
         return response
 
 
-class ClaimNoteCreateAPIView(CreateAPIView):
+class ClaimNoteCreateAPIView(IdempotentPostMixin, CreateAPIView):
     """Create an internal note for a claim."""
 
     serializer_class = InternalNoteCreateSerializer
@@ -148,7 +340,7 @@ class ClaimNoteCreateAPIView(CreateAPIView):
         return response
 
 
-class ClaimDecisionCreateAPIView(CreateAPIView):
+class ClaimDecisionCreateAPIView(IdempotentPostMixin, CreateAPIView):
     """Record a decision for a claim.
 
     Decisions are restricted to reviewer or admin roles.
@@ -181,3 +373,378 @@ class ClaimDecisionCreateAPIView(CreateAPIView):
         if decision is not None:
             response.data = ReviewDecisionSerializer(decision).data
         return response
+
+
+class ClaimDecisionBulkCreateAPIView(IdempotentPostMixin, CreateAPIView):
+    """Record one decision for a batch of claims.
+
+    Decisions are restricted to reviewer or admin roles. Already-decided and unknown claims
+    are skipped and reported rather than failing the batch.
+    """
+
+    serializer_class = ReviewDecisionBulkCreateSerializer
+    permission_classes = [IsAuthenticated, IsReviewerOrAdmin]
+
+    def get_serializer_context(self):
+        """Provide actor to serializer."""
+        ctx = super().get_serializer_context()
+        ctx["actor"] = _actor_from_request(self.request)
+        return ctx
+
+    def perform_create(self, serializer):
+        """Create decisions via domain service."""
+        self.created_object = serializer.save()
+
+    def create(self, request, *args, **kwargs):
+        """Return which claims were applied and which were skipped."""
+        response = super().create(request, *args, **kwargs)
+        result: services.BulkDecisionResult = self.created_object
+        response.data = {"applied": result.applied, "skipped": result.skipped}
+        return response
+
+
+class ClaimMlScoreAPIView(APIView):
+    """Score a claim online.
+
+    Concurrent requests in a worker are micro-batched into one vectorised scoring call.
+    """
+
+    permission_classes = [IsAuthenticated]
+
+    def post(self, request, claim_id: int, *args, **kwargs):
+        """Score the claim and return the persisted MlScore."""
+        get_object_or_404(Claim.objects.only("pk"), pk=claim_id)
+        score = get_scoring_batcher().submit((claim_id, _actor_from_request(request)))
+        if score is None:
+            raise Http404
+        return Response(MlScoreSerializer(score).data)
+
+
+class MlMetricsAPIView(APIView):
+    """Expose this worker's scoring latency and batching metrics."""
+
+    permission_classes = [IsAuthenticated]
+
+    def get(self, request, *args, **kwargs):
+        """Return scoring metrics for the serving process."""
+        return Response({"scoring": scoring_latency.snapshot()})
+
+
+class ShadowReportAPIView(APIView):
+    """Agreement and latency of a shadow candidate against the live model.
+
+    ``candidate_version`` defaults to the configured shadow model. Pool counters and
+    in-process latencies describe the worker that served the request.
+    """
+
+    permission_classes = [IsAuthenticated]
+
+    def get(self, request, *args, **kwargs):
+        """Return the comparison summary for one candidate."""
+        version = request.query_params.get("candidate_version") or (
+            settings.ML_SHADOW_MODEL_VERSION
+        )
+        if not version:
+            raise ValidationError({"candidate_version": "No shadow model is configured."})
+
+        report = shadow_report(version)
+        scorer = get_shadow_scorer()
+        if scorer is not None and scorer.candidate.version == version:
+            report["pool"] = scorer.counters()
+            report["shadow_latency"] = scorer.latency.snapshot()
+        report["live_latency"] = scoring_latency.snapshot()
+        return Response(report)
+
+
+class ThresholdSimulationAPIView(APIView):
+    """What-if sweep of score thresholds over every scored claim.
+
+    Query params: ``thresholds`` (comma-separated values in [0, 1]) or ``steps`` (an even
+    sweep from 0 to 1, default 101), and ``model_version`` (default: the live model).
+    """
+
+    permission_classes = [IsAuthenticated]
+    renderer_classes = [FastJSONRenderer, BrowsableAPIRenderer]
+    max_thresholds = 10_000
+
+    def _thresholds(self, request) -> list[float]:
+        """Parse and validate the requested thresholds."""
+        raw = request.query_params.get("thresholds")
+        if raw:
+            try:
+                values = [float(part) for part in raw.split(",") if part.strip()]
+            except ValueError as exc:
+                raise ValidationError({"thresholds": "Expected comma-separated numbers."}) from exc
+            if not values or any(not 0.0 <= value <= 1.0 for value in values):
+                raise ValidationError({"thresholds": "Thresholds must be between 0 and 1."})
+        else:
+            try:
+                steps = int(request.query_params.get("steps") or 101)
+            except ValueError as exc:
+                raise ValidationError({"steps": "A valid integer is required."}) from exc
+            if steps < 2:
+                raise ValidationError({"steps": "At least 2 steps are required."})
+            values = [i / (steps - 1) for i in range(steps)]
+
+        if len(values) > self.max_thresholds:
+            raise ValidationError(
+                {"thresholds": f"At most {self.max_thresholds} thresholds per request."}
+            )
+        return values
+
+    def get(self, request, *args, **kwargs):
+        """Return flagged counts, open workload, and precision/recall per threshold."""
+        thresholds = self._thresholds(request)
+        version = request.query_params.get("model_version") or get_model().version
+        distribution = distributions.get(version)
+        return Response(
+            {
+                "model_version": version,
+                "scored_claims": distribution.size,
+                "results": distribution.simulate(thresholds),
+            }
+        )
+
+
+class ScoreDriftAPIView(APIView):
+    """PSI and KS drift of the score distribution between two day windows.
+
+    Computed by merging daily score sketches for one model version (the active model's by
+    default, or every version with ``all_versions``), optionally for one product type;
+    MlScore is not scanned.
+    """
+
+    permission_classes = [IsAuthenticated]
+
+    def get(self, request, *args, **kwargs):
+        """Return drift statistics and per-window summaries."""
+        query = ScoreDriftQuerySerializer(data=request.query_params)
+        query.is_valid(raise_exception=True)
+        params = query.validated_data
+        return Response(
+            compare_windows(
+                baseline=Window(params["baseline_start"], params["baseline_end"]),
+                current=Window(params["current_start"], params["current_end"]),
+                model_version=params.get("model_version") or None,
+                all_versions=params["all_versions"],
+                product_type=params.get("product_type") or None,
+            )
+        )
+
+
+class HolderNetworkAPIView(APIView):
+    """A holder's entity cluster: holders linked through shared contact identifiers.
+
+    Cluster size and claim velocity are read from the maintained cluster row. Member and
+    shared-identifier listings are bounded to ``max_members`` holders.
+    """
+
+    permission_classes = [IsAuthenticated]
+    max_members = 50
+
+    def get(self, request, holder_id: int, *args, **kwargs):
+        """Return cluster statistics and a bounded member listing."""
+        holder = get_object_or_404(PolicyHolder.objects.select_related("cluster"), pk=holder_id)
+        cluster = holder.cluster
+        if cluster is None:
+            return Response(
+                {
+                    "holder_id": holder.pk,
+                    "cluster_id": None,
+                    "cluster_size": None,
+                    "claim_count": None,
+                    "claim_velocity": None,
+                    "members": [],
+                    "shared_identifiers": [],
+                }
+            )
+
+        members = list(
+            PolicyHolder.objects.filter(cluster=cluster)
+            .annotate(policy_count=Count("policies"))
+            .order_by("pk")
+            .values("pk", "full_name", "policy_count")[: self.max_members]
+        )
+        shared = (
+            HolderContactKey.objects.filter(holder_id__in=[m["pk"] for m in members])
+            .values("key")
+            .annotate(holders=Count("holder_id"))
+            .filter(holders__gt=1)
+            .order_by("-holders", "key")
+        )
+        return Response(
+            {
+                "holder_id": holder.pk,
+                "cluster_id": cluster.pk,
+                "cluster_size": cluster.size,
+                "claim_count": cluster.claim_count,
+                "claim_velocity": round(entity_links.velocity_now(cluster), 4),
+                "velocity_time_constant_days": entity_links.VELOCITY_TIME_CONSTANT.days,
+                "members": [
+                    {
+                        "holder_id": m["pk"],
+                        "full_name": m["full_name"],
+                        "policy_count": m["policy_count"],
+                    }
+                    for m in members
+                ],
+                "shared_identifiers": [
+                    {"type": row["key"].split(":", 1)[0], "holders": row["holders"]}
+                    for row in shared
+                ],
+            }
+        )
+
+
+class AuditFeedAPIView(APIView):
+    """Tail every audit event in id order as NDJSON.
+
+    ``after`` is the last id the consumer has processed. The response holds one compact JSON
+    object per line and an ``X-Feed-Next-After`` header to pass as the next ``after``. With
+    ``wait``, an empty page long-polls for up to that many seconds.
+    """
+
+    permission_classes = [IsAuthenticated, IsReviewerOrAdmin]
+    content_type = "application/x-ndjson"
+
+    def get(self, request, *args, **kwargs):
+        """Return the next page of events."""
+        query = AuditFeedQuerySerializer(data=request.query_params)
+        query.is_valid(raise_exception=True)
+        params = query.validated_data
+        events = audit_feed.poll(after=params["after"], limit=params["limit"], wait=params["wait"])
+
+        body = b"".join(orjson.dumps(event, option=_NDJSON_OPTIONS) for event in events)
+        response = HttpResponse(body, content_type=self.content_type)
+        response["X-Feed-Next-After"] = str(events[-1]["id"] if events else params["after"])
+        response["X-Feed-Count"] = str(len(events))
+        return response
+
+
+class AuditEventSearchAPIView(APIView):
+    """Search audit events across claims, newest first.
+
+    Filters: ``actor``, ``event_type``, ``claim_id``, ``created_after``/``created_before``, and
+    selected payload keys (``decision``, ``reason_code``, ``model_version``, ...). At least one
+    filter must be backed by an index; payload keys also need ``actor``, ``event_type``, or
+    ``claim_id``, and a payload search may return short pages before ``next`` is null. Pages are keyset-paginated: pass ``next`` as ``after``.
+    """
+
+    permission_classes = [IsAuthenticated, IsReviewerOrAdmin]
+    renderer_classes = [FastJSONRenderer, BrowsableAPIRenderer]
+
+    def get(self, request, *args, **kwargs):
+        """Return one page of matching events after the ``after`` cursor."""
+        queryset, payload = AuditEventFilter().split(AuditEvent.objects.all(), request.query_params)
+
+        cursor = None
+        raw_cursor = request.query_params.get("after")
+        if raw_cursor:
+            try:
+                cursor = audit_search.Cursor.decode(raw_cursor)
+            except cursors.InvalidCursor as exc:
+                raise ValidationError({"after": str(exc)}) from exc
+
+        try:
+            limit = int(request.query_params.get("limit") or audit_search.DEFAULT_PAGE_SIZE)
+        except ValueError as exc:
+            raise ValidationError({"limit": "A valid integer is required."}) from exc
+
+        events, next_cursor = audit_search.search_page(
+            queryset, payload=payload, cursor=cursor, limit=limit
+        )
+        return Response(
+            {
+                "results": [audit_row(event) for event in events],
+                "next": next_cursor.encode() if next_cursor else None,
+            }
+        )
+
+
+def _bundle_response(request, claims, filename: str) -> StreamingHttpResponse:
+    """Stream an evidence bundle ZIP for ``claims`` as a download."""
+    response = StreamingHttpResponse(
+        stream_content(request._request, evidence.stream_bundle(claims)),
+        content_type="application/zip",
+    )
+    response["Content-Disposition"] = f'attachment; filename="{filename}"'
+    response["X-Accel-Buffering"] = "no"
+    return response
+
+
+class ClaimEvidenceBundleAPIView(APIView):
+    """Download one claim's evidence bundle: records as JSON plus every document file."""
+
+    permission_classes = [IsAuthenticated, IsReviewerOrAdmin]
+
+    def get(self, request, claim_id: int, *args, **kwargs):
+        """Stream the bundle; the response starts before the archive is complete."""
+        get_object_or_404(Claim.objects.only("pk"), pk=claim_id)
+        return _bundle_response(
+            request, Claim.objects.filter(pk=claim_id), f"claim-{claim_id}-evidence.zip"
+        )
+
+
+class EvidenceBundleAPIView(APIView):
+    """Download the evidence bundles of every claim created in a date range as one ZIP."""
+
+    permission_classes = [IsAuthenticated, IsReviewerOrAdmin]
+
+    def get(self, request, *args, **kwargs):
+        """Stream one archive with a ``claim-<id>/`` folder per claim."""
+        query = EvidenceBundleQuerySerializer(data=request.query_params)
+        query.is_valid(raise_exception=True)
+        start, end = query.validated_data["created_after"], query.validated_data["created_before"]
+        claims = Claim.objects.filter(
+            created_at__gte=timezone.make_aware(datetime.combine(start, time.min)),
+            created_at__lt=timezone.make_aware(datetime.combine(end, time.min)),
+        )
+        return _bundle_response(
+            request, claims, f"evidence-{start.isoformat()}-{end.isoformat()}.zip"
+        )
+
+
+class PdfRenderUnavailable(APIException):
+    """The PDF could not be rendered in time; the client may retry."""
+
+    status_code = http_status.HTTP_503_SERVICE_UNAVAILABLE
+    default_detail = "The PDF could not be rendered right now. Try again shortly."
+    default_code = "pdf_render_unavailable"
+
+
+class ClaimAuditExportAPIView(APIView):
+    """Export a claim's audit evidence as JSON, or as PDF with ``?format=pdf``.
+
+    PDFs are rendered in a process pool and cached until the claim next changes. A render
+    that times out or loses its worker is reported as 503.
+    """
+
+    permission_classes = [IsAuthenticated, IsReviewerOrAdmin]
+    renderer_classes = [FastJSONRenderer, PDFRenderer, BrowsableAPIRenderer]
+
+    def handle_exception(self, exc):
+        """Report errors as JSON even when a PDF was requested."""
+        if getattr(self.request, "accepted_renderer", None) and isinstance(
+            self.request.accepted_renderer, PDFRenderer
+        ):
+            self.request.accepted_renderer = FastJSONRenderer()
+            self.request.accepted_media_type = FastJSONRenderer.media_type
+        return super().handle_exception(exc)
+
+    def get(self, request, claim_id: int, *args, **kwargs):
+        """Return the export in the negotiated format."""
+        if isinstance(request.accepted_renderer, PDFRenderer):
+            try:
+                handle = pdf_export.open_claim_pdf(claim_id)
+            except pdf_export.RenderUnavailable as exc:
+                raise PdfRenderUnavailable() from exc
+            if handle is None:
+                raise Http404
+            return FileResponse(
+                handle, content_type="application/pdf", filename=f"claim-{claim_id}-audit.pdf"
+            )
+
+        export = audit_export.build_export(claim_id)
+        if export is None:
+            raise Http404
+        return Response(export)
@@ -0,0 +1,151 @@
+"""
+Per-claim audit export.
+
+The export is one claim's record with its audit events, decisions, notes, and document
+metadata, as plain JSON-ready data. ``GET /api/claims/{id}/audit-export/`` serves it as JSON,
+and ``pdf_export`` renders the same data as a PDF.
+
+An export's version combines the id of the claim's latest audit event with a digest of the
+claim record. Documents, notes, and decisions are only added through the service layer,
+which appends an event for each, as do template backfills. The claim record also shows
+values that change without an event, though: the holder's name and the policy. The digest
+covers those.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+from collections.abc import Iterator
+from datetime import UTC, datetime
+from typing import Any
+
+from django.db.models import F, Max, OuterRef, QuerySet, Subquery
+
+from policylens.apps.claims.models import (
+    AuditEvent,
+    Claim,
+    ClaimDocument,
+    InternalNote,
+    ReviewDecision,
+)
+
+
+def _timestamp(value: datetime | None) -> str | None:
+    """Format a timestamp as UTC ISO 8601 with a ``Z`` suffix, as the API does."""
+    if value is None:
+        return None
+    return value.astimezone(UTC).isoformat().replace("+00:00", "Z")
+
+
+def _rows(queryset, *fields: str, timestamps: tuple[str, ...]) -> list[dict[str, Any]]:
+    """Return ``values()`` rows with timestamp columns formatted."""
+    rows = list(queryset.values(*fields))
+    for row in rows:
+        for name in timestamps:
+            row[name] = _timestamp(row[name])
+    return rows
+
+
+def latest_event_id(claim_id: int) -> int:
+    """Return the id of the claim's newest audit event, or 0 if it has none."""
+    return AuditEvent.objects.filter(claim_id=claim_id).aggregate(latest=Max("id"))["latest"] or 0
+
+
+def claim_records(claims: QuerySet[Claim]) -> QuerySet:
+    """Return ``values()`` rows of the claim fields an export shows."""
+    return claims.values(
+        "id",
+        "claim_type",
+        "status",
+        "priority",
+        "summary",
+        "checklist_completeness",
+        "created_by",
+        "created_at",
+        "updated_at",
+        policy_number=F("policy__policy_number"),
+        product_type=F("policy__product_type"),
+        holder_name=F("policy__holder__full_name"),
+    )
+
+
+def _format_claim(claim: dict[str, Any]) -> dict[str, Any]:
+    """Format a claim record's timestamps in place and return it."""
+    claim["created_at"] = _timestamp(claim["created_at"])
+    claim["updated_at"] = _timestamp(claim["updated_at"])
+    return claim
+
+
+def export_version(claim: dict[str, Any], event_id: int) -> str:
+    """Return the version of an export: its latest event id and a digest of the claim."""
+    digest = hashlib.sha256(json.dumps(claim, sort_keys=True, default=str).encode())
+    return f"{event_id}-{digest.hexdigest()[:16]}"
+
+
+def iter_versions(claims: QuerySet[Claim], *, chunk_size: int = 1000) -> Iterator[tuple[int, str]]:
+    """Yield ``(claim_id, export version)`` for each claim in primary key order."""
+    latest = AuditEvent.objects.filter(claim_id=OuterRef("pk")).order_by("-id").values("id")[:1]
+    rows = claim_records(claims).annotate(latest_event_id=Subquery(latest)).order_by("pk")
+    for claim in rows.iterator(chunk_size=chunk_size):
+        event_id = claim.pop("latest_event_id") or 0
+        yield claim["id"], export_version(_format_claim(claim), event_id)
+
+
+def current_version(claim_id: int) -> str | None:
+    """Return the version a fresh export of the claim would have, or None if it is missing."""
+    for _, version in iter_versions(Claim.objects.filter(pk=claim_id)):
+        return version
+    return None
+
+
+def build_export(claim_id: int) -> dict[str, Any] | None:
+    """Return the audit export for one claim, or None if it does not exist."""
+    claim = claim_records(Claim.objects.filter(pk=claim_id)).first()
+    if claim is None:
+        return None
+    _format_claim(claim)
+
+    events = _rows(
+        AuditEvent.objects.filter(claim_id=claim_id).order_by("created_at", "id"),
+        "id",
+        "event_type",
+        "actor",
+        "payload",
+        "created_at",
+        timestamps=("created_at",),
+    )
+    event_id = max((event["id"] for event in events), default=0)
+    return {
+        "claim": claim,
+        "latest_event_id": event_id,
+        "version": export_version(claim, event_id),
+        "audit_events": events,
+        "decisions": _rows(
+            ReviewDecision.objects.filter(claim_id=claim_id).order_by("decided_at", "id"),
+            "id",
+            "decision",
+            "notes",
+            "decided_by",
+            "decided_at",
+            timestamps=("decided_at",),
+        ),
+        "notes": _rows(
+            InternalNote.objects.filter(claim_id=claim_id).order_by("created_at", "id"),
+            "id",
+            "body",
+            "created_by",
+            "created_at",
+            timestamps=("created_at",),
+        ),
+        "documents": _rows(
+            ClaimDocument.objects.filter(claim_id=claim_id).order_by("uploaded_at", "id"),
+            "id",
+            "original_filename",
+            "content_type",
+            "size_bytes",
+            "uploaded_by",
+            "uploaded_at",
+            timestamps=("uploaded_at",),
+        ),
+    }
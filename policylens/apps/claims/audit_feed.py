@@ -0,0 +1,186 @@
+"""
+Change feed over every audit event.
+
+Consumers pass the last id they have seen and get the next events in primary key order: a
+keyset range scan on the primary key index whose cost depends only on the page size, never
+on how far into the table the consumer is. Ids are the cursor, so a consumer resumes after a
+crash by replaying from its last committed id.
+
+Long-polling consumers wait on a per-process watermark (the highest event id seen) instead
+of re-running the page query. One waiter at a time refreshes the watermark with an
+index-only ``max(id)`` probe, at most once per ``AUDIT_FEED_POLL_SECONDS``, and wakes the
+others; however many consumers are tailing, an idle feed costs one cheap probe per poll
+interval per process.
+
+Ids are assigned when a row is inserted, not when it commits, so a slow transaction can
+commit an id below one already served. Pages therefore stop at a commit horizon: the highest
+id that no transaction still in flight can be holding. The horizon pairs the id sequence's
+position with a later ``pg_current_snapshot()``: once every transaction that was running
+when that snapshot was taken has finished, every id up to that position has either
+committed or been lost to a rollback. This relies on each audit event being written after
+its transaction's first write, as all service-layer writes are, so the transaction has an
+id in the snapshot before it draws an event id. A long-running write transaction anywhere
+in the database holds the horizon back until it ends.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+
+from django.conf import settings
+from django.db import connection
+from django.db.models import Max, Model
+
+from policylens.apps.claims.models import AuditEvent
+
+FEED_COLUMNS = ("id", "claim_id", "event_type", "actor", "created_at", "payload")
+
+
+# Oldest transaction still running in the current snapshot (our own is never listed), and
+# the first transaction id the snapshot treats as not yet started.
+_SNAPSHOT_SQL = """
+    SELECT pg_snapshot_xmax(s)::text::bigint,
+           COALESCE(
+               (SELECT min(x::text::bigint) FROM pg_snapshot_xip(s) AS x),
+               pg_snapshot_xmax(s)::text::bigint
+           )
+    FROM pg_current_snapshot() AS s
+"""
+# Checkpoints kept while a long transaction holds the horizon back.
+_MAX_CHECKPOINTS = 64
+
+
+class CommitHorizon:
+    """Highest id of ``model`` known to be final, shared by this process's readers."""
+
+    def __init__(self, model: type[Model] = AuditEvent) -> None:
+        """Start at zero with no checkpoints."""
+        self.model = model
+        self._lock = threading.Lock()
+        self._settled = 0
+        # (first xid after the snapshot, last event id drawn before it), oldest first.
+        self._checkpoints: list[tuple[int, int]] = []
+
+    def refresh(self) -> int:
+        """Take a checkpoint, settle the finished ones, and return the horizon."""
+        with connection.cursor() as cursor:
+            # The sequence is read first: every id it has handed out belongs to a
+            # transaction the snapshot below already sees.
+            cursor.execute(
+                "SELECT pg_sequence_last_value(pg_get_serial_sequence(%s, 'id')::regclass)",
+                [self.model._meta.db_table],
+            )
+            last_id = cursor.fetchone()[0] or 0
+            cursor.execute(_SNAPSHOT_SQL)
+            xmax, oldest_running = cursor.fetchone()
+        with self._lock:
+            newest = self._checkpoints[-1][1] if self._checkpoints else self._settled
+            if last_id > newest:
+                if len(self._checkpoints) < _MAX_CHECKPOINTS:
+                    self._checkpoints.append((xmax, last_id))
+                else:
+                    # Merging into the newest checkpoint only delays it, never overstates it.
+                    self._checkpoints[-1] = (xmax, last_id)
+            while self._checkpoints and self._checkpoints[0][0] <= oldest_running:
+                self._settled = max(self._settled, self._checkpoints.pop(0)[1])
+            return self._settled
+
+    def settle(self, *, timeout: float) -> int:
+        """Wait until every id handed out so far is final, or ``timeout`` passes."""
+        deadline = time.monotonic() + timeout
+        horizon = self.refresh()
+        with self._lock:
+            target = self._checkpoints[-1][1] if self._checkpoints else horizon
+        while horizon < target and time.monotonic() < deadline:
+            time.sleep(settings.AUDIT_FEED_POLL_SECONDS)
+            horizon = self.refresh()
+        return horizon
+
+
+commit_horizon = CommitHorizon()
+
+
+def read_page(*, after: int, limit: int) -> list[dict]:
+    """Return up to ``limit`` committed events with ``id > after``, oldest first.
+
+    Events above the commit horizon are held back until every id below them is final.
+    """
+    horizon = commit_horizon.refresh()
+    if horizon <= after:
+        return []
+    rows = (
+        AuditEvent.objects.filter(pk__gt=after, pk__lte=horizon)
+        .order_by("pk")
+        .values_list(*FEED_COLUMNS)[:limit]
+    )
+    return [dict(zip(FEED_COLUMNS, row, strict=True)) for row in rows]
+
+
+class Watermark:
+    """Highest audit event id known to this process, shared by long-polling waiters."""
+
+    def __init__(self) -> None:
+        """Start unknown; the first waiter probes the database."""
+        self._cond = threading.Condition()
+        self._latest = 0
+        self._checked_at = float("-inf")
+        self._probing = False
+
+    def _probe(self) -> int:
+        """Read the current highest event id."""
+        return AuditEvent.objects.aggregate(latest=Max("pk"))["latest"] or 0
+
+    def wait_beyond(self, after: int, *, timeout: float) -> bool:
+        """Block until an event id above ``after`` is known or ``timeout`` seconds pass."""
+        poll = settings.AUDIT_FEED_POLL_SECONDS
+        deadline = time.monotonic() + timeout
+        with self._cond:
+            while self._latest <= after:
+                now = time.monotonic()
+                if now >= deadline:
+                    return False
+                due = self._checked_at + poll
+                if not self._probing and now >= due:
+                    self._probing = True
+                    self._cond.release()
+                    try:
+                        latest = self._probe()
+                    finally:
+                        self._cond.acquire()
+                        self._probing = False
+                        self._checked_at = time.monotonic()
+                    self._latest = max(self._latest, latest)
+                    self._cond.notify_all()
+                    continue
+                # Sleep until the next probe is due, or until the in-flight probe wakes us.
+                self._cond.wait(timeout=min(deadline - now, max(due - now, 0.0) or poll))
+            return True
+
+    def advance(self, event_id: int) -> None:
+        """Record a known event id and wake waiters behind it."""
+        with self._cond:
+            if event_id > self._latest:
+                self._latest = event_id
+                self._cond.notify_all()
+
+
+watermark = Watermark()
+
+
+def poll(*, after: int, limit: int, wait: float) -> list[dict]:
+    """Return the next page, long-polling up to ``wait`` seconds while it is empty."""
+    page = read_page(after=after, limit=limit)
+    deadline = time.monotonic() + wait
+    while not page:
+        remaining = deadline - time.monotonic()
+        if remaining <= 0 or not watermark.wait_beyond(after, timeout=remaining):
+            break
+        page = read_page(after=after, limit=limit)
+        if not page:
+            # Committed but behind a transaction still in flight: wait for it to finish.
+            pause = settings.AUDIT_FEED_POLL_SECONDS
+            time.sleep(min(pause, max(deadline - time.monotonic(), 0.0)))
+    if page:
+        watermark.advance(page[-1]["id"])
+    return page
@@ -0,0 +1,111 @@
+"""
+Investigative search over audit events.
+
+Filters are applied by ``AuditEventFilter``, which only admits combinations an index can
+drive. Results are newest first and keyset-paginated on ``(created_at, id)``: each page seeks
+past the cursor on the driving index's ``created_at`` column, so a deep page costs the same
+as the first when every filter is on the index.
+
+Payload keys are on no index. They are checked on the rows the ``actor``, ``event_type``, or
+``claim_id`` index yields past the cursor, and a page reads at most ``MAX_SCAN`` of those.
+A rare payload value can therefore leave a page short or empty with ``next`` still set;
+clients keep following ``next`` until it is null.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any
+
+from django.db.models import Q, QuerySet
+
+from policylens.apps.claims.audit_feed import FEED_COLUMNS
+from policylens.apps.claims.cursors import decode_cursor, encode_cursor
+
+DEFAULT_PAGE_SIZE = 100
+MAX_PAGE_SIZE = 1000
+# Indexed rows a payload search checks per page.
+MAX_SCAN = 10_000
+
+
+@dataclass(frozen=True)
+class Cursor:
+    """Position after the last (oldest) event of a page."""
+
+    created_at: datetime
+    id: int
+
+    def encode(self) -> str:
+        """Return an opaque URL-safe cursor string."""
+        return encode_cursor(self.created_at, self.id)
+
+    @classmethod
+    def decode(cls, value: str) -> Cursor:
+        """Parse a cursor produced by :meth:`encode`."""
+        created_at, pk = decode_cursor(value, int, label="search")
+        return cls(created_at=created_at, id=pk)
+
+
+def _before(cursor: Cursor) -> Q:
+    """Return ``(created_at, id) < cursor`` with a leading range on ``created_at``."""
+    return Q(created_at__lte=cursor.created_at) & (
+        Q(created_at__lt=cursor.created_at) | Q(id__lt=cursor.id)
+    )
+
+
+def _not_before(cursor: Cursor) -> Q:
+    """Return ``(created_at, id) >= cursor`` with a leading range on ``created_at``."""
+    return Q(created_at__gte=cursor.created_at) & (
+        Q(created_at__gt=cursor.created_at) | Q(id__gte=cursor.id)
+    )
+
+
+def matching(
+    queryset: QuerySet, *, payload: Q | None = None, cursor: Cursor | None = None
+) -> tuple[QuerySet, Cursor | None]:
+    """Return matches past ``cursor``, newest first, and the end of the scan window.
+
+    Without ``payload`` the window is unbounded and the end is None. With it, the window is
+    the next ``MAX_SCAN`` rows of ``queryset``; its last row is found with one offset probe
+    on the index and bounds the payload check to a ``created_at`` range.
+    """
+    if cursor is not None:
+        queryset = queryset.filter(_before(cursor))
+    queryset = queryset.order_by("-created_at", "-id")
+    if payload is None:
+        return queryset, None
+    end = None
+    for created_at, pk in queryset.values_list("created_at", "id")[MAX_SCAN - 1 : MAX_SCAN]:
+        end = Cursor(created_at=created_at, id=pk)
+    matches = queryset.filter(payload)
+    if end is not None:
+        matches = matches.filter(_not_before(end))
+    return matches, end
+
+
+def search_page(
+    queryset: QuerySet,
+    *,
+    payload: Q | None = None,
+    cursor: Cursor | None = None,
+    limit: int = DEFAULT_PAGE_SIZE,
+) -> tuple[list[dict[str, Any]], Cursor | None]:
+    """Return one page of filtered events, newest first, and the cursor for the next page.
+
+    ``queryset`` carries the index-backed filters and ``payload`` the payload-key predicate.
+    """
+    limit = max(1, min(limit, MAX_PAGE_SIZE))
+    matches, end = matching(queryset, payload=payload, cursor=cursor)
+    rows = matches.values_list(*FEED_COLUMNS)[: limit + 1]
+
+    events = [dict(zip(FEED_COLUMNS, row, strict=True)) for row in rows]
+    next_cursor = None
+    if len(events) > limit:
+        events = events[:limit]
+        last = events[-1]
+        next_cursor = Cursor(created_at=last["created_at"], id=last["id"])
+    elif end is not None:
+        # The window ran out before the page filled; resume after its last row.
+        next_cursor = end
+    return events, next_cursor
@@ -0,0 +1,199 @@
+"""
+Templated claim checklists.
+
+``ChecklistTemplate`` rows describe the items a new claim of a given type and product
+needs. ``create_claim`` copies them onto the claim with one ``bulk_create``; documents and
+notes then satisfy matching items as they arrive. ``Claim.checklist_completeness`` holds
+the percentage of required items satisfied and is rewritten with a single UPDATE whenever
+an item changes, so list filters and queue ordering read it without touching
+``ChecklistItem``.
+
+Template backfills append a CHECKLIST_ITEMS_ADDED audit event per claim they change, like
+every other claim write, so incremental consumers of the audit log (snapshots, the feed,
+live screens) see the new completeness.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterable, Sequence
+
+from django.db.models import Case, Count, IntegerField, OuterRef, Q, Subquery, Value, When
+from django.db.models.functions import Coalesce
+from django.db.models.lookups import Exact
+from django.utils import timezone
+
+from policylens.apps.claims import live, outbox
+from policylens.apps.claims.models import (
+    AuditEvent,
+    ChecklistItem,
+    ChecklistTemplate,
+    Claim,
+    ClaimDocument,
+    InternalNote,
+)
+
+Rule = ChecklistTemplate.Rule
+
+
+def templates_for(*, claim_type: str, product_type: str) -> list[ChecklistTemplate]:
+    """Return active templates for a claim type and product, in display order."""
+    rows = ChecklistTemplate.objects.filter(
+        Q(product_type="") | Q(product_type=product_type),
+        claim_type=claim_type,
+        is_active=True,
+    )
+    by_key: dict[str, ChecklistTemplate] = {}
+    for template in rows:
+        if template.key not in by_key or template.product_type:
+            by_key[template.key] = template
+    return sorted(by_key.values(), key=lambda t: (t.position, t.key))
+
+
+def completeness(*, required: int, satisfied: int) -> int:
+    """Percentage of required items satisfied, rounded down; 100 when nothing is required."""
+    return 100 if not required else satisfied * 100 // required
+
+
+def initial_completeness(templates: Sequence[ChecklistTemplate]) -> int:
+    """Completeness of a claim whose checklist was just created from ``templates``."""
+    return completeness(required=sum(t.is_required for t in templates), satisfied=0)
+
+
+def _items(claim_id: int, templates: Iterable[ChecklistTemplate]) -> list[ChecklistItem]:
+    """Unsaved checklist items for a claim."""
+    return [
+        ChecklistItem(
+            claim_id=claim_id,
+            key=t.key,
+            label=t.label,
+            is_required=t.is_required,
+            rule=t.rule,
+            match=t.match,
+        )
+        for t in templates
+    ]
+
+
+def instantiate_checklist(
+    *, claim: Claim, templates: Sequence[ChecklistTemplate]
+) -> list[ChecklistItem]:
+    """Create a new claim's checklist items with one INSERT."""
+    return ChecklistItem.objects.bulk_create(_items(claim.pk, templates))
+
+
+def _matches(match: str, *texts: str) -> bool:
+    """Return True if ``match`` is blank or occurs in any of ``texts``."""
+    needle = match.strip().lower()
+    return not needle or any(needle in (text or "").lower() for text in texts)
+
+
+def _satisfy(claim: Claim, rule: str, *texts: str) -> list[str]:
+    """Mark open items of ``rule`` matching ``texts`` satisfied; return their keys."""
+    open_items = ChecklistItem.objects.filter(claim=claim, is_satisfied=False, rule=rule)
+    hits = {
+        pk: key
+        for pk, key, match in open_items.values_list("pk", "key", "match")
+        if _matches(match, *texts)
+    }
+    if not hits:
+        return []
+    now = timezone.now()
+    ChecklistItem.objects.filter(pk__in=list(hits)).update(
+        is_satisfied=True, satisfied_at=now, updated_at=now
+    )
+    refresh_completeness([claim.pk])
+    return sorted(hits.values())
+
+
+def satisfy_from_document(*, claim: Claim, document: ClaimDocument) -> list[str]:
+    """Satisfy document items matching the upload's filename or content type."""
+    return _satisfy(claim, Rule.DOCUMENT, document.original_filename, document.content_type)
+
+
+def satisfy_from_note(*, claim: Claim, note: InternalNote) -> list[str]:
+    """Satisfy note items matching the note body."""
+    return _satisfy(claim, Rule.NOTE, note.body)
+
+
+def _count(items, **filters) -> Coalesce:
+    """Correlated count of a claim's checklist items, zero when there are none."""
+    counted = items.filter(**filters).annotate(n=Count("pk")).values("n")
+    return Coalesce(Subquery(counted, output_field=IntegerField()), Value(0))
+
+
+def refresh_completeness(claim_ids: Iterable[int]) -> int:
+    """Recompute ``checklist_completeness`` for claims with one UPDATE; return rows updated."""
+    items = ChecklistItem.objects.filter(claim=OuterRef("pk"), is_required=True).values("claim")
+    required = _count(items)
+    satisfied = _count(items, is_satisfied=True)
+    return Claim.objects.filter(pk__in=list(claim_ids)).update(
+        checklist_completeness=Case(
+            When(Exact(required, 0), then=Value(100)),
+            default=satisfied * 100 / required,
+        ),
+        updated_at=timezone.now(),
+    )
+
+
+def apply_templates(claim_ids: Sequence[int], *, actor: str = "system") -> int:
+    """Add missing template items to existing claims and satisfy them from their history.
+
+    Used to backfill claims created before a template existed. Each claim that gains items
+    gets a CHECKLIST_ITEMS_ADDED event. Returns the number of items created.
+    """
+    claims = list(
+        Claim.objects.filter(pk__in=claim_ids).values_list(
+            "pk", "claim_type", "policy__product_type"
+        )
+    )
+    cache: dict[tuple[str, str], list[ChecklistTemplate]] = {}
+    existing = set(
+        ChecklistItem.objects.filter(claim_id__in=claim_ids).values_list("claim_id", "key")
+    )
+    # Texts each rule matches against, per claim.
+    sources: dict[str, dict[int, list[tuple[str, ...]]]] = {Rule.DOCUMENT: {}, Rule.NOTE: {}}
+    for claim_id, *texts in ClaimDocument.objects.filter(claim_id__in=claim_ids).values_list(
+        "claim_id", "original_filename", "content_type"
+    ):
+        sources[Rule.DOCUMENT].setdefault(claim_id, []).append(tuple(texts))
+    for claim_id, body in InternalNote.objects.filter(claim_id__in=claim_ids).values_list(
+        "claim_id", "body"
+    ):
+        sources[Rule.NOTE].setdefault(claim_id, []).append((body,))
+
+    now = timezone.now()
+    new_items = []
+    for claim_id, claim_type, product_type in claims:
+        key = (claim_type, product_type)
+        if key not in cache:
+            cache[key] = templates_for(claim_type=claim_type, product_type=product_type)
+        missing = [t for t in cache[key] if (claim_id, t.key) not in existing]
+        for item in _items(claim_id, missing):
+            texts = sources[item.rule].get(claim_id, [])
+            item.is_satisfied = any(_matches(item.match, *text) for text in texts)
+            item.satisfied_at = now if item.is_satisfied else None
+            new_items.append(item)
+
+    ChecklistItem.objects.bulk_create(new_items, ignore_conflicts=True)
+    refresh_completeness([pk for pk, _, _ in claims])
+
+    added: dict[int, list[str]] = {}
+    for item in new_items:
+        added.setdefault(item.claim_id, []).append(item.key)
+    scores = dict(
+        Claim.objects.filter(pk__in=list(added)).values_list("pk", "checklist_completeness")
+    )
+    events = AuditEvent.objects.bulk_create(
+        [
+            AuditEvent(
+                claim_id=claim_id,
+                event_type="CHECKLIST_ITEMS_ADDED",
+                actor=actor,
+                payload={"keys": sorted(keys), "completeness": scores[claim_id]},
+            )
+            for claim_id, keys in added.items()
+        ]
+    )
+    outbox.enqueue(events)
+    live.publish_events(events)
+    return len(new_items)
@@ -0,0 +1,47 @@
+"""
+Opaque keyset cursors.
+
+A cursor is a timestamp followed by the tie-break keys of the last row of a page, JSON
+encoded and wrapped in unpadded URL-safe base64. The claim timeline and audit search both
+use this format, and each checks the keys it expects when decoding.
+"""
+
+from __future__ import annotations
+
+import base64
+import json
+from datetime import datetime
+from typing import Any
+
+from django.utils.dateparse import parse_datetime
+
+
+class InvalidCursor(ValueError):
+    """Raised when a cursor cannot be decoded."""
+
+
+def encode_cursor(position: datetime, *keys: str | int) -> str:
+    """Return an opaque URL-safe cursor for ``position`` and its tie-break keys."""
+    raw = json.dumps([position.isoformat(), *keys])
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+
+def decode_cursor(value: str, *types: type, label: str) -> tuple[Any, ...]:
+    """Parse a cursor from :func:`encode_cursor` whose keys have the given ``types``.
+
+    Returns the timestamp followed by the keys. ``label`` names the cursor in the error.
+    """
+    error = InvalidCursor(f"Malformed {label} cursor.")
+    try:
+        padded = value + "=" * (-len(value) % 4)
+        position, *keys = json.loads(base64.urlsafe_b64decode(padded))
+        parsed = parse_datetime(position)
+    except (ValueError, TypeError) as exc:
+        raise error from exc
+    if (
+        parsed is None
+        or len(keys) != len(types)
+        or not all(isinstance(key, kind) for key, kind in zip(keys, types, strict=True))
+    ):
+        raise error
+    return (parsed, *keys)
@@ -0,0 +1,305 @@
+"""
+Entity-link graph over holders, policies, and claims.
+
+Holders are linked when they share a normalised contact identifier. Linked holders form an
+``EntityCluster``; policies and claims join a cluster through their holder. The clusters
+are a union-find kept fully compressed: every holder row points at its cluster, and a merge
+re-points the smaller cluster's holders at the larger one. Cluster size, claim count, and
+an exponentially decayed claim velocity are maintained as holders and claims are written,
+so readers never self-join on contacts.
+
+Contact edits can also split a cluster. In that case the old cluster's members are
+re-partitioned in memory from their keys, which costs time proportional to the cluster.
+"""
+
+from __future__ import annotations
+
+import math
+import re
+import zlib
+from collections.abc import Iterable, Sequence
+from datetime import datetime, timedelta
+
+from django.db import connection
+from django.utils import timezone
+
+from policylens.apps.claims.models import (
+    Claim,
+    EntityCluster,
+    HolderContactKey,
+    Policy,
+    PolicyHolder,
+)
+
+# Time constant of the decayed claim velocity: a claim counts 1 now and 1/e after 30 days.
+VELOCITY_TIME_CONSTANT = timedelta(days=30)
+# Floor on a decay exponent; Postgres raises on exp() underflow instead of returning zero.
+_MIN_EXPONENT = -700.0
+
+_NON_DIGIT = re.compile(r"\D+")
+# Phone numbers are compared on their trailing national digits so "+44 7700 900001" and
+# "07700900001" meet.
+_PHONE_DIGITS = 10
+
+
+def normalise_email(email: str) -> str:
+    """Lowercase an email address and drop any ``+tag`` from the local part."""
+    email = (email or "").strip().lower()
+    local, _, domain = email.partition("@")
+    if not local or not domain:
+        return ""
+    return f"{local.split('+', 1)[0]}@{domain}"
+
+
+def normalise_phone(phone: str) -> str:
+    """Keep the trailing national digits of a phone number."""
+    digits = _NON_DIGIT.sub("", phone or "")
+    return digits[-_PHONE_DIGITS:] if len(digits) >= 7 else ""
+
+
+def contact_keys(*, email: str, phone: str) -> set[str]:
+    """Return the normalised identifier keys for a holder's contacts."""
+    keys = set()
+    if value := normalise_email(email):
+        keys.add(f"email:{value}")
+    if value := normalise_phone(phone):
+        keys.add(f"phone:{value}")
+    return keys
+
+
+def velocity_now(cluster: EntityCluster, now: datetime | None = None) -> float:
+    """Decay a cluster's stored claim velocity to ``now``."""
+    if not cluster.velocity_at or not cluster.claim_velocity:
+        return 0.0
+    now = now or timezone.now()
+    elapsed = max((now - cluster.velocity_at).total_seconds(), 0.0)
+    return cluster.claim_velocity * math.exp(-elapsed / VELOCITY_TIME_CONSTANT.total_seconds())
+
+
+def _refresh_claim_stats(cluster_ids: Sequence[int] | None = None) -> None:
+    """Recompute claim count and decayed velocity of clusters with one aggregate UPDATE.
+
+    Claims are counted and their decay weights summed per cluster in SQL. Covers every
+    cluster when ``cluster_ids`` is None; clusters without claims are set to zero.
+    """
+    qn = connection.ops.quote_name
+    clusters = qn(EntityCluster._meta.db_table)
+    claims = qn(Claim._meta.db_table)
+    policies = qn(Policy._meta.db_table)
+    holders = qn(PolicyHolder._meta.db_table)
+    now = timezone.now()
+    params: list[object] = [now, now, VELOCITY_TIME_CONSTANT.total_seconds(), _MIN_EXPONENT]
+    only_in, only = "", ""
+    if cluster_ids is not None:
+        only_in, only = "WHERE h.cluster_id = ANY(%s) ", " AND k.id = ANY(%s)"
+        params += [list(cluster_ids), list(cluster_ids)]
+    sql = (
+        f"UPDATE {clusters} AS c SET claim_count = COALESCE(s.n, 0), "
+        "claim_velocity = COALESCE(s.v, 0), velocity_at = %s "
+        f"FROM {clusters} AS k LEFT JOIN ("
+        "SELECT h.cluster_id, COUNT(*) AS n, SUM(exp(GREATEST("
+        "-GREATEST(extract(epoch FROM (%s - cl.created_at)), 0) / %s, %s))) AS v "
+        f"FROM {claims} AS cl JOIN {policies} AS p ON p.id = cl.policy_id "
+        f"JOIN {holders} AS h ON h.id = p.holder_id {only_in}GROUP BY h.cluster_id"
+        f") AS s ON s.cluster_id = k.id WHERE c.id = k.id{only}"
+    )
+    with connection.cursor() as cursor:
+        cursor.execute(sql, params)
+
+
+def _recount(cluster_ids: Iterable[int]) -> None:
+    """Recompute size and claim statistics of clusters from their members."""
+    cluster_ids = list(cluster_ids)
+    for cluster in EntityCluster.objects.filter(pk__in=cluster_ids):
+        cluster.size = PolicyHolder.objects.filter(cluster=cluster).count()
+        cluster.save(update_fields=["size"])
+    _refresh_claim_stats(cluster_ids)
+
+
+def _union(first: int, second: int) -> int:
+    """Merge two clusters, keeping the larger; return the surviving cluster id."""
+    if first == second:
+        return first
+    locked = list(
+        EntityCluster.objects.select_for_update().filter(pk__in=[first, second]).order_by("pk")
+    )
+    if len(locked) < 2:
+        return locked[0].pk if locked else first
+    keep, drop = sorted(locked, key=lambda c: (-c.size, c.pk))
+
+    now = timezone.now()
+    PolicyHolder.objects.filter(cluster=drop).update(cluster=keep)
+    keep.size += drop.size
+    keep.claim_count += drop.claim_count
+    keep.claim_velocity = velocity_now(keep, now) + velocity_now(drop, now)
+    keep.velocity_at = now
+    keep.save(update_fields=["size", "claim_count", "claim_velocity", "velocity_at"])
+    drop.delete()
+    return keep.pk
+
+
+def _split(cluster_id: int) -> None:
+    """Re-partition a cluster's holders into connected components of shared keys."""
+    EntityCluster.objects.select_for_update().filter(pk=cluster_id).first()
+    members = list(PolicyHolder.objects.filter(cluster_id=cluster_id).values_list("pk", flat=True))
+    parent = {pk: pk for pk in members}
+
+    def find(pk: int) -> int:
+        while parent[pk] != pk:
+            parent[pk] = parent[parent[pk]]
+            pk = parent[pk]
+        return pk
+
+    first_holder: dict[str, int] = {}
+    for holder_id, key in HolderContactKey.objects.filter(holder_id__in=members).values_list(
+        "holder_id", "key"
+    ):
+        if key in first_holder:
+            parent[find(holder_id)] = find(first_holder[key])
+        else:
+            first_holder[key] = holder_id
+
+    components: dict[int, list[int]] = {}
+    for pk in members:
+        components.setdefault(find(pk), []).append(pk)
+    if len(components) <= 1:
+        return
+
+    # The component holding the lowest holder id keeps the existing cluster row.
+    groups = sorted(components.values(), key=min)
+    touched = [cluster_id]
+    for group in groups[1:]:
+        cluster = EntityCluster.objects.create()
+        PolicyHolder.objects.filter(pk__in=group).update(cluster=cluster)
+        touched.append(cluster.pk)
+    _recount(touched)
+
+
+def _lock_keys(keys: Iterable[str]) -> None:
+    """Take a transaction-scoped advisory lock per contact key, in sorted order.
+
+    Two transactions adding the same key cannot see each other's uncommitted key rows, so
+    without the lock each would keep its own cluster. Sorting keeps linkers with overlapping
+    keys from deadlocking.
+    """
+    with connection.cursor() as cursor:
+        for key in sorted(keys):
+            cursor.execute(
+                "SELECT pg_advisory_xact_lock(%s, %s)",
+                [zlib.crc32(b"contact") - 2**31, zlib.crc32(key.encode()) - 2**31],
+            )
+
+
+def link_holder(holder: PolicyHolder) -> EntityCluster:
+    """Bring a holder's contact keys and cluster membership up to date.
+
+    Call inside the transaction that created or edited the holder.
+    """
+    keys = contact_keys(email=holder.email, phone=holder.phone)
+    existing = set(holder.contact_keys.values_list("key", flat=True))
+    _lock_keys(keys | existing)
+    removed = existing - keys
+    if removed:
+        holder.contact_keys.filter(key__in=removed).delete()
+    HolderContactKey.objects.bulk_create(
+        [HolderContactKey(holder=holder, key=key) for key in sorted(keys - existing)],
+        ignore_conflicts=True,
+    )
+
+    if holder.cluster_id is None:
+        holder.cluster = EntityCluster.objects.create()
+        holder.save(update_fields=["cluster"])
+        _recount([holder.cluster_id])
+    elif removed:
+        _split(holder.cluster_id)
+        holder.refresh_from_db(fields=["cluster"])
+
+    others = (
+        PolicyHolder.objects.filter(contact_keys__key__in=keys, cluster__isnull=False)
+        .exclude(cluster_id=holder.cluster_id)
+        .values_list("cluster_id", flat=True)
+        .distinct()
+    )
+    cluster_id = holder.cluster_id
+    for other in sorted(set(others)):
+        cluster_id = _union(cluster_id, other)
+    holder.cluster_id = cluster_id
+    return EntityCluster.objects.get(pk=cluster_id)
+
+
+def record_claim(claim: Claim) -> None:
+    """Count a new claim against its holder's cluster with one UPDATE."""
+    holder_id = claim.policy.holder_id
+    cluster_id = PolicyHolder.objects.filter(pk=holder_id).values_list("cluster_id", flat=True)[0]
+    if cluster_id is None:
+        # Holders created before linking existed join a cluster on their first claim,
+        # whose statistics then already include this claim.
+        link_holder(PolicyHolder.objects.get(pk=holder_id))
+        return
+
+    table = connection.ops.quote_name(EntityCluster._meta.db_table)
+    sql = (
+        f"UPDATE {table} SET claim_count = claim_count + 1, "
+        "claim_velocity = CASE WHEN velocity_at IS NULL THEN 1.0 ELSE "
+        "claim_velocity * exp(-GREATEST(extract(epoch FROM (%s - velocity_at)), 0) / %s) + 1.0 "
+        "END, velocity_at = %s WHERE id = %s"
+    )
+    now = timezone.now()
+    with connection.cursor() as cursor:
+        cursor.execute(sql, [now, VELOCITY_TIME_CONSTANT.total_seconds(), now, cluster_id])
+
+
+def rebuild_entity_links(*, chunk_size: int = 5000) -> int:
+    """Recompute contact keys and clusters for every holder from scratch.
+
+    Runs an in-memory union-find over all contact keys while writing the keys back in
+    chunks, then writes clusters in one pass and their claim statistics with one aggregate
+    UPDATE. Returns the number of clusters created.
+    """
+    parent: dict[int, int] = {}
+
+    def find(pk: int) -> int:
+        while parent[pk] != pk:
+            parent[pk] = parent[parent[pk]]
+            pk = parent[pk]
+        return pk
+
+    HolderContactKey.objects.all().delete()
+    first_holder: dict[str, int] = {}
+    key_rows: list[HolderContactKey] = []
+    holders = PolicyHolder.objects.order_by("pk").values_list("pk", "email", "phone")
+    for pk, email, phone in holders.iterator(chunk_size=chunk_size):
+        parent[pk] = pk
+        for key in contact_keys(email=email, phone=phone):
+            key_rows.append(HolderContactKey(holder_id=pk, key=key))
+            if key in first_holder:
+                root, other = find(pk), find(first_holder[key])
+                parent[max(root, other)] = min(root, other)
+            else:
+                first_holder[key] = pk
+        if len(key_rows) >= chunk_size:
+            HolderContactKey.objects.bulk_create(key_rows)
+            key_rows = []
+    HolderContactKey.objects.bulk_create(key_rows)
+
+    PolicyHolder.objects.update(cluster=None)
+    EntityCluster.objects.all().delete()
+
+    components: dict[int, list[int]] = {}
+    for pk in parent:
+        components.setdefault(find(pk), []).append(pk)
+    clusters = EntityCluster.objects.bulk_create(
+        [EntityCluster(size=len(members)) for members in components.values()],
+        batch_size=chunk_size,
+    )
+    PolicyHolder.objects.bulk_update(
+        [
+            PolicyHolder(pk=pk, cluster_id=cluster.pk)
+            for cluster, members in zip(clusters, components.values(), strict=True)
+            for pk in members
+        ],
+        ["cluster"],
+        batch_size=chunk_size,
+    )
+    _refresh_claim_stats()
+    return len(clusters)
@@ -0,0 +1,145 @@
+"""
+Incrementally maintained claim facet counts.
+
+Dashboards read counts by status, priority, claim type, and product type from a small
+rollup table instead of grouping over Claim on every page load. The service layer applies
+delta upserts in the same transaction as the write that changes a claim's facets.
+"""
+
+from __future__ import annotations
+
+from collections import Counter
+from collections.abc import Iterator, Mapping
+
+from django.db import connection, transaction
+from django.utils import timezone
+
+from policylens.apps.claims.models import Claim, ClaimFacetCount
+
+FACET_FIELDS = ("status", "priority", "claim_type", "product_type")
+
+FacetKey = tuple[str, str, str, str]
+
+
+def claim_facet_key(*, claim: Claim, status: str | None = None) -> FacetKey:
+    """Return the facet tuple for a claim, optionally overriding its status."""
+    return (
+        status or claim.status,
+        claim.priority,
+        claim.claim_type,
+        claim.policy.product_type,
+    )
+
+
+def apply_facet_delta(*, key: FacetKey, delta: int) -> None:
+    """Add ``delta`` to the count for a facet tuple, creating the row if needed.
+
+    Uses a single INSERT ... ON CONFLICT statement so concurrent writers never lose updates.
+    """
+    if not delta:
+        return
+
+    table = connection.ops.quote_name(ClaimFacetCount._meta.db_table)
+    columns = ", ".join(connection.ops.quote_name(name) for name in FACET_FIELDS)
+    sql = (
+        f"INSERT INTO {table} ({columns}, count, updated_at) "
+        "VALUES (%s, %s, %s, %s, %s, %s) "
+        f"ON CONFLICT ({columns}) DO UPDATE "
+        f"SET count = {table}.count + EXCLUDED.count, updated_at = EXCLUDED.updated_at"
+    )
+    with connection.cursor() as cursor:
+        cursor.execute(sql, [*key, delta, timezone.now()])
+
+
+def apply_facet_deltas(deltas: Mapping[FacetKey, int]) -> None:
+    """Apply several facet deltas in one canonical order.
+
+    Each upsert locks its row until the transaction ends, so every writer touching more than
+    one row goes through here in sorted key order; otherwise two writers moving claims in
+    opposite directions could deadlock.
+    """
+    for key, delta in sorted(deltas.items()):
+        apply_facet_delta(key=key, delta=delta)
+
+
+def move_claim_facet(*, claim: Claim, from_status: str, to_status: str) -> None:
+    """Move a claim between status facets after a status transition."""
+    if from_status == to_status:
+        return
+    apply_facet_deltas(
+        {
+            claim_facet_key(claim=claim, status=from_status): -1,
+            claim_facet_key(claim=claim, status=to_status): 1,
+        }
+    )
+
+
+def read_claim_facets() -> dict[str, object]:
+    """Return per-dimension counts summed from the rollup table.
+
+    The table holds at most one row per facet tuple, so this is bounded by the number of
+    distinct combinations rather than the number of claims.
+    """
+    totals: dict[str, Counter[str]] = {name: Counter() for name in FACET_FIELDS}
+    total = 0
+    rows = ClaimFacetCount.objects.filter(count__gt=0).values_list(*FACET_FIELDS, "count")
+    for *key, count in rows:
+        for name, value in zip(FACET_FIELDS, key, strict=True):
+            totals[name][value] += count
+        total += count
+
+    return {
+        "total": total,
+        **{name: dict(sorted(counter.items())) for name, counter in totals.items()},
+    }
+
+
+def _iter_claim_facet_chunks(*, chunk_size: int) -> Iterator[list[tuple[int, str, str, str, str]]]:
+    """Yield claim facet rows in primary key order using keyset pagination."""
+    last_pk = 0
+    while True:
+        chunk = list(
+            Claim.objects.filter(pk__gt=last_pk)
+            .order_by("pk")
+            .values_list("pk", "status", "priority", "claim_type", "policy__product_type")[
+                :chunk_size
+            ]
+        )
+        if not chunk:
+            return
+        yield chunk
+        last_pk = chunk[-1][0]
+
+
+def rebuild_claim_facets(*, chunk_size: int = 5000) -> int:
+    """Recount facets from Claim in chunks and replace the rollup table atomically.
+
+    The rollup table is locked in SHARE ROW EXCLUSIVE mode before counting. That waits for
+    transactions that have already applied a delta, so their claims are committed and
+    counted, and holds back new deltas until the replacement commits, so none is applied to
+    rows about to be replaced. Service writes apply their delta last, so the claims they
+    wait with are still uncommitted and not in the count. Reads of the rollup are not
+    blocked.
+
+    Returns the number of claims counted.
+    """
+    counts: Counter[FacetKey] = Counter()
+    scanned = 0
+    with transaction.atomic():
+        table = connection.ops.quote_name(ClaimFacetCount._meta.db_table)
+        with connection.cursor() as cursor:
+            cursor.execute(f"LOCK TABLE {table} IN SHARE ROW EXCLUSIVE MODE")
+        for chunk in _iter_claim_facet_chunks(chunk_size=chunk_size):
+            for _pk, *key in chunk:
+                counts[tuple(key)] += 1
+            scanned += len(chunk)
+
+        ClaimFacetCount.objects.all().delete()
+        ClaimFacetCount.objects.bulk_create(
+            [
+                ClaimFacetCount(**dict(zip(FACET_FIELDS, key, strict=True)), count=count)
+                for key, count in counts.items()
+            ],
+            batch_size=chunk_size,
+        )
+    return scanned
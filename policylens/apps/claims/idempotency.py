@@ -0,0 +1,116 @@
+"""
+Idempotency-Key storage for claim write endpoints.
+
+A retry with a known key costs one indexed read and replays the stored response. The first
+request for a key inserts its row inside the write transaction; a concurrent duplicate blocks
+on the unique constraint until that transaction ends, then replays the committed snapshot or,
+if the first attempt rolled back, runs as the first attempt itself.
+
+Each key is bound to a fingerprint of the request body, so reusing a key for a different
+payload is rejected instead of silently replaying the first response.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+from datetime import timedelta
+from typing import Any
+
+from django.conf import settings
+from django.core.files.uploadedfile import UploadedFile
+from django.db import IntegrityError, transaction
+from django.utils import timezone
+
+from policylens.apps.claims.models import IdempotencyKey
+
+MAX_KEY_LENGTH = 255
+
+
+class IdempotencyKeyMismatch(Exception):
+    """Raised when a key is reused for a different endpoint, method, or request body."""
+
+
+def _canonical(value: Any) -> Any:
+    """JSON fallback for fingerprints: uploaded files count by name and content."""
+    if isinstance(value, UploadedFile):
+        digest = hashlib.sha256()
+        for chunk in value.chunks():
+            digest.update(chunk)
+        value.seek(0)
+        return {"name": value.name, "sha256": digest.hexdigest()}
+    return str(value)
+
+
+def fingerprint(data: Any) -> str:
+    """Return a stable hash of a parsed request body.
+
+    Works on parsed data rather than raw bytes so multipart uploads are hashed in chunks
+    and key order in JSON bodies does not matter.
+    """
+    if hasattr(data, "lists"):
+        data = dict(data.lists())
+    canonical = json.dumps(data, sort_keys=True, separators=(",", ":"), default=_canonical)
+    return hashlib.sha256(canonical.encode()).hexdigest()
+
+
+def lookup(
+    *, actor: str, key: str, method: str, path: str, request_fingerprint: str
+) -> IdempotencyKey | None:
+    """Return the live record for a key, or None if it is unknown or expired."""
+    record = IdempotencyKey.objects.filter(
+        actor=actor, key=key, expires_at__gt=timezone.now()
+    ).first()
+    if record is not None and (record.method, record.path) != (method, path):
+        raise IdempotencyKeyMismatch("Idempotency-Key was already used for a different request.")
+    # Rows stored before fingerprints were recorded have none to compare.
+    if record is not None and record.request_fingerprint not in ("", request_fingerprint):
+        raise IdempotencyKeyMismatch(
+            "Idempotency-Key was already used with a different request body."
+        )
+    return record
+
+
+def reserve(
+    *, actor: str, key: str, method: str, path: str, request_fingerprint: str
+) -> IdempotencyKey | None:
+    """Insert the key row in the current transaction.
+
+    Returns None if another request already holds the key. Must be called inside an atomic
+    block that also wraps the guarded write.
+    """
+    now = timezone.now()
+    IdempotencyKey.objects.filter(actor=actor, key=key, expires_at__lte=now).delete()
+    try:
+        with transaction.atomic():
+            return IdempotencyKey.objects.create(
+                actor=actor,
+                key=key,
+                method=method,
+                path=path,
+                request_fingerprint=request_fingerprint,
+                expires_at=now + timedelta(seconds=settings.IDEMPOTENCY_KEY_TTL_SECONDS),
+            )
+    except IntegrityError:
+        return None
+
+
+def complete(*, record: IdempotencyKey, status_code: int, body: Any) -> None:
+    """Store the response snapshot for later replays."""
+    record.status_code = status_code
+    record.response_body = body
+    record.save(update_fields=["status_code", "response_body"])
+
+
+def purge_expired(*, chunk_size: int = 5000) -> int:
+    """Delete expired keys in bounded chunks and return the number removed."""
+    removed = 0
+    while True:
+        pks = list(
+            IdempotencyKey.objects.filter(expires_at__lte=timezone.now()).values_list(
+                "pk", flat=True
+            )[:chunk_size]
+        )
+        if not pks:
+            return removed
+        removed += IdempotencyKey.objects.filter(pk__in=pks).delete()[0]
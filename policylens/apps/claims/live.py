@@ -0,0 +1,229 @@
+"""
+Live change notifications over Postgres LISTEN/NOTIFY.
+
+Publishing: the service layer calls ``publish_events`` next to every audit write. The
+``pg_notify`` calls run inside the write's transaction, so Postgres delivers them only when
+that transaction commits, and drops them on rollback. Payloads are compact JSON naming the
+event type and the claim ids it touched.
+
+Subscribing: each process holds one ``Broadcaster``, whose listener thread owns a single
+dedicated connection that LISTENs on every channel. Notifications are fanned out in memory
+to per-client bounded queues, so however many browsers a worker streams to, it holds one
+database connection for them. A client that falls behind has its queue dropped and receives
+a ``resync`` message telling it to reload, rather than slowing everyone else down.
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+import queue
+import threading
+from collections import defaultdict
+from collections.abc import Iterable, Sequence
+from dataclasses import dataclass, field
+
+import orjson
+import psycopg
+from django.db import connection, connections
+
+from policylens.apps.claims.models import AuditEvent
+
+logger = logging.getLogger(__name__)
+
+# Public channel name -> Postgres channel.
+CLAIMS = "claims"
+QUEUE = "queue"
+SLA = "sla"
+CHANNELS = {CLAIMS: "policylens_claims", QUEUE: "policylens_queue", SLA: "policylens_sla"}
+_PUBLIC = {pg: name for name, pg in CHANNELS.items()}
+
+# Audit events that change what belongs in, or the order of, the review queue.
+QUEUE_EVENT_TYPES = frozenset(
+    {"CLAIM_CREATED", "DECISION_RECORDED", "CHECKLIST_ITEMS_SATISFIED", "CHECKLIST_ITEMS_ADDED"}
+)
+SLA_EVENT_TYPES = frozenset({"SLA_BREACHED"})
+
+# Postgres caps a payload at 8000 bytes; chunks of ids stay well below it.
+_IDS_PER_PAYLOAD = 500
+_RECONNECT_SECONDS = 2.0
+# How often the listener thread checks whether it has been closed.
+_WAKE_SECONDS = 1.0
+
+
+def _payloads(event_type: str, claim_ids: Sequence[int]) -> list[str]:
+    """Encode notifications for ``claim_ids``, split to fit the payload limit."""
+    return [
+        orjson.dumps(
+            {"event": event_type, "claim_ids": list(claim_ids[i : i + _IDS_PER_PAYLOAD])}
+        ).decode()
+        for i in range(0, len(claim_ids), _IDS_PER_PAYLOAD)
+    ]
+
+
+def publish_events(events: Iterable[AuditEvent]) -> None:
+    """Notify subscribers about audit events once the current transaction commits."""
+    by_type: dict[str, list[int]] = defaultdict(list)
+    for event in events:
+        by_type[event.event_type].append(event.claim_id)
+    notifications = []
+    for event_type, claim_ids in sorted(by_type.items()):
+        ids = sorted(set(claim_ids))
+        channels = [CLAIMS]
+        if event_type in QUEUE_EVENT_TYPES:
+            channels.append(QUEUE)
+        if event_type in SLA_EVENT_TYPES:
+            channels.append(SLA)
+        for payload in _payloads(event_type, ids):
+            notifications.extend((CHANNELS[channel], payload) for channel in channels)
+    if not notifications:
+        return
+    sql = "SELECT " + ", ".join(["pg_notify(%s, %s)"] * len(notifications))
+    with connection.cursor() as cursor:
+        cursor.execute(sql, [value for pair in notifications for value in pair])
+
+
+@dataclass(eq=False)
+class Subscription:
+    """One connected client: the channels it wants and its pending messages."""
+
+    channels: frozenset[str]
+    claim_id: int | None = None
+    queue: queue.Queue = field(default_factory=queue.Queue)
+
+    def wants(self, channel: str, claim_ids: Sequence[int]) -> bool:
+        """Return True if a notification is for this client."""
+        if channel not in self.channels:
+            return False
+        return self.claim_id is None or self.claim_id in claim_ids
+
+
+def _connection_kwargs() -> dict:
+    """psycopg connection arguments for the default database, minus Django's hooks."""
+    params = connections["default"].get_connection_params()
+    params.pop("cursor_factory", None)
+    params.pop("context", None)
+    return params
+
+
+class Broadcaster:
+    """Fan notifications from one LISTEN connection out to many subscriptions."""
+
+    def __init__(self, *, buffer: int) -> None:
+        """Create an idle broadcaster; it connects on the first subscription."""
+        self.buffer = buffer
+        self._subscriptions: set[Subscription] = set()
+        self._lock = threading.Lock()
+        self._thread: threading.Thread | None = None
+        self._listening = threading.Event()
+        self._stopping = threading.Event()
+
+    @property
+    def subscriber_count(self) -> int:
+        """Number of connected clients."""
+        return len(self._subscriptions)
+
+    def subscribe(
+        self, *, channels: Iterable[str], claim_id: int | None = None, timeout: float = 10.0
+    ) -> Subscription:
+        """Register a client and return once the LISTEN connection is up."""
+        subscription = Subscription(
+            channels=frozenset(channels),
+            claim_id=claim_id,
+            queue=queue.Queue(maxsize=self.buffer),
+        )
+        with self._lock:
+            self._subscriptions.add(subscription)
+            if self._thread is None or not self._thread.is_alive():
+                self._listening.clear()
+                self._stopping.clear()
+                self._thread = threading.Thread(
+                    target=self._listen, name="live-listen", daemon=True
+                )
+                self._thread.start()
+        self._listening.wait(timeout)
+        return subscription
+
+    def unsubscribe(self, subscription: Subscription) -> None:
+        """Forget a disconnected client."""
+        with self._lock:
+            self._subscriptions.discard(subscription)
+
+    def _deliver(self, subscription: Subscription, message: tuple[str, str]) -> None:
+        """Queue a message, replacing a full backlog with a single resync."""
+        try:
+            subscription.queue.put_nowait(message)
+        except queue.Full:
+            try:
+                while True:
+                    subscription.queue.get_nowait()
+            except queue.Empty:
+                pass
+            subscription.queue.put_nowait(("resync", "{}"))
+
+    def fan_out(self, pg_channel: str, payload: str) -> int:
+        """Deliver one notification to every interested client; return how many."""
+        channel = _PUBLIC.get(pg_channel)
+        if channel is None:
+            return 0
+        try:
+            claim_ids = orjson.loads(payload).get("claim_ids", [])
+        except orjson.JSONDecodeError:
+            claim_ids = []
+        with self._lock:
+            subscriptions = list(self._subscriptions)
+        delivered = 0
+        for subscription in subscriptions:
+            if subscription.wants(channel, claim_ids):
+                self._deliver(subscription, (channel, payload))
+                delivered += 1
+        return delivered
+
+    def _listen(self) -> None:
+        """Hold the LISTEN connection until stopped, reconnecting after failures."""
+        while not self._stopping.is_set():
+            try:
+                with psycopg.connect(**_connection_kwargs(), autocommit=True) as conn:
+                    for pg_channel in CHANNELS.values():
+                        conn.execute(f"LISTEN {pg_channel}")
+                    self._listening.set()
+                    while not self._stopping.is_set():
+                        for notify in conn.notifies(timeout=_WAKE_SECONDS):
+                            self.fan_out(notify.channel, notify.payload)
+            except (psycopg.Error, OSError):
+                logger.exception("Live notification listener lost its connection.")
+                # Anything may have been missed while disconnected.
+                with self._lock:
+                    subscriptions = list(self._subscriptions)
+                for subscription in subscriptions:
+                    self._deliver(subscription, ("resync", "{}"))
+                self._listening.set()
+                self._stopping.wait(_RECONNECT_SECONDS)
+
+    def close(self) -> None:
+        """Stop listening and drop every subscription."""
+        with self._lock:
+            self._subscriptions.clear()
+            thread, self._thread = self._thread, None
+        self._stopping.set()
+        if thread is not None:
+            thread.join()
+
+
+_broadcaster: Broadcaster | None = None
+_broadcaster_pid = 0
+_broadcaster_lock = threading.Lock()
+
+
+def get_broadcaster(*, buffer: int) -> Broadcaster:
+    """Return this process's broadcaster.
+
+    A process forked from one that was already listening (a preloading server) starts its
+    own, since the listener thread does not survive the fork.
+    """
+    global _broadcaster, _broadcaster_pid
+    with _broadcaster_lock:
+        if _broadcaster is None or _broadcaster_pid != os.getpid():
+            _broadcaster = Broadcaster(buffer=buffer)
+            _broadcaster_pid = os.getpid()
+        return _broadcaster
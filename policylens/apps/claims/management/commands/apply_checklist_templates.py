@@ -0,0 +1,42 @@
+"""
+Add checklist template items to existing claims.
+
+``create_claim`` instantiates checklists at intake. Run this after adding or changing
+templates so older claims gain the new items, already satisfied by any matching documents
+and notes, and have their completeness recomputed.
+"""
+
+from __future__ import annotations
+
+from itertools import islice
+
+from django.core.management.base import BaseCommand
+from django.db import transaction
+
+from policylens.apps.claims.checklists import apply_templates
+from policylens.apps.claims.models import Claim
+
+
+class Command(BaseCommand):
+    """Backfill checklist items from the active templates."""
+
+    help = "Create missing ChecklistItem rows from ChecklistTemplate for existing claims."
+
+    def add_arguments(self, parser) -> None:
+        """Register command options."""
+        parser.add_argument(
+            "--chunk-size",
+            type=int,
+            default=1000,
+            help="Claims processed per transaction.",
+        )
+
+    def handle(self, *args, **options) -> None:
+        """Walk claims in primary key order, one transaction per chunk."""
+        chunk_size = options["chunk_size"]
+        ids = Claim.objects.order_by("pk").values_list("pk", flat=True).iterator(chunk_size)
+        created = 0
+        while chunk := list(islice(ids, chunk_size)):
+            with transaction.atomic():
+                created += apply_templates(chunk)
+        self.stdout.write(self.style.SUCCESS(f"Created {created} checklist items."))
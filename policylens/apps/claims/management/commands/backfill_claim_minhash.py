@@ -0,0 +1,94 @@
+"""
+Backfill MinHash signatures and LSH buckets for existing claims.
+
+New claims are indexed by ``create_claim``. This command indexes history in primary key
+ranges across a pool of worker processes, then recounts near-duplicates for every indexed
+claim once all buckets exist, and marks claims with matches for rescoring.
+"""
+
+from __future__ import annotations
+
+import multiprocessing
+from collections.abc import Callable
+from concurrent.futures import ProcessPoolExecutor
+
+from django.core.management.base import BaseCommand
+from django.db import connections, transaction
+from django.db.models import Max, Min
+
+from policylens.apps.claims import similarity
+from policylens.apps.claims.ml.rescoring import mark_claims_dirty
+from policylens.apps.claims.models import Claim
+
+
+def _in_transaction(fn: Callable, start: int, stop: int):
+    """Run one range in its own transaction."""
+    with transaction.atomic():
+        return fn(start, stop)
+
+
+def _in_worker(fn: Callable, start: int, stop: int):
+    """Run one range in a pool process and release that process's connection."""
+    try:
+        return _in_transaction(fn, start, stop)
+    finally:
+        connections.close_all()
+
+
+class Command(BaseCommand):
+    """Index claim summaries for near-duplicate search."""
+
+    help = "Compute MinHash signatures and LSH buckets for claims in parallel."
+
+    def add_arguments(self, parser) -> None:
+        """Register command options."""
+        parser.add_argument(
+            "--chunk-size",
+            type=int,
+            default=5000,
+            help="Claim primary keys per unit of work.",
+        )
+        parser.add_argument(
+            "--workers",
+            type=int,
+            default=multiprocessing.cpu_count(),
+            help="Worker processes; 1 runs in this process.",
+        )
+
+    def _map(self, fn: Callable, ranges: list[tuple[int, int]], workers: int) -> list:
+        """Apply ``fn`` to every range, in a process pool when ``workers`` > 1."""
+        if workers <= 1:
+            return [_in_transaction(fn, start, stop) for start, stop in ranges]
+        # Children must open their own connections rather than share the parent's socket.
+        connections.close_all()
+        with ProcessPoolExecutor(
+            max_workers=workers, mp_context=multiprocessing.get_context("fork")
+        ) as pool:
+            return list(
+                pool.map(
+                    _in_worker,
+                    [fn] * len(ranges),
+                    [start for start, _ in ranges],
+                    [stop for _, stop in ranges],
+                )
+            )
+
+    def handle(self, *args, **options) -> None:
+        """Run the backfill."""
+        bounds = Claim.objects.aggregate(low=Min("pk"), high=Max("pk"))
+        if bounds["low"] is None:
+            self.stdout.write(self.style.SUCCESS("No claims to index."))
+            return
+
+        size = max(1, options["chunk_size"])
+        ranges = [(start, start + size) for start in range(bounds["low"], bounds["high"] + 1, size)]
+        indexed = sum(self._map(similarity.backfill_range, ranges, options["workers"]))
+        flagged = [
+            pk
+            for ids in self._map(similarity.recount_range, ranges, options["workers"])
+            for pk in ids
+        ]
+        mark_claims_dirty(flagged)
+        self.stdout.write(
+            self.style.SUCCESS(f"Indexed {indexed} claims; {len(flagged)} have near-duplicates.")
+        )
@@ -0,0 +1,58 @@
+"""
+Deliver queued outbox messages to downstream webhooks.
+
+Run once from cron, or with ``--interval`` as a long-lived worker. Several dispatchers may
+run at once; each endpoint is served by one of them at a time.
+"""
+
+from __future__ import annotations
+
+import time
+from datetime import timedelta
+
+from django.core.management.base import BaseCommand, CommandError
+
+from policylens.apps.claims import outbox
+
+
+class Command(BaseCommand):
+    """Drain the transactional outbox over HTTP."""
+
+    help = "POST pending OutboxMessage rows to OUTBOX_ENDPOINTS in batches."
+
+    def add_arguments(self, parser) -> None:
+        """Register command options."""
+        parser.add_argument("--batch-size", type=int, help="Messages per POST.")
+        parser.add_argument("--concurrency", type=int, help="Endpoints served in parallel.")
+        parser.add_argument(
+            "--interval",
+            type=float,
+            default=0.0,
+            help="Seconds between passes; 0 runs a single pass.",
+        )
+        parser.add_argument(
+            "--purge-after-days",
+            type=int,
+            help="Also delete delivered and dead messages older than this many days.",
+        )
+
+    def handle(self, *args, **options) -> None:
+        """Dispatch until interrupted, or once without ``--interval``."""
+        if options["batch_size"] is not None and options["batch_size"] < 1:
+            raise CommandError("--batch-size must be at least 1.")
+        interval = options["interval"]
+        while True:
+            result = outbox.dispatch(
+                batch_size=options["batch_size"], concurrency=options["concurrency"]
+            )
+            if options["purge_after_days"] is not None:
+                outbox.purge_delivered(older_than=timedelta(days=options["purge_after_days"]))
+            self.stdout.write(
+                self.style.SUCCESS(
+                    f"Delivered {result.delivered} outbox messages "
+                    f"({result.failed} failed, {result.dead} dead)."
+                )
+            )
+            if interval <= 0:
+                return
+            time.sleep(interval)
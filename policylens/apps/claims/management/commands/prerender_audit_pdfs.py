@@ -0,0 +1,65 @@
+"""
+Render audit export PDFs ahead of demand.
+
+Run before month-end audits so reviewers download every claim from the cache instead of
+waiting on renders. Claims already cached at their current version are skipped, so the
+command is cheap to re-run.
+"""
+
+from __future__ import annotations
+
+from datetime import date, datetime, time
+
+from django.core.management.base import BaseCommand, CommandError
+from django.utils import timezone
+
+from policylens.apps.claims import pdf_export
+from policylens.apps.claims.models import Claim
+
+
+def _month_start(value: str) -> date:
+    """Parse ``YYYY-MM`` into the first day of that month."""
+    try:
+        return datetime.strptime(value, "%Y-%m").date()
+    except ValueError as exc:
+        raise CommandError(f"--month must look like 2026-09, got {value!r}.") from exc
+
+
+class Command(BaseCommand):
+    """Fill the PDF audit export cache for a month of claims."""
+
+    help = "Pre-render audit export PDFs for claims created in a month, or for given claims."
+
+    def add_arguments(self, parser) -> None:
+        """Register command options."""
+        parser.add_argument("--month", help="Render claims created in this month (YYYY-MM).")
+        parser.add_argument(
+            "--claim-id",
+            type=int,
+            action="append",
+            default=[],
+            help="Render this claim; repeat for several.",
+        )
+
+    def handle(self, *args, **options) -> None:
+        """Render every selected claim that is not cached at its current version."""
+        claims = Claim.objects.none()
+        if options["month"]:
+            start = _month_start(options["month"])
+            end = date(start.year + start.month // 12, start.month % 12 + 1, 1)
+            claims = Claim.objects.filter(
+                created_at__gte=timezone.make_aware(datetime.combine(start, time.min)),
+                created_at__lt=timezone.make_aware(datetime.combine(end, time.min)),
+            )
+        if options["claim_id"]:
+            claims = claims | Claim.objects.filter(pk__in=options["claim_id"])
+        if not options["month"] and not options["claim_id"]:
+            raise CommandError("Pass --month or at least one --claim-id.")
+
+        result = pdf_export.prerender(claims)
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Rendered {result.rendered} PDFs; {result.cached} already cached; "
+                f"evicted {result.evicted}."
+            )
+        )
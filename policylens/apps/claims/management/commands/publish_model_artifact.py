@@ -0,0 +1,44 @@
+"""
+Publish a model artefact version.
+
+Workers pick up the new ``current`` target between scoring batches; no restart is needed.
+Use ``--baseline`` to write the built-in baseline model as a version first.
+"""
+
+from __future__ import annotations
+
+import dataclasses
+from pathlib import Path
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+from policylens.apps.claims.ml.artifacts import ArtifactError, publish, save_model
+from policylens.apps.claims.ml.model import BASELINE_MODEL
+
+
+class Command(BaseCommand):
+    """Atomically switch the live model version."""
+
+    help = "Point ML_MODEL_DIR/current at a model artefact version."
+
+    def add_arguments(self, parser) -> None:
+        """Register command options."""
+        parser.add_argument("version", help="Version directory name under ML_MODEL_DIR.")
+        parser.add_argument(
+            "--baseline",
+            action="store_true",
+            help="Write the built-in baseline model under this version before publishing.",
+        )
+
+    def handle(self, *args, **options) -> None:
+        """Run the publish."""
+        root = Path(settings.ML_MODEL_DIR)
+        version = options["version"]
+        try:
+            if options["baseline"]:
+                save_model(dataclasses.replace(BASELINE_MODEL, version=version), root)
+            publish(root, version)
+        except ArtifactError as exc:
+            raise CommandError(str(exc)) from exc
+        self.stdout.write(self.style.SUCCESS(f"Published model {version} from {root}."))
@@ -0,0 +1,32 @@
+"""
+Purge expired Idempotency-Key snapshots.
+
+Run on a schedule (for example hourly from cron). Deletes are chunked so a large backlog
+never holds long locks on the table.
+"""
+
+from __future__ import annotations
+
+from django.core.management.base import BaseCommand
+
+from policylens.apps.claims.idempotency import purge_expired
+
+
+class Command(BaseCommand):
+    """Delete idempotency keys past their TTL."""
+
+    help = "Delete expired IdempotencyKey rows in chunks."
+
+    def add_arguments(self, parser) -> None:
+        """Register command options."""
+        parser.add_argument(
+            "--chunk-size",
+            type=int,
+            default=5000,
+            help="Number of rows deleted per statement.",
+        )
+
+    def handle(self, *args, **options) -> None:
+        """Run the purge."""
+        removed = purge_expired(chunk_size=options["chunk_size"])
+        self.stdout.write(self.style.SUCCESS(f"Purged {removed} expired idempotency keys."))
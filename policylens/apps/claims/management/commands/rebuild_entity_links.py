@@ -0,0 +1,34 @@
+"""
+Rebuild holder contact keys and entity clusters from scratch.
+
+The service layer links holders incrementally on create and edit. This command links
+holders that predate it or were written outside services, and reconciles any drift.
+"""
+
+from __future__ import annotations
+
+from django.core.management.base import BaseCommand
+from django.db import transaction
+
+from policylens.apps.claims.entity_links import rebuild_entity_links
+
+
+class Command(BaseCommand):
+    """Recompute entity clusters with an in-memory union-find."""
+
+    help = "Rebuild HolderContactKey and EntityCluster from PolicyHolder contacts."
+
+    def add_arguments(self, parser) -> None:
+        """Register command options."""
+        parser.add_argument(
+            "--chunk-size",
+            type=int,
+            default=5000,
+            help="Rows read and written per batch.",
+        )
+
+    def handle(self, *args, **options) -> None:
+        """Run the rebuild."""
+        with transaction.atomic():
+            clusters = rebuild_entity_links(chunk_size=options["chunk_size"])
+        self.stdout.write(self.style.SUCCESS(f"Rebuilt {clusters} entity clusters."))
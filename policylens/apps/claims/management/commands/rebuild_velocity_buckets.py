@@ -0,0 +1,23 @@
+"""
+Rebuild the claim velocity buckets from scratch.
+
+``create_claim`` keeps ClaimVelocityBucket current. This command reconciles the buckets
+after bulk imports or any claim write that bypassed services.
+"""
+
+from __future__ import annotations
+
+from django.core.management.base import BaseCommand
+
+from policylens.apps.claims.velocity import rebuild_velocity_buckets
+
+
+class Command(BaseCommand):
+    """Recount daily policy and holder claim buckets."""
+
+    help = "Rebuild ClaimVelocityBucket from Claim with set-based SQL."
+
+    def handle(self, *args, **options) -> None:
+        """Run the rebuild."""
+        buckets = rebuild_velocity_buckets()
+        self.stdout.write(self.style.SUCCESS(f"Rebuilt {buckets} claim velocity buckets."))
@@ -19,11 +19,71 @@ from django.contrib.auth.models import Group
 from django.core.management.base import BaseCommand
 from django.db import transaction
 
-from policylens.apps.claims.models import Claim, Policy, PolicyHolder, ReviewDecision
-from policylens.apps.claims.services import add_decision, add_note, create_claim
+from policylens.apps.claims.models import (
+    ChecklistTemplate,
+    Claim,
+    Policy,
+    PolicyHolder,
+    ReviewDecision,
+)
+from policylens.apps.claims.services import (
+    add_decision,
+    add_note,
+    create_claim,
+    create_policy_holder,
+)
 
 User = get_user_model()
 
+# (claim_type, product_type, key, label, is_required, rule, match)
+CHECKLIST_TEMPLATES = [
+    (
+        Claim.Type.CLAIM,
+        "",
+        "supporting_document",
+        "Supporting document uploaded",
+        True,
+        ChecklistTemplate.Rule.DOCUMENT,
+        "",
+    ),
+    (
+        Claim.Type.CLAIM,
+        "",
+        "triage_note",
+        "Reviewer triage note",
+        True,
+        ChecklistTemplate.Rule.NOTE,
+        "",
+    ),
+    (
+        Claim.Type.CLAIM,
+        "Motor Insurance",
+        "damage_photos",
+        "Photos of the damage",
+        True,
+        ChecklistTemplate.Rule.DOCUMENT,
+        "image/",
+    ),
+    (
+        Claim.Type.CLAIM,
+        "Travel Insurance",
+        "booking_confirmation",
+        "Booking confirmation",
+        False,
+        ChecklistTemplate.Rule.DOCUMENT,
+        "booking",
+    ),
+    (
+        Claim.Type.POLICY_CHANGE,
+        "",
+        "signed_request",
+        "Signed change request",
+        True,
+        ChecklistTemplate.Rule.DOCUMENT,
+        "",
+    ),
+]
+
 
 class Command(BaseCommand):
     """Seed sample data into the database."""
@@ -53,12 +113,28 @@ class Command(BaseCommand):
             admin.save()
         admin.groups.add(admin_group)
 
+        for position, (claim_type, product_type, key, label, required, rule, match) in enumerate(
+            CHECKLIST_TEMPLATES
+        ):
+            ChecklistTemplate.objects.update_or_create(
+                claim_type=claim_type,
+                product_type=product_type,
+                key=key,
+                defaults={
+                    "label": label,
+                    "is_required": required,
+                    "rule": rule,
+                    "match": match,
+                    "position": position,
+                },
+            )
+
         holders = []
         for i in range(5):
             email = f"holder{i+1}@example.com"
             holder = PolicyHolder.objects.filter(email=email).order_by(
                 "pk"
-            ).first() or PolicyHolder.objects.create(
+            ).first() or create_policy_holder(
                 full_name=f"Sample Holder {i+1}",
                 email=email,
                 phone=f"+44 7700 900{i:03d}",
@@ -153,6 +229,6 @@ class Command(BaseCommand):
         self.stdout.write(
             self.style.SUCCESS(
                 "Seeded roles (reviewer, admin), users (reviewer1/admin1), "
-                "holders, policies, claims."
+                "checklist templates, holders, policies, claims."
             )
         )
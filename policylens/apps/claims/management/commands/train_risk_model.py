@@ -0,0 +1,78 @@
+"""
+Train the risk model on decided claims and write a model artefact.
+
+History is streamed from the database chunk by chunk, so the command runs in bounded memory
+on any history size. The artefact is written under ML_MODEL_DIR; pass ``--publish`` to make
+it the live version.
+"""
+
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+from policylens.apps.claims.ml.artifacts import ArtifactError, publish, save_model
+from policylens.apps.claims.ml.training import TrainingDataError, train_incremental
+
+
+class Command(BaseCommand):
+    """Fit the linear risk model out of core."""
+
+    help = "Train the risk model from ReviewDecision outcomes and write a versioned artefact."
+
+    def add_arguments(self, parser) -> None:
+        """Register command options."""
+        parser.add_argument("version", help="Version name for the new artefact.")
+        parser.add_argument("--epochs", type=int, default=5, help="Passes over the history.")
+        parser.add_argument(
+            "--chunk-size",
+            type=int,
+            default=2000,
+            help="Claims streamed per gradient step.",
+        )
+        parser.add_argument("--learning-rate", type=float, default=0.5)
+        parser.add_argument("--l2", type=float, default=1e-4, help="L2 penalty on weights.")
+        parser.add_argument(
+            "--holdout-percent",
+            type=int,
+            default=20,
+            help="Percentage of claims (by id) held out for evaluation.",
+        )
+        parser.add_argument(
+            "--publish",
+            action="store_true",
+            help="Point ML_MODEL_DIR/current at the new version after writing it.",
+        )
+
+    def handle(self, *args, **options) -> None:
+        """Run training."""
+        if not 0 <= options["holdout_percent"] < 100:
+            raise CommandError("--holdout-percent must be between 0 and 99.")
+
+        try:
+            report = train_incremental(
+                version=options["version"],
+                epochs=options["epochs"],
+                chunk_size=options["chunk_size"],
+                learning_rate=options["learning_rate"],
+                l2=options["l2"],
+                holdout_percent=options["holdout_percent"],
+            )
+            root = Path(settings.ML_MODEL_DIR)
+            path = save_model(report.model, root)
+            if options["publish"]:
+                publish(root, report.model.version)
+        except (TrainingDataError, ArtifactError) as exc:
+            raise CommandError(str(exc)) from exc
+
+        self.stdout.write(
+            f"Trained on {report.train_rows} claims x {report.epochs} epochs in "
+            f"{report.seconds:.2f}s ({report.rows_per_second:,.0f} rows/s)."
+        )
+        self.stdout.write(
+            f"Holdout ({report.holdout_rows} claims): {json.dumps(report.holdout, sort_keys=True)}"
+        )
+        self.stdout.write(self.style.SUCCESS(f"Wrote model {report.model.version} to {path}."))
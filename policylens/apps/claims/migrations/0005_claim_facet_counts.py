@@ -0,0 +1,60 @@
+# Generated by Django 5.2.18 on 2026-10-19 11:58
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("claims", "0004_internalnote_claims_inte_claim_i_2f3072_idx"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="ClaimFacetCount",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True, primary_key=True, serialize=False, verbose_name="ID"
+                    ),
+                ),
+                (
+                    "status",
+                    models.CharField(
+                        choices=[
+                            ("NEW", "New"),
+                            ("IN_REVIEW", "In review"),
+                            ("DECIDED", "Decided"),
+                        ],
+                        max_length=16,
+                    ),
+                ),
+                (
+                    "priority",
+                    models.CharField(
+                        choices=[("LOW", "Low"), ("NORMAL", "Normal"), ("HIGH", "High")],
+                        max_length=16,
+                    ),
+                ),
+                (
+                    "claim_type",
+                    models.CharField(
+                        choices=[("CLAIM", "Claim"), ("POLICY_CHANGE", "Policy change")],
+                        max_length=32,
+                    ),
+                ),
+                ("product_type", models.CharField(max_length=128)),
+                ("count", models.BigIntegerField(default=0)),
+                ("updated_at", models.DateTimeField(auto_now=True)),
+            ],
+            options={
+                "constraints": [
+                    models.UniqueConstraint(
+                        fields=("status", "priority", "claim_type", "product_type"),
+                        name="claims_facet_count_tuple_uniq",
+                    )
+                ],
+            },
+        ),
+    ]
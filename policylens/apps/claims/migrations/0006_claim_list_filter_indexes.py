@@ -0,0 +1,41 @@
+# Generated by Django 5.2.18 on 2026-10-19 12:00
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("claims", "0005_claim_facet_counts"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="claim",
+            index=models.Index(
+                fields=["created_by", "created_at"], name="claims_clai_created_171e2e_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="claim",
+            index=models.Index(
+                fields=["policy", "created_at"], name="claims_clai_policy__22c5de_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="claim",
+            index=models.Index(
+                condition=models.Q(("status", "DECIDED"), _negated=True),
+                fields=["created_at"],
+                name="claims_claim_open_created_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="mlscore",
+            index=models.Index(fields=["score"], name="claims_mlsc_score_af39e2_idx"),
+        ),
+        migrations.AddIndex(
+            model_name="policy",
+            index=models.Index(fields=["product_type"], name="claims_poli_product_de30c4_idx"),
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 5.2.18 on 2026-10-19 12:13
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("claims", "0007_idempotency_keys"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="mlscore",
+            name="model_version",
+            field=models.CharField(blank=True, max_length=64),
+        ),
+    ]
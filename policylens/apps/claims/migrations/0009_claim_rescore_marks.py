@@ -0,0 +1,36 @@
+# Generated by Django 5.2.18 on 2026-10-19 12:16
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("claims", "0008_mlscore_model_version"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="ClaimRescoreMark",
+            fields=[
+                (
+                    "claim",
+                    models.OneToOneField(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        primary_key=True,
+                        related_name="rescore_mark",
+                        serialize=False,
+                        to="claims.claim",
+                    ),
+                ),
+                ("version", models.BigIntegerField(default=1)),
+                ("marked_at", models.DateTimeField()),
+            ],
+        ),
+        migrations.AddField(
+            model_name="mlscore",
+            name="feature_fingerprint",
+            field=models.CharField(blank=True, max_length=32),
+        ),
+    ]
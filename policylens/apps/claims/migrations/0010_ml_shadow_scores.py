@@ -0,0 +1,52 @@
+# Generated by Django 5.2.18 on 2026-10-19 12:20
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("claims", "0009_claim_rescore_marks"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="MlShadowScore",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True, primary_key=True, serialize=False, verbose_name="ID"
+                    ),
+                ),
+                ("candidate_version", models.CharField(max_length=64)),
+                ("live_version", models.CharField(max_length=64)),
+                ("live_score", models.FloatField()),
+                ("live_label", models.CharField(max_length=32)),
+                ("shadow_score", models.FloatField()),
+                ("shadow_label", models.CharField(max_length=32)),
+                (
+                    "shadow_ms",
+                    models.FloatField(help_text="Candidate scoring time for the whole batch."),
+                ),
+                ("scored_at", models.DateTimeField(auto_now_add=True)),
+                (
+                    "claim",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="shadow_scores",
+                        to="claims.claim",
+                    ),
+                ),
+            ],
+            options={
+                "indexes": [
+                    models.Index(
+                        fields=["candidate_version", "scored_at"],
+                        name="claims_mlsh_candida_c8a56f_idx",
+                    )
+                ],
+            },
+        ),
+    ]
@@ -0,0 +1,44 @@
+# Generated by Django 5.2.18 on 2026-10-19 12:21
+
+import django.contrib.postgres.fields
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("claims", "0010_ml_shadow_scores"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="ScoreSketch",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True, primary_key=True, serialize=False, verbose_name="ID"
+                    ),
+                ),
+                ("day", models.DateField()),
+                ("model_version", models.CharField(max_length=64)),
+                ("product_type", models.CharField(max_length=128)),
+                (
+                    "counts",
+                    django.contrib.postgres.fields.ArrayField(
+                        base_field=models.BigIntegerField(), size=None
+                    ),
+                ),
+                ("total", models.BigIntegerField(default=0)),
+                ("updated_at", models.DateTimeField(auto_now=True)),
+            ],
+            options={
+                "constraints": [
+                    models.UniqueConstraint(
+                        fields=("day", "model_version", "product_type"),
+                        name="claims_score_sketch_key_uniq",
+                    )
+                ],
+            },
+        ),
+    ]
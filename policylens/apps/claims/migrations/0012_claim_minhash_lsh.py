@@ -0,0 +1,62 @@
+# Generated by Django 5.2.18 on 2026-10-19 12:23
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("claims", "0011_score_sketches"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="ClaimMinHash",
+            fields=[
+                (
+                    "claim",
+                    models.OneToOneField(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        primary_key=True,
+                        related_name="minhash",
+                        serialize=False,
+                        to="claims.claim",
+                    ),
+                ),
+                ("signature", models.BinaryField()),
+                ("near_duplicates", models.PositiveIntegerField(default=0)),
+            ],
+        ),
+        migrations.CreateModel(
+            name="ClaimLshBucket",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True, primary_key=True, serialize=False, verbose_name="ID"
+                    ),
+                ),
+                ("band", models.PositiveSmallIntegerField()),
+                ("bucket", models.BigIntegerField()),
+                (
+                    "claim",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="lsh_buckets",
+                        to="claims.claim",
+                    ),
+                ),
+            ],
+            options={
+                "indexes": [
+                    models.Index(fields=["band", "bucket"], name="claims_clai_band_c68361_idx")
+                ],
+                "constraints": [
+                    models.UniqueConstraint(
+                        fields=("claim", "band"), name="claims_lsh_claim_band_uniq"
+                    )
+                ],
+            },
+        ),
+    ]
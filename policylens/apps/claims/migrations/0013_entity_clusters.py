@@ -0,0 +1,69 @@
+# Generated by Django 5.2.18 on 2026-10-19 12:28
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("claims", "0012_claim_minhash_lsh"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="EntityCluster",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True, primary_key=True, serialize=False, verbose_name="ID"
+                    ),
+                ),
+                ("size", models.PositiveIntegerField(default=1)),
+                ("claim_count", models.PositiveIntegerField(default=0)),
+                ("claim_velocity", models.FloatField(default=0.0)),
+                ("velocity_at", models.DateTimeField(blank=True, null=True)),
+                ("updated_at", models.DateTimeField(auto_now=True)),
+            ],
+        ),
+        migrations.AddField(
+            model_name="policyholder",
+            name="cluster",
+            field=models.ForeignKey(
+                blank=True,
+                null=True,
+                on_delete=django.db.models.deletion.SET_NULL,
+                related_name="holders",
+                to="claims.entitycluster",
+            ),
+        ),
+        migrations.CreateModel(
+            name="HolderContactKey",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True, primary_key=True, serialize=False, verbose_name="ID"
+                    ),
+                ),
+                ("key", models.CharField(max_length=200)),
+                (
+                    "holder",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="contact_keys",
+                        to="claims.policyholder",
+                    ),
+                ),
+            ],
+            options={
+                "indexes": [models.Index(fields=["key"], name="claims_hold_key_37766d_idx")],
+                "constraints": [
+                    models.UniqueConstraint(
+                        fields=("holder", "key"), name="claims_contact_holder_key_uniq"
+                    )
+                ],
+            },
+        ),
+    ]
@@ -0,0 +1,41 @@
+# Generated by Django 5.2.18 on 2026-10-19 12:31
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("claims", "0013_entity_clusters"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="ClaimVelocityBucket",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True, primary_key=True, serialize=False, verbose_name="ID"
+                    ),
+                ),
+                (
+                    "entity_type",
+                    models.CharField(
+                        choices=[("policy", "Policy"), ("holder", "Holder")], max_length=8
+                    ),
+                ),
+                ("entity_id", models.BigIntegerField()),
+                ("day", models.DateField()),
+                ("count", models.IntegerField(default=0)),
+            ],
+            options={
+                "constraints": [
+                    models.UniqueConstraint(
+                        fields=("entity_type", "entity_id", "day"),
+                        name="claims_velocity_bucket_uniq",
+                    )
+                ],
+            },
+        ),
+    ]
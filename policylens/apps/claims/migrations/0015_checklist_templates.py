@@ -0,0 +1,92 @@
+# Generated by Django 5.2.18 on 2026-10-19 12:34
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("claims", "0014_claim_velocity_buckets"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="ChecklistTemplate",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True, primary_key=True, serialize=False, verbose_name="ID"
+                    ),
+                ),
+                (
+                    "claim_type",
+                    models.CharField(
+                        choices=[("CLAIM", "Claim"), ("POLICY_CHANGE", "Policy change")],
+                        max_length=32,
+                    ),
+                ),
+                ("product_type", models.CharField(blank=True, max_length=128)),
+                ("key", models.CharField(max_length=64)),
+                ("label", models.CharField(max_length=255)),
+                ("is_required", models.BooleanField(default=True)),
+                (
+                    "rule",
+                    models.CharField(
+                        choices=[("DOCUMENT", "Document uploaded"), ("NOTE", "Note added")],
+                        max_length=16,
+                    ),
+                ),
+                (
+                    "match",
+                    models.CharField(
+                        blank=True,
+                        help_text="Case-insensitive text the document name or type, or the note body, must contain. Blank matches anything.",
+                        max_length=128,
+                    ),
+                ),
+                ("position", models.PositiveSmallIntegerField(default=0)),
+                ("is_active", models.BooleanField(default=True)),
+            ],
+            options={
+                "ordering": ["position", "key"],
+            },
+        ),
+        migrations.AddField(
+            model_name="checklistitem",
+            name="match",
+            field=models.CharField(blank=True, max_length=128),
+        ),
+        migrations.AddField(
+            model_name="checklistitem",
+            name="rule",
+            field=models.CharField(
+                blank=True,
+                choices=[("DOCUMENT", "Document uploaded"), ("NOTE", "Note added")],
+                max_length=16,
+            ),
+        ),
+        migrations.AddField(
+            model_name="checklistitem",
+            name="satisfied_at",
+            field=models.DateTimeField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name="claim",
+            name="checklist_completeness",
+            field=models.PositiveSmallIntegerField(db_default=100, default=100),
+        ),
+        migrations.AddIndex(
+            model_name="claim",
+            index=models.Index(
+                fields=["checklist_completeness", "created_at"],
+                name="claims_clai_checkli_0860af_idx",
+            ),
+        ),
+        migrations.AddConstraint(
+            model_name="checklisttemplate",
+            constraint=models.UniqueConstraint(
+                fields=("claim_type", "product_type", "key"), name="claims_checklist_template_uniq"
+            ),
+        ),
+    ]
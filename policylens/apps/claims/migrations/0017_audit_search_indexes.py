@@ -0,0 +1,37 @@
+# Generated by Django 5.2.18 on 2026-10-19 12:50
+
+import django.contrib.postgres.indexes
+from django.contrib.postgres.operations import AddIndexConcurrently, RemoveIndexConcurrently
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    # The audit table is large and written on every action; build without blocking writes.
+    atomic = False
+
+    dependencies = [
+        ("claims", "0016_outbox_messages"),
+    ]
+
+    operations = [
+        AddIndexConcurrently(
+            model_name="auditevent",
+            index=models.Index(
+                fields=["event_type", "created_at"], name="claims_audi_event_t_0cc5cf_idx"
+            ),
+        ),
+        RemoveIndexConcurrently(
+            model_name="auditevent",
+            name="claims_audi_event_t_c60ff3_idx",
+        ),
+        AddIndexConcurrently(
+            model_name="auditevent",
+            index=models.Index(fields=["actor", "created_at"], name="claims_audi_actor_d2793b_idx"),
+        ),
+        AddIndexConcurrently(
+            model_name="auditevent",
+            index=django.contrib.postgres.indexes.GinIndex(
+                fields=["payload"], name="claims_audit_payload_gin", opclasses=["jsonb_path_ops"]
+            ),
+        ),
+    ]
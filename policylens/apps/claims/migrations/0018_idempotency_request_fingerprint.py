@@ -0,0 +1,18 @@
+# Generated by Django 5.2.18 on 2026-10-19 13:19
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("claims", "0017_audit_search_indexes"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="idempotencykey",
+            name="request_fingerprint",
+            field=models.CharField(blank=True, default="", max_length=64),
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 5.2.18 on 2026-10-19 13:22
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("claims", "0018_idempotency_request_fingerprint"),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name="holdercontactkey",
+            name="key",
+            field=models.CharField(max_length=261),
+        ),
+    ]
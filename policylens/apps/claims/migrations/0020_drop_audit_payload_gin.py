@@ -0,0 +1,20 @@
+# Generated by Django 5.2.18 on 2026-10-19 15:10
+
+from django.contrib.postgres.operations import RemoveIndexConcurrently
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+    # The audit table is large and written on every action; drop without blocking writes.
+    atomic = False
+
+    dependencies = [
+        ("claims", "0019_widen_contact_key"),
+    ]
+
+    operations = [
+        RemoveIndexConcurrently(
+            model_name="auditevent",
+            name="claims_audit_payload_gin",
+        ),
+    ]
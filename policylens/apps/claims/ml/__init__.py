@@ -0,0 +1 @@
+"""Fraud risk scoring for claims: feature contract, model, and online scoring."""
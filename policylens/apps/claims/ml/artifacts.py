@@ -0,0 +1,166 @@
+"""
+Versioned, memory-mapped model artefacts.
+
+Each model version is a directory of NumPy ``.npy`` arrays (coefficients, binning tables,
+feature names, reason codes) plus a small JSON manifest of scalars::
+
+    <ML_MODEL_DIR>/
+        current -> v2026-10-19
+        v2026-10-19/
+            manifest.json
+            coefficients.npy
+            feature_names.npy
+            reason_codes.npy
+            bin_edges.npy, bin_values.npy, bin_offsets.npy   (optional)
+
+Arrays are opened with ``mmap_mode="r"`` so every worker shares the same physical pages.
+Publishing a version swaps the ``current`` symlink with an atomic rename; workers notice the
+new target the next time they ask for the model and map it without restarting.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import threading
+from pathlib import Path
+
+import numpy as np
+from django.conf import settings
+
+from policylens.apps.claims.ml.model import BASELINE_MODEL, LinearRiskModel
+
+CURRENT_LINK = "current"
+MANIFEST = "manifest.json"
+_BIN_ARRAYS = ("bin_edges", "bin_values", "bin_offsets")
+_MANIFEST_KEYS = ("version", "intercept", "high_threshold", "medium_threshold", "max_reason_codes")
+
+
+class ArtifactError(Exception):
+    """Raised when an artefact directory is missing or malformed."""
+
+
+def save_model(model: LinearRiskModel, root: Path) -> Path:
+    """Write ``model`` as a new version directory under ``root`` and return its path.
+
+    Versions are immutable: writing over an existing version is refused.
+    """
+    path = Path(root) / model.version
+    if path.exists():
+        raise ArtifactError(f"Model version {model.version!r} already exists at {path}.")
+
+    tmp = Path(root) / f".{model.version}.tmp"
+    tmp.mkdir(parents=True)
+    np.save(tmp / "coefficients.npy", np.asarray(model.coefficients, dtype=np.float64))
+    np.save(tmp / "feature_names.npy", np.array(model.feature_names, dtype=str))
+    np.save(
+        tmp / "reason_codes.npy",
+        np.array([model.reason_codes.get(name, "") for name in model.feature_names], dtype=str),
+    )
+    if model.bin_offsets is not None:
+        for name in _BIN_ARRAYS:
+            np.save(tmp / f"{name}.npy", np.asarray(getattr(model, name)))
+    (tmp / MANIFEST).write_text(
+        json.dumps(
+            {
+                "version": model.version,
+                "intercept": float(model.intercept),
+                "high_threshold": model.high_threshold,
+                "medium_threshold": model.medium_threshold,
+                "max_reason_codes": model.max_reason_codes,
+            },
+            indent=2,
+        )
+    )
+    os.rename(tmp, path)
+    return path
+
+
+def load_model(path: Path) -> LinearRiskModel:
+    """Open a version directory with memory-mapped arrays."""
+    path = Path(path)
+    try:
+        manifest = json.loads((path / MANIFEST).read_text())
+        coefficients = np.load(path / "coefficients.npy", mmap_mode="r")
+        feature_names = tuple(str(n) for n in np.load(path / "feature_names.npy"))
+        codes = np.load(path / "reason_codes.npy")
+    except (OSError, ValueError) as exc:
+        raise ArtifactError(f"Cannot load model artefact at {path}: {exc}") from exc
+    if not isinstance(manifest, dict):
+        raise ArtifactError(f"Manifest at {path} is not a JSON object.")
+    missing = [key for key in _MANIFEST_KEYS if key not in manifest]
+    if missing:
+        raise ArtifactError(f"Manifest at {path} is missing {', '.join(missing)}.")
+
+    bins = {}
+    if (path / "bin_offsets.npy").exists():
+        bins = {name: np.load(path / f"{name}.npy", mmap_mode="r") for name in _BIN_ARRAYS}
+
+    if coefficients.shape != (len(feature_names),):
+        raise ArtifactError(f"Coefficient shape does not match feature names at {path}.")
+    return LinearRiskModel(
+        version=manifest["version"],
+        feature_names=feature_names,
+        coefficients=coefficients,
+        intercept=manifest["intercept"],
+        reason_codes={
+            name: str(code) for name, code in zip(feature_names, codes, strict=True) if code
+        },
+        high_threshold=manifest["high_threshold"],
+        medium_threshold=manifest["medium_threshold"],
+        max_reason_codes=manifest["max_reason_codes"],
+        **bins,
+    )
+
+
+def publish(root: Path, version: str) -> None:
+    """Atomically point ``current`` at an existing version directory."""
+    root = Path(root)
+    if not (root / version / MANIFEST).exists():
+        raise ArtifactError(f"Model version {version!r} does not exist under {root}.")
+    tmp = root / f".{CURRENT_LINK}.{os.getpid()}.tmp"
+    if tmp.is_symlink():
+        tmp.unlink()
+    os.symlink(version, tmp)
+    os.replace(tmp, root / CURRENT_LINK)
+
+
+class ModelRegistry:
+    """Per-process cache of the published model, refreshed when ``current`` moves."""
+
+    def __init__(self, root: Path) -> None:
+        """Watch ``root`` for a ``current`` symlink."""
+        self.root = Path(root)
+        self._lock = threading.Lock()
+        self._target: str | None = None
+        self._model: LinearRiskModel = BASELINE_MODEL
+
+    def current(self) -> LinearRiskModel:
+        """Return the published model, or the baseline if nothing is published.
+
+        Costs one ``readlink`` when nothing has changed.
+        """
+        try:
+            target = os.readlink(self.root / CURRENT_LINK)
+        except OSError:
+            return BASELINE_MODEL
+        if target == self._target:
+            return self._model
+
+        with self._lock:
+            if target != self._target:
+                self._model = load_model(self.root / target)
+                self._target = target
+            return self._model
+
+
+_registry: ModelRegistry | None = None
+
+
+def get_registry() -> ModelRegistry:
+    """Return the registry for the configured ``ML_MODEL_DIR``."""
+    global _registry
+    root = Path(settings.ML_MODEL_DIR)
+    if _registry is None or _registry.root != root:
+        _registry = ModelRegistry(root)
+    return _registry
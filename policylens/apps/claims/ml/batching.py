@@ -0,0 +1,122 @@
+"""
+Request micro-batching for online scoring.
+
+Concurrent requests in one worker process are coalesced: the first request to arrive
+becomes the batch leader, waits up to ``max_wait`` seconds (or until ``max_batch_size``
+requests have joined), then scores the whole batch on its own thread and DB connection.
+Followers block until the leader publishes results. No background threads are involved,
+so the batcher works under any threaded WSGI server.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from collections.abc import Callable, Hashable, Sequence
+from typing import Any
+
+from django.conf import settings
+
+from policylens.apps.claims.ml.metrics import LatencyRecorder
+from policylens.apps.claims.ml.scoring import score_claims
+
+
+class _Batch:
+    """Requests collected for one leader."""
+
+    def __init__(self) -> None:
+        """Create an open, empty batch."""
+        self.items: list[Hashable] = []
+        self.full = threading.Event()
+        self.done = threading.Event()
+        self.results: dict[Hashable, Any] = {}
+        self.error: BaseException | None = None
+
+
+class MicroBatcher:
+    """Coalesce concurrent ``submit`` calls into calls of ``handler`` on a list of items."""
+
+    def __init__(
+        self,
+        handler: Callable[[Sequence[Hashable]], dict[Hashable, Any]],
+        *,
+        max_batch_size: int,
+        max_wait: float,
+        recorder: LatencyRecorder | None = None,
+    ) -> None:
+        """Configure batch limits and an optional latency recorder."""
+        self.handler = handler
+        self.max_batch_size = max(1, max_batch_size)
+        self.max_wait = max(0.0, max_wait)
+        self.recorder = recorder
+        self._lock = threading.Lock()
+        self._open: _Batch | None = None
+
+    def submit(self, item: Hashable) -> Any:
+        """Add ``item`` to the open batch and return its result once the batch is scored.
+
+        Returns None if the handler produced no result for the item.
+        """
+        started = time.perf_counter()
+        with self._lock:
+            batch = self._open
+            leader = batch is None
+            if leader:
+                batch = self._open = _Batch()
+            batch.items.append(item)
+            if len(batch.items) >= self.max_batch_size:
+                self._open = None
+                batch.full.set()
+
+        if leader:
+            batch.full.wait(self.max_wait)
+            with self._lock:
+                if self._open is batch:
+                    self._open = None
+            self._run(batch)
+        else:
+            batch.done.wait()
+
+        if self.recorder is not None:
+            self.recorder.record(time.perf_counter() - started)
+        if batch.error is not None:
+            raise batch.error
+        return batch.results.get(item)
+
+    def _run(self, batch: _Batch) -> None:
+        """Score a closed batch and wake its followers."""
+        try:
+            batch.results = self.handler(list(dict.fromkeys(batch.items)))
+        except BaseException as exc:  # Propagate to every waiter, not just the leader.
+            batch.error = exc
+        finally:
+            if self.recorder is not None:
+                self.recorder.record_batch(len(batch.items))
+            batch.done.set()
+
+
+def _score_requests(requests: Sequence[tuple[int, str]]) -> dict[tuple[int, str], Any]:
+    """Score a batch of ``(claim_id, actor)`` requests with one service call."""
+    actors = dict(requests)
+    scores = score_claims(list(actors), actors=actors)
+    return {request: scores.get(request[0]) for request in requests}
+
+
+_scoring_batcher: MicroBatcher | None = None
+_scoring_batcher_lock = threading.Lock()
+
+scoring_latency = LatencyRecorder()
+
+
+def get_scoring_batcher() -> MicroBatcher:
+    """Return this process's scoring batcher, creating it from settings on first use."""
+    global _scoring_batcher
+    with _scoring_batcher_lock:
+        if _scoring_batcher is None:
+            _scoring_batcher = MicroBatcher(
+                _score_requests,
+                max_batch_size=settings.ML_SCORING_MAX_BATCH_SIZE,
+                max_wait=settings.ML_SCORING_MAX_WAIT_MS / 1000.0,
+                recorder=scoring_latency,
+            )
+        return _scoring_batcher
@@ -0,0 +1,185 @@
+"""
+Score distribution sketches and drift between windows.
+
+Every batch written by ``score_claims`` is folded into a fixed-width histogram per day,
+model version, and product type with one delta upsert per key. Because the bins are fixed,
+sketches merge by addition: a window's distribution is the sum of its daily rows, and PSI
+and KS between two windows are computed from two merged histograms without touching
+MlScore. Rescoring a claim adds its new score again, so sketches describe scores written in
+a window rather than the latest score per claim.
+
+Sketches of different model versions describe different score functions, so comparisons
+read one version, the active model's unless another is named, and merge across versions
+only when asked to.
+"""
+
+from __future__ import annotations
+
+import datetime as dt
+from collections.abc import Sequence
+from dataclasses import dataclass
+
+import numpy as np
+from django.db import connection
+from django.utils import timezone
+
+from policylens.apps.claims.ml.artifacts import get_registry
+from policylens.apps.claims.models import ScoreSketch
+
+SKETCH_BINS = 100
+# Floor applied to empty bins so PSI stays finite.
+PSI_EPSILON = 1e-4
+
+
+def histogram(scores: np.ndarray) -> np.ndarray:
+    """Count scores into ``SKETCH_BINS`` equal-width bins over [0, 1]."""
+    index = np.clip((np.asarray(scores, dtype=float) * SKETCH_BINS).astype(int), 0, SKETCH_BINS - 1)
+    return np.bincount(index, minlength=SKETCH_BINS)
+
+
+def record_scores(
+    *,
+    model_version: str,
+    product_types: Sequence[str],
+    scores: np.ndarray,
+    day: dt.date | None = None,
+) -> None:
+    """Add a scored batch to the sketches for ``day`` (default: today)."""
+    if not len(scores):
+        return
+    day = day or timezone.localdate()
+    segments = np.asarray(product_types, dtype=object)
+    scores = np.asarray(scores, dtype=float)
+
+    table = connection.ops.quote_name(ScoreSketch._meta.db_table)
+    sql = (
+        f"INSERT INTO {table} (day, model_version, product_type, counts, total, updated_at) "
+        "VALUES (%s, %s, %s, %s, %s, %s) "
+        "ON CONFLICT (day, model_version, product_type) DO UPDATE SET "
+        f"counts = ARRAY(SELECT a + b FROM unnest({table}.counts, EXCLUDED.counts) AS u(a, b)), "
+        f"total = {table}.total + EXCLUDED.total, updated_at = EXCLUDED.updated_at"
+    )
+    now = timezone.now()
+    with connection.cursor() as cursor:
+        # Sorted keys keep concurrent writers from deadlocking on each other's rows.
+        for segment in sorted(set(segments.tolist())):
+            counts = histogram(scores[segments == segment])
+            cursor.execute(
+                sql,
+                [day, model_version, segment, counts.tolist(), int(counts.sum()), now],
+            )
+
+
+def merged_histogram(
+    *,
+    start: dt.date,
+    end: dt.date,
+    model_version: str | None = None,
+    all_versions: bool = False,
+    product_type: str | None = None,
+) -> np.ndarray:
+    """Sum sketches for days ``start`` to ``end`` inclusive, optionally for one product type.
+
+    Reads ``model_version``, or the active model's version if it is None; ``all_versions``
+    sums every version instead.
+    """
+    rows = ScoreSketch.objects.filter(day__gte=start, day__lte=end)
+    if not all_versions:
+        rows = rows.filter(model_version=model_version or get_registry().current().version)
+    if product_type:
+        rows = rows.filter(product_type=product_type)
+    merged = np.zeros(SKETCH_BINS, dtype=np.int64)
+    for counts in rows.values_list("counts", flat=True):
+        merged += np.asarray(counts, dtype=np.int64)
+    return merged
+
+
+def psi(expected: np.ndarray, actual: np.ndarray) -> float | None:
+    """Population stability index of ``actual`` against ``expected`` histograms."""
+    if not expected.sum() or not actual.sum():
+        return None
+    e = np.maximum(expected / expected.sum(), PSI_EPSILON)
+    a = np.maximum(actual / actual.sum(), PSI_EPSILON)
+    return float(np.sum((a - e) * np.log(a / e)))
+
+
+def ks(expected: np.ndarray, actual: np.ndarray) -> float | None:
+    """Kolmogorov-Smirnov statistic evaluated at bin edges."""
+    if not expected.sum() or not actual.sum():
+        return None
+    return float(
+        np.max(np.abs(np.cumsum(expected) / expected.sum() - np.cumsum(actual) / actual.sum()))
+    )
+
+
+def quantiles(counts: np.ndarray, qs: Sequence[float] = (0.5, 0.9, 0.99)) -> list[float | None]:
+    """Approximate quantiles by linear interpolation within bins."""
+    total = counts.sum()
+    if not total:
+        return [None for _ in qs]
+    cdf = np.concatenate([[0.0], np.cumsum(counts) / total])
+    edges = np.linspace(0.0, 1.0, SKETCH_BINS + 1)
+    return [round(float(np.interp(q, cdf, edges)), 6) for q in qs]
+
+
+@dataclass(frozen=True)
+class Window:
+    """Inclusive day range."""
+
+    start: dt.date
+    end: dt.date
+
+
+def compare_windows(
+    *,
+    baseline: Window,
+    current: Window,
+    model_version: str | None = None,
+    all_versions: bool = False,
+    product_type: str | None = None,
+) -> dict[str, object]:
+    """Return PSI, KS, and per-window summaries between two windows.
+
+    Both windows read the same model version, defaulting to the active one, unless
+    ``all_versions`` is set.
+    """
+    if all_versions:
+        model_version = None
+    else:
+        model_version = model_version or get_registry().current().version
+    expected = merged_histogram(
+        start=baseline.start,
+        end=baseline.end,
+        model_version=model_version,
+        all_versions=all_versions,
+        product_type=product_type,
+    )
+    actual = merged_histogram(
+        start=current.start,
+        end=current.end,
+        model_version=model_version,
+        all_versions=all_versions,
+        product_type=product_type,
+    )
+
+    def summary(window: Window, counts: np.ndarray) -> dict[str, object]:
+        p50, p90, p99 = quantiles(counts)
+        return {
+            "start": window.start.isoformat(),
+            "end": window.end.isoformat(),
+            "count": int(counts.sum()),
+            "p50": p50,
+            "p90": p90,
+            "p99": p99,
+        }
+
+    value = psi(expected, actual)
+    distance = ks(expected, actual)
+    return {
+        "model_version": model_version,
+        "product_type": product_type,
+        "baseline": summary(baseline, expected),
+        "current": summary(current, actual),
+        "psi": round(value, 6) if value is not None else None,
+        "ks": round(distance, 6) if distance is not None else None,
+    }
@@ -0,0 +1,226 @@
+"""
+Feature contract for claim risk scoring.
+
+Features are computed for a whole batch of claims at once. ``load_frame`` reads the raw
+columns for a batch in one query, and each registered feature turns that frame into a
+float column. Models select columns by name, so adding a feature never changes what an
+existing model sees.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable, Iterator, Sequence
+from itertools import islice
+
+import numpy as np
+from django.db.models import Count, QuerySet
+from django.db.models.functions import Length
+from django.utils import timezone
+
+from policylens.apps.claims import velocity
+from policylens.apps.claims.entity_links import VELOCITY_TIME_CONSTANT
+from policylens.apps.claims.models import Claim, Policy
+
+Frame = dict[str, np.ndarray]
+FeatureFn = Callable[[Frame], np.ndarray]
+
+FEATURES: dict[str, FeatureFn] = {}
+
+
+def feature(name: str) -> Callable[[FeatureFn], FeatureFn]:
+    """Register a feature function under ``name``."""
+
+    def register(fn: FeatureFn) -> FeatureFn:
+        FEATURES[name] = fn
+        return fn
+
+    return register
+
+
+_FRAME_COLUMNS = (
+    "pk",
+    "policy_id",
+    "policy__holder_id",
+    "claim_type",
+    "priority",
+    "summary_length",
+    "documents_count",
+    "notes_count",
+    "created_at",
+    "policy__status",
+    "policy__effective_date",
+    "policy__product_type",
+    "minhash__near_duplicates",
+    "policy__holder__cluster__size",
+    "policy__holder__cluster__claim_velocity",
+    "policy__holder__cluster__velocity_at",
+)
+
+
+def frame_queryset() -> QuerySet[Claim]:
+    """Return Claim annotated with the aggregate columns features read."""
+    return Claim.objects.annotate(
+        summary_length=Length("summary"),
+        documents_count=Count("documents", distinct=True),
+        notes_count=Count("notes", distinct=True),
+    )
+
+
+def _frame_from_rows(rows: Sequence[tuple], columns: Sequence[str]) -> Frame:
+    """Transpose value tuples into one object array per column.
+
+    Sliding-window claim counts are added from the velocity buckets in one more query.
+    """
+    values = list(zip(*rows, strict=True)) if rows else [()] * len(columns)
+    frame = {
+        name.replace("__", "_"): np.array(column, dtype=object)
+        for name, column in zip(columns, values, strict=True)
+    }
+    counts = velocity.window_counts(
+        claim_ids=frame["pk"].tolist(),
+        policy_ids=frame["policy_id"].tolist(),
+        holder_ids=frame["policy_holder_id"].tolist(),
+        created_at=frame["created_at"].tolist(),
+    )
+    empty = (0,) * len(velocity.WINDOWS)
+    for i, name in enumerate(velocity.WINDOWS):
+        frame[name] = np.array([counts.get(pk, empty)[i] for pk in frame["pk"]], dtype=object)
+    return frame
+
+
+def load_frame(claim_ids: Sequence[int]) -> Frame:
+    """Read the raw columns needed by registered features for a batch of claims.
+
+    Rows come back in ``claim_ids`` order; ids that do not exist are dropped.
+    """
+    rows = frame_queryset().filter(pk__in=claim_ids).values_list(*_FRAME_COLUMNS)
+    by_pk = {row[0]: row for row in rows}
+    ordered = [by_pk[pk] for pk in dict.fromkeys(claim_ids) if pk in by_pk]
+    return _frame_from_rows(ordered, _FRAME_COLUMNS)
+
+
+def iter_frames(
+    queryset: QuerySet[Claim], *, extra: Sequence[str] = (), chunk_size: int = 2000
+) -> Iterator[Frame]:
+    """Stream frames of at most ``chunk_size`` claims in primary key order.
+
+    ``queryset`` should derive from ``frame_queryset``; ``extra`` names additional
+    columns (such as a label) to carry alongside the features. Rows are fetched through a
+    server-side cursor, so memory is bounded by one chunk however large the result is.
+    """
+    columns = (*_FRAME_COLUMNS, *extra)
+    rows = queryset.order_by("pk").values_list(*columns).iterator(chunk_size=chunk_size)
+    while chunk := list(islice(rows, chunk_size)):
+        yield _frame_from_rows(chunk, columns)
+
+
+def build_matrix(frame: Frame, names: Sequence[str]) -> np.ndarray:
+    """Return a float matrix with one column per feature name, in order."""
+    n = len(frame["pk"])
+    if not names:
+        return np.zeros((n, 0))
+    return np.column_stack([FEATURES[name](frame).astype(float) for name in names]).reshape(
+        n, len(names)
+    )
+
+
+@feature("is_claim")
+def _is_claim(frame: Frame) -> np.ndarray:
+    """Flag claims as opposed to policy changes."""
+    return frame["claim_type"] == Claim.Type.CLAIM
+
+
+@feature("priority_high")
+def _priority_high(frame: Frame) -> np.ndarray:
+    """Flag claims submitted at high priority."""
+    return frame["priority"] == Claim.Priority.HIGH
+
+
+@feature("log_summary_length")
+def _log_summary_length(frame: Frame) -> np.ndarray:
+    """Log-scaled length of the claim summary."""
+    return np.log1p(frame["summary_length"].astype(float))
+
+
+@feature("log_documents_count")
+def _log_documents_count(frame: Frame) -> np.ndarray:
+    """Log-scaled number of supporting documents."""
+    return np.log1p(frame["documents_count"].astype(float))
+
+
+@feature("log_notes_count")
+def _log_notes_count(frame: Frame) -> np.ndarray:
+    """Log-scaled number of reviewer notes."""
+    return np.log1p(frame["notes_count"].astype(float))
+
+
+@feature("policy_not_active")
+def _policy_not_active(frame: Frame) -> np.ndarray:
+    """Flag claims against lapsed or cancelled policies."""
+    return frame["policy_status"] != Policy.Status.ACTIVE
+
+
+@feature("log_policy_age_days")
+def _log_policy_age_days(frame: Frame) -> np.ndarray:
+    """Log-scaled policy age in days when the claim was made."""
+    ages = [
+        max((created.date() - effective).days, 0) if effective else 0
+        for created, effective in zip(
+            frame["created_at"], frame["policy_effective_date"], strict=True
+        )
+    ]
+    return np.log1p(np.array(ages, dtype=float))
+
+
+@feature("has_near_duplicate")
+def _has_near_duplicate(frame: Frame) -> np.ndarray:
+    """Flag claims whose summary nearly duplicates another claim's."""
+    counts = np.array([count or 0 for count in frame["minhash_near_duplicates"]], dtype=float)
+    return counts > 0
+
+
+@feature("shared_contact")
+def _shared_contact(frame: Frame) -> np.ndarray:
+    """Flag claims whose holder shares a contact identifier with another holder."""
+    sizes = np.array([size or 1 for size in frame["policy_holder_cluster_size"]], dtype=float)
+    return sizes > 1
+
+
+@feature("log_cluster_claim_velocity")
+def _log_cluster_claim_velocity(frame: Frame) -> np.ndarray:
+    """Log-scaled recent claims in the holder's cluster beyond one, rounded to 0.1.
+
+    Rounding keeps the value, and so the feature fingerprint, stable as velocity decays.
+    """
+    now = timezone.now()
+    tau = VELOCITY_TIME_CONSTANT.total_seconds()
+    velocity = np.array(
+        [
+            (v or 0.0) * np.exp(-max((now - at).total_seconds(), 0.0) / tau) if at else 0.0
+            for v, at in zip(
+                frame["policy_holder_cluster_claim_velocity"],
+                frame["policy_holder_cluster_velocity_at"],
+                strict=True,
+            )
+        ],
+        dtype=float,
+    )
+    return np.round(np.log1p(np.maximum(velocity - 1.0, 0.0)), 1)
+
+
+@feature("log_policy_claims_30d")
+def _log_policy_claims_30d(frame: Frame) -> np.ndarray:
+    """Log-scaled other claims on the same policy in the 30 days up to this claim."""
+    return np.log1p(np.maximum(frame["policy_claims_30d"].astype(float) - 1.0, 0.0))
+
+
+@feature("log_policy_claims_90d")
+def _log_policy_claims_90d(frame: Frame) -> np.ndarray:
+    """Log-scaled other claims on the same policy in the 90 days up to this claim."""
+    return np.log1p(np.maximum(frame["policy_claims_90d"].astype(float) - 1.0, 0.0))
+
+
+@feature("log_holder_claims_month")
+def _log_holder_claims_month(frame: Frame) -> np.ndarray:
+    """Log-scaled other claims by the same holder earlier in the same calendar month."""
+    return np.log1p(np.maximum(frame["holder_claims_month"].astype(float) - 1.0, 0.0))
@@ -0,0 +1,65 @@
+"""
+In-process latency metrics for scoring.
+
+Each worker keeps a bounded window of recent latencies and batch sizes. Metrics are
+per process; a scrape sees the worker that served it.
+"""
+
+from __future__ import annotations
+
+import threading
+from collections import deque
+
+import numpy as np
+
+
+class LatencyRecorder:
+    """Sliding window of request latencies and batch sizes."""
+
+    def __init__(self, window: int = 10_000) -> None:
+        """Create an empty recorder holding at most ``window`` samples of each kind."""
+        self._lock = threading.Lock()
+        self._latencies: deque[float] = deque(maxlen=window)
+        self._batch_sizes: deque[int] = deque(maxlen=window)
+        self._requests = 0
+        self._batches = 0
+
+    def record(self, seconds: float) -> None:
+        """Record one request latency."""
+        with self._lock:
+            self._latencies.append(seconds)
+            self._requests += 1
+
+    def record_batch(self, size: int) -> None:
+        """Record the size of one executed batch."""
+        with self._lock:
+            self._batch_sizes.append(size)
+            self._batches += 1
+
+    def reset(self) -> None:
+        """Drop all samples and counters."""
+        with self._lock:
+            self._latencies.clear()
+            self._batch_sizes.clear()
+            self._requests = 0
+            self._batches = 0
+
+    def snapshot(self) -> dict[str, float | int | None]:
+        """Return counters and latency percentiles in milliseconds."""
+        with self._lock:
+            latencies = np.array(self._latencies, dtype=float) * 1000.0
+            sizes = np.array(self._batch_sizes, dtype=float)
+            requests, batches = self._requests, self._batches
+
+        def pct(q: float) -> float | None:
+            return round(float(np.percentile(latencies, q)), 3) if latencies.size else None
+
+        return {
+            "requests": requests,
+            "batches": batches,
+            "p50_ms": pct(50),
+            "p95_ms": pct(95),
+            "p99_ms": pct(99),
+            "max_ms": round(float(latencies.max()), 3) if latencies.size else None,
+            "mean_batch_size": round(float(sizes.mean()), 3) if sizes.size else None,
+        }
@@ -0,0 +1,114 @@
+"""
+Linear risk model.
+
+The model is a logistic regression over the feature contract. Its parameters are plain
+arrays so that a batch of claims is scored with one matrix-vector product, and reason codes
+come from the largest positive per-feature contributions.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+
+import numpy as np
+
+LABEL_HIGH = "HIGH"
+LABEL_MEDIUM = "MEDIUM"
+LABEL_LOW = "LOW"
+
+
+@dataclass(frozen=True)
+class LinearRiskModel:
+    """Logistic model with thresholds for labels and a feature-to-reason-code map."""
+
+    version: str
+    feature_names: tuple[str, ...]
+    coefficients: np.ndarray
+    intercept: float
+    reason_codes: dict[str, str] = field(default_factory=dict)
+    high_threshold: float = 0.7
+    medium_threshold: float = 0.4
+    max_reason_codes: int = 3
+    # Optional binning tables, flattened across features. Feature ``i`` has edges
+    # ``bin_edges[bin_offsets[i]:bin_offsets[i + 1]]`` and one more value than edges in
+    # ``bin_values``, stored in the same feature order. Features without edges pass through.
+    bin_edges: np.ndarray | None = None
+    bin_values: np.ndarray | None = None
+    bin_offsets: np.ndarray | None = None
+
+    def transform(self, X: np.ndarray) -> np.ndarray:
+        """Apply binning tables to raw feature values."""
+        if self.bin_offsets is None:
+            return X
+        out = np.array(X, dtype=float, copy=True)
+        binned = 0
+        for i in range(len(self.feature_names)):
+            start, end = int(self.bin_offsets[i]), int(self.bin_offsets[i + 1])
+            if start == end:
+                continue
+            values = self.bin_values[start + binned : end + binned + 1]
+            binned += 1
+            out[:, i] = values[np.searchsorted(self.bin_edges[start:end], X[:, i], side="right")]
+        return out
+
+    def predict(self, X: np.ndarray) -> np.ndarray:
+        """Return risk scores in [0, 1] for a feature matrix."""
+        z = self.transform(X) @ self.coefficients + self.intercept
+        return 1.0 / (1.0 + np.exp(-z))
+
+    def labels(self, scores: np.ndarray) -> list[str]:
+        """Map scores to HIGH/MEDIUM/LOW labels."""
+        return np.where(
+            scores >= self.high_threshold,
+            LABEL_HIGH,
+            np.where(scores >= self.medium_threshold, LABEL_MEDIUM, LABEL_LOW),
+        ).tolist()
+
+    def explain(self, X: np.ndarray) -> list[list[str]]:
+        """Return reason codes for the strongest positive contributions per row."""
+        if not self.reason_codes or X.shape[0] == 0:
+            return [[] for _ in range(X.shape[0])]
+
+        contributions = self.transform(X) * self.coefficients
+        top = np.argsort(-contributions, axis=1)[:, : self.max_reason_codes]
+        codes = []
+        for row, order in zip(contributions, top, strict=True):
+            codes.append(
+                [
+                    self.reason_codes[self.feature_names[i]]
+                    for i in order
+                    if row[i] > 0 and self.feature_names[i] in self.reason_codes
+                ]
+            )
+        return codes
+
+
+# Hand-set governance baseline used until a trained artefact is deployed.
+BASELINE_MODEL = LinearRiskModel(
+    version="baseline-4",
+    feature_names=(
+        "is_claim",
+        "priority_high",
+        "log_summary_length",
+        "log_documents_count",
+        "log_notes_count",
+        "policy_not_active",
+        "log_policy_age_days",
+        "has_near_duplicate",
+        "shared_contact",
+        "log_cluster_claim_velocity",
+        "log_policy_claims_30d",
+    ),
+    coefficients=np.array([0.6, 0.5, -0.15, -0.6, 0.1, 1.8, -0.2, 1.5, 1.0, 0.4, 0.8]),
+    intercept=-0.4,
+    reason_codes={
+        "is_claim": "CLAIM_SUBMISSION",
+        "priority_high": "HIGH_PRIORITY",
+        "log_notes_count": "REVIEWER_ATTENTION",
+        "policy_not_active": "POLICY_NOT_ACTIVE",
+        "has_near_duplicate": "NEAR_DUPLICATE_NARRATIVE",
+        "shared_contact": "SHARED_CONTACT",
+        "log_cluster_claim_velocity": "CLUSTER_CLAIM_VELOCITY",
+        "log_policy_claims_30d": "REPEAT_POLICY_CLAIMS",
+    },
+)
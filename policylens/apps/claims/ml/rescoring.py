@@ -0,0 +1,90 @@
+"""
+Incremental rescoring of claims whose inputs changed.
+
+Service-layer writes call ``mark_claims_dirty`` in their own transaction. The mark is an
+upsert into a small table keyed by claim id that bumps a version counter, so writers never
+wait on the worker. ``drain_dirty_claims`` reads marks in primary key chunks, rescores only
+claims whose feature fingerprint changed, then deletes each mark only if its version is
+still the one it read; a claim touched mid-run stays dirty for the next pass.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterable
+from dataclasses import dataclass
+
+from django.db import connection
+from django.utils import timezone
+
+from policylens.apps.claims.ml.scoring import get_model, score_claims
+from policylens.apps.claims.models import ClaimRescoreMark
+
+
+def mark_claims_dirty(claim_ids: Iterable[int]) -> None:
+    """Flag claims for rescoring with one INSERT ... ON CONFLICT statement."""
+    ids = sorted(set(claim_ids))
+    if not ids:
+        return
+
+    table = connection.ops.quote_name(ClaimRescoreMark._meta.db_table)
+    sql = (
+        f"INSERT INTO {table} (claim_id, version, marked_at) "
+        "SELECT unnest(%s::bigint[]), 1, %s "
+        f"ON CONFLICT (claim_id) DO UPDATE "
+        f"SET version = {table}.version + 1, marked_at = EXCLUDED.marked_at"
+    )
+    with connection.cursor() as cursor:
+        cursor.execute(sql, [ids, timezone.now()])
+
+
+@dataclass(frozen=True)
+class RescoreResult:
+    """Counts from one drain of the dirty set."""
+
+    drained: int
+    rescored: int
+
+    @property
+    def skipped(self) -> int:
+        """Dirty claims whose features had not changed."""
+        return self.drained - self.rescored
+
+
+def _clear_marks(marks: list[tuple[int, int]]) -> None:
+    """Delete marks that have not been bumped since they were read."""
+    table = connection.ops.quote_name(ClaimRescoreMark._meta.db_table)
+    sql = (
+        f"DELETE FROM {table} WHERE (claim_id, version) IN "
+        "(SELECT * FROM unnest(%s::bigint[], %s::bigint[]))"
+    )
+    ids, versions = zip(*marks, strict=True)
+    with connection.cursor() as cursor:
+        cursor.execute(sql, [list(ids), list(versions)])
+
+
+def drain_dirty_claims(*, chunk_size: int = 500, actor: str = "rescore") -> RescoreResult:
+    """Rescore every dirty claim once, in primary key chunks.
+
+    Each chunk is scored in its own transaction, so a failure leaves later marks in place.
+    """
+    model = get_model()
+    drained = rescored = 0
+    last_pk = 0
+    while True:
+        marks = list(
+            ClaimRescoreMark.objects.filter(claim_id__gt=last_pk)
+            .order_by("claim_id")
+            .values_list("claim_id", "version")[:chunk_size]
+        )
+        if not marks:
+            break
+        last_pk = marks[-1][0]
+
+        written = score_claims(
+            [pk for pk, _ in marks], actor=actor, model=model, skip_unchanged=True
+        )
+        _clear_marks(marks)
+        drained += len(marks)
+        rescored += len(written)
+
+    return RescoreResult(drained=drained, rescored=rescored)
@@ -0,0 +1,148 @@
+"""
+Batch scoring service.
+
+``score_claims`` is the single write path for MlScore: features are loaded for the whole
+batch in one query, scored with one vectorised call, and written back with one upsert plus
+one bulk insert of audit evidence. Each batch is also folded into the daily score sketches
+used for drift monitoring.
+
+Each score stores a fingerprint of the model version and the feature values it was computed
+from, so an incremental run can skip claims whose inputs have not changed.
+"""
+
+from __future__ import annotations
+
+import hashlib
+from collections.abc import Mapping, Sequence
+from functools import partial
+
+import numpy as np
+from django.db import transaction
+
+from policylens.apps.claims import live, outbox
+from policylens.apps.claims.ml.artifacts import get_registry
+from policylens.apps.claims.ml.drift import record_scores
+from policylens.apps.claims.ml.features import build_matrix, load_frame
+from policylens.apps.claims.ml.model import LinearRiskModel
+from policylens.apps.claims.ml.shadow import get_shadow_scorer
+from policylens.apps.claims.models import AuditEvent, MlScore
+
+
+def get_model() -> LinearRiskModel:
+    """Return the model resident in this worker process.
+
+    Picks up a newly published artefact between batches without a restart.
+    """
+    return get_registry().current()
+
+
+def feature_fingerprints(model: LinearRiskModel, X: np.ndarray) -> list[str]:
+    """Return one digest per row of ``X`` covering the model version and feature values."""
+    rows = np.ascontiguousarray(X, dtype=np.float64)
+    prefix = model.version.encode()
+    return [hashlib.blake2b(prefix + row.tobytes(), digest_size=16).hexdigest() for row in rows]
+
+
+@transaction.atomic
+def score_claims(
+    claim_ids: Sequence[int],
+    *,
+    actor: str = "system",
+    actors: Mapping[int, str] | None = None,
+    model: LinearRiskModel | None = None,
+    skip_unchanged: bool = False,
+) -> dict[int, MlScore]:
+    """Score a batch of claims and upsert their MlScore rows.
+
+    ``actors`` optionally overrides the audit actor per claim. Unknown claim ids are
+    ignored. With ``skip_unchanged``, claims whose stored fingerprint matches their current
+    features are left alone. Returns the written scores keyed by claim id.
+    """
+    actors = actors or {}
+    model = model or get_model()
+    frame = load_frame(claim_ids)
+    if not len(frame["pk"]):
+        return {}
+
+    X = build_matrix(frame, model.feature_names)
+    fingerprints = feature_fingerprints(model, X)
+    if skip_unchanged:
+        stored = dict(
+            MlScore.objects.filter(claim_id__in=frame["pk"].tolist()).values_list(
+                "claim_id", "feature_fingerprint"
+            )
+        )
+        keep = np.array(
+            [stored.get(pk) != fp for pk, fp in zip(frame["pk"], fingerprints, strict=True)],
+            dtype=bool,
+        )
+        if not keep.any():
+            return {}
+        frame = {name: column[keep] for name, column in frame.items()}
+        X = X[keep]
+        fingerprints = [fp for fp, k in zip(fingerprints, keep, strict=True) if k]
+
+    scores = model.predict(X)
+    labels = model.labels(scores)
+    reasons = model.explain(X)
+
+    written = MlScore.objects.bulk_create(
+        [
+            MlScore(
+                claim_id=pk,
+                score=float(score),
+                label=label,
+                reason_codes=codes,
+                model_version=model.version,
+                feature_fingerprint=fingerprint,
+            )
+            for pk, score, label, codes, fingerprint in zip(
+                frame["pk"], scores, labels, reasons, fingerprints, strict=True
+            )
+        ],
+        update_conflicts=True,
+        unique_fields=["claim"],
+        update_fields=[
+            "score",
+            "label",
+            "reason_codes",
+            "model_version",
+            "feature_fingerprint",
+            "scored_at",
+        ],
+    )
+    record_scores(
+        model_version=model.version,
+        product_types=frame["policy_product_type"],
+        scores=scores,
+    )
+    shadow = get_shadow_scorer()
+    if shadow is not None and shadow.candidate.version != model.version:
+        transaction.on_commit(
+            partial(
+                shadow.submit,
+                frame,
+                live_version=model.version,
+                live_scores=scores,
+                live_labels=labels,
+            )
+        )
+    events = AuditEvent.objects.bulk_create(
+        [
+            AuditEvent(
+                claim_id=row.claim_id,
+                event_type="ML_SCORED",
+                actor=actors.get(row.claim_id, actor),
+                payload={
+                    "score": row.score,
+                    "label": row.label,
+                    "reason_codes": row.reason_codes,
+                    "model_version": model.version,
+                },
+            )
+            for row in written
+        ]
+    )
+    outbox.enqueue(events)
+    live.publish_events(events)
+    return {row.claim_id: row for row in written}
@@ -0,0 +1,236 @@
+"""
+Shadow scoring of a candidate model.
+
+When ``ML_SHADOW_MODEL_VERSION`` names a model artefact, every committed scoring batch is
+handed to a small thread pool that scores the same feature frame with the candidate and
+records both results in ``MlShadowScore``. The primary path only pays for a non-blocking
+semaphore try: if every worker is busy the batch is dropped, never queued.
+
+``ML_SHADOW_TIMEOUT_MS`` is a per-batch budget, checked between stages (feature matrix,
+prediction, labelling, write) because a running thread cannot be interrupted. A batch past
+its deadline stops at the next stage boundary and nothing is written. A worker thread can
+therefore overrun the budget by at most one stage. It keeps its pool slot while it does, so
+a slow candidate makes later batches drop instead of piling up behind it.
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+import time
+from collections import Counter
+from collections.abc import Sequence
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+import numpy as np
+from django.conf import settings
+from django.db import connection
+from django.db.models import Avg, Count, F, Q
+from django.db.models.functions import Abs
+
+from policylens.apps.claims.ml.artifacts import ArtifactError, load_model
+from policylens.apps.claims.ml.features import Frame, build_matrix
+from policylens.apps.claims.ml.metrics import LatencyRecorder
+from policylens.apps.claims.ml.model import LinearRiskModel
+from policylens.apps.claims.models import MlShadowScore
+
+logger = logging.getLogger(__name__)
+
+
+class _OverBudget(Exception):
+    """Raised inside a worker when a batch passes its deadline."""
+
+
+class ShadowScorer:
+    """Bounded, drop-when-busy pool that scores batches with a candidate model."""
+
+    def __init__(self, candidate: LinearRiskModel, *, workers: int, timeout: float) -> None:
+        """Start a pool of ``workers`` threads with a per-batch ``timeout`` in seconds."""
+        self.candidate = candidate
+        self.timeout = timeout
+        self.latency = LatencyRecorder()
+        self._executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="ml-shadow")
+        self._slots = threading.BoundedSemaphore(workers)
+        self._lock = threading.Lock()
+        self._counters: Counter[str] = Counter()
+
+    def _count(self, name: str) -> None:
+        """Increment one pool counter."""
+        with self._lock:
+            self._counters[name] += 1
+
+    def counters(self) -> dict[str, int]:
+        """Return submitted/completed/dropped/timed_out/failed batch counts."""
+        with self._lock:
+            return {
+                name: self._counters[name]
+                for name in ("submitted", "completed", "dropped", "timed_out", "failed")
+            }
+
+    def submit(
+        self,
+        frame: Frame,
+        *,
+        live_version: str,
+        live_scores: np.ndarray,
+        live_labels: Sequence[str],
+    ) -> bool:
+        """Hand a scored batch to the pool; return False if it was dropped."""
+        if not self._slots.acquire(blocking=False):
+            self._count("dropped")
+            return False
+        self._count("submitted")
+        deadline = time.monotonic() + self.timeout
+        try:
+            self._executor.submit(
+                self._run, frame, live_version, live_scores, list(live_labels), deadline
+            )
+        except RuntimeError:  # Pool shut down.
+            self._slots.release()
+            self._count("dropped")
+            return False
+        return True
+
+    def _run(
+        self,
+        frame: Frame,
+        live_version: str,
+        live_scores: np.ndarray,
+        live_labels: list[str],
+        deadline: float,
+    ) -> None:
+        """Score with the candidate and record the comparison, stopping once over budget."""
+
+        def check_budget() -> None:
+            if time.monotonic() > deadline:
+                raise _OverBudget
+
+        started = time.perf_counter()
+        try:
+            X = build_matrix(frame, self.candidate.feature_names)
+            check_budget()
+            scores = self.candidate.predict(X)
+            check_budget()
+            labels = self.candidate.labels(scores)
+            elapsed = time.perf_counter() - started
+            check_budget()
+
+            MlShadowScore.objects.bulk_create(
+                [
+                    MlShadowScore(
+                        claim_id=pk,
+                        candidate_version=self.candidate.version,
+                        live_version=live_version,
+                        live_score=float(live_score),
+                        live_label=live_label,
+                        shadow_score=float(score),
+                        shadow_label=label,
+                        shadow_ms=elapsed * 1000.0,
+                    )
+                    for pk, live_score, live_label, score, label in zip(
+                        frame["pk"], live_scores, live_labels, scores, labels, strict=True
+                    )
+                ]
+            )
+            self.latency.record(elapsed)
+            self.latency.record_batch(len(labels))
+            self._count("completed")
+        except _OverBudget:
+            self._count("timed_out")
+        except Exception:
+            logger.exception("Shadow scoring with %s failed.", self.candidate.version)
+            self._count("failed")
+        finally:
+            connection.close()
+            self._slots.release()
+
+    def shutdown(self) -> None:
+        """Wait for in-flight batches and stop the pool."""
+        self._executor.shutdown(wait=True)
+
+
+_shadow: ShadowScorer | None = None
+_shadow_key: tuple | None = None
+_shadow_lock = threading.Lock()
+
+
+def get_shadow_scorer() -> ShadowScorer | None:
+    """Return this process's shadow scorer, or None when shadow mode is off.
+
+    A candidate that cannot be loaded disables shadow mode rather than failing scoring.
+    """
+    global _shadow, _shadow_key
+    version = settings.ML_SHADOW_MODEL_VERSION
+    if not version:
+        return None
+
+    key = (
+        version,
+        settings.ML_MODEL_DIR,
+        settings.ML_SHADOW_WORKERS,
+        settings.ML_SHADOW_TIMEOUT_MS,
+    )
+    with _shadow_lock:
+        if key != _shadow_key:
+            if _shadow is not None:
+                _shadow.shutdown()
+            _shadow, _shadow_key = None, key
+            try:
+                candidate = load_model(Path(settings.ML_MODEL_DIR) / version)
+            except ArtifactError:
+                logger.exception("Shadow model %s could not be loaded.", version)
+            else:
+                _shadow = ShadowScorer(
+                    candidate,
+                    workers=max(1, settings.ML_SHADOW_WORKERS),
+                    timeout=settings.ML_SHADOW_TIMEOUT_MS / 1000.0,
+                )
+        return _shadow
+
+
+def shadow_report(candidate_version: str) -> dict[str, object]:
+    """Summarise agreement and latency between a candidate and the live model."""
+    rows = MlShadowScore.objects.filter(candidate_version=candidate_version)
+    summary = rows.aggregate(
+        compared=Count("pk"),
+        label_agreement=Count("pk", filter=Q(live_label=F("shadow_label"))),
+        mean_abs_score_diff=Avg(Abs(F("live_score") - F("shadow_score"))),
+    )
+    compared = summary["compared"]
+    by_label = {
+        (live, shadow): count
+        for live, shadow, count in rows.values_list("live_label", "shadow_label")
+        .annotate(count=Count("pk"))
+        .order_by("live_label", "shadow_label")
+    }
+
+    with connection.cursor() as cursor:
+        cursor.execute(
+            "SELECT percentile_cont(ARRAY[0.5, 0.95, 0.99]) WITHIN GROUP (ORDER BY shadow_ms) "
+            f"FROM {connection.ops.quote_name(MlShadowScore._meta.db_table)} "
+            "WHERE candidate_version = %s",
+            [candidate_version],
+        )
+        percentiles = cursor.fetchone()[0] or [None, None, None]
+
+    mean_diff = summary["mean_abs_score_diff"]
+    return {
+        "candidate_version": candidate_version,
+        "compared": compared,
+        "label_agreement_rate": (
+            round(summary["label_agreement"] / compared, 6) if compared else None
+        ),
+        "mean_abs_score_diff": round(mean_diff, 6) if mean_diff is not None else None,
+        "confusion": [
+            {"live_label": live, "shadow_label": shadow, "count": count}
+            for (live, shadow), count in by_label.items()
+        ],
+        "shadow_batch_ms": dict(
+            zip(
+                ("p50", "p95", "p99"),
+                [round(p, 3) if p is not None else None for p in percentiles],
+                strict=True,
+            )
+        ),
+    }
@@ -0,0 +1,148 @@
+"""
+Threshold what-if simulation over persisted scores.
+
+All scores for a model version are loaded once into a sorted NumPy array with prefix sums of
+the per-claim indicators governance asks about (open for review, known outcome, rejected).
+Any threshold is then answered with one binary search and a few array lookups, so a sweep
+over thousands of thresholds costs microseconds after the first load. Distributions are
+cached per worker process and per model version, and refreshed after
+``ML_SIMULATION_CACHE_SECONDS``.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from collections.abc import Sequence
+from dataclasses import dataclass
+from itertools import islice
+
+import numpy as np
+from django.conf import settings
+
+from policylens.apps.claims.ml.training import POSITIVE_DECISION, final_decision
+from policylens.apps.claims.models import Claim, MlScore
+
+_LOAD_CHUNK_SIZE = 50_000
+
+
+@dataclass(frozen=True)
+class ScoreDistribution:
+    """Scores for one model version, sorted ascending, with prefix sums of indicators.
+
+    ``open_prefix[k]`` is the number of open claims among the ``k`` lowest scores; the same
+    holds for ``decided_prefix`` (claims with a final outcome) and ``positive_prefix``
+    (claims whose final outcome was a rejection).
+    """
+
+    model_version: str
+    scores: np.ndarray
+    open_prefix: np.ndarray
+    decided_prefix: np.ndarray
+    positive_prefix: np.ndarray
+    loaded_at: float
+
+    @property
+    def size(self) -> int:
+        """Number of scored claims."""
+        return int(self.scores.size)
+
+    def simulate(self, thresholds: Sequence[float]) -> list[dict[str, float | int | None]]:
+        """Return workload and outcome counts for claims scoring at or above each threshold."""
+        cuts = np.asarray(thresholds, dtype=np.float64)
+        first = np.searchsorted(self.scores, cuts, side="left")
+        n = self.size
+
+        def above(prefix: np.ndarray) -> np.ndarray:
+            return prefix[-1] - prefix[first]
+
+        flagged = n - first
+        flagged_open = above(self.open_prefix)
+        flagged_decided = above(self.decided_prefix)
+        flagged_positive = above(self.positive_prefix)
+        positives = int(self.positive_prefix[-1])
+
+        rows = []
+        for i, threshold in enumerate(cuts.tolist()):
+            decided = int(flagged_decided[i])
+            hits = int(flagged_positive[i])
+            rows.append(
+                {
+                    "threshold": threshold,
+                    "flagged": int(flagged[i]),
+                    "flagged_rate": round(int(flagged[i]) / n, 6) if n else None,
+                    "open_flagged": int(flagged_open[i]),
+                    "decided_flagged": decided,
+                    "rejected_flagged": hits,
+                    "precision": round(hits / decided, 6) if decided else None,
+                    "recall": round(hits / positives, 6) if positives else None,
+                }
+            )
+        return rows
+
+
+def _prefix(flags: np.ndarray) -> np.ndarray:
+    """Prefix sums with a leading zero."""
+    out = np.zeros(flags.size + 1, dtype=np.int64)
+    np.cumsum(flags, out=out[1:])
+    return out
+
+
+def load_distribution(model_version: str) -> ScoreDistribution:
+    """Read every score for ``model_version`` in chunks and build the sorted arrays."""
+    rows = (
+        MlScore.objects.filter(model_version=model_version)
+        .annotate(outcome=final_decision("claim_id"))
+        .values_list("score", "claim__status", "outcome")
+        .iterator(chunk_size=_LOAD_CHUNK_SIZE)
+    )
+    scores, is_open, decided, positive = [], [], [], []
+    while chunk := list(islice(rows, _LOAD_CHUNK_SIZE)):
+        score, status, outcome = (
+            np.array(column, dtype=object) for column in zip(*chunk, strict=True)
+        )
+        scores.append(score.astype(np.float64))
+        is_open.append(status != Claim.Status.DECIDED)
+        decided.append(np.not_equal(outcome, None))
+        positive.append(outcome == POSITIVE_DECISION)
+
+    def joined(parts: list[np.ndarray], dtype) -> np.ndarray:
+        return np.concatenate(parts).astype(dtype) if parts else np.zeros(0, dtype=dtype)
+
+    all_scores = joined(scores, np.float64)
+    order = np.argsort(all_scores, kind="stable")
+    return ScoreDistribution(
+        model_version=model_version,
+        scores=all_scores[order],
+        open_prefix=_prefix(joined(is_open, bool)[order]),
+        decided_prefix=_prefix(joined(decided, bool)[order]),
+        positive_prefix=_prefix(joined(positive, bool)[order]),
+        loaded_at=time.monotonic(),
+    )
+
+
+class DistributionCache:
+    """Per-process cache of score distributions keyed by model version."""
+
+    def __init__(self) -> None:
+        """Create an empty cache."""
+        self._lock = threading.Lock()
+        self._entries: dict[str, ScoreDistribution] = {}
+
+    def get(self, model_version: str) -> ScoreDistribution:
+        """Return a fresh enough distribution, loading it at most once per expiry."""
+        ttl = settings.ML_SIMULATION_CACHE_SECONDS
+        with self._lock:
+            entry = self._entries.get(model_version)
+            if entry is None or time.monotonic() - entry.loaded_at > ttl:
+                entry = load_distribution(model_version)
+                self._entries[model_version] = entry
+            return entry
+
+    def clear(self) -> None:
+        """Drop all cached distributions."""
+        with self._lock:
+            self._entries.clear()
+
+
+distributions = DistributionCache()
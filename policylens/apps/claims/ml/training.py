@@ -0,0 +1,166 @@
+"""
+Out-of-core training of the linear risk model.
+
+Decided claims are streamed from the database in primary key chunks through a server-side
+cursor and the logistic model is fitted by mini-batch gradient descent, one chunk per step.
+Memory is bounded by one chunk regardless of history size. A deterministic slice of claim
+ids is held out and scored in a separate streamed pass after the final epoch.
+"""
+
+from __future__ import annotations
+
+import dataclasses
+import time
+from collections.abc import Sequence
+from dataclasses import dataclass
+
+import numpy as np
+from django.db.models import OuterRef, QuerySet, Subquery
+from django.db.models.functions import Mod
+
+from policylens.apps.claims.ml.features import build_matrix, frame_queryset, iter_frames
+from policylens.apps.claims.ml.model import BASELINE_MODEL, LinearRiskModel
+from policylens.apps.claims.models import Claim, ReviewDecision
+
+# A rejected claim is the positive class; approvals are negatives.
+POSITIVE_DECISION = ReviewDecision.Decision.REJECT
+
+
+class TrainingDataError(Exception):
+    """Raised when there is not enough decided history to train on."""
+
+
+@dataclass(frozen=True)
+class TrainingReport:
+    """Trained model plus throughput and holdout metrics."""
+
+    model: LinearRiskModel
+    epochs: int
+    train_rows: int
+    holdout_rows: int
+    seconds: float
+    holdout: dict[str, float | None]
+
+    @property
+    def rows_per_second(self) -> float:
+        """Training rows processed per second across all epochs."""
+        return self.train_rows * self.epochs / self.seconds if self.seconds else 0.0
+
+
+def final_decision(claim_ref: str = "pk") -> Subquery:
+    """Subquery for the latest APPROVE/REJECT decision of the claim at ``claim_ref``."""
+    return Subquery(
+        ReviewDecision.objects.filter(claim=OuterRef(claim_ref))
+        .exclude(decision=ReviewDecision.Decision.REQUEST_INFO)
+        .order_by("-decided_at", "-pk")
+        .values("decision")[:1]
+    )
+
+
+def decided_claims() -> QuerySet[Claim]:
+    """Return decided claims annotated with their final outcome."""
+    return (
+        frame_queryset()
+        .filter(status=Claim.Status.DECIDED)
+        .annotate(outcome=final_decision(), holdout_bucket=Mod("pk", 100))
+        .filter(outcome__isnull=False)
+    )
+
+
+def _sigmoid(z: np.ndarray) -> np.ndarray:
+    """Logistic function."""
+    return 1.0 / (1.0 + np.exp(-z))
+
+
+def _auc(y: np.ndarray, p: np.ndarray) -> float | None:
+    """Area under the ROC curve via the rank-sum statistic, with tied ranks averaged."""
+    positives = int(y.sum())
+    negatives = y.size - positives
+    if not positives or not negatives:
+        return None
+    _, inverse, counts = np.unique(p, return_inverse=True, return_counts=True)
+    ends = np.cumsum(counts)
+    ranks = (ends - (counts - 1) / 2.0)[inverse]
+    return float((ranks[y].sum() - positives * (positives + 1) / 2.0) / (positives * negatives))
+
+
+def _holdout_metrics(y: np.ndarray, p: np.ndarray, threshold: float) -> dict[str, float | None]:
+    """Log loss, AUC, and accuracy at ``threshold`` for holdout predictions."""
+    if not y.size:
+        return {"log_loss": None, "auc": None, "accuracy": None, "positive_rate": None}
+    clipped = np.clip(p, 1e-12, 1 - 1e-12)
+    log_loss = -np.mean(y * np.log(clipped) + (~y) * np.log(1 - clipped))
+    auc = _auc(y, p)
+    return {
+        "log_loss": round(float(log_loss), 6),
+        "auc": round(auc, 6) if auc is not None else None,
+        "accuracy": round(float(np.mean((p >= threshold) == y)), 6),
+        "positive_rate": round(float(y.mean()), 6),
+    }
+
+
+def train_incremental(
+    *,
+    version: str,
+    feature_names: Sequence[str] = BASELINE_MODEL.feature_names,
+    epochs: int = 5,
+    chunk_size: int = 2000,
+    learning_rate: float = 0.5,
+    l2: float = 1e-4,
+    holdout_percent: int = 20,
+    base: LinearRiskModel = BASELINE_MODEL,
+) -> TrainingReport:
+    """Fit a logistic model over decided claims without loading them all at once.
+
+    Claims with ``pk % 100 < holdout_percent`` are held out. ``base`` supplies reason codes
+    and label thresholds for the trained model.
+    """
+    names = tuple(feature_names)
+    weights = np.zeros(len(names))
+    intercept = 0.0
+    queryset = decided_claims()
+    train = queryset.filter(holdout_bucket__gte=holdout_percent)
+    holdout = queryset.filter(holdout_bucket__lt=holdout_percent)
+
+    started = time.perf_counter()
+    train_rows = 0
+    for epoch in range(epochs):
+        for frame in iter_frames(train, extra=("outcome",), chunk_size=chunk_size):
+            X = build_matrix(frame, names)
+            y = frame["outcome"] == POSITIVE_DECISION
+            error = _sigmoid(X @ weights + intercept) - y
+            weights -= learning_rate * (X.T @ error / len(y) + l2 * weights)
+            intercept -= learning_rate * float(error.mean())
+            if epoch == 0:
+                train_rows += len(y)
+        if not train_rows:
+            raise TrainingDataError("No decided claims outside the holdout to train on.")
+    seconds = time.perf_counter() - started
+
+    model = dataclasses.replace(
+        base,
+        version=version,
+        feature_names=names,
+        coefficients=weights,
+        intercept=intercept,
+        reason_codes={k: v for k, v in base.reason_codes.items() if k in names},
+        bin_edges=None,
+        bin_values=None,
+        bin_offsets=None,
+    )
+
+    labels, predictions = [], []
+    for frame in iter_frames(holdout, extra=("outcome",), chunk_size=chunk_size):
+        labels.append(frame["outcome"] == POSITIVE_DECISION)
+        predictions.append(model.predict(build_matrix(frame, names)))
+    y = np.concatenate(labels).astype(bool) if labels else np.zeros(0, dtype=bool)
+    p = np.concatenate(predictions) if predictions else np.zeros(0)
+
+    return TrainingReport(
+        model=model,
+        epochs=epochs,
+        train_rows=train_rows,
+        holdout_rows=int(y.size),
+        seconds=seconds,
+        holdout=_holdout_metrics(y, p, base.medium_threshold),
+    )
@@ -10,7 +10,9 @@ Week 2 adds:
 
 from __future__ import annotations
 
+from django.contrib.postgres.fields import ArrayField
 from django.db import models
+from django.utils import timezone
 
 
 class PolicyHolder(models.Model):
@@ -19,6 +21,13 @@ class PolicyHolder(models.Model):
     full_name = models.CharField(max_length=255)
     email = models.EmailField(blank=True)
     phone = models.CharField(max_length=32, blank=True)
+    cluster = models.ForeignKey(
+        "EntityCluster",
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+        related_name="holders",
+    )
     created_at = models.DateTimeField(auto_now_add=True)
 
     class Meta:
@@ -30,6 +39,40 @@ class PolicyHolder(models.Model):
         return f"{self.full_name}".strip() or f"PolicyHolder:{self.pk}"
 
 
+class EntityCluster(models.Model):
+    """Connected component of holders linked through shared contact identifiers.
+
+    Every holder points straight at its cluster, and cluster statistics are maintained on
+    holder and claim writes, so reading a holder's cluster size or claim velocity is a
+    single row lookup. ``claim_velocity`` is an exponentially decayed claim count as of
+    ``velocity_at``; see ``entity_links.velocity_now``.
+    """
+
+    size = models.PositiveIntegerField(default=1)
+    claim_count = models.PositiveIntegerField(default=0)
+    claim_velocity = models.FloatField(default=0.0)
+    velocity_at = models.DateTimeField(null=True, blank=True)
+    updated_at = models.DateTimeField(auto_now=True)
+
+
+class HolderContactKey(models.Model):
+    """Normalised contact identifier (``email:...`` or ``phone:...``) of a holder."""
+
+    holder = models.ForeignKey(PolicyHolder, on_delete=models.CASCADE, related_name="contact_keys")
+    # "email:" plus a full-length (254 character) EmailField address.
+    key = models.CharField(max_length=261)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(
+                fields=["holder", "key"], name="claims_contact_holder_key_uniq"
+            ),
+        ]
+        indexes = [
+            models.Index(fields=["key"]),
+        ]
+
+
 class Policy(models.Model):
     """An insurance policy linked to a policy holder."""
 
@@ -50,6 +93,7 @@ class Policy(models.Model):
         indexes = [
             models.Index(fields=["policy_number"]),
             models.Index(fields=["status"]),
+            models.Index(fields=["product_type"]),
         ]
 
     def __str__(self) -> str:
@@ -78,6 +122,9 @@ class Claim(models.Model):
     status = models.CharField(max_length=16, choices=Status.choices, default=Status.NEW)
     priority = models.CharField(max_length=16, choices=Priority.choices, default=Priority.NORMAL)
     summary = models.TextField(blank=True)
+    # Percentage of required checklist items satisfied, kept in step with ChecklistItem so
+    # queues can sort and filter on it without a join.
+    checklist_completeness = models.PositiveSmallIntegerField(default=100, db_default=100)
 
     # Week 2 uses string actor ids. Week 5 UI will use authenticated users.
     created_by = models.CharField(max_length=128, blank=True)
@@ -89,6 +136,15 @@ class Claim(models.Model):
         indexes = [
             models.Index(fields=["status", "priority"]),
             models.Index(fields=["created_at"]),
+            models.Index(fields=["created_by", "created_at"]),
+            models.Index(fields=["policy", "created_at"]),
+            models.Index(fields=["checklist_completeness", "created_at"]),
+            # Open claims are a small, hot slice of the table; keep them in their own index.
+            models.Index(
+                fields=["created_at"],
+                condition=~models.Q(status="DECIDED"),
+                name="claims_claim_open_created_idx",
+            ),
         ]
         ordering = ["-created_at"]
 
@@ -134,6 +190,42 @@ class InternalNote(models.Model):
         ordering = ["-created_at"]
 
 
+class ChecklistTemplate(models.Model):
+    """A checklist item created on new claims of a claim type and product.
+
+    A blank ``product_type`` applies to every product; a product-specific template replaces
+    a generic one with the same key.
+    """
+
+    class Rule(models.TextChoices):
+        DOCUMENT = "DOCUMENT", "Document uploaded"
+        NOTE = "NOTE", "Note added"
+
+    claim_type = models.CharField(max_length=32, choices=Claim.Type.choices)
+    product_type = models.CharField(max_length=128, blank=True)
+    key = models.CharField(max_length=64)
+    label = models.CharField(max_length=255)
+    is_required = models.BooleanField(default=True)
+    rule = models.CharField(max_length=16, choices=Rule.choices)
+    match = models.CharField(
+        max_length=128,
+        blank=True,
+        help_text="Case-insensitive text the document name or type, or the note body, must "
+        "contain. Blank matches anything.",
+    )
+    position = models.PositiveSmallIntegerField(default=0)
+    is_active = models.BooleanField(default=True)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(
+                fields=["claim_type", "product_type", "key"],
+                name="claims_checklist_template_uniq",
+            ),
+        ]
+        ordering = ["position", "key"]
+
+
 class ChecklistItem(models.Model):
     """A deterministic checklist item used for completeness and review."""
 
@@ -142,6 +234,10 @@ class ChecklistItem(models.Model):
     label = models.CharField(max_length=255)
     is_required = models.BooleanField(default=True)
     is_satisfied = models.BooleanField(default=False)
+    # Copied from the template so later template edits do not change open claims.
+    rule = models.CharField(max_length=16, choices=ChecklistTemplate.Rule.choices, blank=True)
+    match = models.CharField(max_length=128, blank=True)
+    satisfied_at = models.DateTimeField(null=True, blank=True)
     updated_at = models.DateTimeField(auto_now=True)
 
     class Meta:
@@ -198,11 +294,48 @@ class AuditEvent(models.Model):
     class Meta:
         indexes = [
             models.Index(fields=["claim", "created_at"]),
-            models.Index(fields=["event_type"]),
+            models.Index(fields=["event_type", "created_at"]),
+            models.Index(fields=["actor", "created_at"]),
         ]
         ordering = ["-created_at"]
 
 
+class OutboxMessage(models.Model):
+    """An audit event awaiting delivery to one downstream endpoint.
+
+    Rows are written in the same transaction as their audit event, one per configured
+    endpoint, and drained in id order by the ``dispatch_outbox`` command.
+    """
+
+    class Status(models.TextChoices):
+        PENDING = "PENDING", "Pending"
+        DELIVERED = "DELIVERED", "Delivered"
+        DEAD = "DEAD", "Dead"
+
+    endpoint = models.CharField(max_length=64)
+    audit_event = models.ForeignKey(
+        AuditEvent, on_delete=models.CASCADE, related_name="outbox_messages"
+    )
+    event_type = models.CharField(max_length=64)
+    body = models.JSONField()
+    status = models.CharField(max_length=16, choices=Status.choices, default=Status.PENDING)
+    attempts = models.PositiveIntegerField(default=0)
+    next_attempt_at = models.DateTimeField(default=timezone.now)
+    last_error = models.TextField(blank=True)
+    created_at = models.DateTimeField(auto_now_add=True)
+    delivered_at = models.DateTimeField(null=True, blank=True)
+
+    class Meta:
+        indexes = [
+            # The dispatcher only ever reads the pending head of each endpoint's queue.
+            models.Index(
+                fields=["endpoint", "id"],
+                condition=models.Q(status="PENDING"),
+                name="claims_outbox_pending_idx",
+            ),
+        ]
+
+
 class MlScore(models.Model):
     """ML score placeholder.
 
@@ -213,4 +346,180 @@ class MlScore(models.Model):
     score = models.FloatField(default=0.0)
     label = models.CharField(max_length=32, blank=True)
     reason_codes = models.JSONField(default=list)
+    model_version = models.CharField(max_length=64, blank=True)
+    feature_fingerprint = models.CharField(max_length=32, blank=True)
     scored_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        indexes = [
+            models.Index(fields=["score"]),
+        ]
+
+
+class MlShadowScore(models.Model):
+    """A candidate model's score recorded next to the live score for the same batch.
+
+    Written by shadow scoring only; never read by the primary scoring path.
+    """
+
+    claim = models.ForeignKey(Claim, on_delete=models.CASCADE, related_name="shadow_scores")
+    candidate_version = models.CharField(max_length=64)
+    live_version = models.CharField(max_length=64)
+    live_score = models.FloatField()
+    live_label = models.CharField(max_length=32)
+    shadow_score = models.FloatField()
+    shadow_label = models.CharField(max_length=32)
+    shadow_ms = models.FloatField(help_text="Candidate scoring time for the whole batch.")
+    scored_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        indexes = [
+            models.Index(fields=["candidate_version", "scored_at"]),
+        ]
+
+
+class ScoreSketch(models.Model):
+    """Fixed-width histogram of scores written per day, model version, and product type.
+
+    Histograms over the [0, 1] score range merge by elementwise addition, so any window's
+    distribution is the sum of its daily rows. Maintained by ``score_claims``.
+    """
+
+    day = models.DateField()
+    model_version = models.CharField(max_length=64)
+    product_type = models.CharField(max_length=128)
+    counts = ArrayField(models.BigIntegerField())
+    total = models.BigIntegerField(default=0)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(
+                fields=["day", "model_version", "product_type"],
+                name="claims_score_sketch_key_uniq",
+            ),
+        ]
+
+
+class ClaimMinHash(models.Model):
+    """MinHash signature of a claim summary.
+
+    ``near_duplicates`` counts other claims whose estimated similarity passes the
+    near-duplicate threshold; it feeds the ``has_near_duplicate`` risk feature.
+    """
+
+    claim = models.OneToOneField(
+        Claim, on_delete=models.CASCADE, primary_key=True, related_name="minhash"
+    )
+    signature = models.BinaryField()
+    near_duplicates = models.PositiveIntegerField(default=0)
+
+
+class ClaimLshBucket(models.Model):
+    """One LSH band of a claim's MinHash signature.
+
+    Claims sharing any ``(band, bucket)`` pair are near-duplicate candidates.
+    """
+
+    claim = models.ForeignKey(Claim, on_delete=models.CASCADE, related_name="lsh_buckets")
+    band = models.PositiveSmallIntegerField()
+    bucket = models.BigIntegerField()
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(fields=["claim", "band"], name="claims_lsh_claim_band_uniq"),
+        ]
+        indexes = [
+            models.Index(fields=["band", "bucket"]),
+        ]
+
+
+class ClaimVelocityBucket(models.Model):
+    """Daily claim count for one policy or one holder.
+
+    Maintained by ``create_claim`` with delta upserts; sliding-window frequency features
+    sum a handful of these rows instead of counting Claim.
+    """
+
+    class Entity(models.TextChoices):
+        POLICY = "policy", "Policy"
+        HOLDER = "holder", "Holder"
+
+    entity_type = models.CharField(max_length=8, choices=Entity.choices)
+    entity_id = models.BigIntegerField()
+    day = models.DateField()
+    count = models.IntegerField(default=0)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(
+                fields=["entity_type", "entity_id", "day"],
+                name="claims_velocity_bucket_uniq",
+            ),
+        ]
+
+
+class ClaimRescoreMark(models.Model):
+    """Dirty set of claims whose risk score may be stale.
+
+    Services upsert a row (bumping ``version``) in the same transaction as any write that
+    can change a claim's features; the ``rescore_dirty_claims`` worker drains it.
+    """
+
+    claim = models.OneToOneField(
+        Claim, on_delete=models.CASCADE, primary_key=True, related_name="rescore_mark"
+    )
+    version = models.BigIntegerField(default=1)
+    marked_at = models.DateTimeField()
+
+
+class ClaimFacetCount(models.Model):
+    """Rollup of claim counts keyed by facet tuple.
+
+    Maintained incrementally by the service layer so dashboards never GROUP BY over Claim.
+    Rebuild with the ``rebuild_claim_facets`` management command if it drifts.
+    """
+
+    status = models.CharField(max_length=16, choices=Claim.Status.choices)
+    priority = models.CharField(max_length=16, choices=Claim.Priority.choices)
+    claim_type = models.CharField(max_length=32, choices=Claim.Type.choices)
+    product_type = models.CharField(max_length=128)
+    count = models.BigIntegerField(default=0)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(
+                fields=["status", "priority", "claim_type", "product_type"],
+                name="claims_facet_count_tuple_uniq",
+            ),
+        ]
+
+
+class IdempotencyKey(models.Model):
+    """Response snapshot for a client-supplied ``Idempotency-Key``.
+
+    Rows are inserted in the same transaction as the write they guard, so a concurrent retry
+    blocks on the unique constraint and then replays the stored response.
+    """
+
+    actor = models.CharField(max_length=128)
+    key = models.CharField(max_length=255)
+    method = models.CharField(max_length=8)
+    path = models.CharField(max_length=255)
+    # SHA-256 of the parsed request body; a reused key must come with the same body.
+    request_fingerprint = models.CharField(max_length=64, blank=True, default="")
+    status_code = models.PositiveSmallIntegerField(null=True, blank=True)
+    response_body = models.JSONField(null=True, blank=True)
+    created_at = models.DateTimeField(auto_now_add=True)
+    expires_at = models.DateTimeField()
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(
+                fields=["actor", "key"], name="claims_idempotency_actor_key_uniq"
+            ),
+        ]
+        indexes = [
+            models.Index(fields=["expires_at"]),
+        ]
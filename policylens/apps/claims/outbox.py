@@ -0,0 +1,222 @@
+"""
+Transactional outbox for downstream webhooks.
+
+Audit events of the types in ``OUTBOX_EVENT_TYPES`` are copied into ``OutboxMessage``, one
+row per endpoint in ``OUTBOX_ENDPOINTS``, inside the transaction that writes the event. A
+message therefore exists exactly when its business change committed, and the write path
+never waits on a downstream system.
+
+``dispatch`` drains the outbox. Endpoints are served concurrently, at most
+``OUTBOX_CONCURRENCY`` at a time. Each endpoint's queue is delivered strictly in id order:
+the oldest pending messages are POSTed as one JSON batch, and a failed batch blocks the
+endpoint until its exponential backoff expires. After a failure, messages are retried one at
+a time so a single rejected message cannot exhaust its neighbours' attempts; messages that
+fail ``OUTBOX_MAX_ATTEMPTS`` times are marked dead and the queue moves on.
+
+A transaction-scoped advisory lock per endpoint lets several dispatchers run at once without
+delivering one endpoint's messages out of order or twice.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import urllib.error
+import urllib.request
+import zlib
+from collections.abc import Iterable, Sequence
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from datetime import timedelta
+
+from django.conf import settings
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import connection, transaction
+from django.db.models import Q
+from django.utils import timezone
+
+from policylens.apps.claims.models import AuditEvent, OutboxMessage
+
+logger = logging.getLogger(__name__)
+
+Status = OutboxMessage.Status
+
+_MAX_BACKOFF = timedelta(hours=1)
+_ERROR_LENGTH = 500
+
+
+def message_body(event: AuditEvent) -> dict:
+    """Wire representation of an audit event."""
+    return {
+        "id": event.pk,
+        "event_type": event.event_type,
+        "claim_id": event.claim_id,
+        "actor": event.actor,
+        "occurred_at": event.created_at.isoformat(),
+        "payload": event.payload,
+    }
+
+
+def enqueue(events: Iterable[AuditEvent]) -> int:
+    """Queue events for every configured endpoint; return the number of messages written.
+
+    Call inside the transaction that wrote the events.
+    """
+    endpoints = sorted(settings.OUTBOX_ENDPOINTS)
+    if not endpoints:
+        return 0
+    wanted = set(settings.OUTBOX_EVENT_TYPES)
+    messages = [
+        OutboxMessage(
+            endpoint=endpoint,
+            audit_event=event,
+            event_type=event.event_type,
+            body=message_body(event),
+        )
+        for event in events
+        if event.event_type in wanted
+        for endpoint in endpoints
+    ]
+    OutboxMessage.objects.bulk_create(messages)
+    return len(messages)
+
+
+@dataclass
+class DispatchResult:
+    """Message counts from one dispatch run."""
+
+    delivered: int = 0
+    failed: int = 0
+    dead: int = 0
+
+    def add(self, other: DispatchResult) -> None:
+        """Accumulate another result into this one."""
+        self.delivered += other.delivered
+        self.failed += other.failed
+        self.dead += other.dead
+
+
+class DeliveryError(Exception):
+    """Raised when an endpoint does not acknowledge a batch."""
+
+
+def post_batch(url: str, bodies: Sequence[dict], *, timeout: float) -> None:
+    """POST a batch of messages; any non-2xx response or transport error raises."""
+    data = json.dumps({"events": list(bodies)}, cls=DjangoJSONEncoder).encode()
+    request = urllib.request.Request(
+        url, data=data, method="POST", headers={"Content-Type": "application/json"}
+    )
+    try:
+        with urllib.request.urlopen(request, timeout=timeout) as response:
+            response.read()
+    except urllib.error.HTTPError as exc:
+        raise DeliveryError(f"HTTP {exc.code}") from exc
+    except (urllib.error.URLError, OSError) as exc:
+        raise DeliveryError(str(getattr(exc, "reason", exc))) from exc
+
+
+def backoff(attempts: int) -> timedelta:
+    """Delay before retrying a message that has failed ``attempts`` times."""
+    delay = timedelta(seconds=settings.OUTBOX_BACKOFF_SECONDS * 2 ** (attempts - 1))
+    return min(delay, _MAX_BACKOFF)
+
+
+def _try_lock(endpoint: str) -> bool:
+    """Take the endpoint's advisory lock for the current transaction, without waiting."""
+    with connection.cursor() as cursor:
+        cursor.execute(
+            "SELECT pg_try_advisory_xact_lock(%s, %s)",
+            [zlib.crc32(b"outbox") - 2**31, zlib.crc32(endpoint.encode()) - 2**31],
+        )
+        return cursor.fetchone()[0]
+
+
+def deliver_batch(endpoint: str, url: str, *, batch_size: int) -> DispatchResult | None:
+    """Deliver the head of one endpoint's queue.
+
+    Returns None when there is nothing due: the queue is empty, its head is backing off, or
+    another dispatcher holds the endpoint.
+    """
+    result = DispatchResult()
+    with transaction.atomic():
+        if not _try_lock(endpoint):
+            return None
+        pending = OutboxMessage.objects.filter(endpoint=endpoint, status=Status.PENDING)
+        head = list(pending.order_by("pk")[:batch_size])
+        if not head or head[0].next_attempt_at > timezone.now():
+            return None
+        batch = head[:1] if head[0].attempts else head
+
+        try:
+            post_batch(url, [m.body for m in batch], timeout=settings.OUTBOX_TIMEOUT_SECONDS)
+        except DeliveryError as exc:
+            now = timezone.now()
+            for message in batch:
+                message.attempts += 1
+                message.last_error = str(exc)[:_ERROR_LENGTH]
+                message.next_attempt_at = now + backoff(message.attempts)
+                if message.attempts >= settings.OUTBOX_MAX_ATTEMPTS:
+                    message.status = Status.DEAD
+                    result.dead += 1
+                else:
+                    result.failed += 1
+            OutboxMessage.objects.bulk_update(
+                batch, ["attempts", "last_error", "next_attempt_at", "status"]
+            )
+            logger.warning("Outbox delivery to %s failed: %s", endpoint, exc)
+            return result
+
+        OutboxMessage.objects.filter(pk__in=[m.pk for m in batch]).update(
+            status=Status.DELIVERED, delivered_at=timezone.now()
+        )
+        result.delivered = len(batch)
+        return result
+
+
+def _drain(endpoint: str, url: str, *, batch_size: int, max_batches: int) -> DispatchResult:
+    """Deliver batches for one endpoint until it has nothing due or a delivery fails."""
+    total = DispatchResult()
+    try:
+        for _ in range(max_batches):
+            result = deliver_batch(endpoint, url, batch_size=batch_size)
+            if result is None:
+                break
+            total.add(result)
+            if result.failed:
+                break
+    finally:
+        connection.close()
+    return total
+
+
+def dispatch(
+    *,
+    batch_size: int | None = None,
+    concurrency: int | None = None,
+    max_batches: int = 100,
+) -> DispatchResult:
+    """Run one pass over every configured endpoint and return what happened.
+
+    Each endpoint is drained on its own worker thread and database connection.
+    """
+    endpoints = settings.OUTBOX_ENDPOINTS
+    batch_size = batch_size or settings.OUTBOX_BATCH_SIZE
+    workers = max(1, min(concurrency or settings.OUTBOX_CONCURRENCY, len(endpoints) or 1))
+    total = DispatchResult()
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="outbox") as pool:
+        futures = [
+            pool.submit(_drain, name, url, batch_size=batch_size, max_batches=max_batches)
+            for name, url in sorted(endpoints.items())
+        ]
+        for future in futures:
+            total.add(future.result())
+    return total
+
+
+def purge_delivered(*, older_than: timedelta) -> int:
+    """Delete delivered and dead messages older than ``older_than``; return how many."""
+    cutoff = timezone.now() - older_than
+    deleted, _ = OutboxMessage.objects.filter(
+        ~Q(status=Status.PENDING), created_at__lt=cutoff
+    ).delete()
+    return deleted
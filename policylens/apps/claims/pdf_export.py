@@ -0,0 +1,251 @@
+"""
+Cached PDF audit exports rendered in a process pool.
+
+Rendering a PDF is pure-Python CPU work that would hold the GIL and stall every other request
+in the worker. Exports are therefore built here (a handful of indexed queries) and rendered
+by ``pdf_render`` in a per-process pool of ``PDF_RENDER_WORKERS`` spawned processes.
+
+Rendered files are cached on disk under ``PDF_CACHE_DIR``, keyed by claim id and export
+version (``audit_export.export_version``: the latest audit event id plus a digest of the
+claim record). A cached file is valid for exactly as long as its key is current and needs no
+invalidation. A superseded version is simply never read again. The cache is bounded by
+``PDF_CACHE_MAX_BYTES``; each read refreshes a file's mtime and eviction removes the least
+recently used files first. All processes share the directory: writes are atomic renames and
+eviction tolerates races.
+
+A render that overruns ``PDF_RENDER_TIMEOUT_SECONDS`` or loses its worker raises
+``RenderUnavailable``. A broken pool is dropped so the next render starts a fresh one.
+"""
+
+from __future__ import annotations
+
+import multiprocessing
+import os
+import tempfile
+import threading
+from concurrent.futures import Future, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import dataclass
+from pathlib import Path
+from typing import BinaryIO
+
+from django.conf import settings
+from django.db.models import QuerySet
+
+from policylens.apps.claims import audit_export, pdf_render
+from policylens.apps.claims.models import Claim
+
+
+class RenderUnavailable(Exception):
+    """Raised when a PDF could not be rendered in time or its render worker died."""
+
+
+class PdfCache:
+    """Size-bounded, least-recently-used directory of rendered PDFs."""
+
+    def __init__(self, root: Path, *, max_bytes: int) -> None:
+        """Use ``root`` (created on demand) holding at most ``max_bytes`` of PDFs."""
+        self.root = root
+        self.max_bytes = max_bytes
+
+    def path_for(self, claim_id: int, version: str) -> Path:
+        """Return where the PDF for this claim version lives."""
+        return self.root / f"claim-{claim_id}-{version}.pdf"
+
+    def open(self, claim_id: int, version: str) -> BinaryIO | None:
+        """Open a cached PDF and mark it recently used, or return None on a miss."""
+        path = self.path_for(claim_id, version)
+        try:
+            handle = path.open("rb")
+        except FileNotFoundError:
+            return None
+        try:
+            os.utime(path)
+        except FileNotFoundError:
+            # Evicted since it was opened; the open handle still reads the whole file.
+            pass
+        return handle
+
+    def put(self, claim_id: int, version: str, data: bytes, *, evict: bool = True) -> Path:
+        """Store a rendered PDF atomically, then trim the cache unless told not to."""
+        self.root.mkdir(parents=True, exist_ok=True)
+        path = self.path_for(claim_id, version)
+        with tempfile.NamedTemporaryFile(dir=self.root, suffix=".tmp", delete=False) as tmp:
+            tmp.write(data)
+        os.replace(tmp.name, path)
+        if evict:
+            self.evict()
+        return path
+
+    def evict(self) -> int:
+        """Remove least recently used PDFs until the cache fits; return how many."""
+        entries = []
+        try:
+            for entry in os.scandir(self.root):
+                if entry.name.endswith(".pdf"):
+                    try:
+                        stat = entry.stat()
+                    except FileNotFoundError:
+                        continue
+                    entries.append((stat.st_mtime, stat.st_size, entry.path))
+        except FileNotFoundError:
+            return 0
+        total = sum(size for _, size, _ in entries)
+        removed = 0
+        for _, size, path in sorted(entries):
+            if total <= self.max_bytes:
+                break
+            try:
+                os.unlink(path)
+                removed += 1
+            except FileNotFoundError:
+                pass
+            total -= size
+        return removed
+
+
+def get_cache() -> PdfCache:
+    """Return the cache configured in settings."""
+    return PdfCache(Path(settings.PDF_CACHE_DIR), max_bytes=settings.PDF_CACHE_MAX_BYTES)
+
+
+_pool: ProcessPoolExecutor | None = None
+_pool_workers = 0
+_pool_lock = threading.Lock()
+# Renders in flight in this process, so concurrent requests for one version share a render.
+_inflight: dict[tuple[int, str], Future] = {}
+_inflight_lock = threading.Lock()
+
+
+def get_render_pool() -> ProcessPoolExecutor:
+    """Return this process's render pool, starting it on first use.
+
+    Workers are spawned rather than forked: forking a threaded server process can copy held
+    locks and open database connections into the child.
+    """
+    global _pool, _pool_workers
+    workers = settings.PDF_RENDER_WORKERS
+    with _pool_lock:
+        if _pool is None or _pool_workers != workers:
+            if _pool is not None:
+                _pool.shutdown(wait=False)
+            _pool = ProcessPoolExecutor(
+                max_workers=workers, mp_context=multiprocessing.get_context("spawn")
+            )
+            _pool_workers = workers
+        return _pool
+
+
+def _discard_pool(pool: ProcessPoolExecutor) -> None:
+    """Drop a broken pool so the next render starts a fresh one."""
+    global _pool
+    with _pool_lock:
+        if _pool is pool:
+            _pool = None
+    pool.shutdown(wait=False, cancel_futures=True)
+
+
+def _submit_to_pool(export: dict) -> tuple[Future, ProcessPoolExecutor]:
+    """Submit a render, replacing the pool once if it is already broken."""
+    pool = get_render_pool()
+    try:
+        return pool.submit(pdf_render.render_audit_pdf, export), pool
+    except BrokenProcessPool:
+        _discard_pool(pool)
+        pool = get_render_pool()
+        return pool.submit(pdf_render.render_audit_pdf, export), pool
+
+
+def _submit(claim_id: int, version: str, export: dict) -> Future:
+    """Start rendering one claim version, or join a render already in flight."""
+    key = (claim_id, version)
+    with _inflight_lock:
+        future = _inflight.get(key)
+        if future is None:
+            future, pool = _submit_to_pool(export)
+            _inflight[key] = future
+
+            def done(finished: Future) -> None:
+                _inflight.pop(key, None)
+                if not finished.cancelled() and isinstance(finished.exception(), BrokenProcessPool):
+                    _discard_pool(pool)
+
+            future.add_done_callback(done)
+    return future
+
+
+def _result(future: Future) -> bytes:
+    """Wait for a render, mapping timeouts and dead workers to RenderUnavailable."""
+    try:
+        return future.result(timeout=settings.PDF_RENDER_TIMEOUT_SECONDS)
+    except TimeoutError as exc:
+        raise RenderUnavailable("Rendering the PDF timed out.") from exc
+    except BrokenProcessPool as exc:
+        raise RenderUnavailable("The PDF render worker stopped unexpectedly.") from exc
+
+
+def open_claim_pdf(claim_id: int) -> BinaryIO | None:
+    """Return an open handle on the claim's current audit PDF, rendering it on a miss.
+
+    Returns None if the claim does not exist. Raises RenderUnavailable if the render times
+    out or its worker dies.
+    """
+    cache = get_cache()
+    version = audit_export.current_version(claim_id)
+    if version is None:
+        return None
+    handle = cache.open(claim_id, version)
+    if handle is not None:
+        return handle
+
+    export = audit_export.build_export(claim_id)
+    if export is None:
+        return None
+    # The claim may have changed since the lookup; key on what was rendered.
+    version = export["version"]
+    data = _result(_submit(claim_id, version, export))
+    return cache.put(claim_id, version, data).open("rb")
+
+
+@dataclass(frozen=True)
+class PrerenderResult:
+    """Outcome of a bulk pre-render."""
+
+    rendered: int = 0
+    cached: int = 0
+    evicted: int = 0
+
+
+def prerender(claims: QuerySet[Claim]) -> PrerenderResult:
+    """Render every claim in ``claims`` whose current version is not cached yet.
+
+    Up to twice the pool size renders are kept in flight while the next exports are built,
+    so the pool stays busy without holding every export in memory at once.
+    """
+    cache = get_cache()
+    window = max(1, settings.PDF_RENDER_WORKERS * 2)
+    pending: list[tuple[int, str, Future]] = []
+    rendered = cached = 0
+
+    def finish_oldest() -> None:
+        nonlocal rendered
+        claim_id, version, future = pending.pop(0)
+        cache.put(claim_id, version, _result(future), evict=False)
+        rendered += 1
+
+    for claim_id, version in audit_export.iter_versions(claims):
+        handle = cache.open(claim_id, version)
+        if handle is not None:
+            handle.close()
+            cached += 1
+            continue
+        export = audit_export.build_export(claim_id)
+        if export is None:
+            continue
+        version = export["version"]
+        pending.append((claim_id, version, _submit(claim_id, version, export)))
+        if len(pending) >= window:
+            finish_oldest()
+    while pending:
+        finish_oldest()
+    return PrerenderResult(rendered=rendered, cached=cached, evicted=cache.evict())
@@ -0,0 +1,155 @@
+"""
+PDF rendering of claim audit exports.
+
+This module runs inside the render process pool. It takes the plain data built by
+``audit_export.build_export`` and returns PDF bytes; it does not import Django, so spawned
+workers start without setting up the project or opening database connections.
+
+Output is byte-for-byte reproducible for the same export (``invariant`` mode), which keeps
+cached copies and freshly rendered ones interchangeable.
+"""
+
+from __future__ import annotations
+
+import io
+import json
+from typing import Any
+from xml.sax.saxutils import escape
+
+from reportlab.lib import colors
+from reportlab.lib.pagesizes import A4
+from reportlab.lib.styles import getSampleStyleSheet
+from reportlab.lib.units import mm
+from reportlab.platypus import LongTable, Paragraph, SimpleDocTemplate, Spacer, TableStyle
+
+_STYLES = getSampleStyleSheet()
+_CELL = _STYLES["BodyText"].clone("Cell", fontSize=7.5, leading=9)
+_TABLE_STYLE = TableStyle(
+    [
+        ("FONT", (0, 0), (-1, 0), "Helvetica-Bold", 8),
+        ("BACKGROUND", (0, 0), (-1, 0), colors.HexColor("#e8ecf1")),
+        ("GRID", (0, 0), (-1, -1), 0.25, colors.HexColor("#b0b8c4")),
+        ("VALIGN", (0, 0), (-1, -1), "TOP"),
+    ]
+)
+# Long payloads are cut so one event cannot fill pages; the JSON export has them in full.
+_MAX_CELL_CHARS = 600
+
+
+def _cell(value: Any) -> Paragraph:
+    """Wrap a value in a paragraph so long text breaks across lines."""
+    if value is None:
+        text = ""
+    elif isinstance(value, (dict, list)):
+        text = json.dumps(value, sort_keys=True, separators=(", ", ": "))
+    else:
+        text = str(value)
+    if len(text) > _MAX_CELL_CHARS:
+        text = text[:_MAX_CELL_CHARS] + " …"
+    return Paragraph(escape(text), _CELL)
+
+
+def _table(header: list[str], rows: list[list[Any]], widths: list[float]) -> LongTable:
+    """Build a table that repeats its header row on every page."""
+    data = [header] + [[_cell(value) for value in row] for row in rows]
+    table = LongTable(data, colWidths=[w * mm for w in widths], repeatRows=1)
+    table.setStyle(_TABLE_STYLE)
+    return table
+
+
+def _section(title: str, flowables: list, empty: bool) -> list:
+    """Return a titled section, or a note that there is nothing to show."""
+    heading = Paragraph(escape(title), _STYLES["Heading2"])
+    if empty:
+        return [heading, Paragraph("None recorded.", _STYLES["BodyText"])]
+    return [heading, *flowables]
+
+
+def render_audit_pdf(export: dict[str, Any]) -> bytes:
+    """Render an audit export to PDF bytes."""
+    claim = export["claim"]
+    buffer = io.BytesIO()
+    doc = SimpleDocTemplate(
+        buffer,
+        pagesize=A4,
+        leftMargin=15 * mm,
+        rightMargin=15 * mm,
+        topMargin=15 * mm,
+        bottomMargin=15 * mm,
+        title=f"Claim {claim['id']} audit evidence",
+        author="PolicyLens",
+        invariant=True,
+    )
+
+    story: list = [
+        Paragraph(escape(f"Claim {claim['id']} audit evidence"), _STYLES["Title"]),
+        Paragraph(escape(f"As of audit event #{export['latest_event_id']}"), _STYLES["Italic"]),
+        Spacer(1, 4 * mm),
+        _table(
+            ["Field", "Value"],
+            [[name.replace("_", " ").capitalize(), value] for name, value in claim.items()],
+            [45, 135],
+        ),
+    ]
+    story += _section(
+        "Decisions",
+        [
+            _table(
+                ["Decided at", "Decision", "By", "Notes"],
+                [
+                    [d["decided_at"], d["decision"], d["decided_by"], d["notes"]]
+                    for d in export["decisions"]
+                ],
+                [38, 25, 30, 87],
+            )
+        ],
+        empty=not export["decisions"],
+    )
+    story += _section(
+        "Internal notes",
+        [
+            _table(
+                ["Created at", "By", "Note"],
+                [[n["created_at"], n["created_by"], n["body"]] for n in export["notes"]],
+                [38, 30, 112],
+            )
+        ],
+        empty=not export["notes"],
+    )
+    story += _section(
+        "Documents",
+        [
+            _table(
+                ["Uploaded at", "File", "Type", "Bytes", "By"],
+                [
+                    [
+                        d["uploaded_at"],
+                        d["original_filename"],
+                        d["content_type"],
+                        d["size_bytes"],
+                        d["uploaded_by"],
+                    ]
+                    for d in export["documents"]
+                ],
+                [38, 55, 35, 20, 32],
+            )
+        ],
+        empty=not export["documents"],
+    )
+    story += _section(
+        "Audit events",
+        [
+            _table(
+                ["#", "At", "Event", "Actor", "Payload"],
+                [
+                    [e["id"], e["created_at"], e["event_type"], e["actor"], e["payload"]]
+                    for e in export["audit_events"]
+                ],
+                [14, 34, 34, 24, 74],
+            )
+        ],
+        empty=not export["audit_events"],
+    )
+
+    doc.build(story)
+    return buffer.getvalue()
@@ -8,17 +8,31 @@ Week 2 adds document upload, internal notes, and decisions.
 
 from __future__ import annotations
 
+from collections import Counter
+from dataclasses import dataclass
 from typing import Any
 
 from django.core.files.base import File
 from django.db import transaction
+from django.utils import timezone
 
+from policylens.apps.claims import (
+    checklists,
+    entity_links,
+    facets,
+    live,
+    outbox,
+    similarity,
+    velocity,
+)
+from policylens.apps.claims.ml.rescoring import mark_claims_dirty
 from policylens.apps.claims.models import (
     AuditEvent,
     Claim,
     ClaimDocument,
     InternalNote,
     Policy,
+    PolicyHolder,
     ReviewDecision,
 )
 
@@ -33,13 +47,63 @@ class DomainRuleViolation(Exception):
 def append_audit_event(
     *, claim: Claim, event_type: str, actor: str, payload: dict[str, Any]
 ) -> AuditEvent:
-    """Append an audit event for a claim."""
-    return AuditEvent.objects.create(
+    """Append an audit event for a claim and queue it for downstream consumers."""
+    event = AuditEvent.objects.create(
         claim=claim,
         event_type=event_type,
         actor=actor,
         payload=payload,
     )
+    outbox.enqueue([event])
+    live.publish_events([event])
+    return event
+
+
+def _relink_holder(holder: PolicyHolder) -> None:
+    """Update the holder's cluster and flag the cluster's claims for rescoring."""
+    cluster = entity_links.link_holder(holder)
+    mark_claims_dirty(
+        Claim.objects.filter(policy__holder__cluster=cluster).values_list("pk", flat=True)
+    )
+
+
+@transaction.atomic
+def create_policy_holder(*, full_name: str, email: str = "", phone: str = "") -> PolicyHolder:
+    """Create a policy holder and link it to holders sharing its contact details."""
+    holder = PolicyHolder.objects.create(full_name=full_name, email=email, phone=phone)
+    _relink_holder(holder)
+    return holder
+
+
+@transaction.atomic
+def update_policy_holder(
+    *,
+    holder: PolicyHolder,
+    full_name: str | None = None,
+    email: str | None = None,
+    phone: str | None = None,
+) -> PolicyHolder:
+    """Edit a holder's details and re-link it if its contact details changed."""
+    changes = {
+        name: value
+        for name, value in (("full_name", full_name), ("email", email), ("phone", phone))
+        if value is not None and value != getattr(holder, name)
+    }
+    if not changes:
+        return holder
+    for name, value in changes.items():
+        setattr(holder, name, value)
+    holder.save(update_fields=list(changes))
+    if {"email", "phone"} & changes.keys():
+        previous = holder.cluster_id
+        _relink_holder(holder)
+        if previous and previous != holder.cluster_id:
+            mark_claims_dirty(
+                Claim.objects.filter(policy__holder__cluster_id=previous).values_list(
+                    "pk", flat=True
+                )
+            )
+    return holder
 
 
 @transaction.atomic
@@ -51,14 +115,21 @@ def create_claim(
     summary: str,
     actor: str,
 ) -> Claim:
-    """Create a claim and append an initial audit event."""
+    """Create a claim with its checklist and append an initial audit event."""
+    templates = checklists.templates_for(claim_type=claim_type, product_type=policy.product_type)
     claim = Claim.objects.create(
         policy=policy,
         claim_type=claim_type,
         priority=priority,
         summary=summary,
         created_by=actor,
+        checklist_completeness=checklists.initial_completeness(templates),
     )
+    checklists.instantiate_checklist(claim=claim, templates=templates)
+    velocity.record_claim(claim=claim, holder_id=policy.holder_id)
+    entity_links.record_claim(claim)
+    duplicates = similarity.index_claim(claim)
+    mark_claims_dirty([claim.pk, *(match.claim_id for match in duplicates)])
 
     append_audit_event(
         claim=claim,
@@ -70,10 +141,22 @@ def create_claim(
             "priority": priority,
         },
     )
+    # Rescore marks on matched claims come first and shared facet rows last, the same
+    # order as the decision paths, so creating a near-duplicate cannot deadlock with them.
+    facets.apply_facet_delta(key=facets.claim_facet_key(claim=claim), delta=1)
 
     return claim
 
 
+def _lock_claim(claim: Claim) -> Claim:
+    """Re-read the claim's status under a row lock.
+
+    Every workflow write takes this lock before any other, so writers on one claim queue
+    here instead of deadlocking on the rows they touch afterwards.
+    """
+    return Claim.objects.select_for_update(of=("self",)).only("status").get(pk=claim.pk)
+
+
 def _assert_claim_not_decided(*, claim: Claim) -> None:
     """Prevent mutations that should not happen after a final decision."""
     if claim.status == Claim.Status.DECIDED:
@@ -82,6 +165,19 @@ def _assert_claim_not_decided(*, claim: Claim) -> None:
         )
 
 
+def _record_checklist_progress(*, claim: Claim, keys: list[str], actor: str) -> None:
+    """Audit checklist items satisfied by a document or note."""
+    if not keys:
+        return
+    claim.refresh_from_db(fields=["checklist_completeness"])
+    append_audit_event(
+        claim=claim,
+        event_type="CHECKLIST_ITEMS_SATISFIED",
+        actor=actor,
+        payload={"keys": keys, "completeness": claim.checklist_completeness},
+    )
+
+
 @transaction.atomic
 def add_document(
     *,
@@ -92,7 +188,7 @@ def add_document(
     actor: str,
 ) -> ClaimDocument:
     """Attach a document to a claim and append an audit event."""
-    _assert_claim_not_decided(claim=claim)
+    _assert_claim_not_decided(claim=_lock_claim(claim))
 
     size_bytes = getattr(uploaded_file, "size", 0) or 0
     doc = ClaimDocument.objects.create(
@@ -103,6 +199,7 @@ def add_document(
         size_bytes=size_bytes,
         uploaded_by=actor,
     )
+    mark_claims_dirty([claim.pk])
 
     append_audit_event(
         claim=claim,
@@ -115,6 +212,9 @@ def add_document(
             "size_bytes": size_bytes,
         },
     )
+    _record_checklist_progress(
+        claim=claim, keys=checklists.satisfy_from_document(claim=claim, document=doc), actor=actor
+    )
     return doc
 
 
@@ -123,12 +223,15 @@ def add_note(*, claim: Claim, body: str, actor: str) -> InternalNote:
     """Add an internal note to a claim and append an audit event."""
     if not body or not body.strip():
         raise DomainRuleViolation("Note body is required.")
+    # Notes stay allowed after a decision; the lock only orders this write per claim.
+    _lock_claim(claim)
 
     note = InternalNote.objects.create(
         claim=claim,
         body=body.strip(),
         created_by=actor,
     )
+    mark_claims_dirty([claim.pk])
 
     append_audit_event(
         claim=claim,
@@ -139,6 +242,9 @@ def add_note(*, claim: Claim, body: str, actor: str) -> InternalNote:
             "length": len(note.body),
         },
     )
+    _record_checklist_progress(
+        claim=claim, keys=checklists.satisfy_from_note(claim=claim, note=note), actor=actor
+    )
     return note
 
 
@@ -150,8 +256,15 @@ def add_decision(
     notes: str,
     actor: str,
 ) -> ReviewDecision:
-    """Record a decision for a claim, update claim status, and append an audit event."""
-    _assert_claim_not_decided(claim=claim)
+    """Record a decision for a claim, update claim status, and append an audit event.
+
+    The claim row is re-read under a row lock so concurrent reviewers are serialised per
+    claim only: the second writer sees the committed status and is rejected. The passed
+    instance may be stale and is refreshed with the new status.
+    """
+    locked = _lock_claim(claim)
+    _assert_claim_not_decided(claim=locked)
+    previous_status = locked.status
 
     record = ReviewDecision.objects.create(
         claim=claim,
@@ -162,10 +275,13 @@ def add_decision(
 
     # Minimal deterministic workflow rules for Week 2.
     if decision == ReviewDecision.Decision.REQUEST_INFO:
-        claim.status = Claim.Status.IN_REVIEW
+        locked.status = Claim.Status.IN_REVIEW
     else:
-        claim.status = Claim.Status.DECIDED
-    claim.save(update_fields=["status", "updated_at"])
+        locked.status = Claim.Status.DECIDED
+    locked.save(update_fields=["status", "updated_at"])
+    claim.status = locked.status
+    claim.updated_at = locked.updated_at
+    mark_claims_dirty([claim.pk])
 
     append_audit_event(
         claim=claim,
@@ -176,4 +292,84 @@ def add_decision(
             "decision": decision,
         },
     )
+    # Facet rows are shared by many claims; touch them last to keep their lock window short.
+    facets.move_claim_facet(claim=claim, from_status=previous_status, to_status=claim.status)
     return record
+
+
+@dataclass(frozen=True)
+class BulkDecisionResult:
+    """Outcome of a bulk decision request."""
+
+    applied: list[int]
+    skipped: list[dict[str, Any]]
+
+
+@transaction.atomic
+def bulk_add_decisions(
+    *,
+    claim_ids: list[int],
+    decision: str,
+    notes: str,
+    actor: str,
+) -> BulkDecisionResult:
+    """Record the same decision for many claims with set-based writes.
+
+    Eligible claims are locked in primary key order (so concurrent bulk requests cannot
+    deadlock), then decisions and audit events are bulk inserted and statuses updated with
+    one UPDATE. Missing and already-decided claims are reported as skipped.
+    """
+    requested = list(dict.fromkeys(claim_ids))
+    rows = list(
+        Claim.objects.select_for_update(of=("self",))
+        .filter(pk__in=requested)
+        .order_by("pk")
+        .values_list("pk", "status", "priority", "claim_type", "policy__product_type")
+    )
+    found = {row[0]: row for row in rows}
+    eligible = [row for row in rows if row[1] != Claim.Status.DECIDED]
+    eligible_ids = [row[0] for row in eligible]
+
+    skipped = [
+        {"claim_id": pk, "reason": "not_found" if pk not in found else "already_decided"}
+        for pk in requested
+        if pk not in found or found[pk][1] == Claim.Status.DECIDED
+    ]
+    if not eligible:
+        return BulkDecisionResult(applied=[], skipped=skipped)
+
+    new_status = (
+        Claim.Status.IN_REVIEW
+        if decision == ReviewDecision.Decision.REQUEST_INFO
+        else Claim.Status.DECIDED
+    )
+    records = ReviewDecision.objects.bulk_create(
+        [
+            ReviewDecision(claim_id=pk, decision=decision, notes=notes or "", decided_by=actor)
+            for pk in eligible_ids
+        ]
+    )
+    Claim.objects.filter(pk__in=eligible_ids).update(status=new_status, updated_at=timezone.now())
+    mark_claims_dirty(eligible_ids)
+    events = AuditEvent.objects.bulk_create(
+        [
+            AuditEvent(
+                claim_id=record.claim_id,
+                event_type="DECISION_RECORDED",
+                actor=actor,
+                payload={"decision_id": record.pk, "decision": decision, "bulk": True},
+            )
+            for record in records
+        ]
+    )
+    outbox.enqueue(events)
+    live.publish_events(events)
+
+    deltas: Counter[facets.FacetKey] = Counter()
+    for _pk, status, priority, claim_type, product_type in eligible:
+        if status != new_status:
+            deltas[(status, priority, claim_type, product_type)] -= 1
+            deltas[(new_status, priority, claim_type, product_type)] += 1
+    facets.apply_facet_deltas(deltas)
+
+    return BulkDecisionResult(applied=eligible_ids, skipped=skipped)
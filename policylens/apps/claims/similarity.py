@@ -0,0 +1,206 @@
+"""
+Near-duplicate claim narratives via MinHash and locality-sensitive hashing.
+
+A claim summary is reduced to word shingles and a fixed-length MinHash signature whose
+per-position agreement with another signature estimates Jaccard similarity. The signature
+is split into bands; each band hashes to a bucket stored in an indexed table, so candidate
+near-duplicates are the claims sharing any ``(band, bucket)`` pair: a handful of index
+lookups instead of a comparison against every other claim. Candidates are then ranked by
+their estimated similarity.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import re
+import zlib
+from collections.abc import Iterable, Sequence
+from dataclasses import dataclass
+from functools import reduce
+from operator import or_
+
+import numpy as np
+from django.db.models import Count, F, Q
+
+from policylens.apps.claims.models import Claim, ClaimLshBucket, ClaimMinHash
+
+NUM_PERMUTATIONS = 64
+BANDS = 16
+ROWS_PER_BAND = NUM_PERMUTATIONS // BANDS
+SHINGLE_SIZE = 3
+# Estimated Jaccard similarity at or above which two summaries count as near-duplicates.
+# With 16 bands of 4 rows, pairs at this similarity become candidates about 2/3 of the time.
+NEAR_DUPLICATE_THRESHOLD = 0.5
+MAX_CANDIDATES = 200
+
+# Universal hash family h(x) = (a * x + b) mod p over 32-bit shingle hashes. Products stay
+# below 2**64, so the arithmetic is exact in uint64.
+_PRIME = np.uint64(4_294_967_291)
+_rng = np.random.default_rng(20260301)
+_A = _rng.integers(1, int(_PRIME), size=NUM_PERMUTATIONS, dtype=np.uint64)
+_B = _rng.integers(0, int(_PRIME), size=NUM_PERMUTATIONS, dtype=np.uint64)
+
+_WORD = re.compile(r"[a-z0-9]+")
+
+
+def shingles(text: str) -> set[str]:
+    """Return the set of lowercase word ``SHINGLE_SIZE``-grams in ``text``."""
+    words = _WORD.findall(text.lower())
+    if len(words) < SHINGLE_SIZE:
+        return {" ".join(words)} if words else set()
+    return {" ".join(words[i : i + SHINGLE_SIZE]) for i in range(len(words) - SHINGLE_SIZE + 1)}
+
+
+def signature(text: str) -> np.ndarray | None:
+    """Return the MinHash signature of ``text``, or None if it has no words."""
+    grams = shingles(text)
+    if not grams:
+        return None
+    hashes = np.fromiter((zlib.crc32(g.encode()) for g in grams), dtype=np.uint64)
+    permuted = (_A[:, None] * (hashes[None, :] % _PRIME) + _B[:, None]) % _PRIME
+    return permuted.min(axis=1).astype(np.uint32)
+
+
+def band_buckets(sig: np.ndarray) -> list[int]:
+    """Hash each band of a signature to a signed 64-bit bucket id."""
+    return [
+        int.from_bytes(
+            hashlib.blake2b(
+                bytes([band]) + sig[band * ROWS_PER_BAND : (band + 1) * ROWS_PER_BAND].tobytes(),
+                digest_size=8,
+            ).digest(),
+            "big",
+            signed=True,
+        )
+        for band in range(BANDS)
+    ]
+
+
+def estimate_similarity(a: np.ndarray, b: np.ndarray) -> float:
+    """Estimated Jaccard similarity of two signatures."""
+    return float(np.mean(a == b))
+
+
+def _from_bytes(raw: bytes | memoryview) -> np.ndarray:
+    """Decode a stored signature."""
+    return np.frombuffer(bytes(raw), dtype=np.uint32)
+
+
+@dataclass(frozen=True)
+class SimilarClaim:
+    """A near-duplicate candidate with its estimated similarity."""
+
+    claim_id: int
+    similarity: float
+
+
+def _candidates(sig: np.ndarray, *, exclude: int | None) -> list[SimilarClaim]:
+    """Rank claims sharing an LSH bucket with ``sig`` by estimated similarity."""
+    match = reduce(
+        or_, (Q(band=band, bucket=bucket) for band, bucket in enumerate(band_buckets(sig)))
+    )
+    shared = ClaimLshBucket.objects.filter(match)
+    if exclude is not None:
+        shared = shared.exclude(claim_id=exclude)
+    ids = list(
+        shared.values("claim_id")
+        .annotate(bands=Count("pk"))
+        .order_by("-bands", "claim_id")
+        .values_list("claim_id", flat=True)[:MAX_CANDIDATES]
+    )
+    signatures = ClaimMinHash.objects.filter(claim_id__in=ids).values_list("claim_id", "signature")
+    ranked = [
+        SimilarClaim(claim_id=pk, similarity=estimate_similarity(sig, _from_bytes(raw)))
+        for pk, raw in signatures
+    ]
+    return sorted(ranked, key=lambda c: (-c.similarity, c.claim_id))
+
+
+def near_duplicates(sig: np.ndarray, *, exclude: int | None = None) -> list[SimilarClaim]:
+    """Return candidates at or above ``NEAR_DUPLICATE_THRESHOLD``."""
+    return [
+        c for c in _candidates(sig, exclude=exclude) if c.similarity >= NEAR_DUPLICATE_THRESHOLD
+    ]
+
+
+def similar_claims(claim_id: int, *, limit: int = 20) -> list[SimilarClaim]:
+    """Return indexed near-duplicates of a claim, most similar first."""
+    raw = ClaimMinHash.objects.filter(claim_id=claim_id).values_list("signature", flat=True).first()
+    if raw is None:
+        return []
+    return near_duplicates(_from_bytes(raw), exclude=claim_id)[:limit]
+
+
+def _store(rows: Sequence[tuple[int, np.ndarray]]) -> None:
+    """Insert signatures and band buckets for claims not yet indexed."""
+    ClaimMinHash.objects.bulk_create(
+        [ClaimMinHash(claim_id=pk, signature=sig.tobytes()) for pk, sig in rows],
+        ignore_conflicts=True,
+    )
+    ClaimLshBucket.objects.bulk_create(
+        [
+            ClaimLshBucket(claim_id=pk, band=band, bucket=bucket)
+            for pk, sig in rows
+            for band, bucket in enumerate(band_buckets(sig))
+        ],
+        ignore_conflicts=True,
+    )
+
+
+def index_claim(claim: Claim) -> list[SimilarClaim]:
+    """Index a new claim's summary and return its near-duplicates.
+
+    Matched claims have their ``near_duplicates`` count bumped as well, so the count stays
+    symmetric without re-examining older claims.
+    """
+    sig = signature(claim.summary)
+    if sig is None:
+        return []
+    matches = near_duplicates(sig, exclude=claim.pk)
+    _store([(claim.pk, sig)])
+    if matches:
+        ClaimMinHash.objects.filter(claim_id=claim.pk).update(near_duplicates=len(matches))
+        ClaimMinHash.objects.filter(claim_id__in=[m.claim_id for m in matches]).update(
+            near_duplicates=F("near_duplicates") + 1
+        )
+    return matches
+
+
+def index_summaries(rows: Iterable[tuple[int, str]]) -> int:
+    """Store signatures for ``(claim_id, summary)`` pairs; return how many were indexed."""
+    signed = [(pk, sig) for pk, summary in rows if (sig := signature(summary)) is not None]
+    _store(signed)
+    return len(signed)
+
+
+def recount_near_duplicates(claim_ids: Sequence[int]) -> None:
+    """Recompute ``near_duplicates`` for indexed claims from the current index."""
+    rows = ClaimMinHash.objects.filter(claim_id__in=claim_ids).only("signature")
+    updated = []
+    for row in rows:
+        row.near_duplicates = len(near_duplicates(_from_bytes(row.signature), exclude=row.pk))
+        updated.append(row)
+    ClaimMinHash.objects.bulk_update(updated, ["near_duplicates"])
+
+
+def backfill_range(start: int, stop: int) -> int:
+    """Index claims with ``start <= pk < stop`` that have no signature yet."""
+    rows = Claim.objects.filter(pk__gte=start, pk__lt=stop, minhash__isnull=True).values_list(
+        "pk", "summary"
+    )
+    return index_summaries(rows)
+
+
+def recount_range(start: int, stop: int) -> list[int]:
+    """Recount near-duplicates for indexed claims in a pk range; return those with any."""
+    ids = list(
+        ClaimMinHash.objects.filter(claim_id__gte=start, claim_id__lt=stop).values_list(
+            "claim_id", flat=True
+        )
+    )
+    recount_near_duplicates(ids)
+    return list(
+        ClaimMinHash.objects.filter(claim_id__in=ids, near_duplicates__gt=0).values_list(
+            "claim_id", flat=True
+        )
+    )
@@ -0,0 +1,390 @@
+"""
+Columnar Parquet snapshots for analytics.
+
+``export_snapshot`` writes claims, policies, review decisions, and ML scores as Hive-style
+partitioned Parquet datasets (``<dataset>/month=YYYY-MM/product_type=<product>/``) that
+notebooks can read with pyarrow, pandas, Polars, or DuckDB without touching the OLTP
+database.
+
+Rows are streamed from a server-side cursor and converted into Arrow record batches of
+``batch_size`` rows, each written out as a Parquet row group before the next is read; no
+table is ever materialised in Python.
+
+Runs are incremental once a snapshot exists. ``_snapshot_state.json`` records watermarks at
+the end of each run, and the next run appends only rows changed since:
+
+- claims and ML scores: claims with audit events above the last audit event id, since every
+  write to a claim row appends one (CHECKLIST_ITEMS_ADDED for template backfills, ML_SCORED
+  events for scores);
+- decisions and policies: ids above the last exported id, as both are insert-only here.
+
+Appended rows are new versions, not updates. Every row carries ``snapshot_at``, so readers
+keep the newest version per id. Watermarks are commit horizons
+(``audit_feed.CommitHorizon``): the run waits for transactions already holding lower ids to
+finish, so none of them commits below a watermark afterwards. A full run (the first run, or
+``--full``) rewrites each dataset and swaps it into place.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import shutil
+import tempfile
+from collections.abc import Callable, Iterator
+from dataclasses import dataclass
+from datetime import UTC, datetime
+from pathlib import Path
+from urllib.parse import quote
+
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.parquet as pq
+from django.db.models import QuerySet
+from django.utils import timezone
+
+from policylens.apps.claims import audit_feed
+from policylens.apps.claims.models import AuditEvent, Claim, MlScore, Policy, ReviewDecision
+
+STATE_FILE = "_snapshot_state.json"
+PARTITIONING = ["month", "product_type"]
+DEFAULT_BATCH_SIZE = 50_000
+# How long a run waits for in-flight writers before using the ids settled so far.
+SETTLE_TIMEOUT_SECONDS = 60.0
+
+_TIMESTAMP = pa.timestamp("us", tz="UTC")
+
+
+@dataclass(frozen=True)
+class Watermarks:
+    """Highest settled ids covered by a snapshot."""
+
+    audit_event_id: int = 0
+    decision_id: int = 0
+    policy_id: int = 0
+
+
+@dataclass(frozen=True)
+class Dataset:
+    """One exported table: its columns, source rows, and the column that picks its month."""
+
+    name: str
+    schema: pa.Schema
+    month_from: str
+    rows: Callable[[Watermarks | None, Watermarks], QuerySet]
+
+
+def _changed_claims(since: Watermarks, until: Watermarks, event_type: str | None = None):
+    """Ids of claims with audit events in ``(since, until]``, via the primary key index."""
+    events = AuditEvent.objects.filter(pk__gt=since.audit_event_id, pk__lte=until.audit_event_id)
+    if event_type:
+        events = events.filter(event_type=event_type)
+    return events.values("claim_id")
+
+
+def _claim_rows(since: Watermarks | None, until: Watermarks) -> QuerySet:
+    qs = Claim.objects.all()
+    if since is not None:
+        qs = qs.filter(pk__in=_changed_claims(since, until))
+    return qs.values_list(
+        "id",
+        "policy_id",
+        "claim_type",
+        "status",
+        "priority",
+        "checklist_completeness",
+        "created_by",
+        "created_at",
+        "updated_at",
+        "policy__product_type",
+    )
+
+
+def _policy_rows(since: Watermarks | None, until: Watermarks) -> QuerySet:
+    qs = Policy.objects.all()
+    if since is not None:
+        qs = qs.filter(pk__gt=since.policy_id, pk__lte=until.policy_id)
+    return qs.values_list(
+        "id",
+        "holder_id",
+        "policy_number",
+        "status",
+        "effective_date",
+        "expiry_date",
+        "created_at",
+        "product_type",
+    )
+
+
+def _decision_rows(since: Watermarks | None, until: Watermarks) -> QuerySet:
+    qs = ReviewDecision.objects.all()
+    if since is not None:
+        qs = qs.filter(pk__gt=since.decision_id, pk__lte=until.decision_id)
+    return qs.values_list(
+        "id", "claim_id", "decision", "decided_by", "decided_at", "claim__policy__product_type"
+    )
+
+
+def _score_rows(since: Watermarks | None, until: Watermarks) -> QuerySet:
+    qs = MlScore.objects.all()
+    if since is not None:
+        qs = qs.filter(claim_id__in=_changed_claims(since, until, event_type="ML_SCORED"))
+    return qs.values_list(
+        "claim_id",
+        "score",
+        "label",
+        "reason_codes",
+        "model_version",
+        "scored_at",
+        "claim__policy__product_type",
+    )
+
+
+# Free text (claim summaries, decision notes) stays out of analytics snapshots.
+DATASETS = (
+    Dataset(
+        "claims",
+        pa.schema(
+            [
+                ("id", pa.int64()),
+                ("policy_id", pa.int64()),
+                ("claim_type", pa.string()),
+                ("status", pa.string()),
+                ("priority", pa.string()),
+                ("checklist_completeness", pa.int16()),
+                ("created_by", pa.string()),
+                ("created_at", _TIMESTAMP),
+                ("updated_at", _TIMESTAMP),
+                ("product_type", pa.string()),
+            ]
+        ),
+        month_from="created_at",
+        rows=_claim_rows,
+    ),
+    Dataset(
+        "policies",
+        pa.schema(
+            [
+                ("id", pa.int64()),
+                ("holder_id", pa.int64()),
+                ("policy_number", pa.string()),
+                ("status", pa.string()),
+                ("effective_date", pa.date32()),
+                ("expiry_date", pa.date32()),
+                ("created_at", _TIMESTAMP),
+                ("product_type", pa.string()),
+            ]
+        ),
+        month_from="created_at",
+        rows=_policy_rows,
+    ),
+    Dataset(
+        "decisions",
+        pa.schema(
+            [
+                ("id", pa.int64()),
+                ("claim_id", pa.int64()),
+                ("decision", pa.string()),
+                ("decided_by", pa.string()),
+                ("decided_at", _TIMESTAMP),
+                ("product_type", pa.string()),
+            ]
+        ),
+        month_from="decided_at",
+        rows=_decision_rows,
+    ),
+    Dataset(
+        "ml_scores",
+        pa.schema(
+            [
+                ("claim_id", pa.int64()),
+                ("score", pa.float64()),
+                ("label", pa.string()),
+                ("reason_codes", pa.list_(pa.string())),
+                ("model_version", pa.string()),
+                ("scored_at", _TIMESTAMP),
+                ("product_type", pa.string()),
+            ]
+        ),
+        month_from="scored_at",
+        rows=_score_rows,
+    ),
+)
+
+
+def _output_schema(dataset: Dataset) -> pa.Schema:
+    """The dataset's columns plus the snapshot timestamp and month partition key."""
+    return dataset.schema.append(pa.field("snapshot_at", _TIMESTAMP)).append(
+        pa.field("month", pa.string())
+    )
+
+
+def record_batches(
+    dataset: Dataset,
+    queryset: QuerySet,
+    *,
+    snapshot_at: datetime,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+) -> Iterator[pa.RecordBatch]:
+    """Stream ``queryset`` rows as record batches of up to ``batch_size`` rows."""
+    schema = _output_schema(dataset)
+    names = dataset.schema.names
+    month_index = names.index(dataset.month_from)
+    rows = queryset.order_by("pk").iterator(chunk_size=batch_size)
+    while True:
+        columns: list[list] = [[] for _ in names]
+        months: list[str] = []
+        for row in rows:
+            for column, value in zip(columns, row, strict=True):
+                column.append(value)
+            months.append(row[month_index].astimezone(UTC).strftime("%Y-%m"))
+            if len(months) == batch_size:
+                break
+        if not months:
+            return
+        arrays = [
+            pa.array(column, type=field.type)
+            for column, field in zip(columns, dataset.schema, strict=True)
+        ]
+        arrays.append(pa.array([snapshot_at] * len(months), type=_TIMESTAMP))
+        arrays.append(pa.array(months, type=pa.string()))
+        yield pa.RecordBatch.from_arrays(arrays, schema=schema)
+
+
+def _partition_dir(directory: Path, month: str, product_type: str) -> Path:
+    """Return the Hive partition directory for one month and product type."""
+    return (
+        directory
+        / f"month={quote(month, safe='')}"
+        / f"product_type={quote(product_type, safe='')}"
+    )
+
+
+def _write(
+    dataset: Dataset,
+    queryset: QuerySet,
+    directory: Path,
+    *,
+    run: str,
+    snapshot_at: datetime,
+    batch_size: int,
+) -> int:
+    """Append ``queryset`` to the partitioned dataset at ``directory``; return rows written.
+
+    Each run adds one file per partition it touches, with a row group per batch. Writers are
+    driven from this thread because the batches read from this thread's database connection;
+    ``pyarrow.dataset.write_dataset`` would pull them from its own threads.
+    """
+    file_schema = _output_schema(dataset)
+    for name in PARTITIONING:
+        file_schema = file_schema.remove(file_schema.get_field_index(name))
+    writers: dict[tuple[str, str], pq.ParquetWriter] = {}
+    written = 0
+    try:
+        for batch in record_batches(
+            dataset, queryset, snapshot_at=snapshot_at, batch_size=batch_size
+        ):
+            table = pa.Table.from_batches([batch])
+            keys = table.select(PARTITIONING).group_by(PARTITIONING).aggregate([])
+            for month, product_type in zip(
+                keys.column("month").to_pylist(),
+                keys.column("product_type").to_pylist(),
+                strict=True,
+            ):
+                part = table.filter(
+                    (pc.field("month") == month) & (pc.field("product_type") == product_type)
+                ).drop_columns(PARTITIONING)
+                writer = writers.get((month, product_type))
+                if writer is None:
+                    path = _partition_dir(directory, month, product_type)
+                    path.mkdir(parents=True, exist_ok=True)
+                    writer = writers[(month, product_type)] = pq.ParquetWriter(
+                        path / f"part-{run}.parquet", file_schema, compression="zstd"
+                    )
+                writer.write_table(part)
+            written += batch.num_rows
+    finally:
+        for writer in writers.values():
+            writer.close()
+    return written
+
+
+def current_watermarks(since: Watermarks | None = None) -> Watermarks:
+    """Return the highest ids below which no transaction can still be committing.
+
+    Never lower than ``since``, should in-flight writers outlast the settle timeout.
+    """
+    since = since or Watermarks()
+
+    def settled(model, previous: int) -> int:
+        horizon = audit_feed.CommitHorizon(model).settle(timeout=SETTLE_TIMEOUT_SECONDS)
+        return max(horizon, previous)
+
+    return Watermarks(
+        audit_event_id=settled(AuditEvent, since.audit_event_id),
+        decision_id=settled(ReviewDecision, since.decision_id),
+        policy_id=settled(Policy, since.policy_id),
+    )
+
+
+def read_state(root: Path) -> Watermarks | None:
+    """Return the watermarks of the last completed snapshot under ``root``, if any."""
+    try:
+        state = json.loads((root / STATE_FILE).read_text())
+    except FileNotFoundError:
+        return None
+    return Watermarks(**state["watermarks"])
+
+
+def _write_state(root: Path, *, run: str, mode: str, watermarks: Watermarks, rows: dict) -> None:
+    """Record a completed run atomically."""
+    state = {"run": run, "mode": mode, "watermarks": watermarks.__dict__, "rows": rows}
+    with tempfile.NamedTemporaryFile("w", dir=root, suffix=".tmp", delete=False) as tmp:
+        json.dump(state, tmp, indent=2)
+    os.replace(tmp.name, root / STATE_FILE)
+
+
+@dataclass(frozen=True)
+class SnapshotResult:
+    """Outcome of one export run."""
+
+    mode: str
+    rows: dict[str, int]
+    watermarks: Watermarks
+
+
+def export_snapshot(
+    root: Path, *, full: bool = False, batch_size: int = DEFAULT_BATCH_SIZE
+) -> SnapshotResult:
+    """Write a full or incremental snapshot of every dataset under ``root``."""
+    root.mkdir(parents=True, exist_ok=True)
+    since = None if full else read_state(root)
+    until = current_watermarks(since)
+    snapshot_at = timezone.now()
+    run = snapshot_at.strftime("%Y%m%dT%H%M%S%fZ")
+    rows: dict[str, int] = {}
+
+    for dataset in DATASETS:
+        queryset = dataset.rows(since, until)
+        target = root / dataset.name
+        if since is not None:
+            rows[dataset.name] = _write(
+                dataset, queryset, target, run=run, snapshot_at=snapshot_at, batch_size=batch_size
+            )
+            continue
+        # Full runs build beside the live copy and swap, so readers never see half a dataset.
+        staging = root / f".{dataset.name}-{run}"
+        rows[dataset.name] = _write(
+            dataset, queryset, staging, run=run, snapshot_at=snapshot_at, batch_size=batch_size
+        )
+        if not staging.exists():
+            staging.mkdir()
+        retired = root / f".{dataset.name}-retired-{run}"
+        if target.exists():
+            target.rename(retired)
+        staging.rename(target)
+        shutil.rmtree(retired, ignore_errors=True)
+
+    mode = "full" if since is None else "incremental"
+    _write_state(root, run=run, mode=mode, watermarks=until, rows=rows)
+    return SnapshotResult(mode=mode, rows=rows, watermarks=until)
@@ -0,0 +1,116 @@
+"""
+Unified claim timeline.
+
+Notes, decisions, documents, and audit events are merged into one chronological stream by
+a single UNION ALL query. Each branch seeks past the cursor on its own ``(claim, timestamp)``
+index and is limited to one page, so a page costs the same however many events a claim has.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any
+
+from django.db.models import CharField, F, Q, QuerySet, Value
+
+from policylens.apps.claims.cursors import InvalidCursor, decode_cursor, encode_cursor
+from policylens.apps.claims.models import AuditEvent, ClaimDocument, InternalNote, ReviewDecision
+
+DEFAULT_PAGE_SIZE = 50
+MAX_PAGE_SIZE = 500
+
+
+@dataclass(frozen=True)
+class TimelineSource:
+    """A model contributing events to the timeline."""
+
+    kind: str
+    model: type
+    timestamp: str
+    actor: str
+    detail: str
+
+
+# Ordered by kind so the keyset tie-break (occurred_at, kind, id) is easy to reason about.
+SOURCES = (
+    TimelineSource("audit", AuditEvent, "created_at", "actor", "event_type"),
+    TimelineSource("decision", ReviewDecision, "decided_at", "decided_by", "decision"),
+    TimelineSource("document", ClaimDocument, "uploaded_at", "uploaded_by", "original_filename"),
+    TimelineSource("note", InternalNote, "created_at", "created_by", "body"),
+)
+
+COLUMNS = ("kind", "id", "occurred_at", "performed_by", "detail")
+
+
+@dataclass(frozen=True)
+class Cursor:
+    """Position after the last event of a page."""
+
+    occurred_at: datetime
+    kind: str
+    id: int
+
+    def encode(self) -> str:
+        """Return an opaque URL-safe cursor string."""
+        return encode_cursor(self.occurred_at, self.kind, self.id)
+
+    @classmethod
+    def decode(cls, value: str) -> Cursor:
+        """Parse a cursor produced by :meth:`encode`."""
+        occurred_at, kind, pk = decode_cursor(value, str, int, label="timeline")
+        if kind not in {s.kind for s in SOURCES}:
+            raise InvalidCursor("Malformed timeline cursor.")
+        return cls(occurred_at=occurred_at, kind=kind, id=pk)
+
+
+def _after(source: TimelineSource, cursor: Cursor) -> Q:
+    """Return the keyset predicate for one branch.
+
+    Equivalent to ``(timestamp, kind, id) > cursor`` with ``kind`` constant per branch, written
+    so the leading predicate is a range on the indexed timestamp column.
+    """
+    ts = source.timestamp
+    if source.kind > cursor.kind:
+        return Q(**{f"{ts}__gte": cursor.occurred_at})
+    if source.kind < cursor.kind:
+        return Q(**{f"{ts}__gt": cursor.occurred_at})
+    return Q(**{f"{ts}__gte": cursor.occurred_at}) & (
+        Q(**{f"{ts}__gt": cursor.occurred_at}) | Q(id__gt=cursor.id)
+    )
+
+
+def _branch(source: TimelineSource, *, claim_id: int, cursor: Cursor | None, limit: int):
+    """Build one limited, ordered branch of the union."""
+    qs: QuerySet = source.model.objects.filter(claim_id=claim_id)
+    if cursor is not None:
+        qs = qs.filter(_after(source, cursor))
+    return (
+        qs.annotate(
+            kind=Value(source.kind, output_field=CharField()),
+            occurred_at=F(source.timestamp),
+            performed_by=F(source.actor),
+            detail=F(source.detail),
+        )
+        .order_by(source.timestamp, "id")
+        .values_list(*COLUMNS)[:limit]
+    )
+
+
+def claim_timeline_page(
+    *, claim_id: int, cursor: Cursor | None = None, limit: int = DEFAULT_PAGE_SIZE
+) -> tuple[list[dict[str, Any]], Cursor | None]:
+    """Return one page of timeline events and the cursor for the next page, if any."""
+    limit = max(1, min(limit, MAX_PAGE_SIZE))
+    first, *rest = (
+        _branch(source, claim_id=claim_id, cursor=cursor, limit=limit + 1) for source in SOURCES
+    )
+    merged = first.union(*rest, all=True).order_by("occurred_at", "kind", "id")[: limit + 1]
+
+    events = [dict(zip(COLUMNS, row, strict=True)) for row in merged]
+    next_cursor = None
+    if len(events) > limit:
+        events = events[:limit]
+        last = events[-1]
+        next_cursor = Cursor(occurred_at=last["occurred_at"], kind=last["kind"], id=last["id"])
+    return events, next_cursor
@@ -0,0 +1,145 @@
+"""
+Time-bucketed claim velocity counters.
+
+``create_claim`` adds one to today's bucket for the claim's policy and for its holder with
+a single INSERT ... ON CONFLICT. Sliding-window counts ("claims on this policy in the last
+30 days") are sums over at most 90 daily buckets per entity, read for a whole batch of
+claims in one indexed query. Windows end at the claim itself: the bucket for its own day is
+reduced by the claims created later that day (read through the ``(policy, created_at)``
+index), so a claim's counts are point-in-time, do not change as it ages, and never include
+claims that came after it.
+"""
+
+from __future__ import annotations
+
+import datetime as dt
+from collections.abc import Sequence
+
+from django.conf import settings
+from django.db import connection, transaction
+from django.utils import timezone
+
+from policylens.apps.claims.models import Claim, ClaimVelocityBucket, Policy
+
+POLICY = ClaimVelocityBucket.Entity.POLICY
+HOLDER = ClaimVelocityBucket.Entity.HOLDER
+
+# Window counts returned per claim, in column order.
+WINDOWS = (
+    "policy_claims_7d",
+    "policy_claims_30d",
+    "policy_claims_90d",
+    "holder_claims_month",
+    "holder_claims_90d",
+)
+_LONGEST_WINDOW_DAYS = 90
+
+
+def bucket_day(created_at: dt.datetime) -> dt.date:
+    """Local calendar day a claim is counted on."""
+    return timezone.localtime(created_at).date()
+
+
+def record_claim(*, claim: Claim, holder_id: int) -> None:
+    """Add a new claim to its policy's and holder's daily buckets."""
+    table = connection.ops.quote_name(ClaimVelocityBucket._meta.db_table)
+    sql = (
+        f"INSERT INTO {table} (entity_type, entity_id, day, count) "
+        "VALUES (%s, %s, %s, 1), (%s, %s, %s, 1) "
+        "ON CONFLICT (entity_type, entity_id, day) "
+        f"DO UPDATE SET count = {table}.count + EXCLUDED.count"
+    )
+    day = bucket_day(claim.created_at)
+    # Entity types are always written in the same order to avoid lock-order deadlocks.
+    with connection.cursor() as cursor:
+        cursor.execute(sql, [HOLDER, holder_id, day, POLICY, claim.policy_id, day])
+
+
+def window_counts(
+    *,
+    claim_ids: Sequence[int],
+    policy_ids: Sequence[int],
+    holder_ids: Sequence[int],
+    created_at: Sequence[dt.datetime],
+) -> dict[int, tuple[int, ...]]:
+    """Return ``WINDOWS`` counts per claim id, each including the claim itself."""
+    if not claim_ids:
+        return {}
+    table = connection.ops.quote_name(ClaimVelocityBucket._meta.db_table)
+    claims = connection.ops.quote_name(Claim._meta.db_table)
+    policies = connection.ops.quote_name(Policy._meta.db_table)
+    days = [bucket_day(created) for created in created_at]
+    day_ends = [
+        timezone.make_aware(dt.datetime.combine(day + dt.timedelta(days=1), dt.time.min))
+        for day in days
+    ]
+    # Claims on the same day created after this one are in its bucket but not in its past.
+    later = (
+        f"SELECT count(*) FROM {claims} l {{join}} WHERE {{match}} "
+        "AND l.created_at < c.day_end AND (l.created_at, l.id) > (c.created_at, c.claim_id)"
+    )
+    later_policy = later.format(join="", match="l.policy_id = c.policy_id")
+    later_holder = later.format(
+        join=f"JOIN {policies} p ON p.id = l.policy_id", match="p.holder_id = c.holder_id"
+    )
+    sql = (
+        "WITH c (claim_id, policy_id, holder_id, created_at, day, day_end) AS ("
+        "SELECT * FROM unnest(%s::bigint[], %s::bigint[], %s::bigint[], "
+        "%s::timestamptz[], %s::date[], %s::timestamptz[])), "
+        "totals AS (SELECT c.claim_id, "
+        "COALESCE(SUM(b.count) FILTER (WHERE b.entity_type = %s AND b.day > c.day - 7), 0), "
+        "COALESCE(SUM(b.count) FILTER (WHERE b.entity_type = %s AND b.day > c.day - 30), 0), "
+        "COALESCE(SUM(b.count) FILTER (WHERE b.entity_type = %s), 0), "
+        "COALESCE(SUM(b.count) FILTER (WHERE b.entity_type = %s "
+        "AND b.day >= date_trunc('month', c.day)::date), 0), "
+        "COALESCE(SUM(b.count) FILTER (WHERE b.entity_type = %s), 0) "
+        f"FROM c LEFT JOIN {table} b ON b.day > c.day - %s AND b.day <= c.day AND ("
+        "(b.entity_type = %s AND b.entity_id = c.policy_id) "
+        "OR (b.entity_type = %s AND b.entity_id = c.holder_id)) "
+        "GROUP BY c.claim_id) "
+        "SELECT t.*, lp.n, lh.n FROM c JOIN totals t USING (claim_id) "
+        f"CROSS JOIN LATERAL ({later_policy}) lp (n) "
+        f"CROSS JOIN LATERAL ({later_holder}) lh (n)"
+    )
+    params = [
+        list(claim_ids),
+        list(policy_ids),
+        list(holder_ids),
+        list(created_at),
+        days,
+        day_ends,
+        POLICY,
+        POLICY,
+        POLICY,
+        HOLDER,
+        HOLDER,
+        _LONGEST_WINDOW_DAYS,
+        POLICY,
+        HOLDER,
+    ]
+    with connection.cursor() as cursor:
+        cursor.execute(sql, params)
+        return {
+            claim_id: (p7 - lp, p30 - lp, p90 - lp, h_month - lh, h90 - lh)
+            for claim_id, p7, p30, p90, h_month, h90, lp, lh in cursor.fetchall()
+        }
+
+
+def rebuild_velocity_buckets() -> int:
+    """Recount every bucket from Claim with set-based SQL; return the number of buckets."""
+    buckets = connection.ops.quote_name(ClaimVelocityBucket._meta.db_table)
+    claims = connection.ops.quote_name(Claim._meta.db_table)
+    policies = connection.ops.quote_name(Policy._meta.db_table)
+    local_day = "(c.created_at AT TIME ZONE %s)::date"
+    with transaction.atomic(), connection.cursor() as cursor:
+        cursor.execute(f"DELETE FROM {buckets}")
+        cursor.execute(
+            f"INSERT INTO {buckets} (entity_type, entity_id, day, count) "
+            f"SELECT %s, c.policy_id, {local_day}, count(*) FROM {claims} c "
+            "GROUP BY 2, 3 "
+            "UNION ALL "
+            f"SELECT %s, p.holder_id, {local_day}, count(*) FROM {claims} c "
+            f"JOIN {policies} p ON p.id = c.policy_id GROUP BY 2, 3",
+            [POLICY, settings.TIME_ZONE, HOLDER, settings.TIME_ZONE],
+        )
+        return cursor.rowcount
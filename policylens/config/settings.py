@@ -21,6 +21,32 @@ env = environ.Env(
     DJANGO_SECRET_KEY=(str, ""),
     DJANGO_ALLOWED_HOSTS=(str, "localhost,127.0.0.1"),
     DATABASE_URL=(str, ""),
+    IDEMPOTENCY_KEY_TTL_SECONDS=(int, 24 * 60 * 60),
+    ML_SCORING_MAX_BATCH_SIZE=(int, 64),
+    ML_SCORING_MAX_WAIT_MS=(float, 5.0),
+    ML_MODEL_DIR=(str, str(BASE_DIR.parent / "artifacts" / "models")),
+    ML_SIMULATION_CACHE_SECONDS=(int, 300),
+    ML_SHADOW_MODEL_VERSION=(str, ""),
+    ML_SHADOW_WORKERS=(int, 2),
+    ML_SHADOW_TIMEOUT_MS=(float, 200.0),
+    OUTBOX_ENDPOINTS=(dict, {}),
+    OUTBOX_EVENT_TYPES=(list, ["CLAIM_CREATED", "DECISION_RECORDED"]),
+    OUTBOX_BATCH_SIZE=(int, 100),
+    OUTBOX_CONCURRENCY=(int, 4),
+    OUTBOX_TIMEOUT_SECONDS=(float, 10.0),
+    OUTBOX_MAX_ATTEMPTS=(int, 10),
+    OUTBOX_BACKOFF_SECONDS=(float, 2.0),
+    AUDIT_FEED_MAX_LIMIT=(int, 5000),
+    AUDIT_FEED_MAX_WAIT_SECONDS=(float, 30.0),
+    AUDIT_FEED_POLL_SECONDS=(float, 0.5),
+    LIVE_HEARTBEAT_SECONDS=(float, 15.0),
+    LIVE_STREAM_MAX_SECONDS=(float, 300.0),
+    LIVE_CLIENT_BUFFER=(int, 256),
+    PDF_CACHE_DIR=(str, str(BASE_DIR.parent / "var" / "pdf_cache")),
+    PDF_CACHE_MAX_BYTES=(int, 2 * 1024**3),
+    PDF_RENDER_WORKERS=(int, 2),
+    PDF_RENDER_TIMEOUT_SECONDS=(float, 60.0),
+    SNAPSHOT_DIR=(str, str(BASE_DIR.parent / "var" / "snapshots")),
 )
 
 SECRET_KEY = env("DJANGO_SECRET_KEY")
@@ -108,3 +134,55 @@ REST_FRAMEWORK = {
         "rest_framework.permissions.IsAuthenticated",
     ],
 }
+
+# Replayed responses for Idempotency-Key retries are kept this long, then purged.
+IDEMPOTENCY_KEY_TTL_SECONDS = env("IDEMPOTENCY_KEY_TTL_SECONDS")
+
+# Online scoring coalesces concurrent requests per worker into one vectorised batch.
+ML_SCORING_MAX_BATCH_SIZE = env("ML_SCORING_MAX_BATCH_SIZE")
+ML_SCORING_MAX_WAIT_MS = env("ML_SCORING_MAX_WAIT_MS")
+
+# Versioned model artefacts; the "current" symlink selects the live version.
+ML_MODEL_DIR = env("ML_MODEL_DIR")
+
+# How long a worker reuses its sorted score array for threshold simulation.
+ML_SIMULATION_CACHE_SECONDS = env("ML_SIMULATION_CACHE_SECONDS")
+
+# Shadow scoring: candidate artefact version (empty disables), pool size, and per-batch
+# budget (checked between stages; over-budget batches are discarded, not written).
+ML_SHADOW_MODEL_VERSION = env("ML_SHADOW_MODEL_VERSION")
+ML_SHADOW_WORKERS = env("ML_SHADOW_WORKERS")
+ML_SHADOW_TIMEOUT_MS = env("ML_SHADOW_TIMEOUT_MS")
+
+# Transactional outbox: downstream webhook URLs by name ("payments=https://...,siu=...")
+# and the audit event types they receive. Delivered by `manage.py dispatch_outbox`.
+OUTBOX_ENDPOINTS = env("OUTBOX_ENDPOINTS")
+OUTBOX_EVENT_TYPES = env("OUTBOX_EVENT_TYPES")
+OUTBOX_BATCH_SIZE = env("OUTBOX_BATCH_SIZE")
+OUTBOX_CONCURRENCY = env("OUTBOX_CONCURRENCY")
+OUTBOX_TIMEOUT_SECONDS = env("OUTBOX_TIMEOUT_SECONDS")
+# Failed deliveries back off exponentially from OUTBOX_BACKOFF_SECONDS, then go dead.
+OUTBOX_MAX_ATTEMPTS = env("OUTBOX_MAX_ATTEMPTS")
+OUTBOX_BACKOFF_SECONDS = env("OUTBOX_BACKOFF_SECONDS")
+
+# Audit change feed: page cap, long-poll cap, and how often waiters probe for new events.
+AUDIT_FEED_MAX_LIMIT = env("AUDIT_FEED_MAX_LIMIT")
+AUDIT_FEED_MAX_WAIT_SECONDS = env("AUDIT_FEED_MAX_WAIT_SECONDS")
+AUDIT_FEED_POLL_SECONDS = env("AUDIT_FEED_POLL_SECONDS")
+
+# Server-sent events: keep-alive interval, how long one stream holds a worker thread before
+# the browser is made to reconnect, and per-client message backlog before a slow client is
+# told to resync.
+LIVE_HEARTBEAT_SECONDS = env("LIVE_HEARTBEAT_SECONDS")
+LIVE_STREAM_MAX_SECONDS = env("LIVE_STREAM_MAX_SECONDS")
+LIVE_CLIENT_BUFFER = env("LIVE_CLIENT_BUFFER")
+
+# PDF audit exports: rendered in a pool of PDF_RENDER_WORKERS processes and cached on disk,
+# least recently used first out once the cache passes PDF_CACHE_MAX_BYTES.
+PDF_CACHE_DIR = env("PDF_CACHE_DIR")
+PDF_CACHE_MAX_BYTES = env("PDF_CACHE_MAX_BYTES")
+PDF_RENDER_WORKERS = env("PDF_RENDER_WORKERS")
+PDF_RENDER_TIMEOUT_SECONDS = env("PDF_RENDER_TIMEOUT_SECONDS")
+
+# Parquet analytics snapshots written by `manage.py export_snapshot`.
+SNAPSHOT_DIR = env("SNAPSHOT_DIR")
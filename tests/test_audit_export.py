@@ -0,0 +1,209 @@
+"""
+Tests for per-claim audit exports and their cached, pool-rendered PDFs.
+"""
+
+from __future__ import annotations
+
+import os
+import time
+from concurrent.futures import Future
+from concurrent.futures.process import BrokenProcessPool
+from datetime import timedelta
+
+import pytest
+from django.contrib.auth import get_user_model
+from django.contrib.auth.models import Group
+from django.core.management import call_command
+from django.urls import reverse
+from django.utils import timezone
+
+from policylens.apps.claims import audit_export, pdf_export, pdf_render, services
+from policylens.apps.claims.models import Claim, ReviewDecision
+from tests.factories import PolicyFactory
+
+User = get_user_model()
+
+
+@pytest.fixture()
+def pdf_settings(settings, tmp_path):
+    """Cache PDFs under tmp_path and render with a single worker."""
+    settings.PDF_CACHE_DIR = str(tmp_path / "pdf")
+    settings.PDF_RENDER_WORKERS = 1
+    return settings
+
+
+@pytest.fixture()
+def reviewer_client(api_client):
+    """API client authenticated as a reviewer."""
+    user = User.objects.create_user(username="auditor")
+    user.groups.add(Group.objects.get_or_create(name="reviewer")[0])
+    api_client.force_authenticate(user=user)
+    return api_client
+
+
+def _claim(summary: str = "Hail damage to the car.") -> Claim:
+    """Create a claim through the service layer."""
+    return services.create_claim(
+        policy=PolicyFactory(),
+        claim_type=Claim.Type.CLAIM,
+        priority=Claim.Priority.HIGH,
+        summary=summary,
+        actor="intake",
+    )
+
+
+def _cached_files(settings) -> list[str]:
+    """Names of the PDFs currently in the cache."""
+    return sorted(os.listdir(settings.PDF_CACHE_DIR))
+
+
+@pytest.mark.django_db
+def test_json_export_lists_claim_history(reviewer_client, api_client):
+    """The JSON export carries the claim and its events, notes, and decisions."""
+    claim = _claim()
+    services.add_note(claim=claim, body="Photos requested.", actor="reviewer-1")
+    services.add_decision(
+        claim=claim, decision=ReviewDecision.Decision.APPROVE, notes="", actor="reviewer-1"
+    )
+
+    url = reverse("claims-audit-export", kwargs={"claim_id": claim.pk})
+    body = reviewer_client.get(url).json()
+    assert body["claim"]["summary"] == "Hail damage to the car."
+    assert body["claim"]["policy_number"] == claim.policy.policy_number
+    assert [e["event_type"] for e in body["audit_events"]] == [
+        "CLAIM_CREATED",
+        "NOTE_ADDED",
+        "DECISION_RECORDED",
+    ]
+    assert body["latest_event_id"] == body["audit_events"][-1]["id"]
+    assert body["latest_event_id"] == audit_export.latest_event_id(claim.pk)
+    assert body["version"] == audit_export.current_version(claim.pk)
+    assert body["notes"][0]["body"] == "Photos requested."
+    assert body["decisions"][0]["decision"] == "APPROVE"
+
+    missing = reverse("claims-audit-export", kwargs={"claim_id": claim.pk + 1000})
+    assert reviewer_client.get(missing).status_code == 404
+    assert reviewer_client.get(missing, data={"format": "pdf"}).status_code == 404
+
+    api_client.force_authenticate(User.objects.create_user(username="plain"))
+    assert api_client.get(url).status_code == 403
+
+
+@pytest.mark.django_db
+def test_pdf_is_cached_until_the_claim_changes(pdf_settings, reviewer_client):
+    """The first download renders and caches; a new audit event keys a new version."""
+    claim = _claim()
+    url = reverse("claims-audit-export", kwargs={"claim_id": claim.pk})
+
+    resp = reviewer_client.get(url, data={"format": "pdf"})
+    assert resp.status_code == 200
+    assert resp["Content-Type"] == "application/pdf"
+    first = b"".join(resp.streaming_content)
+    assert first.startswith(b"%PDF")
+    version = audit_export.current_version(claim.pk)
+    assert _cached_files(pdf_settings) == [f"claim-{claim.pk}-{version}.pdf"]
+    # Rendering is reproducible, so the cached copy matches a fresh render byte for byte.
+    assert pdf_render.render_audit_pdf(audit_export.build_export(claim.pk)) == first
+
+    cached = pdf_export.get_cache().path_for(claim.pk, version)
+    os.utime(cached, (1, 1))
+    again = reviewer_client.get(url, HTTP_ACCEPT="application/pdf")
+    assert b"".join(again.streaming_content) == first
+    assert cached.stat().st_mtime > 1  # the hit refreshed its LRU position
+
+    services.add_note(claim=claim, body="Repair quote received.", actor="reviewer-1")
+    updated = b"".join(reviewer_client.get(url, data={"format": "pdf"}).streaming_content)
+    assert updated != first
+    assert len(_cached_files(pdf_settings)) == 2
+
+
+@pytest.mark.django_db
+def test_pdf_version_covers_changes_without_an_audit_event(pdf_settings, reviewer_client):
+    """Renaming the holder or backfilling completeness writes no event but renders anew."""
+    claim = _claim()
+    url = reverse("claims-audit-export", kwargs={"claim_id": claim.pk})
+    first = b"".join(reviewer_client.get(url, data={"format": "pdf"}).streaming_content)
+    event_id = audit_export.latest_event_id(claim.pk)
+
+    services.update_policy_holder(holder=claim.policy.holder, full_name="Renamed Holder")
+    renamed = b"".join(reviewer_client.get(url, data={"format": "pdf"}).streaming_content)
+    assert renamed != first
+
+    Claim.objects.filter(pk=claim.pk).update(checklist_completeness=0.5)
+    backfilled = b"".join(reviewer_client.get(url, data={"format": "pdf"}).streaming_content)
+    assert backfilled != renamed
+
+    assert audit_export.latest_event_id(claim.pk) == event_id
+    assert len(_cached_files(pdf_settings)) == 3
+
+
+@pytest.mark.django_db
+def test_pdf_render_timeout_is_a_503(pdf_settings, reviewer_client, monkeypatch):
+    """A render that overruns its timeout is reported as a retryable 503 in JSON."""
+    claim = _claim()
+    monkeypatch.setattr(pdf_export, "_submit", lambda *args: Future())
+    pdf_settings.PDF_RENDER_TIMEOUT_SECONDS = 0.01
+
+    url = reverse("claims-audit-export", kwargs={"claim_id": claim.pk})
+    resp = reviewer_client.get(url, data={"format": "pdf"})
+    assert resp.status_code == 503
+    assert resp.json()["detail"].startswith("The PDF could not be rendered")
+    assert not os.path.exists(pdf_settings.PDF_CACHE_DIR)
+
+
+@pytest.mark.django_db
+def test_broken_render_pool_is_replaced(pdf_settings, reviewer_client, monkeypatch):
+    """Losing a worker fails that download with 503, and the next one uses a fresh pool."""
+    claim = _claim()
+    url = reverse("claims-audit-export", kwargs={"claim_id": claim.pk})
+    broken = pdf_export.get_render_pool()
+
+    def submit_to_dead_worker(export):
+        future = Future()
+        future.set_exception(BrokenProcessPool("A worker process terminated abruptly."))
+        return future, broken
+
+    monkeypatch.setattr(pdf_export, "_submit_to_pool", submit_to_dead_worker)
+    assert reviewer_client.get(url, data={"format": "pdf"}).status_code == 503
+    assert pdf_export._pool is None
+
+    monkeypatch.undo()
+    resp = reviewer_client.get(url, data={"format": "pdf"})
+    assert resp.status_code == 200
+    assert pdf_export.get_render_pool() is not broken
+
+
+def test_cache_evicts_least_recently_used(tmp_path):
+    """Past the size bound, the files read longest ago are removed first."""
+    cache = pdf_export.PdfCache(tmp_path, max_bytes=2500)
+    for claim_id in (1, 2):
+        cache.put(claim_id, "10", b"x" * 1000)
+    old = time.time() - 60
+    os.utime(cache.path_for(1, "10"), (old, old))
+    os.utime(cache.path_for(2, "10"), (old + 1, old + 1))
+    cache.open(1, "10").close()
+
+    cache.put(3, "10", b"x" * 1000)
+
+    assert cache.open(2, "10") is None
+    assert sorted(p.name for p in tmp_path.iterdir()) == [
+        "claim-1-10.pdf",
+        "claim-3-10.pdf",
+    ]
+
+
+@pytest.mark.django_db
+def test_prerender_command_fills_the_cache_for_a_month(pdf_settings):
+    """The command renders a month's claims once and skips them on a re-run."""
+    this_month = [_claim(f"Claim {i}") for i in range(3)]
+    older = _claim("Last year")
+    Claim.objects.filter(pk=older.pk).update(created_at=timezone.now() - timedelta(days=400))
+    month = timezone.localdate().strftime("%Y-%m")
+
+    call_command("prerender_audit_pdfs", "--month", month)
+    assert _cached_files(pdf_settings) == sorted(
+        f"claim-{c.pk}-{audit_export.current_version(c.pk)}.pdf" for c in this_month
+    )
+
+    call_command("prerender_audit_pdfs", "--month", month, "--claim-id", str(older.pk))
+    assert len(_cached_files(pdf_settings)) == 4
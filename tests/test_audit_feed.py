@@ -0,0 +1,171 @@
+"""
+Tests for the cross-claim audit change feed.
+"""
+
+from __future__ import annotations
+
+import json
+import threading
+import time
+
+import pytest
+from django.contrib.auth import get_user_model
+from django.contrib.auth.models import Group
+from django.db import connection, transaction
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+
+from policylens.apps.claims import audit_feed, services
+from policylens.apps.claims.models import AuditEvent, Claim
+from tests.factories import PolicyFactory
+
+User = get_user_model()
+
+
+@pytest.fixture()
+def feed_settings(settings, monkeypatch):
+    """Probe often and start from a fresh watermark and commit horizon."""
+    settings.AUDIT_FEED_POLL_SECONDS = 0.05
+    monkeypatch.setattr(audit_feed, "watermark", audit_feed.Watermark())
+    monkeypatch.setattr(audit_feed, "commit_horizon", audit_feed.CommitHorizon())
+    return settings
+
+
+@pytest.fixture()
+def reviewer_client(api_client):
+    """API client authenticated as a reviewer."""
+    user = User.objects.create_user(username="feed-reader")
+    user.groups.add(Group.objects.get_or_create(name="reviewer")[0])
+    api_client.force_authenticate(user=user)
+    return api_client
+
+
+def _claim(summary: str) -> Claim:
+    """Create a claim, which writes one CLAIM_CREATED event."""
+    return services.create_claim(
+        policy=PolicyFactory(),
+        claim_type=Claim.Type.CLAIM,
+        priority=Claim.Priority.NORMAL,
+        summary=summary,
+        actor="intake",
+    )
+
+
+def _lines(resp) -> list[dict]:
+    """Decode an NDJSON response body."""
+    return [json.loads(line) for line in resp.content.splitlines()]
+
+
+@pytest.mark.django_db
+def test_feed_walks_every_event_with_keyset_pages(feed_settings, reviewer_client):
+    """Consecutive pages cover all events once, in id order, across claims."""
+    for i in range(5):
+        claim = _claim(f"Claim {i}")
+        services.add_note(claim=claim, body=f"Note {i}", actor="reviewer-1")
+    expected = list(AuditEvent.objects.order_by("pk").values_list("pk", flat=True))
+    url = reverse("audit-events-feed")
+
+    seen, after = [], 0
+    while True:
+        resp = reviewer_client.get(url, data={"after": after, "limit": 4})
+        assert resp.status_code == 200
+        assert resp["Content-Type"] == "application/x-ndjson"
+        rows = _lines(resp)
+        if not rows:
+            break
+        seen.extend(row["id"] for row in rows)
+        after = int(resp["X-Feed-Next-After"])
+        assert after == rows[-1]["id"]
+
+    assert seen == expected
+    first = _lines(reviewer_client.get(url, data={"limit": 1}))[0]
+    assert set(first) == set(audit_feed.FEED_COLUMNS)
+
+
+@pytest.mark.django_db
+def test_feed_page_is_one_range_query(feed_settings):
+    """A non-empty page costs one primary-key range query plus the commit horizon probes."""
+    for i in range(3):
+        _claim(f"Claim {i}")
+    table = AuditEvent._meta.db_table
+    with CaptureQueriesContext(connection) as queries:
+        page = audit_feed.poll(after=0, limit=100, wait=5.0)
+    assert len(page) == 3
+    assert len(queries) == 3
+    assert [q["sql"] for q in queries if f'FROM "{table}"' in q["sql"]] == [queries[-1]["sql"]]
+
+
+@pytest.mark.django_db
+def test_feed_validates_params_and_requires_reviewer(feed_settings, reviewer_client, api_client):
+    """Bad cursors are rejected and the feed is limited to reviewers."""
+    url = reverse("audit-events-feed")
+    assert reviewer_client.get(url, data={"after": "-1"}).status_code == 400
+    assert reviewer_client.get(url, data={"limit": "0"}).status_code == 400
+
+    api_client.force_authenticate(User.objects.create_user(username="plain"))
+    assert api_client.get(url).status_code == 403
+
+
+@pytest.mark.django_db(transaction=True)
+def test_long_poll_returns_when_an_event_commits(feed_settings):
+    """An empty feed waits, then returns the event committed while waiting."""
+    _claim("Already there")
+    after = AuditEvent.objects.latest("pk").pk
+
+    def write_later() -> None:
+        time.sleep(0.3)
+        try:
+            _claim("Arrives during the poll")
+        finally:
+            connection.close()
+
+    writer = threading.Thread(target=write_later)
+    started = time.monotonic()
+    writer.start()
+    page = audit_feed.poll(after=after, limit=10, wait=5.0)
+    elapsed = time.monotonic() - started
+    writer.join()
+
+    assert [row["event_type"] for row in page] == ["CLAIM_CREATED"]
+    assert 0.2 < elapsed < 3.0
+
+
+@pytest.mark.django_db
+def test_long_poll_times_out_empty(feed_settings):
+    """With nothing new the poll returns an empty page after ``wait``."""
+    started = time.monotonic()
+    assert audit_feed.poll(after=10**9, limit=10, wait=0.3) == []
+    assert time.monotonic() - started >= 0.3
+
+
+@pytest.mark.django_db(transaction=True)
+def test_events_behind_a_slow_commit_are_held_back(feed_settings):
+    """An event committed above one still in flight waits for it instead of skipping it."""
+    first = _claim("Already there")
+    after = AuditEvent.objects.filter(claim=first).latest("pk").pk
+    inserted = threading.Event()
+    release = threading.Event()
+
+    def slow_writer() -> None:
+        try:
+            with transaction.atomic():
+                _claim("Inserted first, committed last")
+                inserted.set()
+                release.wait(5)
+        finally:
+            connection.close()
+
+    writer = threading.Thread(target=slow_writer)
+    writer.start()
+    assert inserted.wait(5)
+    # A note on another claim touches none of the rows the slow writer holds.
+    services.add_note(claim=first, body="Inserted second, committed first.", actor="reviewer-1")
+
+    # The newer event is committed, but an older id may still land below it.
+    assert audit_feed.read_page(after=after, limit=10) == []
+    release.set()
+    writer.join(5)
+
+    page = audit_feed.read_page(after=after, limit=10)
+    assert [row["id"] for row in page] == sorted(row["id"] for row in page)
+    assert [row["event_type"] for row in page] == ["CLAIM_CREATED", "NOTE_ADDED"]
@@ -0,0 +1,200 @@
+"""
+Tests for cross-claim audit event search.
+
+Covers filtering, keyset pagination, the bounded scan behind payload searches, rejection of
+searches no index can drive, and an EXPLAIN check that each driving filter is served by an
+index at volume.
+"""
+
+from __future__ import annotations
+
+from datetime import timedelta
+
+import pytest
+from django.contrib.auth import get_user_model
+from django.contrib.auth.models import Group
+from django.db import connection
+from django.http import QueryDict
+from django.urls import reverse
+from django.utils import timezone
+
+from policylens.apps.claims import audit_search, services
+from policylens.apps.claims.api.filters import AuditEventFilter
+from policylens.apps.claims.models import AuditEvent, Claim, ReviewDecision
+from tests.factories import ClaimFactory, PolicyFactory
+
+User = get_user_model()
+
+EXPLAIN_ROWS = 200_000
+
+
+@pytest.fixture()
+def reviewer_client(api_client):
+    """API client authenticated as a reviewer."""
+    user = User.objects.create_user(username="investigator")
+    user.groups.add(Group.objects.get_or_create(name="reviewer")[0])
+    api_client.force_authenticate(user=user)
+    return api_client
+
+
+def _claim(actor: str = "intake") -> Claim:
+    """Create a claim through the service layer."""
+    return services.create_claim(
+        policy=PolicyFactory(),
+        claim_type=Claim.Type.CLAIM,
+        priority=Claim.Priority.NORMAL,
+        summary="Water damage in the kitchen.",
+        actor=actor,
+    )
+
+
+@pytest.mark.django_db
+def test_search_by_actor_time_range_and_payload(reviewer_client):
+    """Actor, time range, event type, and payload keys narrow the results."""
+    url = reverse("audit-events-search")
+    claims = [_claim() for _ in range(3)]
+    services.add_decision(
+        claim=claims[0], decision=ReviewDecision.Decision.REJECT, notes="", actor="reviewer-1"
+    )
+    services.add_decision(
+        claim=claims[1], decision=ReviewDecision.Decision.APPROVE, notes="", actor="reviewer-1"
+    )
+    services.add_decision(
+        claim=claims[2], decision=ReviewDecision.Decision.REJECT, notes="", actor="reviewer-2"
+    )
+    old = AuditEvent.objects.get(claim=claims[0], event_type="DECISION_RECORDED")
+    AuditEvent.objects.filter(pk=old.pk).update(created_at=timezone.now() - timedelta(days=8))
+
+    resp = reviewer_client.get(url, data={"actor": "reviewer-1"})
+    assert resp.status_code == 200
+    assert [e["claim_id"] for e in resp.json()["results"]] == [claims[1].pk, claims[0].pk]
+
+    since = (timezone.now() - timedelta(days=1)).isoformat()
+    resp = reviewer_client.get(url, data={"actor": "reviewer-1", "created_after": since})
+    assert [e["claim_id"] for e in resp.json()["results"]] == [claims[1].pk]
+
+    resp = reviewer_client.get(url, data={"event_type": "DECISION_RECORDED", "decision": "REJECT"})
+    results = resp.json()["results"]
+    assert [e["claim_id"] for e in results] == [claims[2].pk, claims[0].pk]
+    assert set(results[0]) == {"id", "claim_id", "event_type", "actor", "created_at", "payload"}
+
+
+@pytest.mark.django_db
+def test_keyset_pages_cover_every_match_once(reviewer_client):
+    """Walking ``next`` visits each match once, newest first, across equal timestamps."""
+    claim = _claim()
+    for i in range(7):
+        services.add_note(claim=claim, body=f"Note {i}", actor="reviewer-1")
+    # Ties on created_at are broken by id.
+    AuditEvent.objects.filter(actor="reviewer-1").update(created_at=timezone.now())
+    expected = list(
+        AuditEvent.objects.filter(actor="reviewer-1")
+        .order_by("-created_at", "-id")
+        .values_list("pk", flat=True)
+    )
+
+    url = reverse("audit-events-search")
+    seen, after = [], None
+    while True:
+        params = {"actor": "reviewer-1", "limit": 3}
+        if after:
+            params["after"] = after
+        body = reviewer_client.get(url, data=params).json()
+        seen.extend(e["id"] for e in body["results"])
+        after = body["next"]
+        if after is None:
+            break
+    assert seen == expected
+
+
+@pytest.mark.django_db
+def test_payload_search_pages_through_a_bounded_scan(reviewer_client, monkeypatch):
+    """Each page checks payload keys on a capped window; ``next`` walks past empty windows."""
+    monkeypatch.setattr(audit_search, "MAX_SCAN", 3)
+    claims = [_claim() for _ in range(7)]
+    for claim in claims:
+        decision = ReviewDecision.Decision.REJECT if claim in claims[::3] else "APPROVE"
+        services.add_decision(claim=claim, decision=decision, notes="", actor="reviewer-1")
+
+    url = reverse("audit-events-search")
+    pages, after = [], None
+    while True:
+        params = {"event_type": "DECISION_RECORDED", "decision": "REJECT", "limit": 5}
+        if after:
+            params["after"] = after
+        body = reviewer_client.get(url, data=params).json()
+        pages.append([e["claim_id"] for e in body["results"]])
+        after = body["next"]
+        if after is None:
+            break
+    # Seven decisions in windows of three, newest first; rejections are claims 0, 3, and 6.
+    assert pages == [[claims[6].pk], [claims[3].pk], [claims[0].pk]]
+
+
+@pytest.mark.django_db
+def test_rejects_unindexed_searches_and_bad_input(reviewer_client, api_client):
+    """Searches need an index-driving filter; cursors and values are validated."""
+    url = reverse("audit-events-search")
+    assert "filters" in reviewer_client.get(url).json()
+    resp = reviewer_client.get(url, data={"created_after": "2026-01-01"})
+    assert resp.status_code == 400
+    assert "filters" in resp.json()
+    # A payload key narrows an indexed search but cannot lead one.
+    resp = reviewer_client.get(url, data={"decision": "APPROVE"})
+    assert resp.status_code == 400
+    assert "filters" in resp.json()
+
+    assert reviewer_client.get(url, data={"actor": "x", "after": "bogus"}).status_code == 400
+    assert reviewer_client.get(url, data={"claim_id": "zero"}).status_code == 400
+    assert reviewer_client.get(url, data={"actor": "x", "limit": "many"}).status_code == 400
+
+    api_client.force_authenticate(User.objects.create_user(username="plain"))
+    assert api_client.get(url, data={"actor": "x"}).status_code == 403
+
+
+def _seed_explain_volume(rows: int) -> None:
+    """Bulk load audit events with set-based SQL for planner realism."""
+    claim_id = ClaimFactory().pk
+    events = AuditEvent._meta.db_table
+    with connection.cursor() as cursor:
+        cursor.execute(
+            f"INSERT INTO {events} (claim_id, event_type, actor, payload, created_at) "
+            "SELECT %s, CASE g %% 4 WHEN 0 THEN 'DECISION_RECORDED' WHEN 1 THEN 'ML_SCORED' "
+            "WHEN 2 THEN 'NOTE_ADDED' ELSE 'CLAIM_CREATED' END, 'actor-' || (g %% 2000), "
+            "CASE g %% 4 WHEN 0 THEN jsonb_build_object('decision_id', g, 'decision', "
+            "CASE WHEN g %% 400 = 0 THEN 'REJECT' ELSE 'APPROVE' END) "
+            "WHEN 1 THEN jsonb_build_object('score', 0.5, 'label', 'LOW', 'reason_codes', "
+            "jsonb_build_array('R' || (g %% 500)), 'model_version', 'baseline-4') "
+            "ELSE jsonb_build_object('note_id', g, 'length', 10) END, "
+            "now() - g * interval '30 seconds' "
+            "FROM generate_series(1, %s) g",
+            [claim_id, rows],
+        )
+        cursor.execute(f"ANALYZE {events}")
+
+
+@pytest.mark.django_db
+@pytest.mark.skipif(connection.vendor != "postgresql", reason="EXPLAIN plans are Postgres-specific")
+def test_each_driving_filter_uses_an_index_at_volume():
+    """Actor and event type searches, with or without payload keys, use an index."""
+    _seed_explain_volume(EXPLAIN_ROWS)
+    now = timezone.now()
+    cases = {
+        "actor": {"actor": "actor-7"},
+        "actor+range": {"actor": "actor-7", "created_after": (now - timedelta(days=1)).isoformat()},
+        "event_type+range": {
+            "event_type": "CLAIM_CREATED",
+            "created_after": (now - timedelta(hours=1)).isoformat(),
+        },
+        "decision": {"event_type": "DECISION_RECORDED", "decision": "REJECT"},
+        "reason_code": {"event_type": "ML_SCORED", "reason_code": "R42"},
+        "actor+decision_id": {"actor": "actor-0", "decision_id": "4000"},
+    }
+
+    for label, params in cases.items():
+        query = QueryDict(mutable=True)
+        query.update(params)
+        qs, payload = AuditEventFilter().split(AuditEvent.objects.all(), query)
+        matches, _end = audit_search.matching(qs, payload=payload)
+        plan = matches[:100].explain()
+        assert "Index" in plan and "Seq Scan on claims_auditevent" not in plan, (label, plan)
@@ -0,0 +1,101 @@
+"""
+Tests for bulk decision recording.
+
+Batches must skip decided and unknown claims, write evidence for every applied claim, and
+use a fixed number of queries regardless of batch size.
+"""
+
+from __future__ import annotations
+
+import pytest
+from django.contrib.auth import get_user_model
+from django.contrib.auth.models import Group
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+
+from policylens.apps.claims import services
+from policylens.apps.claims.facets import read_claim_facets
+from policylens.apps.claims.models import AuditEvent, Claim, ReviewDecision
+from tests.factories import PolicyFactory
+
+User = get_user_model()
+
+
+def _claims(count: int) -> list[Claim]:
+    """Create claims through the service layer so facets are maintained."""
+    policy = PolicyFactory()
+    return [
+        services.create_claim(
+            policy=policy,
+            claim_type=Claim.Type.POLICY_CHANGE,
+            priority=Claim.Priority.LOW,
+            summary="Low-risk change.",
+            actor="seed",
+        )
+        for _ in range(count)
+    ]
+
+
+@pytest.mark.django_db
+def test_bulk_endpoint_applies_eligible_and_reports_skipped(api_client):
+    """Decided and unknown claims are skipped; the rest are decided with evidence."""
+    reviewer = User.objects.create_user(username="bulk-reviewer", password="password123")
+    reviewer.groups.add(Group.objects.get_or_create(name="reviewer")[0])
+    api_client.force_authenticate(user=reviewer)
+
+    claims = _claims(4)
+    services.add_decision(
+        claim=claims[0], decision=ReviewDecision.Decision.REJECT, notes="", actor="seed"
+    )
+    missing_id = claims[-1].pk + 1000
+    ids = [c.pk for c in claims] + [missing_id, claims[1].pk]
+
+    resp = api_client.post(
+        reverse("claims-decisions-bulk"),
+        data={"claim_ids": ids, "decision": ReviewDecision.Decision.APPROVE},
+        format="json",
+    )
+    assert resp.status_code == 201, resp.content
+
+    body = resp.json()
+    assert body["applied"] == [c.pk for c in claims[1:]]
+    assert body["skipped"] == [
+        {"claim_id": claims[0].pk, "reason": "already_decided"},
+        {"claim_id": missing_id, "reason": "not_found"},
+    ]
+    assert Claim.objects.filter(status=Claim.Status.DECIDED).count() == 4
+    assert ReviewDecision.objects.filter(decision=ReviewDecision.Decision.APPROVE).count() == 3
+    assert AuditEvent.objects.filter(event_type="DECISION_RECORDED").count() == 4
+    assert read_claim_facets()["status"] == {Claim.Status.DECIDED: 4}
+
+
+@pytest.mark.django_db
+def test_bulk_endpoint_requires_reviewer_role(api_client):
+    """Basic users cannot record bulk decisions."""
+    user = User.objects.create_user(username="bulk-basic", password="password123")
+    api_client.force_authenticate(user=user)
+
+    resp = api_client.post(
+        reverse("claims-decisions-bulk"),
+        data={"claim_ids": [1], "decision": ReviewDecision.Decision.APPROVE},
+        format="json",
+    )
+    assert resp.status_code == 403
+
+
+@pytest.mark.django_db
+def test_bulk_service_query_count_is_independent_of_batch_size():
+    """Set-based writes keep the statement count flat as the batch grows."""
+
+    def count_queries(claims: list[Claim]) -> int:
+        with CaptureQueriesContext(connection) as ctx:
+            services.bulk_add_decisions(
+                claim_ids=[c.pk for c in claims],
+                decision=ReviewDecision.Decision.REQUEST_INFO,
+                notes="",
+                actor="bulk",
+            )
+        return len(ctx.captured_queries)
+
+    assert count_queries(_claims(3)) == count_queries(_claims(60))
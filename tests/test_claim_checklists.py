@@ -0,0 +1,236 @@
+"""
+Tests for templated claim checklists and the denormalised completeness percentage.
+"""
+
+from __future__ import annotations
+
+import threading
+
+import pytest
+from django.contrib.auth import get_user_model
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.core.management import call_command
+from django.db import connection, connections
+from django.urls import reverse
+
+from policylens.apps.claims import services
+from policylens.apps.claims.models import (
+    AuditEvent,
+    ChecklistItem,
+    ChecklistTemplate,
+    Claim,
+    Policy,
+    ReviewDecision,
+)
+from tests.factories import ClaimFactory, PolicyFactory
+
+User = get_user_model()
+Rule = ChecklistTemplate.Rule
+
+
+@pytest.fixture()
+def templates(db):
+    """Generic claim templates plus a Motor-specific override and extra item."""
+    for position, (product, key, rule, match, required) in enumerate(
+        [
+            ("", "supporting_document", Rule.DOCUMENT, "", True),
+            ("", "triage_note", Rule.NOTE, "", True),
+            ("", "police_report", Rule.DOCUMENT, "police", False),
+            ("Motor Insurance", "triage_note", Rule.NOTE, "liability", True),
+            ("Motor Insurance", "damage_photos", Rule.DOCUMENT, "image/", True),
+        ]
+    ):
+        ChecklistTemplate.objects.create(
+            claim_type=Claim.Type.CLAIM,
+            product_type=product,
+            key=key,
+            label=key.replace("_", " ").capitalize(),
+            is_required=required,
+            rule=rule,
+            match=match,
+            position=position,
+        )
+    ChecklistTemplate.objects.create(
+        claim_type=Claim.Type.CLAIM,
+        key="retired",
+        label="Retired item",
+        rule=Rule.NOTE,
+        is_active=False,
+    )
+
+
+def _claim(policy: Policy) -> Claim:
+    """Create a claim through the service layer."""
+    return services.create_claim(
+        policy=policy,
+        claim_type=Claim.Type.CLAIM,
+        priority=Claim.Priority.NORMAL,
+        summary="Rear-ended at a junction.",
+        actor="intake",
+    )
+
+
+def _upload(claim: Claim, name: str, content_type: str) -> None:
+    """Attach a small document to a claim."""
+    services.add_document(
+        claim=claim,
+        uploaded_file=SimpleUploadedFile(name, b"data", content_type=content_type),
+        original_filename=name,
+        content_type=content_type,
+        actor="reviewer-1",
+    )
+
+
+@pytest.mark.django_db
+def test_create_claim_instantiates_product_templates(templates):
+    """Product templates replace generic ones by key; inactive templates are skipped."""
+    claim = _claim(PolicyFactory(product_type="Motor Insurance"))
+
+    items = {i.key: i for i in ChecklistItem.objects.filter(claim=claim)}
+    assert set(items) == {"supporting_document", "triage_note", "police_report", "damage_photos"}
+    assert items["triage_note"].match == "liability"
+    assert not any(i.is_satisfied for i in items.values())
+    assert claim.checklist_completeness == 0
+
+    other = _claim(PolicyFactory(product_type="Home Insurance"))
+    assert other.checklist_items.count() == 3
+
+
+@pytest.mark.django_db
+def test_claim_without_templates_is_complete():
+    """A claim with no required items reports 100% complete."""
+    claim = _claim(PolicyFactory())
+    assert claim.checklist_items.count() == 0
+    assert Claim.objects.get(pk=claim.pk).checklist_completeness == 100
+
+
+@pytest.mark.django_db
+def test_documents_and_notes_satisfy_matching_items(templates, settings, tmp_path):
+    """Uploads and notes tick matching items and keep completeness in step."""
+    settings.MEDIA_ROOT = tmp_path
+    claim = _claim(PolicyFactory(product_type="Motor Insurance"))
+
+    _upload(claim, "photo.jpg", "image/jpeg")
+    claim.refresh_from_db()
+    # A photo counts as a supporting document and the damage photos; 2 of 3 required.
+    assert claim.checklist_completeness == 66
+    event = AuditEvent.objects.get(claim=claim, event_type="CHECKLIST_ITEMS_SATISFIED")
+    assert event.payload == {"keys": ["damage_photos", "supporting_document"], "completeness": 66}
+
+    services.add_note(claim=claim, body="Waiting on the other driver.", actor="reviewer-1")
+    claim.refresh_from_db()
+    assert claim.checklist_completeness == 66
+
+    services.add_note(claim=claim, body="Liability accepted by third party.", actor="reviewer-1")
+    _upload(claim, "Police-Report.pdf", "application/pdf")
+    claim.refresh_from_db()
+    assert claim.checklist_completeness == 100
+    assert set(
+        ChecklistItem.objects.filter(claim=claim, is_satisfied=True).values_list("key", flat=True)
+    ) == {"supporting_document", "damage_photos", "triage_note", "police_report"}
+    assert (
+        AuditEvent.objects.filter(claim=claim, event_type="CHECKLIST_ITEMS_SATISFIED").count() == 3
+    )
+
+
+@pytest.mark.django_db
+def test_list_filters_and_orders_by_completeness(templates, api_client):
+    """The claims list filters on completeness and orders the least complete first."""
+    api_client.force_authenticate(User.objects.create_user(username="queue-reviewer"))
+    policy = PolicyFactory(product_type="Home Insurance")
+    untouched = _claim(policy)
+    noted = _claim(policy)
+    services.add_note(claim=noted, body="Triage done.", actor="reviewer-1")
+    untemplated = ClaimFactory(policy=policy)
+    url = reverse("claims-list-create")
+
+    resp = api_client.get(url, data={"completeness_max": "50"})
+    assert resp.status_code == 200
+    rows = resp.json()
+    assert sorted(r["id"] for r in rows) == sorted([untouched.pk, noted.pk])
+    assert {r["id"]: r["checklist_completeness"] for r in rows} == {untouched.pk: 0, noted.pk: 50}
+
+    resp = api_client.get(url, data={"ordering": "checklist_completeness", "open": "true"})
+    assert [r["id"] for r in resp.json()] == [untouched.pk, noted.pk, untemplated.pk]
+
+    assert api_client.get(url, data={"ordering": "summary"}).status_code == 400
+    assert api_client.get(url, data={"completeness_min": "101"}).status_code == 400
+
+
+@pytest.mark.django_db
+def test_apply_templates_backfills_existing_claims(settings, tmp_path):
+    """The backfill adds missing items, satisfied from the claim's existing history."""
+    settings.MEDIA_ROOT = tmp_path
+    documented = _claim(PolicyFactory())
+    _upload(documented, "receipt.pdf", "application/pdf")
+    bare = _claim(PolicyFactory())
+    ChecklistTemplate.objects.create(
+        claim_type=Claim.Type.CLAIM, key="receipt", label="Receipt", rule=Rule.DOCUMENT
+    )
+
+    call_command("apply_checklist_templates", "--chunk-size", "1")
+    call_command("apply_checklist_templates")
+
+    assert ChecklistItem.objects.count() == 2
+    assert Claim.objects.get(pk=documented.pk).checklist_completeness == 100
+    assert Claim.objects.get(pk=bare.pk).checklist_completeness == 0
+    events = AuditEvent.objects.filter(event_type="CHECKLIST_ITEMS_ADDED")
+    assert sorted(events.values_list("claim_id", "payload")) == [
+        (documented.pk, {"keys": ["receipt"], "completeness": 100}),
+        (bare.pk, {"keys": ["receipt"], "completeness": 0}),
+    ]
+
+
+@pytest.mark.django_db(transaction=True)
+@pytest.mark.skipif(connection.vendor != "postgresql", reason="Needs row-level locking")
+def test_satisfying_note_does_not_deadlock_with_a_decision(templates, monkeypatch):
+    """A note that updates completeness holds the claim row, so a decision waits for it."""
+    claim = _claim(PolicyFactory(product_type="Home Insurance"))
+    noted = threading.Event()
+    release = threading.Event()
+    errors = []
+    append_audit_event = services.append_audit_event
+
+    def pause_note(**kwargs):
+        # The note has marked the claim dirty and has not yet updated its completeness.
+        if kwargs["event_type"] == "NOTE_ADDED":
+            noted.set()
+            release.wait(5)
+        return append_audit_event(**kwargs)
+
+    monkeypatch.setattr(services, "append_audit_event", pause_note)
+
+    def run(action) -> None:
+        try:
+            action(Claim.objects.get(pk=claim.pk))
+        except Exception as exc:
+            errors.append(exc)
+        finally:
+            connections.close_all()
+
+    note = threading.Thread(
+        target=run,
+        args=(lambda c: services.add_note(claim=c, body="Triage done.", actor="reviewer-1"),),
+    )
+    decision = threading.Thread(
+        target=run,
+        args=(
+            lambda c: services.add_decision(
+                claim=c, decision=ReviewDecision.Decision.APPROVE, notes="", actor="reviewer-2"
+            ),
+        ),
+    )
+    note.start()
+    assert noted.wait(5)
+    decision.start()
+    # The decision queues on the claim row lock the note took first.
+    decision.join(0.3)
+    assert decision.is_alive()
+    release.set()
+    note.join(10)
+    decision.join(10)
+
+    assert errors == []
+    claim.refresh_from_db()
+    assert claim.status == Claim.Status.DECIDED
+    assert claim.checklist_completeness == 50
@@ -0,0 +1,172 @@
+"""
+Tests for incrementally maintained claim facet counts.
+
+The rollup must agree with a GROUP BY over Claim after service-layer writes and after a
+full rebuild.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+
+import pytest
+from django.contrib.auth import get_user_model
+from django.core.management import call_command
+from django.db import connection, connections
+from django.db.models import Count
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+
+from policylens.apps.claims import facets, services
+from policylens.apps.claims.facets import read_claim_facets, rebuild_claim_facets
+from policylens.apps.claims.models import Claim, ClaimFacetCount, ReviewDecision
+from tests.factories import ClaimFactory, PolicyFactory
+
+User = get_user_model()
+
+
+def _create(policy, *, priority=Claim.Priority.NORMAL, claim_type=Claim.Type.CLAIM) -> Claim:
+    """Create a claim through the service layer."""
+    return services.create_claim(
+        policy=policy,
+        claim_type=claim_type,
+        priority=priority,
+        summary="Facet test.",
+        actor="reviewer-1",
+    )
+
+
+@pytest.mark.django_db
+def test_services_maintain_facet_counts():
+    """create_claim and add_decision keep the rollup in step with claim statuses."""
+    home = PolicyFactory(product_type="Home Insurance")
+    motor = PolicyFactory(product_type="Motor Insurance")
+
+    first = _create(home, priority=Claim.Priority.HIGH)
+    _create(home)
+    second = _create(motor, claim_type=Claim.Type.POLICY_CHANGE)
+
+    services.add_decision(
+        claim=first,
+        decision=ReviewDecision.Decision.APPROVE,
+        notes="",
+        actor="reviewer-1",
+    )
+    services.add_decision(
+        claim=second,
+        decision=ReviewDecision.Decision.REQUEST_INFO,
+        notes="",
+        actor="reviewer-1",
+    )
+
+    facets = read_claim_facets()
+    assert facets["total"] == 3
+    assert facets["status"] == {"DECIDED": 1, "IN_REVIEW": 1, "NEW": 1}
+    assert facets["priority"] == {"HIGH": 1, "NORMAL": 2}
+    assert facets["claim_type"] == {"CLAIM": 2, "POLICY_CHANGE": 1}
+    assert facets["product_type"] == {"Home Insurance": 2, "Motor Insurance": 1}
+
+
+@pytest.mark.django_db
+def test_single_and_bulk_decisions_lock_facet_rows_in_the_same_order():
+    """Both decision paths upsert facet rows in sorted key order, so they cannot deadlock."""
+    policy = PolicyFactory(product_type="Home Insurance")
+    single, bulk = _create(policy), _create(policy)
+    table = ClaimFacetCount._meta.db_table
+
+    def upserted_statuses(write) -> list[str]:
+        with CaptureQueriesContext(connection) as ctx:
+            write()
+        statuses = []
+        for query in ctx.captured_queries:
+            if query["sql"].startswith(f'INSERT INTO "{table}"'):
+                statuses += [s for s in Claim.Status.values if f"'{s}'" in query["sql"]]
+        return statuses
+
+    info = ReviewDecision.Decision.REQUEST_INFO
+    assert upserted_statuses(
+        lambda: services.add_decision(claim=single, decision=info, notes="", actor="r")
+    ) == ["IN_REVIEW", "NEW"]
+    assert upserted_statuses(
+        lambda: services.bulk_add_decisions(claim_ids=[bulk.pk], decision=info, notes="", actor="r")
+    ) == ["IN_REVIEW", "NEW"]
+
+
+@pytest.mark.django_db
+def test_rebuild_command_matches_group_by():
+    """The reconciliation command recounts claims written outside the service layer."""
+    ClaimFactory.create_batch(3, status=Claim.Status.NEW)
+    ClaimFactory.create_batch(2, status=Claim.Status.IN_REVIEW, priority=Claim.Priority.LOW)
+    ClaimFacetCount.objects.create(
+        status=Claim.Status.DECIDED,
+        priority=Claim.Priority.HIGH,
+        claim_type=Claim.Type.CLAIM,
+        product_type="Stale",
+        count=99,
+    )
+
+    call_command("rebuild_claim_facets", "--chunk-size", "2")
+
+    expected = {
+        row["status"]: row["n"] for row in Claim.objects.values("status").annotate(n=Count("id"))
+    }
+    facets = read_claim_facets()
+    assert facets["status"] == expected
+    assert facets["total"] == 5
+    assert "Stale" not in facets["product_type"]
+
+
+@pytest.mark.django_db(transaction=True)
+@pytest.mark.skipif(connection.vendor != "postgresql", reason="Needs table-level locking")
+def test_rebuild_waits_for_an_uncommitted_facet_delta(monkeypatch):
+    """A claim whose delta is applied but not committed is counted, not lost, by a rebuild."""
+    policy = PolicyFactory(product_type="Home Insurance")
+    _create(policy)
+    applied = threading.Event()
+    release = threading.Event()
+    apply_facet_delta = facets.apply_facet_delta
+
+    def pause_after_delta(**kwargs):
+        apply_facet_delta(**kwargs)
+        if threading.current_thread().name == "writer":
+            applied.set()
+            release.wait(10)
+
+    monkeypatch.setattr(facets, "apply_facet_delta", pause_after_delta)
+
+    def in_thread(target, name):
+        def run():
+            try:
+                target()
+            finally:
+                connections.close_all()
+
+        thread = threading.Thread(target=run, name=name)
+        thread.start()
+        return thread
+
+    writer = in_thread(lambda: _create(policy), "writer")
+    assert applied.wait(10)
+    rebuild = in_thread(rebuild_claim_facets, "rebuild")
+    # Give the rebuild time to reach the rollup lock before the writer commits.
+    time.sleep(0.5)
+    release.set()
+    writer.join(10)
+    rebuild.join(10)
+
+    assert read_claim_facets()["total"] == Claim.objects.count() == 2
+
+
+@pytest.mark.django_db
+def test_get_claim_facets_endpoint(api_client):
+    """GET /api/claims/facets/ serves counts from the rollup table."""
+    user = User.objects.create_user(username="basic-facets", password="password123")
+    api_client.force_authenticate(user=user)
+    _create(PolicyFactory(product_type="Travel Insurance"))
+
+    resp = api_client.get(reverse("claims-facets"))
+    assert resp.status_code == 200
+    body = resp.json()
+    assert body["total"] == 1
+    assert body["product_type"] == {"Travel Insurance": 1}
@@ -120,3 +120,29 @@ def test_add_decision_blocks_second_decision_after_finalisation():
             notes="Too late.",
             actor="reviewer-1",
         )
+
+
+@pytest.mark.django_db
+def test_add_document_checks_the_committed_status_not_the_callers_copy():
+    """A stale instance still showing NEW cannot attach documents to a decided claim."""
+    claim = services.create_claim(
+        policy=PolicyFactory(),
+        claim_type=Claim.Type.CLAIM,
+        priority=Claim.Priority.NORMAL,
+        summary="Decided elsewhere.",
+        actor="reviewer-1",
+    )
+    stale = Claim.objects.get(pk=claim.pk)
+    services.add_decision(
+        claim=claim, decision=ReviewDecision.Decision.APPROVE, notes="", actor="reviewer-2"
+    )
+
+    assert stale.status == Claim.Status.NEW
+    with pytest.raises(services.DomainRuleViolation):
+        services.add_document(
+            claim=stale,
+            uploaded_file=SimpleUploadedFile("late.pdf", b"data", content_type="application/pdf"),
+            original_filename="late.pdf",
+            content_type="application/pdf",
+            actor="reviewer-1",
+        )
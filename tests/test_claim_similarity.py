@@ -0,0 +1,156 @@
+"""
+Tests for MinHash/LSH near-duplicate claim detection.
+"""
+
+from __future__ import annotations
+
+import threading
+
+import pytest
+from django.contrib.auth import get_user_model
+from django.core.management import call_command
+from django.db import connection, connections
+from django.urls import reverse
+
+from policylens.apps.claims import services, similarity
+from policylens.apps.claims.facets import read_claim_facets
+from policylens.apps.claims.ml.scoring import score_claims
+from policylens.apps.claims.models import Claim, ClaimMinHash, ClaimRescoreMark, ReviewDecision
+from tests.factories import ClaimFactory, PolicyFactory
+
+User = get_user_model()
+
+RING = (
+    "Vehicle was parked outside the house overnight and in the morning the rear window "
+    "was smashed and the stereo, laptop bag and tools were stolen from the boot"
+)
+VARIANT = RING.replace("laptop bag", "camera bag")
+UNRELATED = "Storm damage to the garden fence and two roof tiles after heavy winds on Sunday"
+
+
+def _create(summary: str, policy=None) -> Claim:
+    """Create a claim through the service layer."""
+    return services.create_claim(
+        policy=policy or PolicyFactory(),
+        claim_type=Claim.Type.CLAIM,
+        priority=Claim.Priority.NORMAL,
+        summary=summary,
+        actor="intake",
+    )
+
+
+def test_signatures_estimate_jaccard_similarity():
+    """Reworded copies score high, unrelated text low, and empty text has no signature."""
+    ring, variant, other = (similarity.signature(t) for t in (RING, VARIANT, UNRELATED))
+    assert similarity.estimate_similarity(ring, similarity.signature(RING.upper())) == 1.0
+    assert similarity.estimate_similarity(ring, variant) >= similarity.NEAR_DUPLICATE_THRESHOLD
+    assert similarity.estimate_similarity(ring, other) < 0.2
+    assert similarity.signature("  ...  ") is None
+    assert len(similarity.band_buckets(ring)) == similarity.BANDS
+
+
+@pytest.mark.django_db
+def test_create_claim_indexes_and_links_near_duplicates(api_client, django_assert_max_num_queries):
+    """A reworded claim is found via LSH buckets, counted, and surfaced as a reason code."""
+    first = _create(RING)
+    _create(UNRELATED)
+    ClaimRescoreMark.objects.all().delete()
+    second = _create(VARIANT)
+
+    assert ClaimMinHash.objects.get(claim=first).near_duplicates == 1
+    assert ClaimMinHash.objects.get(claim=second).near_duplicates == 1
+    assert set(ClaimRescoreMark.objects.values_list("claim_id", flat=True)) == {
+        first.pk,
+        second.pk,
+    }
+
+    with django_assert_max_num_queries(3):
+        matches = similarity.similar_claims(first.pk)
+    assert [m.claim_id for m in matches] == [second.pk]
+
+    api_client.force_authenticate(user=User.objects.create_user(username="r", password="pw"))
+    resp = api_client.get(reverse("claims-similar", kwargs={"claim_id": second.pk}))
+    assert resp.status_code == 200, resp.content
+    results = resp.json()["results"]
+    assert [r["claim_id"] for r in results] == [first.pk]
+    assert results[0]["summary"] == RING
+    assert api_client.get(reverse("claims-similar", kwargs={"claim_id": 999999})).status_code == 404
+
+    assert "NEAR_DUPLICATE_NARRATIVE" in score_claims([second.pk])[second.pk].reason_codes
+
+
+@pytest.mark.django_db(transaction=True)
+def test_backfill_command_indexes_history_in_parallel():
+    """Claims created outside services are indexed and counted by the backfill."""
+    ids = [ClaimFactory(summary=text).pk for text in (RING, VARIANT, UNRELATED, "")]
+    ids.append(ClaimFactory(summary=RING).pk)
+
+    call_command("backfill_claim_minhash", "--chunk-size", "2", "--workers", "2")
+
+    counts = dict(ClaimMinHash.objects.values_list("claim_id", "near_duplicates"))
+    assert counts == {ids[0]: 2, ids[1]: 2, ids[2]: 0, ids[4]: 2}
+    assert set(ClaimRescoreMark.objects.values_list("claim_id", flat=True)) == {
+        ids[0],
+        ids[1],
+        ids[4],
+    }
+
+    call_command("backfill_claim_minhash", "--workers", "1")
+    assert ClaimMinHash.objects.count() == 4
+
+
+@pytest.mark.django_db(transaction=True)
+@pytest.mark.skipif(connection.vendor != "postgresql", reason="Needs row-level locking")
+def test_near_duplicate_creation_does_not_deadlock_with_a_decision(monkeypatch):
+    """Creating a near-duplicate of a claim being decided waits for it instead of deadlocking."""
+    policy = PolicyFactory()
+    original = _create(RING, policy)
+    marked = threading.Event()
+    release = threading.Event()
+    errors = []
+    append_audit_event = services.append_audit_event
+
+    def pause_decision(**kwargs):
+        # The decision holds the claim row and its rescore mark; hold them until released.
+        if kwargs["event_type"] == "DECISION_RECORDED":
+            marked.set()
+            release.wait(5)
+        return append_audit_event(**kwargs)
+
+    monkeypatch.setattr(services, "append_audit_event", pause_decision)
+
+    def decide() -> None:
+        try:
+            services.add_decision(
+                claim=Claim.objects.get(pk=original.pk),
+                decision=ReviewDecision.Decision.APPROVE,
+                notes="",
+                actor="reviewer-1",
+            )
+        except Exception as exc:
+            errors.append(exc)
+        finally:
+            connections.close_all()
+
+    def create() -> None:
+        try:
+            _create(VARIANT, policy)
+        except Exception as exc:
+            errors.append(exc)
+        finally:
+            connections.close_all()
+
+    decider = threading.Thread(target=decide)
+    creator = threading.Thread(target=create)
+    decider.start()
+    assert marked.wait(5)
+    creator.start()
+    # The creation blocks on the original's rescore mark before it touches any facet row.
+    creator.join(0.3)
+    release.set()
+    decider.join(10)
+    creator.join(10)
+
+    assert errors == []
+    assert read_claim_facets()["status"] == {Claim.Status.NEW: 1, Claim.Status.DECIDED: 1}
+    assert ClaimMinHash.objects.get(claim=original).near_duplicates == 1
@@ -0,0 +1,125 @@
+"""
+Tests for the unified claim timeline endpoint.
+
+Pages must concatenate into one chronological stream with no gaps or duplicates, including
+when events from different sources share a timestamp.
+"""
+
+from __future__ import annotations
+
+from datetime import timedelta
+
+import pytest
+from django.contrib.auth import get_user_model
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from django.utils import timezone
+from django.utils.dateparse import parse_datetime
+
+from policylens.apps.claims import services
+from policylens.apps.claims.models import (
+    AuditEvent,
+    Claim,
+    InternalNote,
+    ReviewDecision,
+)
+from policylens.apps.claims.timeline import claim_timeline_page
+from tests.factories import PolicyFactory
+
+User = get_user_model()
+
+
+@pytest.fixture()
+def claim_with_history() -> Claim:
+    """Create a claim with notes, a document, a decision, and their audit events."""
+    claim = services.create_claim(
+        policy=PolicyFactory(),
+        claim_type=Claim.Type.CLAIM,
+        priority=Claim.Priority.NORMAL,
+        summary="Timeline claim.",
+        actor="reviewer-1",
+    )
+    for i in range(3):
+        services.add_note(claim=claim, body=f"Note {i}", actor="reviewer-1")
+    services.add_document(
+        claim=claim,
+        uploaded_file=SimpleUploadedFile("a.txt", b"a", content_type="text/plain"),
+        original_filename="a.txt",
+        content_type="text/plain",
+        actor="reviewer-1",
+    )
+    services.add_decision(
+        claim=claim,
+        decision=ReviewDecision.Decision.REQUEST_INFO,
+        notes="",
+        actor="reviewer-1",
+    )
+    return claim
+
+
+@pytest.mark.django_db
+def test_timeline_pages_form_one_ordered_stream(api_client, claim_with_history):
+    """Walking the cursor returns every event exactly once in (time, kind, id) order."""
+    claim = claim_with_history
+    # Force cross-source timestamp ties to exercise the keyset tie-break.
+    tied_at = timezone.now() - timedelta(hours=1)
+    InternalNote.objects.filter(claim=claim).update(created_at=tied_at)
+    AuditEvent.objects.filter(claim=claim, event_type="NOTE_ADDED").update(created_at=tied_at)
+
+    user = User.objects.create_user(username="basic-timeline", password="password123")
+    api_client.force_authenticate(user=user)
+    url = reverse("claims-timeline", kwargs={"claim_id": claim.pk})
+
+    seen = []
+    params = {"limit": 2}
+    while True:
+        resp = api_client.get(url, data=params)
+        assert resp.status_code == 200, resp.content
+        body = resp.json()
+        assert len(body["results"]) <= 2
+        seen.extend(body["results"])
+        if body["next"] is None:
+            break
+        params = {"limit": 2, "after": body["next"]}
+
+    keys = [(e["occurred_at"], e["kind"], e["id"]) for e in seen]
+    assert len(seen) == 3 + 1 + 1 + 6
+    assert len(set(keys)) == len(keys)
+    parsed = [(parse_datetime(ts), kind, pk) for ts, kind, pk in keys]
+    assert parsed == sorted(parsed)
+    assert seen[0]["kind"] == "audit" and seen[0]["detail"] == "NOTE_ADDED"
+    assert {e["kind"] for e in seen} == {"audit", "decision", "document", "note"}
+
+
+@pytest.mark.django_db
+def test_timeline_page_is_a_single_query(claim_with_history):
+    """Each page is served by one UNION ALL statement."""
+    with CaptureQueriesContext(connection) as ctx:
+        events, next_cursor = claim_timeline_page(claim_id=claim_with_history.pk, limit=4)
+
+    assert len(ctx.captured_queries) == 1
+    assert "UNION ALL" in ctx.captured_queries[0]["sql"]
+    assert len(events) == 4
+    assert next_cursor is not None
+
+
+@pytest.mark.django_db
+def test_timeline_rejects_bad_cursor_and_missing_claim(api_client):
+    """Malformed cursors return 400 and unknown claims return 404."""
+    user = User.objects.create_user(username="basic-timeline-2", password="password123")
+    api_client.force_authenticate(user=user)
+    claim = services.create_claim(
+        policy=PolicyFactory(),
+        claim_type=Claim.Type.CLAIM,
+        priority=Claim.Priority.NORMAL,
+        summary="",
+        actor="reviewer-1",
+    )
+
+    url = reverse("claims-timeline", kwargs={"claim_id": claim.pk})
+    assert api_client.get(url, data={"after": "not-a-cursor"}).status_code == 400
+
+    missing = reverse("claims-timeline", kwargs={"claim_id": claim.pk + 1000})
+    assert api_client.get(missing).status_code == 404
@@ -0,0 +1,111 @@
+"""
+Tests for time-bucketed claim velocity counters.
+"""
+
+from __future__ import annotations
+
+import math
+from datetime import timedelta
+
+import pytest
+from django.core.management import call_command
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+
+from policylens.apps.claims import services, velocity
+from policylens.apps.claims.ml.features import build_matrix, load_frame
+from policylens.apps.claims.ml.scoring import score_claims
+from policylens.apps.claims.models import Claim, ClaimVelocityBucket, Policy
+from tests.factories import PolicyFactory
+
+
+def _claim(policy: Policy) -> Claim:
+    """Create a claim on ``policy`` through the service layer."""
+    return services.create_claim(
+        policy=policy,
+        claim_type=Claim.Type.CLAIM,
+        priority=Claim.Priority.NORMAL,
+        summary="Water damage in the kitchen.",
+        actor="intake",
+    )
+
+
+@pytest.mark.django_db
+def test_create_claim_upserts_policy_and_holder_buckets():
+    """Claims on the same day share one bucket per policy and per holder."""
+    policy = PolicyFactory()
+    sibling = PolicyFactory(holder=policy.holder)
+    _claim(policy)
+    _claim(policy)
+    _claim(sibling)
+
+    today = velocity.bucket_day(timezone.now())
+    counts = {
+        (b.entity_type, b.entity_id): b.count for b in ClaimVelocityBucket.objects.filter(day=today)
+    }
+    assert counts == {
+        (velocity.POLICY, policy.pk): 2,
+        (velocity.POLICY, sibling.pk): 1,
+        (velocity.HOLDER, policy.holder_id): 3,
+    }
+
+
+@pytest.mark.django_db
+def test_window_counts_are_point_in_time_after_rebuild():
+    """Windows sum the buckets ending on each claim's own day."""
+    policy = PolicyFactory()
+    now = timezone.now()
+    claims = [_claim(policy) for _ in range(4)]
+    for claim, age in zip(claims, (100, 40, 10, 0), strict=True):
+        Claim.objects.filter(pk=claim.pk).update(created_at=now - timedelta(days=age))
+    call_command("rebuild_velocity_buckets")
+    assert ClaimVelocityBucket.objects.filter(entity_type=velocity.POLICY).count() == 4
+
+    frame = load_frame([c.pk for c in claims])
+    assert frame["policy_claims_7d"].tolist() == [1, 1, 1, 1]
+    assert frame["policy_claims_30d"].tolist() == [1, 1, 1, 2]
+    assert frame["policy_claims_90d"].tolist() == [1, 2, 2, 3]
+    assert frame["holder_claims_90d"].tolist() == [1, 2, 2, 3]
+
+
+@pytest.mark.django_db
+def test_later_same_day_claims_are_not_counted():
+    """A claim's windows stop at the claim, even though its day's bucket counts later ones."""
+    first = PolicyFactory()
+    second = PolicyFactory(holder=first.holder)
+    early, late = _claim(first), _claim(second)
+
+    frame = load_frame([late.pk, early.pk])
+    assert frame["pk"].tolist() == [late.pk, early.pk]
+    assert frame["holder_claims_90d"].tolist() == [2, 1]
+    assert frame["holder_claims_month"].tolist() == [2, 1]
+    assert frame["policy_claims_7d"].tolist() == [1, 1]
+
+
+@pytest.mark.django_db
+def test_batch_window_counts_take_one_query():
+    """Velocity features for a batch cost a single extra query regardless of size."""
+    policies = [PolicyFactory() for _ in range(3)]
+    claims = [_claim(policy) for policy in policies for _ in range(3)]
+
+    with CaptureQueriesContext(connection) as queries:
+        frame = load_frame([c.pk for c in claims])
+    assert len(queries) == 2
+    # Each claim counts itself and the claims before it on its policy, never later ones.
+    assert frame["policy_claims_30d"].tolist() == [1, 2, 3] * len(policies)
+    assert build_matrix(frame, ["log_policy_claims_30d"])[:, 0].tolist() == pytest.approx(
+        [math.log1p(n) for n in (0, 1, 2)] * len(policies)
+    )
+
+
+@pytest.mark.django_db
+def test_repeat_policy_claims_reason_code():
+    """A claim following others on the same policy carries REPEAT_POLICY_CLAIMS."""
+    policy = PolicyFactory()
+    first = _claim(policy)
+    _claim(policy)
+    latest = _claim(policy)
+
+    scores = score_claims([first.pk, latest.pk])
+    assert "REPEAT_POLICY_CLAIMS" in scores[latest.pk].reason_codes
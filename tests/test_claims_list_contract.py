@@ -0,0 +1,72 @@
+"""
+Contract tests for the claims list fast path.
+
+The values()-based rows and orjson rendering must produce exactly the bytes that
+ClaimSerializer and DRF's JSONRenderer produced before the fast path existed.
+"""
+
+from __future__ import annotations
+
+import pytest
+from django.contrib.auth import get_user_model
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from rest_framework.renderers import JSONRenderer
+
+from policylens.apps.claims.api.serializers import ClaimSerializer
+from policylens.apps.claims.models import Claim
+from tests.factories import ClaimFactory, PolicyFactory
+
+User = get_user_model()
+
+
+@pytest.fixture()
+def authed_client(api_client):
+    """Return an API client authenticated as a basic user."""
+    user = User.objects.create_user(username="basic-contract", password="password123")
+    api_client.force_authenticate(user=user)
+    return api_client
+
+
+@pytest.mark.django_db
+def test_list_bytes_match_serializer_contract(authed_client):
+    """Full rows render byte-for-byte like ClaimSerializer through JSONRenderer."""
+    policy = PolicyFactory(policy_number="PL-CONTRACT")
+    ClaimFactory(policy=policy, summary="Plain summary.")
+    ClaimFactory(policy=policy, summary='Ünïcødé, "quotes", tabs\tand\nnewlines \u2028 \x01 sep.')
+    ClaimFactory(policy=policy, summary="", created_by="")
+
+    resp = authed_client.get(reverse("claims-list-create"))
+    assert resp.status_code == 200
+
+    expected = JSONRenderer().render(
+        ClaimSerializer(
+            Claim.objects.select_related("policy").order_by("-created_at"), many=True
+        ).data
+    )
+    assert resp.content == expected
+
+
+@pytest.mark.django_db
+def test_sparse_fieldset_narrows_rows_and_sql(authed_client):
+    """?fields= returns only the requested keys and selects only their columns."""
+    ClaimFactory(summary="Should not be selected.")
+    url = reverse("claims-list-create")
+
+    with CaptureQueriesContext(connection) as ctx:
+        resp = authed_client.get(url, data={"fields": "status,id"})
+    assert resp.status_code == 200
+    assert list(resp.json()[0].keys()) == ["id", "status"]
+
+    claim_query = next(q["sql"] for q in ctx.captured_queries if "claims_claim" in q["sql"])
+    assert '"claims_claim"."summary"' not in claim_query
+    assert "claims_policy" not in claim_query
+
+
+@pytest.mark.django_db
+def test_sparse_fieldset_rejects_unknown_fields(authed_client):
+    """Unknown or write-only field names are rejected with 400."""
+    resp = authed_client.get(reverse("claims-list-create"), data={"fields": "id,policy_id"})
+    assert resp.status_code == 400
+    assert "fields" in resp.json()
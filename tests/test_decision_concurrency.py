@@ -0,0 +1,81 @@
+"""
+Concurrency stress test for decision recording.
+
+Many reviewers racing on the same claims with stale instances must still produce exactly
+one final decision per claim.
+"""
+
+from __future__ import annotations
+
+import random
+import threading
+
+import pytest
+from django.db import connection, connections
+
+from policylens.apps.claims import services
+from policylens.apps.claims.facets import read_claim_facets
+from policylens.apps.claims.models import Claim, ReviewDecision
+from tests.factories import PolicyFactory
+
+WRITERS = 32
+CLAIMS = 40
+
+
+@pytest.mark.django_db(transaction=True)
+@pytest.mark.skipif(connection.vendor != "postgresql", reason="Needs row-level locking")
+def test_parallel_writers_record_exactly_one_final_decision_per_claim():
+    """32 writers deciding the same claims leave one APPROVE/REJECT per claim."""
+    policy = PolicyFactory()
+    claim_ids = [
+        services.create_claim(
+            policy=policy,
+            claim_type=Claim.Type.CLAIM,
+            priority=Claim.Priority.NORMAL,
+            summary=f"Contended {i}",
+            actor="seed",
+        ).pk
+        for i in range(CLAIMS)
+    ]
+    barrier = threading.Barrier(WRITERS)
+    outcomes = {"recorded": 0, "rejected": 0}
+    lock = threading.Lock()
+
+    def writer(seed: int) -> None:
+        rng = random.Random(seed)
+        try:
+            # Every writer loads its instances up front, so all of them start stale.
+            claims = list(Claim.objects.select_related("policy").filter(pk__in=claim_ids))
+            rng.shuffle(claims)
+            barrier.wait()
+            for claim in claims:
+                try:
+                    services.add_decision(
+                        claim=claim,
+                        decision=rng.choice(
+                            [ReviewDecision.Decision.APPROVE, ReviewDecision.Decision.REJECT]
+                        ),
+                        notes="",
+                        actor=f"reviewer-{seed}",
+                    )
+                    key = "recorded"
+                except services.DomainRuleViolation:
+                    key = "rejected"
+                with lock:
+                    outcomes[key] += 1
+        finally:
+            connections.close_all()
+
+    threads = [threading.Thread(target=writer, args=(i,)) for i in range(WRITERS)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    attempts = WRITERS * CLAIMS
+
+    assert outcomes == {"recorded": CLAIMS, "rejected": attempts - CLAIMS}
+    per_claim = {pk: ReviewDecision.objects.filter(claim_id=pk).count() for pk in claim_ids}
+    assert set(per_claim.values()) == {1}
+    assert Claim.objects.filter(pk__in=claim_ids, status=Claim.Status.DECIDED).count() == CLAIMS
+    assert read_claim_facets()["status"] == {Claim.Status.DECIDED: CLAIMS}
@@ -0,0 +1,208 @@
+"""
+Tests for the holder entity-link graph.
+"""
+
+from __future__ import annotations
+
+import math
+import threading
+
+import pytest
+from django.contrib.auth import get_user_model
+from django.core.management import call_command
+from django.db import connection, connections, transaction
+from django.urls import reverse
+from django.utils import timezone
+
+from policylens.apps.claims import entity_links, services
+from policylens.apps.claims.ml.scoring import score_claims
+from policylens.apps.claims.models import Claim, EntityCluster, PolicyHolder
+from tests.factories import PolicyFactory, PolicyHolderFactory
+
+User = get_user_model()
+
+
+def _claim(holder: PolicyHolder) -> Claim:
+    """Create a claim against a new policy of ``holder``."""
+    return services.create_claim(
+        policy=PolicyFactory(holder=holder),
+        claim_type=Claim.Type.CLAIM,
+        priority=Claim.Priority.NORMAL,
+        summary="Lost luggage at the airport.",
+        actor="intake",
+    )
+
+
+def test_contact_keys_are_normalised():
+    """Case, plus-tags, and phone formatting do not hide a shared contact."""
+    assert entity_links.contact_keys(email=" Ann+claims@Mail.com ", phone="+44 7700 900001") == {
+        "email:ann@mail.com",
+        "phone:7700900001",
+    }
+    assert entity_links.contact_keys(email="ann@mail.com", phone="07700 900001") == {
+        "email:ann@mail.com",
+        "phone:7700900001",
+    }
+    assert entity_links.contact_keys(email="not-an-email", phone="123") == set()
+
+
+@pytest.mark.django_db
+def test_full_length_email_is_stored_as_a_key():
+    """A 254-character address, the EmailField maximum, fits in the contact key column."""
+    email = f"{'a' * 64}@{'b' * 63}.{'c' * 63}.{'d' * 57}.com"
+    assert len(email) == 254
+    first = services.create_policy_holder(full_name="Long", email=email)
+    second = services.create_policy_holder(full_name="Long too", email=email.upper())
+    assert first.contact_keys.get().key == f"email:{email}"
+    assert PolicyHolder.objects.get(pk=second.pk).cluster_id == first.cluster_id
+
+
+@pytest.mark.django_db(transaction=True)
+@pytest.mark.skipif(connection.vendor != "postgresql", reason="Needs advisory locks")
+def test_concurrent_holders_sharing_a_contact_join_one_cluster():
+    """A holder created while another with the same contact is uncommitted still links."""
+    created = threading.Event()
+    release = threading.Event()
+    holders = {}
+
+    def first() -> None:
+        try:
+            with transaction.atomic():
+                holders["first"] = services.create_policy_holder(
+                    full_name="First", email="shared@mail.com"
+                )
+                created.set()
+                release.wait(5)
+        finally:
+            connections.close_all()
+
+    def second() -> None:
+        try:
+            holders["second"] = services.create_policy_holder(
+                full_name="Second", email="shared@mail.com"
+            )
+        finally:
+            connections.close_all()
+
+    threads = [threading.Thread(target=first), threading.Thread(target=second)]
+    threads[0].start()
+    assert created.wait(5)
+    threads[1].start()
+    # The second link waits on the first transaction's key lock.
+    threads[1].join(0.3)
+    assert threads[1].is_alive()
+    release.set()
+    for thread in threads:
+        thread.join(5)
+
+    clusters = set(
+        PolicyHolder.objects.filter(pk__in=[holders["first"].pk, holders["second"].pk]).values_list(
+            "cluster_id", flat=True
+        )
+    )
+    assert len(clusters) == 1
+    assert EntityCluster.objects.get(pk=clusters.pop()).size == 2
+
+
+@pytest.mark.django_db
+def test_holders_sharing_contacts_merge_and_split_on_edit():
+    """Create links holders transitively; removing the shared contact splits them again."""
+    ann = services.create_policy_holder(full_name="Ann", email="ann@mail.com", phone="")
+    alias = services.create_policy_holder(
+        full_name="A. N.", email="ANN+2@mail.com", phone="+44 7700 900001"
+    )
+    cousin = services.create_policy_holder(
+        full_name="Cousin", email="c@mail.com", phone="07700900001"
+    )
+    other = services.create_policy_holder(full_name="Bob", email="bob@mail.com", phone="")
+    _claim(ann)
+    _claim(cousin)
+
+    ann.refresh_from_db()
+    cluster = ann.cluster
+    assert cluster.size == 3
+    assert cluster.claim_count == 2
+    assert entity_links.velocity_now(cluster) == pytest.approx(2.0, rel=1e-3)
+    assert set(cluster.holders.values_list("pk", flat=True)) == {ann.pk, alias.pk, cousin.pk}
+    assert PolicyHolder.objects.get(pk=other.pk).cluster.size == 1
+
+    services.update_policy_holder(holder=alias, phone="")
+    cousin.refresh_from_db()
+    ann.refresh_from_db()
+    assert ann.cluster.size == 2
+    assert ann.cluster.claim_count == 1
+    assert cousin.cluster_id != ann.cluster_id
+    assert cousin.cluster.size == 1
+    assert cousin.cluster.claim_count == 1
+    assert EntityCluster.objects.count() == 3
+
+
+@pytest.mark.django_db
+def test_shared_contact_feeds_reason_code():
+    """Claims from holders in a multi-holder cluster carry SHARED_CONTACT."""
+    services.create_policy_holder(full_name="One", email="ring@mail.com")
+    two = services.create_policy_holder(full_name="Two", email="ring@mail.com")
+    claim = _claim(two)
+    assert "SHARED_CONTACT" in score_claims([claim.pk])[claim.pk].reason_codes
+
+
+@pytest.mark.django_db
+def test_network_endpoint_reads_cluster_row(api_client, django_assert_max_num_queries):
+    """The endpoint reports cluster statistics and shared identifier types."""
+    one = services.create_policy_holder(full_name="One", email="ring@mail.com", phone="0770090000")
+    two = services.create_policy_holder(full_name="Two", email="ring@mail.com")
+    _claim(one)
+    api_client.force_authenticate(user=User.objects.create_user(username="r", password="pw"))
+
+    with django_assert_max_num_queries(4):
+        resp = api_client.get(reverse("holders-network", kwargs={"holder_id": two.pk}))
+    assert resp.status_code == 200, resp.content
+    body = resp.json()
+    assert body["cluster_size"] == 2
+    assert body["claim_count"] == 1
+    assert body["claim_velocity"] == pytest.approx(1.0, rel=1e-3)
+    assert [m["holder_id"] for m in body["members"]] == [one.pk, two.pk]
+    assert body["shared_identifiers"] == [{"type": "email", "holders": 2}]
+    assert api_client.get(reverse("holders-network", kwargs={"holder_id": 0})).status_code == 404
+
+
+@pytest.mark.django_db
+def test_rebuild_command_links_existing_holders():
+    """Holders written outside services are clustered by the rebuild."""
+    a = PolicyHolderFactory(email="x@mail.com", phone="")
+    b = PolicyHolderFactory(email="y@mail.com", phone="+1 (555) 010-9999")
+    c = PolicyHolderFactory(email="X@mail.com", phone="555 010 9999")
+    d = PolicyHolderFactory(email="z@mail.com", phone="")
+    Claim.objects.create(policy=PolicyFactory(holder=b), claim_type=Claim.Type.CLAIM, summary="s")
+
+    call_command("rebuild_entity_links", "--chunk-size", "2")
+
+    rows = {h.pk: h.cluster for h in PolicyHolder.objects.select_related("cluster")}
+    assert rows[a.pk] == rows[b.pk] == rows[c.pk]
+    assert rows[a.pk].size == 3
+    assert rows[a.pk].claim_count == 1
+    assert rows[d.pk].size == 1
+
+
+@pytest.mark.django_db
+def test_rebuild_sums_decayed_claim_velocity_per_cluster():
+    """Claim count and velocity come from one aggregate, ancient claims weighing zero."""
+    holder = PolicyHolderFactory(email="v@mail.com", phone="")
+    policy = PolicyFactory(holder=holder)
+    claims = [
+        Claim.objects.create(policy=policy, claim_type=Claim.Type.CLAIM, summary="s")
+        for _ in range(3)
+    ]
+    tau = entity_links.VELOCITY_TIME_CONSTANT
+    now = timezone.now()
+    Claim.objects.filter(pk=claims[1].pk).update(created_at=now - tau)
+    Claim.objects.filter(pk=claims[2].pk).update(created_at=now - 1000 * tau)
+    quiet = PolicyHolderFactory(email="q@mail.com", phone="")
+
+    call_command("rebuild_entity_links", "--chunk-size", "1")
+
+    cluster = PolicyHolder.objects.get(pk=holder.pk).cluster
+    assert cluster.claim_count == 3
+    assert cluster.claim_velocity == pytest.approx(1 + math.exp(-1), rel=1e-3)
+    assert PolicyHolder.objects.get(pk=quiet.pk).cluster.claim_count == 0
+    assert holder.contact_keys.count() == quiet.contact_keys.count() == 1
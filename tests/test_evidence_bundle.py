@@ -0,0 +1,234 @@
+"""
+Tests for streamed ZIP evidence bundles.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import io
+import json
+import os
+import zipfile
+from datetime import timedelta
+
+import pytest
+from django.contrib.auth import get_user_model
+from django.contrib.auth.models import Group
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.core.handlers.asgi import ASGIHandler
+from django.urls import reverse
+from django.utils import timezone
+
+from policylens.apps.claims import evidence, services
+from policylens.apps.claims.models import Claim, ClaimDocument, ReviewDecision
+from tests.factories import PolicyFactory
+
+User = get_user_model()
+
+
+@pytest.fixture()
+def reviewer_client(api_client, settings, tmp_path):
+    """API client authenticated as a reviewer, with uploads kept under tmp_path."""
+    settings.MEDIA_ROOT = tmp_path
+    user = User.objects.create_user(username="compliance")
+    user.groups.add(Group.objects.get_or_create(name="reviewer")[0])
+    api_client.force_authenticate(user=user)
+    return api_client
+
+
+def _claim(summary: str = "Fire in the garage.") -> Claim:
+    """Create a claim through the service layer."""
+    return services.create_claim(
+        policy=PolicyFactory(),
+        claim_type=Claim.Type.CLAIM,
+        priority=Claim.Priority.NORMAL,
+        summary=summary,
+        actor="intake",
+    )
+
+
+def _upload(claim: Claim, name: str, content: bytes, content_type: str) -> ClaimDocument:
+    """Attach a document through the service layer."""
+    return services.add_document(
+        claim=claim,
+        uploaded_file=SimpleUploadedFile(name, content, content_type=content_type),
+        original_filename=name,
+        content_type=content_type,
+        actor="reviewer-1",
+    )
+
+
+def _download(client, url: str, **params) -> tuple[list[bytes], zipfile.ZipFile]:
+    """Fetch a bundle, returning the streamed chunks and the parsed archive."""
+    resp = client.get(url, data=params)
+    assert resp.status_code == 200
+    assert resp["Content-Type"] == "application/zip"
+    chunks = list(resp.streaming_content)
+    archive = zipfile.ZipFile(io.BytesIO(b"".join(chunks)))
+    assert archive.testzip() is None
+    return chunks, archive
+
+
+@pytest.mark.django_db
+def test_claim_bundle_contains_records_and_documents(reviewer_client):
+    """A claim bundle holds its JSON records and document files, stored or deflated."""
+    claim = _claim()
+    services.add_note(claim=claim, body="Spoke to the holder.", actor="reviewer-1")
+    pdf = _upload(claim, "report.pdf", b"%PDF-1.4 " + os.urandom(2048), "application/pdf")
+    txt = _upload(claim, "statement.txt", b"It was raining. " * 200, "text/plain")
+    gone = _upload(claim, "photo.jpg", b"\xff\xd8" + os.urandom(64), "image/jpeg")
+    gone.file.storage.delete(gone.file.name)
+    services.add_decision(
+        claim=claim, decision=ReviewDecision.Decision.APPROVE, notes="ok", actor="reviewer-1"
+    )
+
+    url = reverse("claims-evidence-bundle-detail", kwargs={"claim_id": claim.pk})
+    _, archive = _download(reviewer_client, url)
+    prefix = f"claim-{claim.pk}/"
+
+    assert json.loads(archive.read(prefix + "claim.json"))["summary"] == "Fire in the garage."
+    events = json.loads(archive.read(prefix + "audit_events.json"))
+    assert [e["event_type"] for e in events][:2] == ["CLAIM_CREATED", "NOTE_ADDED"]
+    assert json.loads(archive.read(prefix + "decisions.json"))[0]["decision"] == "APPROVE"
+    assert json.loads(archive.read(prefix + "notes.json"))[0]["body"] == "Spoke to the holder."
+    assert json.loads(archive.read(prefix + "missing_documents.json")) == [
+        {"id": gone.pk, "original_filename": "photo.jpg"}
+    ]
+
+    pdf_entry = archive.getinfo(f"{prefix}documents/{pdf.pk}-report.pdf")
+    txt_entry = archive.getinfo(f"{prefix}documents/{txt.pk}-statement.txt")
+    assert pdf_entry.compress_type == zipfile.ZIP_STORED
+    assert txt_entry.compress_type == zipfile.ZIP_DEFLATED
+    assert txt_entry.compress_size < txt_entry.file_size
+    assert archive.read(txt_entry) == b"It was raining. " * 200
+
+
+@pytest.mark.django_db(transaction=True)
+def test_bundle_streams_chunk_by_chunk_under_asgi(settings, tmp_path, monkeypatch, client):
+    """Served by the ASGI handler, each chunk is sent before the next one is built."""
+    settings.MEDIA_ROOT = tmp_path
+    monkeypatch.setattr(evidence, "CHUNK_SIZE", 64 * 1024)
+    claim = _claim()
+    _upload(claim, "scan.png", os.urandom(512 * 1024), "image/png")
+    user = User.objects.create_user(username="compliance")
+    user.groups.add(Group.objects.get_or_create(name="reviewer")[0])
+    client.force_login(user)
+
+    built = []
+    stream_bundle = evidence.stream_bundle
+
+    def counted(claims):
+        for chunk in stream_bundle(claims):
+            built.append(len(chunk))
+            yield chunk
+
+    monkeypatch.setattr(evidence, "stream_bundle", counted)
+    sent: list[tuple[bytes, int]] = []
+    started = {}
+
+    async def scenario() -> None:
+        disconnected = asyncio.Event()
+        requested = False
+
+        async def receive() -> dict:
+            nonlocal requested
+            if not requested:
+                requested = True
+                return {"type": "http.request", "body": b"", "more_body": False}
+            await disconnected.wait()
+            return {"type": "http.disconnect"}
+
+        async def send(message: dict) -> None:
+            if message["type"] == "http.response.start":
+                started.update(message)
+            elif message.get("body"):
+                sent.append((message["body"], len(built)))
+
+        url = reverse("claims-evidence-bundle-detail", kwargs={"claim_id": claim.pk})
+        cookie = (
+            f"{settings.SESSION_COOKIE_NAME}={client.cookies[settings.SESSION_COOKIE_NAME].value}"
+        )
+        scope = {
+            "type": "http",
+            "asgi": {"version": "3.0"},
+            "http_version": "1.1",
+            "method": "GET",
+            "scheme": "http",
+            "path": url,
+            "query_string": b"",
+            "headers": [(b"host", b"testserver"), (b"cookie", cookie.encode())],
+            "client": ("127.0.0.1", 50000),
+            "server": ("testserver", 80),
+        }
+        await ASGIHandler()(scope, receive, send)
+
+    asyncio.run(scenario())
+
+    assert started["status"] == 200
+    # The first bytes left before the second chunk existed; nothing was drained up front.
+    assert sent[0][0].startswith(b"PK\x03\x04")
+    assert sent[0][1] == 1
+    assert len(sent) > 8
+    assert [built_before for _, built_before in sent] == sorted(b for _, b in sent)
+    archive = zipfile.ZipFile(io.BytesIO(b"".join(body for body, _ in sent)))
+    assert archive.testzip() is None
+
+
+@pytest.mark.django_db
+def test_bundle_streams_in_bounded_chunks(reviewer_client, monkeypatch):
+    """The first chunk is a local file header and no chunk exceeds one read of output."""
+    monkeypatch.setattr(evidence, "CHUNK_SIZE", 64 * 1024)
+    claim = _claim()
+    _upload(claim, "scan.png", os.urandom(1024 * 1024), "image/png")
+
+    url = reverse("claims-evidence-bundle-detail", kwargs={"claim_id": claim.pk})
+    chunks, archive = _download(reviewer_client, url)
+
+    assert chunks[0].startswith(b"PK\x03\x04")
+    assert len(chunks) > 16
+    assert max(len(chunk) for chunk in chunks) <= 64 * 1024 + 1024
+    assert len(archive.namelist()) == 5
+
+
+@pytest.mark.django_db
+def test_large_entries_use_zip64(reviewer_client, monkeypatch):
+    """Entries at or past the threshold carry ZIP64 sizes and still read back intact."""
+    monkeypatch.setattr(evidence, "ZIP64_FROM", 0)
+    claim = _claim()
+    doc = _upload(claim, "notes.txt", b"zip64 " * 1000, "text/plain")
+
+    url = reverse("claims-evidence-bundle-detail", kwargs={"claim_id": claim.pk})
+    _, archive = _download(reviewer_client, url)
+
+    entry = archive.getinfo(f"claim-{claim.pk}/documents/{doc.pk}-notes.txt")
+    assert entry.extract_version >= zipfile.ZIP64_VERSION
+    assert archive.read(entry) == b"zip64 " * 1000
+
+
+@pytest.mark.django_db
+def test_date_range_bundle_and_access(reviewer_client, api_client):
+    """A range bundle holds one folder per claim created in the range; access is limited."""
+    inside = [_claim(f"Claim {i}") for i in range(3)]
+    outside = _claim("Too old")
+    Claim.objects.filter(pk=outside.pk).update(created_at=timezone.now() - timedelta(days=30))
+
+    today = timezone.localdate()
+    url = reverse("claims-evidence-bundle")
+    _, archive = _download(
+        reviewer_client,
+        url,
+        created_after=(today - timedelta(days=1)).isoformat(),
+        created_before=(today + timedelta(days=1)).isoformat(),
+    )
+    folders = {name.split("/")[0] for name in archive.namelist()}
+    assert folders == {f"claim-{c.pk}" for c in inside}
+
+    bad = reviewer_client.get(
+        url, data={"created_after": "2026-02-01", "created_before": "2026-01-01"}
+    )
+    assert bad.status_code == 400
+    assert reviewer_client.get(url).status_code == 400
+
+    api_client.force_authenticate(User.objects.create_user(username="plain"))
+    detail = reverse("claims-evidence-bundle-detail", kwargs={"claim_id": outside.pk})
+    assert api_client.get(detail).status_code == 403
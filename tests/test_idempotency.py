@@ -0,0 +1,228 @@
+"""
+Tests for Idempotency-Key handling on claim write endpoints.
+
+Retries must replay the original response without re-running service calls, concurrent
+duplicates must collapse to a single write, and expired keys must be purgeable.
+"""
+
+from __future__ import annotations
+
+import threading
+from datetime import timedelta
+
+import pytest
+from django.contrib.auth import get_user_model
+from django.contrib.auth.models import Group
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.core.management import call_command
+from django.db import connection, connections
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework.test import APIClient
+
+from policylens.apps.claims.models import (
+    AuditEvent,
+    Claim,
+    IdempotencyKey,
+    InternalNote,
+    ReviewDecision,
+)
+from tests.factories import ClaimFactory, PolicyFactory
+
+User = get_user_model()
+
+
+def _reviewer(username: str):
+    """Create a user in the reviewer group."""
+    user = User.objects.create_user(username=username, password="password123")
+    group, _ = Group.objects.get_or_create(name="reviewer")
+    user.groups.add(group)
+    return user
+
+
+@pytest.mark.django_db
+def test_retried_claim_create_replays_without_duplicate_writes(api_client):
+    """A retried POST /api/claims/ returns the first response and writes nothing new."""
+    api_client.force_authenticate(user=_reviewer("idem-1"))
+    policy = PolicyFactory()
+    payload = {
+        "policy_id": policy.pk,
+        "claim_type": Claim.Type.CLAIM,
+        "priority": Claim.Priority.NORMAL,
+        "summary": "Retry me.",
+    }
+    url = reverse("claims-list-create")
+
+    first = api_client.post(url, data=payload, format="json", HTTP_IDEMPOTENCY_KEY="k-1")
+    assert first.status_code == 201
+
+    with CaptureQueriesContext(connection) as ctx:
+        second = api_client.post(url, data=payload, format="json", HTTP_IDEMPOTENCY_KEY="k-1")
+    assert second.status_code == 201
+    assert second.json() == first.json()
+    assert second["Idempotent-Replayed"] == "true"
+    assert len(ctx.captured_queries) == 1
+
+    assert Claim.objects.count() == 1
+    assert AuditEvent.objects.filter(event_type="CLAIM_CREATED").count() == 1
+
+
+@pytest.mark.django_db
+def test_nested_write_endpoints_are_idempotent(api_client):
+    """Notes and decisions are recorded once per key."""
+    api_client.force_authenticate(user=_reviewer("idem-2"))
+    claim = ClaimFactory()
+
+    note_url = reverse("claims-notes-create", kwargs={"claim_id": claim.pk})
+    for _ in range(3):
+        resp = api_client.post(
+            note_url, data={"body": "Once."}, format="json", HTTP_IDEMPOTENCY_KEY="note-1"
+        )
+        assert resp.status_code == 201
+    assert InternalNote.objects.filter(claim=claim).count() == 1
+
+    decision_url = reverse("claims-decisions-create", kwargs={"claim_id": claim.pk})
+    for _ in range(3):
+        resp = api_client.post(
+            decision_url,
+            data={"decision": ReviewDecision.Decision.APPROVE},
+            format="json",
+            HTTP_IDEMPOTENCY_KEY="decision-1",
+        )
+        assert resp.status_code == 201
+    assert ReviewDecision.objects.filter(claim=claim).count() == 1
+
+
+@pytest.mark.django_db
+def test_key_reuse_on_another_endpoint_is_rejected(api_client):
+    """A key bound to one endpoint cannot be replayed against another."""
+    api_client.force_authenticate(user=_reviewer("idem-3"))
+    claim = ClaimFactory()
+
+    resp = api_client.post(
+        reverse("claims-notes-create", kwargs={"claim_id": claim.pk}),
+        data={"body": "First."},
+        format="json",
+        HTTP_IDEMPOTENCY_KEY="shared",
+    )
+    assert resp.status_code == 201
+
+    resp = api_client.post(
+        reverse("claims-decisions-create", kwargs={"claim_id": claim.pk}),
+        data={"decision": ReviewDecision.Decision.APPROVE},
+        format="json",
+        HTTP_IDEMPOTENCY_KEY="shared",
+    )
+    assert resp.status_code == 422
+    assert not ReviewDecision.objects.filter(claim=claim).exists()
+
+
+@pytest.mark.django_db
+def test_key_reuse_with_a_different_body_is_rejected(api_client):
+    """A key is bound to its request body; only an identical retry is replayed."""
+    api_client.force_authenticate(user=_reviewer("idem-body"))
+    claim = ClaimFactory()
+    url = reverse("claims-notes-create", kwargs={"claim_id": claim.pk})
+
+    first = api_client.post(url, data={"body": "First."}, format="json", HTTP_IDEMPOTENCY_KEY="b")
+    assert first.status_code == 201
+
+    resp = api_client.post(url, data={"body": "Second."}, format="json", HTTP_IDEMPOTENCY_KEY="b")
+    assert resp.status_code == 422
+    assert "body" in resp.json()["detail"]
+    assert list(InternalNote.objects.filter(claim=claim).values_list("body", flat=True)) == [
+        "First."
+    ]
+
+    replay = api_client.post(url, data={"body": "First."}, format="json", HTTP_IDEMPOTENCY_KEY="b")
+    assert replay.status_code == 201
+    assert replay["Idempotent-Replayed"] == "true"
+
+
+@pytest.mark.django_db
+def test_upload_retries_are_matched_by_file_content(api_client, settings, tmp_path):
+    """Multipart uploads are fingerprinted by file content, not just by form fields."""
+    settings.MEDIA_ROOT = str(tmp_path)
+    api_client.force_authenticate(user=_reviewer("idem-upload"))
+    claim = ClaimFactory()
+    url = reverse("claims-documents-create", kwargs={"claim_id": claim.pk})
+
+    def upload(content: bytes):
+        payload = {
+            "file": SimpleUploadedFile("photo.jpg", content, content_type="image/jpeg"),
+            "original_filename": "photo.jpg",
+            "content_type": "image/jpeg",
+        }
+        return api_client.post(url, data=payload, format="multipart", HTTP_IDEMPOTENCY_KEY="u")
+
+    assert upload(b"first").status_code == 201
+    assert upload(b"first")["Idempotent-Replayed"] == "true"
+    assert upload(b"other").status_code == 422
+    assert claim.documents.count() == 1
+
+
+@pytest.mark.django_db
+def test_failed_requests_do_not_consume_the_key(api_client):
+    """Validation failures roll back the key so a corrected retry can succeed."""
+    api_client.force_authenticate(user=_reviewer("idem-4"))
+    claim = ClaimFactory()
+    url = reverse("claims-notes-create", kwargs={"claim_id": claim.pk})
+
+    resp = api_client.post(url, data={"body": "   "}, format="json", HTTP_IDEMPOTENCY_KEY="k")
+    assert resp.status_code == 400
+    assert not IdempotencyKey.objects.exists()
+
+    resp = api_client.post(url, data={"body": "Fixed."}, format="json", HTTP_IDEMPOTENCY_KEY="k")
+    assert resp.status_code == 201
+
+
+@pytest.mark.django_db(transaction=True)
+def test_concurrent_duplicates_collapse_to_one_write():
+    """Parallel requests with one key produce one claim and identical responses."""
+    user = _reviewer("idem-5")
+    policy = PolicyFactory()
+    payload = {
+        "policy_id": policy.pk,
+        "claim_type": Claim.Type.CLAIM,
+        "priority": Claim.Priority.HIGH,
+        "summary": "Storm.",
+    }
+    url = reverse("claims-list-create")
+    barrier = threading.Barrier(8)
+    results = []
+
+    def worker():
+        client = APIClient()
+        client.force_authenticate(user=user)
+        barrier.wait()
+        try:
+            resp = client.post(url, data=payload, format="json", HTTP_IDEMPOTENCY_KEY="storm")
+            results.append((resp.status_code, resp.json()))
+        finally:
+            connections.close_all()
+
+    threads = [threading.Thread(target=worker) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert Claim.objects.count() == 1
+    assert AuditEvent.objects.filter(event_type="CLAIM_CREATED").count() == 1
+    assert {status for status, _ in results} == {201}
+    assert len({body["id"] for _, body in results}) == 1
+
+
+@pytest.mark.django_db
+def test_purge_command_removes_only_expired_keys():
+    """purge_idempotency_keys deletes rows past their TTL."""
+    now = timezone.now()
+    for i, expires_at in enumerate([now - timedelta(seconds=1), now + timedelta(hours=1)]):
+        IdempotencyKey.objects.create(
+            actor="a", key=f"k{i}", method="POST", path="/api/claims/", expires_at=expires_at
+        )
+
+    call_command("purge_idempotency_keys", "--chunk-size", "1")
+
+    assert list(IdempotencyKey.objects.values_list("key", flat=True)) == ["k1"]
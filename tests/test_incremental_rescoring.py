@@ -0,0 +1,95 @@
+"""
+Tests for dirty-tracking incremental rescoring.
+"""
+
+from __future__ import annotations
+
+import pytest
+from django.core.management import call_command
+
+from policylens.apps.claims import services
+from policylens.apps.claims.ml.rescoring import drain_dirty_claims, mark_claims_dirty
+from policylens.apps.claims.models import (
+    AuditEvent,
+    Claim,
+    ClaimRescoreMark,
+    MlScore,
+    ReviewDecision,
+)
+from tests.factories import ClaimFactory, PolicyFactory
+
+
+@pytest.mark.django_db
+def test_service_writes_mark_claims_dirty():
+    """Each write that can change features leaves exactly one mark per claim."""
+    claim = services.create_claim(
+        policy=PolicyFactory(),
+        claim_type=Claim.Type.CLAIM,
+        priority=Claim.Priority.NORMAL,
+        summary="Burst pipe.",
+        actor="reviewer-1",
+    )
+    assert ClaimRescoreMark.objects.get(claim=claim).version == 1
+
+    services.add_note(claim=claim, body="Called the holder.", actor="reviewer-1")
+    services.add_decision(
+        claim=claim, decision=ReviewDecision.Decision.REQUEST_INFO, notes="", actor="r"
+    )
+    assert ClaimRescoreMark.objects.get(claim=claim).version == 3
+
+    other = ClaimFactory()
+    services.bulk_add_decisions(
+        claim_ids=[other.pk], decision=ReviewDecision.Decision.APPROVE, notes="", actor="r"
+    )
+    assert ClaimRescoreMark.objects.filter(claim=other).exists()
+
+
+@pytest.mark.django_db
+def test_drain_rescores_only_changed_claims_and_clears_marks():
+    """Unchanged fingerprints are skipped; changed features are rescored."""
+    claims = [ClaimFactory() for _ in range(5)]
+    ids = [c.pk for c in claims]
+    mark_claims_dirty(ids)
+
+    first = drain_dirty_claims(chunk_size=2)
+    assert (first.drained, first.rescored) == (5, 5)
+    assert not ClaimRescoreMark.objects.exists()
+
+    services.add_note(claim=claims[0], body="Adjuster visit booked.", actor="r")
+    mark_claims_dirty(ids[1:3])
+    before = dict(MlScore.objects.values_list("claim_id", "scored_at"))
+
+    second = drain_dirty_claims(chunk_size=2)
+    assert (second.drained, second.rescored, second.skipped) == (3, 1, 2)
+    after = dict(MlScore.objects.values_list("claim_id", "scored_at"))
+    assert after[ids[0]] > before[ids[0]]
+    assert after[ids[1]] == before[ids[1]]
+    assert AuditEvent.objects.filter(event_type="ML_SCORED").count() == 6
+
+
+@pytest.mark.django_db
+def test_mark_bumped_after_read_survives_drain(monkeypatch):
+    """A claim marked again while its chunk is being scored stays dirty."""
+    from policylens.apps.claims.ml import rescoring
+
+    claim = ClaimFactory()
+    mark_claims_dirty([claim.pk])
+    original = rescoring.score_claims
+
+    def score_then_touch(ids, **kwargs):
+        written = original(ids, **kwargs)
+        mark_claims_dirty(ids)
+        return written
+
+    monkeypatch.setattr(rescoring, "score_claims", score_then_touch)
+    drain_dirty_claims()
+    assert ClaimRescoreMark.objects.get(claim=claim).version == 2
+
+
+@pytest.mark.django_db
+def test_rescore_command_reports_counts(capsys):
+    """The management command drains the dirty set."""
+    mark_claims_dirty([ClaimFactory().pk])
+    call_command("rescore_dirty_claims", "--chunk-size", "10")
+    assert "1 rescored" in capsys.readouterr().out
+    assert not ClaimRescoreMark.objects.exists()
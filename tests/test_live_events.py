@@ -0,0 +1,207 @@
+"""
+Tests for LISTEN/NOTIFY change notifications and the server-sent events stream.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import queue
+import threading
+import time
+
+import orjson
+import pytest
+from asgiref.sync import async_to_sync
+from django.contrib.auth import get_user_model
+from django.db import connection, transaction
+from django.test import AsyncClient
+from django.urls import reverse
+
+from policylens.apps.claims import live, services
+from policylens.apps.claims.models import Claim, ReviewDecision
+from tests.factories import PolicyFactory
+
+User = get_user_model()
+
+
+def _create_claim(*, rollback: bool = False) -> int:
+    """Create a claim on this thread's connection; optionally roll it back."""
+    try:
+        with transaction.atomic():
+            claim = services.create_claim(
+                policy=PolicyFactory(),
+                claim_type=Claim.Type.CLAIM,
+                priority=Claim.Priority.NORMAL,
+                summary="Storm damage to the roof.",
+                actor="intake",
+            )
+            if rollback:
+                raise RuntimeError("rolled back")
+        return claim.pk
+    except RuntimeError:
+        return 0
+    finally:
+        connection.close()
+
+
+def _decide(claim_id: int) -> None:
+    """Approve a claim on this thread's connection."""
+    try:
+        services.add_decision(
+            claim=Claim.objects.get(pk=claim_id),
+            decision=ReviewDecision.Decision.APPROVE,
+            notes="",
+            actor="reviewer-1",
+        )
+    finally:
+        connection.close()
+
+
+def _next(subscription: live.Subscription) -> tuple[str, dict]:
+    """Wait briefly for the subscription's next message."""
+    channel, data = subscription.queue.get(timeout=5)
+    return channel, orjson.loads(data)
+
+
+def _in_thread(target, *args) -> None:
+    """Run a write on its own thread and connection, as another request would."""
+    thread = threading.Thread(target=target, args=args)
+    thread.start()
+    thread.join()
+
+
+@pytest.fixture()
+def live_settings(settings):
+    """Short heartbeats and streams, and a fresh broadcaster closed after the test."""
+    settings.LIVE_HEARTBEAT_SECONDS = 0.1
+    settings.LIVE_STREAM_MAX_SECONDS = 5.0
+    yield settings
+    live.get_broadcaster(buffer=1).close()
+
+
+@pytest.mark.django_db(transaction=True)
+def test_notifications_are_delivered_on_commit_only():
+    """Committed writes notify the claims and queue channels; rollbacks notify nothing."""
+    broadcaster = live.Broadcaster(buffer=10)
+    claims = broadcaster.subscribe(channels=[live.CLAIMS])
+    review_queue = broadcaster.subscribe(channels=[live.QUEUE])
+    try:
+        _in_thread(lambda: _create_claim(rollback=True))
+        time.sleep(0.2)
+        assert claims.queue.empty() and review_queue.queue.empty()
+
+        created = []
+        _in_thread(lambda: created.append(_create_claim()))
+        assert _next(claims) == ("claims", {"event": "CLAIM_CREATED", "claim_ids": created})
+        assert _next(review_queue) == ("queue", {"event": "CLAIM_CREATED", "claim_ids": created})
+    finally:
+        broadcaster.close()
+
+
+def test_fan_out_filters_by_claim_and_resyncs_slow_clients():
+    """Claim-scoped clients only see their claim; a full backlog collapses to resync."""
+    broadcaster = live.Broadcaster(buffer=2)
+    one = live.Subscription(
+        channels=frozenset({live.CLAIMS}), claim_id=1, queue=queue.Queue(maxsize=2)
+    )
+    everything = live.Subscription(
+        channels=frozenset({live.CLAIMS, live.QUEUE}), queue=queue.Queue(maxsize=2)
+    )
+    broadcaster._subscriptions.update({one, everything})
+
+    payload = orjson.dumps({"event": "NOTE_ADDED", "claim_ids": [2]}).decode()
+    assert broadcaster.fan_out("policylens_claims", payload) == 1
+    assert broadcaster.fan_out("policylens_queue", payload) == 1
+    assert one.queue.empty()
+
+    broadcaster.fan_out("policylens_claims", payload)
+    assert everything.queue.qsize() == 1
+    assert everything.queue.get_nowait() == ("resync", "{}")
+
+
+def test_large_batches_are_split_under_the_payload_limit():
+    """Bulk writes produce several notifications, each under Postgres's 8000 byte cap."""
+    payloads = live._payloads("DECISION_RECORDED", list(range(10**9, 10**9 + 1200)))
+    assert len(payloads) == 3
+    assert all(len(p.encode()) < 8000 for p in payloads)
+
+
+@pytest.mark.django_db(transaction=True)
+def test_sse_stream_delivers_claim_events(live_settings, client):
+    """Under WSGI the stream sends a greeting, then one frame per notification for the claim."""
+    claim_id = _create_claim()
+    client.force_login(User.objects.create_user(username="ops-screen"))
+
+    response = client.get(reverse("live-events"), {"channels": "claims", "claim_id": claim_id})
+    assert response.status_code == 200
+    assert response["Content-Type"] == "text/event-stream"
+    frames = iter(response.streaming_content)
+    try:
+        assert b": connected" in next(frames)
+        _in_thread(_create_claim)
+        _in_thread(_decide, claim_id)
+        frame = next(f for f in frames if not f.startswith(b": keepalive"))
+        assert frame.startswith(b"event: claims\ndata: ")
+        assert orjson.loads(frame.split(b"data: ", 1)[1]) == {
+            "event": "DECISION_RECORDED",
+            "claim_ids": [claim_id],
+        }
+    finally:
+        response.close()
+    assert live.get_broadcaster(buffer=1).subscriber_count == 0
+
+
+@pytest.mark.django_db(transaction=True)
+def test_sse_stream_ends_after_its_time_limit(live_settings, client):
+    """A stream frees its worker thread after LIVE_STREAM_MAX_SECONDS; the browser reconnects."""
+    live_settings.LIVE_STREAM_MAX_SECONDS = 0.35
+    client.force_login(User.objects.create_user(username="ops-screen"))
+
+    started = time.monotonic()
+    response = client.get(reverse("live-events"))
+    frames = list(response.streaming_content)
+    elapsed = time.monotonic() - started
+
+    assert frames[0].startswith(b"retry: 3000\n")
+    assert frames[1:] and set(frames[1:]) == {b": keepalive\n\n"}
+    assert 0.3 < elapsed < 3.0
+    assert live.get_broadcaster(buffer=1).subscriber_count == 0
+
+
+@pytest.mark.django_db(transaction=True)
+def test_sse_stream_is_served_incrementally_under_asgi(live_settings):
+    """Under ASGI the same stream is pulled frame by frame instead of drained up front."""
+    claim_id = _create_claim()
+    user = User.objects.create_user(username="ops-screen")
+    connection.close()
+
+    async def scenario() -> None:
+        client = AsyncClient()
+        await client.aforce_login(user)
+        response = await client.get(
+            reverse("live-events"), {"channels": "claims", "claim_id": claim_id}
+        )
+        assert response.status_code == 200
+        frames = aiter(response.streaming_content)
+        try:
+            assert b": connected" in await asyncio.wait_for(anext(frames), timeout=5)
+            await asyncio.to_thread(_decide, claim_id)
+            frame = await asyncio.wait_for(anext(frames), timeout=5)
+            while frame.startswith(b": keepalive"):
+                frame = await asyncio.wait_for(anext(frames), timeout=5)
+            assert orjson.loads(frame.split(b"data: ", 1)[1])["claim_ids"] == [claim_id]
+        finally:
+            await frames.aclose()
+
+    async_to_sync(scenario)()
+
+
+@pytest.mark.django_db
+def test_sse_requires_login_and_known_channels(client):
+    """Anonymous clients and unknown channels are rejected before streaming."""
+    url = reverse("live-events")
+    assert client.get(url).status_code == 401
+    client.force_login(User.objects.create_user(username="ops-screen"))
+    resp = client.get(url, {"channels": "claims,payments"})
+    assert resp.status_code == 400
+    assert "payments" in resp.json()["channels"]
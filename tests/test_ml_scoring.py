@@ -0,0 +1,130 @@
+"""
+Tests for online fraud risk scoring.
+
+Covers the vectorised batch scoring service, request micro-batching, the ml-score
+endpoint, and the scoring metrics it exposes.
+"""
+
+from __future__ import annotations
+
+import threading
+
+import numpy as np
+import pytest
+from django.contrib.auth import get_user_model
+from django.urls import reverse
+
+from policylens.apps.claims.ml.batching import MicroBatcher, scoring_latency
+from policylens.apps.claims.ml.features import build_matrix, load_frame
+from policylens.apps.claims.ml.metrics import LatencyRecorder
+from policylens.apps.claims.ml.model import BASELINE_MODEL
+from policylens.apps.claims.ml.scoring import score_claims
+from policylens.apps.claims.models import AuditEvent, Claim, MlScore, Policy
+from tests.factories import ClaimFactory, PolicyFactory
+
+User = get_user_model()
+
+
+@pytest.mark.django_db
+def test_score_claims_matches_row_by_row_model_output():
+    """Batch scoring upserts one MlScore per claim consistent with the model."""
+    lapsed = PolicyFactory(status=Policy.Status.LAPSED)
+    claims = [
+        ClaimFactory(priority=Claim.Priority.HIGH),
+        ClaimFactory(policy=lapsed, claim_type=Claim.Type.POLICY_CHANGE),
+        ClaimFactory(summary=""),
+    ]
+    ids = [c.pk for c in claims]
+
+    written = score_claims(ids, actor="tester")
+    score_claims(ids, actor="tester")
+
+    assert MlScore.objects.count() == 3
+    for claim in claims:
+        X = build_matrix(load_frame([claim.pk]), BASELINE_MODEL.feature_names)
+        expected = float(BASELINE_MODEL.predict(X)[0])
+        assert written[claim.pk].score == pytest.approx(expected)
+        assert MlScore.objects.get(claim=claim).score == pytest.approx(expected)
+    assert "POLICY_NOT_ACTIVE" in written[claims[1].pk].reason_codes
+    assert AuditEvent.objects.filter(event_type="ML_SCORED", actor="tester").count() == 6
+
+
+def test_micro_batcher_coalesces_concurrent_requests():
+    """Concurrent submits are grouped into batches no larger than max_batch_size."""
+    calls = []
+
+    def handler(items):
+        calls.append(list(items))
+        return {item: item * 2 for item in items}
+
+    recorder = LatencyRecorder()
+    batcher = MicroBatcher(handler, max_batch_size=8, max_wait=0.5, recorder=recorder)
+    barrier = threading.Barrier(16)
+    results = {}
+
+    def worker(n):
+        barrier.wait()
+        results[n] = batcher.submit(n)
+
+    threads = [threading.Thread(target=worker, args=(n,)) for n in range(16)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert results == {n: n * 2 for n in range(16)}
+    assert sorted(x for call in calls for x in call) == list(range(16))
+    assert all(len(call) <= 8 for call in calls)
+    assert len(calls) < 16
+    snapshot = recorder.snapshot()
+    assert snapshot["requests"] == 16
+    assert snapshot["p99_ms"] is not None
+
+
+def test_micro_batcher_propagates_handler_errors_to_every_waiter():
+    """A failing batch raises in the leader and all followers."""
+
+    def handler(items):
+        raise RuntimeError("model unavailable")
+
+    batcher = MicroBatcher(handler, max_batch_size=4, max_wait=0.2)
+    errors = []
+
+    def worker(n):
+        try:
+            batcher.submit(n)
+        except RuntimeError as exc:
+            errors.append(exc)
+
+    threads = [threading.Thread(target=worker, args=(n,)) for n in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(errors) == 4
+
+
+@pytest.mark.django_db
+def test_ml_score_endpoint_persists_score_and_reports_metrics(api_client):
+    """POST /api/claims/{id}/ml-score/ returns the persisted score; metrics expose p99."""
+    user = User.objects.create_user(username="scorer", password="password123")
+    api_client.force_authenticate(user=user)
+    claim = ClaimFactory()
+    scoring_latency.reset()
+
+    resp = api_client.post(reverse("claims-ml-score", kwargs={"claim_id": claim.pk}))
+    assert resp.status_code == 200, resp.content
+    body = resp.json()
+    assert body["claim_id"] == claim.pk
+    assert 0.0 <= body["score"] <= 1.0
+    assert body["label"] in {"LOW", "MEDIUM", "HIGH"}
+    assert np.isclose(MlScore.objects.get(claim=claim).score, body["score"])
+    assert AuditEvent.objects.filter(claim=claim, event_type="ML_SCORED", actor="scorer").exists()
+
+    missing = api_client.post(reverse("claims-ml-score", kwargs={"claim_id": claim.pk + 999}))
+    assert missing.status_code == 404
+
+    metrics = api_client.get(reverse("ml-metrics")).json()["scoring"]
+    assert metrics["requests"] == 1
+    assert metrics["p99_ms"] is not None
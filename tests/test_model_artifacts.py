@@ -0,0 +1,120 @@
+"""
+Tests for memory-mapped, hot-swappable model artefacts.
+"""
+
+from __future__ import annotations
+
+import dataclasses
+import json
+
+import numpy as np
+import pytest
+from django.core.management import call_command
+
+from policylens.apps.claims.ml.artifacts import (
+    ArtifactError,
+    ModelRegistry,
+    load_model,
+    publish,
+    save_model,
+)
+from policylens.apps.claims.ml.model import BASELINE_MODEL
+from policylens.apps.claims.ml.scoring import score_claims
+from policylens.apps.claims.models import MlScore
+from tests.factories import ClaimFactory
+
+
+def _binned_model(version: str):
+    """Baseline model with a binning table on log_summary_length only."""
+    n = len(BASELINE_MODEL.feature_names)
+    idx = BASELINE_MODEL.feature_names.index("log_summary_length")
+    offsets = np.zeros(n + 1, dtype=np.int64)
+    offsets[idx + 1 :] = 2
+    return dataclasses.replace(
+        BASELINE_MODEL,
+        version=version,
+        bin_edges=np.array([1.0, 3.0]),
+        bin_values=np.array([0.0, 1.0, 2.0]),
+        bin_offsets=offsets,
+    )
+
+
+def test_round_trip_maps_arrays_and_preserves_predictions(tmp_path):
+    """A saved artefact loads memory-mapped and scores identically."""
+    model = _binned_model("v1")
+    save_model(model, tmp_path)
+    loaded = load_model(tmp_path / "v1")
+
+    assert isinstance(loaded.coefficients, np.memmap)
+    assert isinstance(loaded.bin_edges, np.memmap)
+    assert loaded.feature_names == model.feature_names
+    assert loaded.reason_codes == model.reason_codes
+
+    X = np.random.default_rng(0).uniform(0, 5, size=(50, len(model.feature_names)))
+    np.testing.assert_allclose(loaded.predict(X), model.predict(X))
+    assert loaded.explain(X) == model.explain(X)
+
+    with pytest.raises(ArtifactError):
+        save_model(model, tmp_path)
+
+
+def test_truncated_manifest_names_the_missing_keys(tmp_path):
+    """A manifest missing scalars is an artefact error naming them, not a KeyError."""
+    path = save_model(dataclasses.replace(BASELINE_MODEL, version="v1"), tmp_path)
+    manifest = json.loads((path / "manifest.json").read_text())
+    del manifest["intercept"], manifest["max_reason_codes"]
+    (path / "manifest.json").write_text(json.dumps(manifest))
+
+    with pytest.raises(ArtifactError, match="missing intercept, max_reason_codes"):
+        load_model(path)
+
+    (path / "manifest.json").write_text("[]")
+    with pytest.raises(ArtifactError, match="not a JSON object"):
+        load_model(path)
+
+
+def test_binning_maps_raw_values_to_bin_values():
+    """Binned features are replaced by their bin value; others pass through."""
+    model = _binned_model("v1")
+    idx = model.feature_names.index("log_summary_length")
+    X = np.full((4, len(model.feature_names)), 0.5)
+    X[:, idx] = [0.5, 1.0, 2.5, 9.0]
+
+    out = model.transform(X)
+
+    assert out[:, idx].tolist() == [0.0, 1.0, 1.0, 2.0]
+    assert np.delete(out, idx, axis=1).tolist() == np.delete(X, idx, axis=1).tolist()
+
+
+def test_registry_picks_up_published_version_without_restart(tmp_path):
+    """Swapping ``current`` is seen on the next lookup; unpublished falls back to baseline."""
+    registry = ModelRegistry(tmp_path)
+    assert registry.current() is BASELINE_MODEL
+
+    save_model(dataclasses.replace(BASELINE_MODEL, version="v1"), tmp_path)
+    save_model(_binned_model("v2"), tmp_path)
+
+    publish(tmp_path, "v1")
+    first = registry.current()
+    assert first.version == "v1"
+    assert registry.current() is first
+
+    publish(tmp_path, "v2")
+    assert registry.current().version == "v2"
+
+    with pytest.raises(ArtifactError):
+        publish(tmp_path, "missing")
+
+
+@pytest.mark.django_db
+def test_score_claims_records_published_model_version(settings, tmp_path):
+    """Scores written after a publish carry the live model version."""
+    settings.ML_MODEL_DIR = str(tmp_path)
+    claim = ClaimFactory()
+
+    score_claims([claim.pk])
+    assert MlScore.objects.get(claim=claim).model_version == BASELINE_MODEL.version
+
+    call_command("publish_model_artifact", "v2", "--baseline")
+    score_claims([claim.pk])
+    assert MlScore.objects.get(claim=claim).model_version == "v2"
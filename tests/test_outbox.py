@@ -0,0 +1,210 @@
+"""
+Tests for the transactional outbox and its batched webhook dispatcher.
+
+Deliveries go to a stub HTTP server on localhost that records each batch and can be told to
+fail.
+"""
+
+from __future__ import annotations
+
+import json
+import threading
+from collections.abc import Iterator
+from datetime import timedelta
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+from django.core.management import call_command
+from django.utils import timezone
+
+from policylens.apps.claims import outbox, services
+from policylens.apps.claims.models import Claim, OutboxMessage, ReviewDecision
+from tests.factories import PolicyFactory
+
+
+class StubWebhook(ThreadingHTTPServer):
+    """Records POSTed batches per path and fails the next ``failures[path]`` requests."""
+
+    def __init__(self) -> None:
+        super().__init__(("127.0.0.1", 0), _StubHandler)
+        self.lock = threading.Lock()
+        self.batches: dict[str, list[list[dict]]] = {}
+        self.failures: dict[str, int] = {}
+
+    def url(self, path: str) -> str:
+        """Return the stub's URL for ``path``."""
+        return f"http://127.0.0.1:{self.server_address[1]}{path}"
+
+    def ids(self, path: str) -> list[int]:
+        """Audit event ids delivered to ``path``, in arrival order."""
+        return [event["id"] for batch in self.batches.get(path, []) for event in batch]
+
+
+class _StubHandler(BaseHTTPRequestHandler):
+    server: StubWebhook
+
+    def do_POST(self) -> None:  # noqa: N802 - http.server naming
+        body = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+        with self.server.lock:
+            if self.server.failures.get(self.path, 0) > 0:
+                self.server.failures[self.path] -= 1
+                status = 503
+            else:
+                self.server.batches.setdefault(self.path, []).append(body["events"])
+                status = 204
+        self.send_response(status)
+        self.end_headers()
+
+    def log_message(self, *args) -> None:
+        pass
+
+
+@pytest.fixture()
+def webhook(settings) -> Iterator[StubWebhook]:
+    """Serve a stub webhook and point two outbox endpoints at it."""
+    server = StubWebhook()
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    settings.OUTBOX_ENDPOINTS = {
+        "payments": server.url("/payments"),
+        "siu": server.url("/siu"),
+    }
+    settings.OUTBOX_EVENT_TYPES = ["CLAIM_CREATED", "DECISION_RECORDED"]
+    settings.OUTBOX_BACKOFF_SECONDS = 60.0
+    settings.OUTBOX_MAX_ATTEMPTS = 3
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+def _claim(summary: str = "Burst pipe in the loft.") -> Claim:
+    """Create a claim through the service layer."""
+    return services.create_claim(
+        policy=PolicyFactory(),
+        claim_type=Claim.Type.CLAIM,
+        priority=Claim.Priority.NORMAL,
+        summary=summary,
+        actor="intake",
+    )
+
+
+def _make_due() -> None:
+    """Expire every backoff so the next pass retries immediately."""
+    OutboxMessage.objects.update(next_attempt_at=timezone.now() - timedelta(seconds=1))
+
+
+@pytest.mark.django_db
+def test_outbox_rows_are_written_with_the_audit_event(webhook):
+    """Subscribed events get one message per endpoint; rollback discards them."""
+    claim = _claim()
+    services.add_note(claim=claim, body="Not subscribed.", actor="reviewer-1")
+    services.add_decision(
+        claim=claim, decision=ReviewDecision.Decision.APPROVE, notes="", actor="reviewer-1"
+    )
+
+    rows = OutboxMessage.objects.order_by("endpoint", "pk")
+    assert [(m.endpoint, m.event_type) for m in rows] == [
+        ("payments", "CLAIM_CREATED"),
+        ("payments", "DECISION_RECORDED"),
+        ("siu", "CLAIM_CREATED"),
+        ("siu", "DECISION_RECORDED"),
+    ]
+    assert rows[0].body["claim_id"] == claim.pk
+    assert rows[0].body["id"] == rows[0].audit_event_id
+
+    before = OutboxMessage.objects.count()
+    with pytest.raises(services.DomainRuleViolation):
+        services.add_decision(
+            claim=claim, decision=ReviewDecision.Decision.REJECT, notes="", actor="reviewer-1"
+        )
+    assert OutboxMessage.objects.count() == before
+
+
+@pytest.mark.django_db
+def test_no_endpoints_means_no_outbox_rows(settings):
+    """With nothing configured the write path does not touch the outbox."""
+    settings.OUTBOX_ENDPOINTS = {}
+    _claim()
+    assert not OutboxMessage.objects.exists()
+
+
+@pytest.mark.django_db(transaction=True)
+def test_dispatch_delivers_batches_in_order_per_endpoint(webhook):
+    """Each endpoint receives every message once, oldest first, batch_size at a time."""
+    claims = [_claim(f"Claim number {i}") for i in range(5)]
+    services.bulk_add_decisions(
+        claim_ids=[c.pk for c in claims],
+        decision=ReviewDecision.Decision.APPROVE,
+        notes="",
+        actor="reviewer-1",
+    )
+    expected = list(
+        OutboxMessage.objects.filter(endpoint="payments")
+        .order_by("pk")
+        .values_list("audit_event_id", flat=True)
+    )
+    assert len(expected) == 10
+
+    result = outbox.dispatch(batch_size=4, concurrency=2)
+
+    assert result == outbox.DispatchResult(delivered=20)
+    for path in ("/payments", "/siu"):
+        assert webhook.ids(path) == expected
+        assert [len(batch) for batch in webhook.batches[path]] == [4, 4, 2]
+    assert not OutboxMessage.objects.exclude(status=OutboxMessage.Status.DELIVERED).exists()
+    assert outbox.dispatch() == outbox.DispatchResult()
+
+
+@pytest.mark.django_db(transaction=True)
+def test_failed_batch_backs_off_and_retries_one_at_a_time(webhook):
+    """A failure blocks only its endpoint, backs off, then retries the head alone."""
+    for i in range(3):
+        _claim(f"Claim number {i}")
+    webhook.failures["/siu"] = 1
+
+    result = outbox.dispatch(batch_size=10)
+    assert result == outbox.DispatchResult(delivered=3, failed=3)
+    assert len(webhook.ids("/payments")) == 3
+    failed = OutboxMessage.objects.filter(endpoint="siu")
+    assert {(m.attempts, m.last_error) for m in failed} == {(1, "HTTP 503")}
+    assert min(m.next_attempt_at for m in failed) > timezone.now() + timedelta(seconds=30)
+
+    # Still backing off: nothing is sent.
+    assert outbox.dispatch(batch_size=10) == outbox.DispatchResult()
+
+    _make_due()
+    outbox.dispatch(batch_size=10)
+    assert [len(batch) for batch in webhook.batches["/siu"]] == [1, 1, 1]
+    assert webhook.ids("/siu") == webhook.ids("/payments")
+
+
+@pytest.mark.django_db(transaction=True)
+def test_message_goes_dead_after_max_attempts(webhook):
+    """A message that keeps failing is dead-lettered and the queue moves past it."""
+    _claim("First claim")
+    _claim("Second claim")
+    webhook.failures["/payments"] = 3
+
+    outbox.dispatch()
+    for _ in range(2):
+        _make_due()
+        outbox.dispatch()
+
+    payments = OutboxMessage.objects.filter(endpoint="payments").order_by("pk")
+    assert [m.status for m in payments] == [
+        OutboxMessage.Status.DEAD,
+        OutboxMessage.Status.DELIVERED,
+    ]
+    assert webhook.ids("/payments") == [payments[1].audit_event_id]
+
+
+@pytest.mark.django_db(transaction=True)
+def test_dispatch_outbox_command_and_purge(webhook):
+    """The command runs one pass and can purge old delivered messages."""
+    _claim()
+    call_command("dispatch_outbox")
+    assert OutboxMessage.objects.filter(status=OutboxMessage.Status.DELIVERED).count() == 2
+
+    OutboxMessage.objects.update(created_at=timezone.now() - timedelta(days=10))
+    call_command("dispatch_outbox", "--purge-after-days", "7")
+    assert not OutboxMessage.objects.exists()
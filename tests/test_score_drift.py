@@ -0,0 +1,145 @@
+"""
+Tests for score distribution sketches and drift monitoring.
+"""
+
+from __future__ import annotations
+
+import datetime as dt
+
+import numpy as np
+import pytest
+from django.contrib.auth import get_user_model
+from django.urls import reverse
+from django.utils import timezone
+
+from policylens.apps.claims.ml.drift import (
+    SKETCH_BINS,
+    Window,
+    compare_windows,
+    histogram,
+    ks,
+    psi,
+    quantiles,
+    record_scores,
+)
+from policylens.apps.claims.ml.model import BASELINE_MODEL
+from policylens.apps.claims.ml.scoring import score_claims
+from policylens.apps.claims.models import MlScore, ScoreSketch
+from tests.factories import ClaimFactory, PolicyFactory
+
+User = get_user_model()
+
+
+def test_histogram_merge_is_exact_and_stats_detect_shift():
+    """Merged histograms equal the histogram of the union; PSI/KS grow with a shift."""
+    rng = np.random.default_rng(3)
+    a, b = rng.beta(2, 5, 5000), rng.beta(2, 5, 5000)
+    shifted = rng.beta(5, 2, 5000)
+
+    assert (histogram(a) + histogram(b) == histogram(np.concatenate([a, b]))).all()
+    assert histogram(np.array([0.0, 1.0])).tolist()[:: SKETCH_BINS - 1] == [1, 1]
+    assert psi(histogram(a), histogram(b)) < 0.1
+    assert psi(histogram(a), histogram(shifted)) > 1.0
+    assert ks(histogram(a), histogram(shifted)) > 0.5
+    assert quantiles(histogram(a), [0.5])[0] == pytest.approx(np.median(a), abs=0.01)
+    assert psi(histogram(a), np.zeros(SKETCH_BINS, dtype=int)) is None
+
+
+@pytest.mark.django_db
+def test_score_claims_updates_daily_sketch_per_product_type():
+    """Each written batch is added to today's sketch for its product type."""
+    home = [ClaimFactory(policy=PolicyFactory(product_type="Home")) for _ in range(3)]
+    motor = ClaimFactory(policy=PolicyFactory(product_type="Motor"))
+
+    score_claims([c.pk for c in home] + [motor.pk])
+    score_claims([home[0].pk])
+
+    sketch = ScoreSketch.objects.get(product_type="Home", day=timezone.localdate())
+    assert sketch.total == 4
+    assert sum(sketch.counts) == 4
+    expected = histogram(np.array([MlScore.objects.get(claim=c).score for c in [*home, home[0]]]))
+    assert sketch.counts == expected.tolist()
+    assert ScoreSketch.objects.get(product_type="Motor").total == 1
+
+
+@pytest.mark.django_db
+def test_drift_endpoint_merges_windows(api_client, django_assert_max_num_queries):
+    """PSI/KS between windows come from merged sketches, filtered by segment."""
+    today = dt.date(2026, 3, 10)
+    rng = np.random.default_rng(5)
+    for offset in range(1, 8):
+        record_scores(
+            model_version="v1",
+            product_types=["Home"] * 500,
+            scores=rng.beta(2, 5, 500),
+            day=today - dt.timedelta(days=offset),
+        )
+    record_scores(
+        model_version="v1", product_types=["Home"] * 500, scores=rng.beta(5, 2, 500), day=today
+    )
+    record_scores(
+        model_version="v1", product_types=["Motor"] * 10, scores=rng.random(10), day=today
+    )
+    api_client.force_authenticate(user=User.objects.create_user(username="gov", password="pw"))
+
+    with django_assert_max_num_queries(2):
+        resp = api_client.get(
+            reverse("ml-drift"),
+            {"current_end": today.isoformat(), "model_version": "v1", "product_type": "Home"},
+        )
+    assert resp.status_code == 200, resp.content
+    body = resp.json()
+    assert body["baseline"]["count"] == 3500
+    assert body["baseline"]["start"] == "2026-03-03"
+    assert body["current"]["count"] == 500
+    assert body["psi"] > 1.0
+    assert body["ks"] > 0.5
+
+    stable = api_client.get(
+        reverse("ml-drift"),
+        {
+            "baseline_start": "2026-03-03",
+            "baseline_end": "2026-03-05",
+            "current_start": "2026-03-06",
+            "current_end": "2026-03-09",
+            "model_version": "v1",
+            "product_type": "Home",
+        },
+    ).json()
+    assert stable["psi"] < 0.1
+
+    bad = api_client.get(
+        reverse("ml-drift"), {"current_start": "2026-03-10", "current_end": "2026-03-01"}
+    )
+    assert bad.status_code == 400
+
+
+@pytest.mark.django_db
+def test_drift_reads_the_active_model_version_unless_asked_to_merge(api_client):
+    """Other versions' sketches stay out of the comparison unless ``all_versions`` is set."""
+    day = dt.date(2026, 3, 10)
+    rng = np.random.default_rng(7)
+    for version, n in ((BASELINE_MODEL.version, 300), ("retired", 200)):
+        for offset in (0, 1):
+            record_scores(
+                model_version=version,
+                product_types=["Home"] * n,
+                scores=rng.random(n),
+                day=day - dt.timedelta(days=offset),
+            )
+    yesterday = day - dt.timedelta(days=1)
+    windows = {"baseline": Window(yesterday, yesterday), "current": Window(day, day)}
+
+    active = compare_windows(**windows)
+    assert active["model_version"] == BASELINE_MODEL.version
+    assert active["current"]["count"] == 300
+    assert compare_windows(**windows, model_version="retired")["current"]["count"] == 200
+    merged = compare_windows(**windows, all_versions=True)
+    assert (merged["model_version"], merged["current"]["count"]) == (None, 500)
+
+    api_client.force_authenticate(user=User.objects.create_user(username="gov", password="pw"))
+    url = reverse("ml-drift")
+    params = {"current_end": day.isoformat(), "all_versions": "true"}
+    assert api_client.get(url, params).json()["current"]["count"] == 500
+    params["model_version"] = "retired"
+    assert api_client.get(url, params).status_code == 400
@@ -0,0 +1,130 @@
+"""
+Tests for shadow scoring of a candidate model.
+"""
+
+from __future__ import annotations
+
+import dataclasses
+import threading
+import time
+
+import numpy as np
+import pytest
+from django.contrib.auth import get_user_model
+from django.urls import reverse
+
+from policylens.apps.claims.ml import shadow
+from policylens.apps.claims.ml.artifacts import save_model
+from policylens.apps.claims.ml.model import BASELINE_MODEL
+from policylens.apps.claims.ml.scoring import score_claims
+from policylens.apps.claims.models import MlScore, MlShadowScore
+from tests.factories import ClaimFactory
+
+User = get_user_model()
+
+
+def _wait_for(predicate, timeout: float = 5.0) -> None:
+    """Poll until ``predicate`` holds or fail after ``timeout`` seconds."""
+    deadline = time.monotonic() + timeout
+    while not predicate():
+        assert time.monotonic() < deadline, "timed out waiting for shadow pool"
+        time.sleep(0.01)
+
+
+def _zeros_matrix(frame, names):
+    """Stand-in for build_matrix that needs no database columns."""
+    return np.zeros((len(frame["pk"]), len(names)))
+
+
+@pytest.mark.django_db(transaction=True)
+def test_candidate_scores_committed_batches_into_comparison_table(settings, tmp_path, client):
+    """The candidate's results land in MlShadowScore only, and the report summarises them."""
+    candidate = dataclasses.replace(BASELINE_MODEL, version="cand-1", intercept=5.0)
+    save_model(candidate, tmp_path)
+    settings.ML_MODEL_DIR = str(tmp_path)
+    settings.ML_SHADOW_MODEL_VERSION = "cand-1"
+    claims = [ClaimFactory() for _ in range(3)]
+
+    score_claims([c.pk for c in claims])
+    scorer = shadow.get_shadow_scorer()
+    _wait_for(lambda: scorer.counters()["completed"] == 1)
+
+    assert set(MlScore.objects.values_list("model_version", flat=True)) == {BASELINE_MODEL.version}
+    rows = list(MlShadowScore.objects.order_by("claim_id"))
+    assert [r.claim_id for r in rows] == [c.pk for c in claims]
+    live = {s.claim_id: s for s in MlScore.objects.all()}
+    for row in rows:
+        assert row.live_score == pytest.approx(live[row.claim_id].score)
+        assert row.shadow_score > row.live_score
+        assert row.shadow_label == "HIGH"
+
+    User.objects.create_user(username="gov", password="pw")
+    client.login(username="gov", password="pw")
+    report = client.get(reverse("ml-shadow-report")).json()
+    assert report["candidate_version"] == "cand-1"
+    assert report["compared"] == 3
+    expected = sum(r.live_label == r.shadow_label for r in rows) / 3
+    assert report["label_agreement_rate"] == pytest.approx(expected)
+    assert report["shadow_batch_ms"]["p99"] is not None
+    assert report["pool"]["completed"] == 1
+
+
+def test_saturated_pool_drops_instead_of_queueing(monkeypatch):
+    """With every worker busy, submit returns immediately and counts a drop."""
+    release = threading.Event()
+
+    def blocking_matrix(frame, names):
+        release.wait(5)
+        return _zeros_matrix(frame, names)
+
+    monkeypatch.setattr(shadow, "build_matrix", blocking_matrix)
+    scorer = shadow.ShadowScorer(BASELINE_MODEL, workers=1, timeout=0.0)
+    frame = {"pk": np.array([1, 2], dtype=object)}
+    batch = {"live_version": "v", "live_scores": np.zeros(2), "live_labels": ["LOW", "LOW"]}
+
+    assert scorer.submit(frame, **batch) is True
+    started = time.perf_counter()
+    assert scorer.submit(frame, **batch) is False
+    assert time.perf_counter() - started < 0.1
+
+    release.set()
+    scorer.shutdown()
+    assert scorer.counters()["dropped"] == 1
+    assert scorer.counters()["submitted"] == 1
+
+
+def test_batches_over_budget_are_discarded(monkeypatch):
+    """Work finishing after the timeout is counted and not written."""
+    monkeypatch.setattr(shadow, "build_matrix", _zeros_matrix)
+    scorer = shadow.ShadowScorer(BASELINE_MODEL, workers=1, timeout=0.0)
+    scorer.submit(
+        {"pk": np.array([1], dtype=object)},
+        live_version="v",
+        live_scores=np.zeros(1),
+        live_labels=["LOW"],
+    )
+    scorer.shutdown()
+    assert scorer.counters()["timed_out"] == 1
+    assert scorer.counters()["completed"] == 0
+
+
+def test_over_budget_batches_stop_at_the_next_stage(monkeypatch):
+    """A batch that runs out of budget building features never reaches the candidate."""
+    predicted = []
+
+    def slow_matrix(frame, names):
+        time.sleep(0.05)
+        return _zeros_matrix(frame, names)
+
+    monkeypatch.setattr(shadow, "build_matrix", slow_matrix)
+    monkeypatch.setattr(type(BASELINE_MODEL), "predict", lambda self, X: predicted.append(X))
+    scorer = shadow.ShadowScorer(BASELINE_MODEL, workers=1, timeout=0.01)
+    scorer.submit(
+        {"pk": np.array([1], dtype=object)},
+        live_version="v",
+        live_scores=np.zeros(1),
+        live_labels=["LOW"],
+    )
+    scorer.shutdown()
+    assert scorer.counters()["timed_out"] == 1
+    assert predicted == []